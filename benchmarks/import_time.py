@@ -0,0 +1,114 @@
+"""
+Measures how long `import eobot` takes in a fresh interpreter, using `python -X importtime`, and checks it against a
+budget. Importing the package must not import the methods or their dependencies (e.g. `requests`), which are only
+loaded when a method is first used. Exits with status 1 if the budget is exceeded or a forbidden module was imported:
+
+    python benchmarks/import_time.py --budget 25
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# modules that `import eobot` must not pull in
+FORBIDDEN_MODULES = ("requests", "urllib3", "asyncio", "eobot.lib.eobot_request")
+
+_SCRIPT = "import json, sys; import {0}; print(json.dumps(sorted(sys.modules.keys())))"
+
+
+def measure_import(module="eobot"):
+    """
+    Imports `module` in a fresh interpreter and returns the cumulative import time in seconds, plus the names of all
+    modules that were loaded
+
+    :param module : (Optional) Module to import
+    :type module : str
+
+    :returns tuple : (seconds, module names)
+    :rtype : tuple
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _SCRIPT.format(module)],
+        cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=True
+    )
+
+    seconds = None
+    for line in process.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package", the top-level module is not indented
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].rstrip() == " " + module:
+            seconds = int(parts[1]) / 1000000.0
+
+    return seconds, json.loads(process.stdout)
+
+
+def run_import_benchmark(module="eobot", repeat=10):
+    """
+    Measures the import time of `module` `repeat` times and returns the median and minimum in seconds, and the
+    forbidden modules that were imported
+
+    :param module : (Optional) Module to import
+    :param repeat : (Optional) Number of fresh interpreters to measure
+
+    :type module : str
+    :type repeat : int
+
+    :rtype : dict
+    """
+    timings = []
+    loaded = set()
+
+    for _ in range(repeat):
+        seconds, modules = measure_import(module)
+        timings.append(seconds)
+        loaded.update(modules)
+
+    timings.sort()
+
+    return {
+        "module": module,
+        "python": sys.version.split()[0],
+        "repeat": repeat,
+        "median": timings[len(timings) // 2],
+        "min": timings[0],
+        "forbidden": sorted(name for name in FORBIDDEN_MODULES if name in loaded),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the import time of the eobot package")
+    parser.add_argument("--budget", type=float, default=25.0, help="maximum median import time in ms (default 25)")
+    parser.add_argument("--repeat", type=int, default=10, help="number of fresh interpreters to measure")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    arguments = parser.parse_args(argv)
+
+    results = run_import_benchmark(repeat=arguments.repeat)
+    results["budget"] = arguments.budget / 1000.0
+
+    print("import eobot: median {0:.2f} ms, min {1:.2f} ms, budget {2:.2f} ms".format(
+        results["median"] * 1000, results["min"] * 1000, arguments.budget
+    ))
+
+    if arguments.output is not None:
+        with open(arguments.output, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    failed = False
+
+    if results["median"] > results["budget"]:
+        print("OVER BUDGET")
+        failed = True
+
+    if results["forbidden"]:
+        print("FORBIDDEN IMPORTS: {0}".format(", ".join(results["forbidden"])))
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
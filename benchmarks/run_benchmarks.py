@@ -0,0 +1,537 @@
+"""
+End-to-end benchmarks of every Eobot API method against the bundled mock server.
+
+Every method is called repeatedly through each transport:
+
+- unpooled : a new connection per call (plain `requests.get`)
+- pooled   : calls one after another over a keep-alive `EobotConnectionPool`
+- threaded : concurrent calls from a thread pool over a shared `EobotConnectionPool`
+- async    : concurrent calls from `eobot.aio` over an `EobotAsyncConnectionPool`
+- httplib  : calls one after another with `EobotHttpClientTransport` (the standard library's `http.client`)
+- inproc   : calls one after another with `MockServerTransport`, which skips sockets and HTTP altogether, so that only
+             the client overhead is measured
+
+The mock server runs in load-test mode, serving concurrent keep-alive connections, optionally with an artificial latency
+per response. Caching, request coalescing and retries are switched off so that every call reaches the server. Every
+benchmark is repeated and reported by the median of its repeats. The results are written as JSON and can be compared
+against a stored baseline, in which case the script exits with status 1 when a regression beyond the tolerance is found:
+
+    python benchmarks/run_benchmarks.py --output results.json --baseline benchmarks/baseline.json
+
+Absolute timings only compare between runs on the same machine, so every run also times a fixed calibration workload
+(JSON round trips and socket ping-pongs, which is what the client spends its time on), and results are compared as
+ratios to it. The calibration is timed between the benchmarks, so that it slows down with them when something else
+keeps the machine busy. Median latencies (of the transports that make one call at a time) and throughput are
+compared, and only count as a regression when they are both beyond the relative tolerance and more than a fixed noise
+floor slower, since a sub-millisecond latency easily varies by a quarter from one run to the next. A baseline without
+a calibration is only compared by errors, and one recorded with different settings (iterations, repeats, concurrency,
+latency or accounts) is not compared at all, with exit status 2.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import socket
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from eobot import aio, methods  # noqa: E402
+from eobot.lib.eobot_async_request import EobotAsyncConnectionPool, EobotAsyncRequest  # noqa: E402
+from eobot.lib.eobot_config import EobotConfig  # noqa: E402
+from eobot.lib.eobot_pool import EobotConnectionPool  # noqa: E402
+from eobot.lib.eobot_request import EobotRequest  # noqa: E402
+from eobot.lib.eobot_endpoints import is_write_endpoint  # noqa: E402
+from eobot.lib.eobot_transport import EobotHttpClientTransport  # noqa: E402
+from eobot.tests.mock_server import MockServer, MockServerTransport, generate_fleet  # noqa: E402
+
+TRANSPORTS = ("unpooled", "pooled", "threaded", "async", "httplib", "inproc")
+
+# transports that keep several calls in flight at once, whose latencies are mostly time spent waiting for each other
+CONCURRENT_TRANSPORTS = ("threaded", "async")
+
+# positional arguments per method, chosen so that every call succeeds against the mock server's default state
+METHOD_ARGUMENTS = {
+    "exchange_coins": ("BTC", 0.0001, "ETH"),
+    "get_account_overview": (),
+    "get_balances": (),
+    "get_coin_value": ("BTC",),
+    "get_coin_values": (["BTC", "ETH"],),
+    "get_deposit_address": ("BTC",),
+    "get_exchange_estimate": ("BTC", "ETH", 1.0),
+    "get_exchange_rate": ("EUR",),
+    "get_mining_estimates": (),
+    "get_mining_mode": (),
+    "get_mining_speed": (),
+    "get_supported_coins": (),
+    "get_supported_fiat": (),
+    "get_user_id": (),
+    "manual_withdraw": ("BTC", 0.0001, "bitcoin-wallet"),
+    "set_automatic_withdraw": ("BTC", 1.0, "bitcoin-wallet"),
+    "set_mining_mode": ("BTC",),
+}
+
+# settings that must match between results and a baseline for the two to be compared
+SETTINGS = ("iterations", "repeats", "concurrency", "latency", "accounts")
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def percentile(samples, fraction):
+    """
+    Returns the nearest-rank percentile of a sorted list of samples
+
+    :param samples  : sorted samples
+    :param fraction : percentile to return, e.g. 0.95
+
+    :type samples  : list
+    :type fraction : float
+
+    :rtype : float|None
+    """
+    if len(samples) == 0:
+        return None
+
+    index = max(0, min(len(samples) - 1, int(round(fraction * len(samples) + 0.5)) - 1))
+    return samples[index]
+
+
+def summarize(latencies, errors, elapsed):
+    """
+    Returns throughput and latency statistics for one benchmark run
+
+    :param latencies : duration in seconds of every successful call
+    :param errors    : number of failed calls
+    :param elapsed   : wall-clock duration in seconds of the whole run
+
+    :type latencies : list
+    :type errors    : int
+    :type elapsed   : float
+
+    :rtype : dict
+    """
+    latencies = sorted(latencies)
+
+    return {
+        "calls": len(latencies) + errors,
+        "errors": errors,
+        "throughput": (len(latencies) + errors) / elapsed if elapsed > 0 else None,
+        "mean": sum(latencies) / len(latencies) if latencies else None,
+        "p50": percentile(latencies, 0.50),
+        "p95": percentile(latencies, 0.95),
+        "p99": percentile(latencies, 0.99),
+    }
+
+
+def combine(runs):
+    """
+    Returns the median of every statistic over repeated runs of the same benchmark, with the calls and errors of all
+    runs added up
+
+    :param runs : results of `summarize()` for every repeat
+    :type runs : list
+
+    :rtype : dict
+    """
+    combined = {
+        "calls": sum(run["calls"] for run in runs),
+        "errors": sum(run["errors"] for run in runs),
+    }
+
+    for metric in ("throughput", "mean", "p50", "p95", "p99"):
+        values = [run[metric] for run in runs if run[metric] is not None]
+        combined[metric] = statistics.median(values) if values else None
+
+    return combined
+
+
+# a response the size of a typical balances response, for the calibration workload
+_CALIBRATION_DOCUMENT = dict(("COIN{0}".format(index), "{0}.12345678".format(index)) for index in range(50))
+
+
+def calibrate(rounds=200):
+    """
+    Returns the duration in seconds of a fixed workload of JSON round trips and socket ping-pongs, to express benchmark
+    results relative to the speed of the machine they ran on
+
+    :param rounds : (Optional) Number of round trips
+    :type rounds : int
+
+    :rtype : float
+    """
+    left, right = socket.socketpair()
+
+    try:
+        started = time.perf_counter()
+        for _ in range(rounds):
+            left.sendall(json.dumps(_CALIBRATION_DOCUMENT).encode("utf-8"))
+            json.loads(right.recv(65536).decode("utf-8"))
+            right.sendall(b"ok")
+            left.recv(16)
+        return time.perf_counter() - started
+    finally:
+        left.close()
+        right.close()
+
+
+def make_config(user_id):
+    return EobotConfig().configure(user_id=user_id, email="{0}@example.com".format(user_id), password="password")
+
+
+def prepare(request, base_url):
+    return request.set_base_url(base_url).set_cache(None).set_single_flight(None).set_retry_policy(None)
+
+
+def timed_call(method, arguments, config, template):
+    started = time.perf_counter()
+    try:
+        method(*arguments, config=config, request=template.clone())
+    except Exception:
+        return None
+
+    return time.perf_counter() - started
+
+
+async def timed_call_async(method, arguments, config, template):
+    started = time.perf_counter()
+    try:
+        await method(*arguments, config=config, request=template.clone())
+    except Exception:
+        return None
+
+    return time.perf_counter() - started
+
+
+def run_sync(name, base_url, iterations, concurrency, transport, account_ids):
+    method = getattr(methods, name)
+    arguments = METHOD_ARGUMENTS[name]
+    configs = [make_config(user_id) for user_id in account_ids]
+    pool = None if transport == "unpooled" else EobotConnectionPool(pool_size=max(concurrency, 1))
+    template = prepare(EobotRequest(), base_url).set_pool(pool)
+
+    if transport == "httplib":
+        template.set_transport(EobotHttpClientTransport())
+    elif transport == "inproc":
+        template.set_transport(MockServerTransport())
+
+    started = time.perf_counter()
+    if transport == "threaded":
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(
+                lambda index: timed_call(method, arguments, configs[index % len(configs)], template),
+                range(iterations)
+            ))
+    else:
+        results = [
+            timed_call(method, arguments, configs[index % len(configs)], template) for index in range(iterations)
+        ]
+    elapsed = time.perf_counter() - started
+
+    if pool is not None:
+        pool.close()
+
+    if template.get_transport() is not None:
+        template.get_transport().close()
+
+    return results, elapsed
+
+
+def run_async(name, base_url, iterations, concurrency, account_ids):
+    method = getattr(aio, name)
+    arguments = METHOD_ARGUMENTS[name]
+    configs = [make_config(user_id) for user_id in account_ids]
+    pool = EobotAsyncConnectionPool(pool_size=max(concurrency, 1))
+    template = prepare(EobotAsyncRequest(), base_url).set_async_pool(pool)
+
+    async def run():
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call(config):
+            async with semaphore:
+                return await timed_call_async(method, arguments, config, template)
+
+        try:
+            return await asyncio.gather(*[call(configs[index % len(configs)]) for index in range(iterations)])
+        finally:
+            # pooled connections belong to this event loop, so they must be closed before it is
+            pool.close()
+
+    started = time.perf_counter()
+    results = asyncio.run(run())
+    elapsed = time.perf_counter() - started
+
+    return results, elapsed
+
+
+def run_benchmarks(iterations=200, concurrency=8, transports=TRANSPORTS, method_names=None, base_url=None, latency=0.0,
+                   accounts=None, coins=10, seed=1, repeats=5):
+    """
+    Runs the benchmarks and returns the results, keyed by transport and method name. Unless `base_url` is given, the
+    bundled mock server is started for the duration of the run. Calls are spread over all accounts the mock server
+    knows, which is a generated fleet if `accounts` is given
+
+    :param iterations   : (Optional) Number of calls per method and transport
+    :param concurrency  : (Optional) Number of calls in flight at once for the "threaded" and "async" transports
+    :param transports   : (Optional) Transports to benchmark
+    :param method_names : (Optional) Methods to benchmark, defaults to all of them
+    :param base_url     : (Optional) Base URL of an already running API (mock) server
+    :param latency      : (Optional) Seconds the mock server waits before every response
+    :param accounts     : (Optional) Number of accounts to generate, instead of the mock server's two default accounts
+    :param coins        : (Optional) Number of coins to generate, if `accounts` is given
+    :param seed         : (Optional) Seed of the generated fleet
+    :param repeats      : (Optional) Number of times to run every benchmark, the median of which is reported
+
+    :type iterations   : int
+    :type concurrency  : int
+    :type transports   : tuple|list
+    :type method_names : list|None
+    :type base_url     : str|None
+    :type latency      : float
+    :type accounts     : int|None
+    :type coins        : int
+    :type seed         : int
+    :type repeats      : int
+
+    :rtype : dict
+    """
+    fleet = None if accounts is None else generate_fleet(accounts, coins, seed)
+    MockServer.reset(fleet)
+    account_ids = [123] if base_url is not None else sorted(fleet["accounts"].keys()) if fleet else [123, 456]
+
+    server = None
+    if base_url is None:
+        server = MockServer(load_mode=True, in_process=False)
+        server.set_latency(latency or None)
+        server.start()
+        base_url = "http://localhost:{0}/api.aspx".format(server.port)
+
+    results = {}
+    calibrations = []
+
+    try:
+        for transport in transports:
+            if transport not in TRANSPORTS:
+                raise ValueError("Invalid transport, must be one of: {0}".format(", ".join(TRANSPORTS)))
+
+            if transport == "inproc" and server is None:
+                raise ValueError("Invalid transport, inproc only works with the bundled mock server")
+
+            results[transport] = {}
+
+            for name in sorted(METHOD_ARGUMENTS.keys()) if method_names is None else method_names:
+                runs = []
+
+                for _ in range(repeats):
+                    calibrations.append(calibrate())
+
+                    if transport == "async":
+                        samples, elapsed = run_async(name, base_url, iterations, concurrency, account_ids)
+                    else:
+                        samples, elapsed = run_sync(name, base_url, iterations, concurrency, transport, account_ids)
+
+                    # write methods change the mock server's state, so start every run from the same state
+                    if is_write_endpoint(name):
+                        MockServer.reset(fleet)
+
+                    latencies = [sample for sample in samples if sample is not None]
+                    runs.append(summarize(latencies, len(samples) - len(latencies), elapsed))
+
+                results[transport][name] = combine(runs)
+    finally:
+        if server is not None:
+            server.stop()
+        MockServer.reset()
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "iterations": iterations,
+        "repeats": repeats,
+        "concurrency": concurrency,
+        "latency": latency,
+        "accounts": len(account_ids),
+        "calibration": statistics.median(calibrations) if calibrations else None,
+        "results": results,
+    }
+
+
+def get_mismatched_settings(results, baseline):
+    """
+    Returns the names of the settings that differ between `results` and `baseline`, which cannot be compared at all
+    unless this is empty
+
+    :param results  : results of `run_benchmarks()`
+    :param baseline : stored results of an earlier `run_benchmarks()`
+
+    :type results  : dict
+    :type baseline : dict
+
+    :rtype : list
+    """
+    return [name for name in SETTINGS if results.get(name) != baseline.get(name)]
+
+
+def is_comparable(results, baseline):
+    """
+    Returns whether the timings of `results` can be compared against `baseline`, which requires both to carry a
+    calibration
+
+    :param results  : results of `run_benchmarks()`
+    :param baseline : stored results of an earlier `run_benchmarks()`
+
+    :type results  : dict
+    :type baseline : dict
+
+    :rtype : bool
+    """
+    return bool(results.get("calibration")) and bool(baseline.get("calibration"))
+
+
+def compare(results, baseline, tolerance=0.25, noise_floor=0.002):
+    """
+    Compares benchmark results against a baseline and returns the regressions: a median latency that grew, or a
+    throughput that shrank, by more than `tolerance`, after scaling the baseline by how much faster or slower the
+    calibration ran. A timing must also have grown by more than `noise_floor` seconds, per call for throughput, to
+    count. Timings are not compared at all unless both sides have a calibration, see `is_comparable()`. Transports and
+    methods missing from either side are ignored.
+
+    Only throughput is compared for the concurrent transports, and tail latencies are not compared at all: they depend
+    on how calls happened to queue up behind each other, and vary far more between runs than any regression worth
+    failing on
+
+    :param results     : results of `run_benchmarks()`
+    :param baseline    : stored results of an earlier `run_benchmarks()`, with the same settings
+    :param tolerance   : (Optional) Allowed relative change, e.g. 0.25 for 25%
+    :param noise_floor : (Optional) Change in seconds below which a timing never counts as a regression
+
+    :type results     : dict
+    :type baseline    : dict
+    :type tolerance   : float
+    :type noise_floor : float
+
+    :returns list : (transport, method, metric, baseline value scaled to this machine, current value) tuples
+    :rtype : list
+    """
+    mismatched = get_mismatched_settings(results, baseline)
+    if mismatched:
+        raise ValueError("Invalid baseline, recorded with different settings: {0}".format(", ".join(mismatched)))
+
+    regressions = []
+    comparable = is_comparable(results, baseline)
+    speed = results["calibration"] / baseline["calibration"] if comparable else None
+
+    for transport, current_methods in results["results"].items():
+        baseline_methods = baseline.get("results", {}).get(transport, {})
+
+        for name, current in current_methods.items():
+            previous = baseline_methods.get(name)
+            if previous is None:
+                continue
+
+            if comparable and transport not in CONCURRENT_TRANSPORTS and previous["p50"] and current["p50"]:
+                expected = previous["p50"] * speed
+                if current["p50"] > expected * (1 + tolerance) and current["p50"] - expected > noise_floor:
+                    regressions.append((transport, name, "p50", expected, current["p50"]))
+
+            if comparable and previous["throughput"] and current["throughput"]:
+                expected = previous["throughput"] / speed
+                if current["throughput"] < expected * (1 - tolerance) \
+                        and 1.0 / current["throughput"] - 1.0 / expected > noise_floor:
+                    regressions.append((transport, name, "throughput", expected, current["throughput"]))
+
+            if current["errors"] > previous["errors"]:
+                regressions.append((transport, name, "errors", previous["errors"], current["errors"]))
+
+    return regressions
+
+
+def format_results(results):
+    lines = ["{0:<10} {1:<24} {2:>10} {3:>9} {4:>9} {5:>9} {6:>7}".format(
+        "transport", "method", "calls/s", "p50 ms", "p95 ms", "p99 ms", "errors"
+    )]
+
+    for transport in TRANSPORTS:
+        for name, stats in sorted(results["results"].get(transport, {}).items()):
+            lines.append("{0:<10} {1:<24} {2:>10.1f} {3:>9.2f} {4:>9.2f} {5:>9.2f} {6:>7}".format(
+                transport, name, stats["throughput"] or 0.0, (stats["p50"] or 0.0) * 1000,
+                (stats["p95"] or 0.0) * 1000, (stats["p99"] or 0.0) * 1000, stats["errors"]
+            ))
+
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Eobot API methods against the bundled mock server")
+    parser.add_argument("--iterations", type=int, default=200, help="calls per method and transport")
+    parser.add_argument("--concurrency", type=int, default=8, help="calls in flight for threaded and async transports")
+    parser.add_argument("--transport", action="append", choices=TRANSPORTS, help="transport to run, can be repeated")
+    parser.add_argument("--method", action="append", choices=sorted(METHOD_ARGUMENTS.keys()),
+                        help="method to run, can be repeated")
+    parser.add_argument("--base-url", help="use an already running server instead of the bundled mock server")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds the mock server waits before responding")
+    parser.add_argument("--accounts", type=int, help="generate a fleet of this many accounts to spread calls over")
+    parser.add_argument("--coins", type=int, default=10, help="number of coins in the generated fleet (default 10)")
+    parser.add_argument("--seed", type=int, default=1, help="seed of the generated fleet (default 1)")
+    parser.add_argument("--repeats", type=int, default=5, help="runs per benchmark, the median is reported (default 5)")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", help="compare the results against this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative regression (default 0.25)")
+    parser.add_argument("--noise-floor", type=float, default=0.002,
+                        help="seconds a timing must grow by to count as a regression (default 0.002)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="store the results as the new baseline ({0})".format(DEFAULT_BASELINE))
+    arguments = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        iterations=arguments.iterations,
+        concurrency=arguments.concurrency,
+        transports=arguments.transport or TRANSPORTS,
+        method_names=arguments.method,
+        base_url=arguments.base_url,
+        latency=arguments.latency,
+        accounts=arguments.accounts,
+        coins=arguments.coins,
+        seed=arguments.seed,
+        repeats=arguments.repeats,
+    )
+
+    print(format_results(results))
+
+    for path in [arguments.output, DEFAULT_BASELINE if arguments.save_baseline else None]:
+        if path is not None:
+            with open(path, "w") as f:
+                json.dump(results, f, indent=2, sort_keys=True)
+                f.write("\n")
+
+    if arguments.baseline is None:
+        return 0
+
+    with open(arguments.baseline) as f:
+        baseline = json.load(f)
+
+    mismatched = get_mismatched_settings(results, baseline)
+    if mismatched:
+        print("{0} was recorded with different settings ({1}), not comparing".format(
+            arguments.baseline, ", ".join(mismatched)
+        ))
+        return 2
+
+    if not is_comparable(results, baseline):
+        print("{0} has no calibration, only comparing errors".format(arguments.baseline))
+
+    regressions = compare(results, baseline, arguments.tolerance, arguments.noise_floor)
+    for transport, name, metric, previous, current in regressions:
+        print("REGRESSION {0} {1} {2}: {3:.6g} -> {4:.6g}".format(transport, name, metric, previous, current))
+
+    if len(regressions) == 0:
+        print("No regressions against {0}".format(arguments.baseline))
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
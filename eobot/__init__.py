@@ -1,5 +1,26 @@
 from .lib.eobot_config import get_config
 from .lib.eobot_errors import NoUserIdError, NoPasswordOrTokenError
+from .lib.eobot_executor import submit
 
-from .methods import *
+from . import methods
 from ._version import __version__, __version_info__
+
+__all__ = ["get_config", "NoUserIdError", "NoPasswordOrTokenError", "submit", "EobotClient"] + methods.__all__
+
+
+def __getattr__(name):
+    # the API methods are imported from `eobot.methods` on first use, see `eobot.lib.eobot_lazy`, and so is the client,
+    # which imports all of them
+    if name == "EobotClient":
+        from .lib.eobot_client import EobotClient as value
+    elif name in methods.__all__:
+        value = getattr(methods, name)
+    else:
+        raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals().keys()) | set(__all__))
@@ -0,0 +1,24 @@
+from ..lib.eobot_lazy import make_lazy_methods
+
+# every method lives in the submodule with the same name, which is only imported when the method is first used
+__all__ = [
+    "exchange_coins",
+    "get_account_overview",
+    "get_balances",
+    "get_coin_value",
+    "get_coin_values",
+    "get_deposit_address",
+    "get_exchange_estimate",
+    "get_exchange_rate",
+    "get_mining_estimates",
+    "get_mining_mode",
+    "get_mining_speed",
+    "get_supported_coins",
+    "get_supported_fiat",
+    "get_user_id",
+    "manual_withdraw",
+    "set_automatic_withdraw",
+    "set_mining_mode",
+]
+
+__getattr__, __dir__ = make_lazy_methods(__name__)
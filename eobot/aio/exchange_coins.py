@@ -0,0 +1,42 @@
+from ..lib.eobot_async_request import EobotAsyncRequest
+from ..lib.eobot_operation import run_operation_async
+from ..methods.exchange_coins import operation
+
+
+async def perform_request(from_coin, amount, to_coin, config=None, request=None, verification=None,
+                          prior_balances=None):
+    """
+    Exchanges `amount` `from_coin` to `to_coin` (note: Eobot will withhold a percentage as fee when doing this)
+
+    :param from_coin : Cryptocurrency to exchange from
+    :type from_coin : str
+
+    :param amount : Amount to exchange
+    :type amount : int|float
+
+    :param to_coin : Cryptocurrency to exchange to
+    :type to_coin : str
+
+    :param config : (Optional) Configuration to use, will default to the global config if not provided
+    :type config : EobotConfig|str|None
+
+    :param request : (Optional) Request object to use, will default to a new one if not provided
+    :type request : EobotAsyncRequest|None
+
+    :param verification : (Optional) How to check that the exchange took effect, defaults to the config's verification
+                          mode, see `eobot_verification.VERIFICATION_MODES`
+    :type verification : str|None
+
+    :param prior_balances : (Optional) Balances before the exchange, to verify against instead of reading them first
+    :type prior_balances : dict|None
+
+    :rtype : bool
+    """
+    if request is None:
+        request = EobotAsyncRequest()
+    elif not isinstance(request, EobotAsyncRequest):
+        raise ValueError("Invalid request, must be a EobotAsyncRequest")
+
+    return await run_operation_async(
+        operation(from_coin, amount, to_coin, config, request.get_base_url(), verification, prior_balances), request
+    )
@@ -0,0 +1,28 @@
+from ..lib.eobot_async_request import EobotAsyncRequest
+from ..lib.eobot_operation import run_operation_async
+from ..methods.get_account_overview import operation
+
+
+async def perform_request(config=None, request=None):
+    """
+    Retrieves the balances, mining mode, mining speed and mining estimates for the current user, performing the four
+    API calls concurrently once the user ID is known. A call that fails does not fail the others: its value is None,
+    and the exception it raised is reported under its name in "errors"
+
+    :param config : (Optional) Configuration to use, will default to the global config if not provided
+    :type config : EobotConfig|str|None
+
+    :param request : (Optional) Request object to use as a template for all API calls, will default to a new one if not
+                     provided
+    :type request : EobotAsyncRequest|None
+
+    :returns dict : {"balances": dict, "mining_mode": str, "mining_speed": dict, "mining_estimates": dict,
+                    "errors": {name: Exception}}
+    :rtype : dict
+    """
+    if request is None:
+        request = EobotAsyncRequest()
+    elif not isinstance(request, EobotAsyncRequest):
+        raise ValueError("Invalid request, must be a EobotAsyncRequest")
+
+    return await run_operation_async(operation(config, request.get_base_url()), request)
@@ -0,0 +1,32 @@
+from ..lib.eobot_async_request import EobotAsyncRequest
+from ..lib.eobot_operation import run_operation_async
+from ..methods.get_coin_value import operation
+
+
+# noinspection PyUnusedLocal
+async def perform_request(coin, config=None, request=None, snapshot=None):
+    """
+    Retrieves the current value for `coin` in US dollar. 1 `coin` equals {result} US dollar
+
+    :param coin : Cryptocurrency to retrieve value for
+    :type coin : str
+
+    :param config : Not used for this request, since this API method does not require authentication
+    :type config : EobotConfig|str|None
+
+    :param request : (Optional) Request object to use, will default to a new one if not provided
+    :type request : EobotAsyncRequest|None
+
+    :param snapshot : (Optional) Set to True to read the value from the `get_supported_coins` result instead of
+                      requesting it separately, which lets many lookups share a single (cached) API call, or provide an
+                      earlier `get_supported_coins` result to read the value from
+    :type snapshot : dict|bool|None
+
+    :rtype : float
+    """
+    if request is None:
+        request = EobotAsyncRequest()
+    elif not isinstance(request, EobotAsyncRequest):
+        raise ValueError("Invalid request, must be a EobotAsyncRequest")
+
+    return await run_operation_async(operation(coin, snapshot), request)
@@ -0,0 +1,32 @@
+from ..lib.eobot_async_request import EobotAsyncRequest
+from ..lib.eobot_operation import run_operation_async
+from ..methods.get_coin_values import operation
+
+
+# noinspection PyUnusedLocal
+async def perform_request(coins, config=None, request=None, snapshot=None):
+    """
+    Retrieves the current values for all `coins` in US dollar, using at most a single API call. 1 coin equals {result}
+    US dollar
+
+    :param coins : Cryptocurrencies to retrieve values for
+    :type coins : list|tuple
+
+    :param config : Not used for this request, since this API method does not require authentication
+    :type config : EobotConfig|str|None
+
+    :param request : (Optional) Request object to use, will default to a new one if not provided
+    :type request : EobotAsyncRequest|None
+
+    :param snapshot : (Optional) Result of an earlier `get_supported_coins` call to read the values from, instead of
+                      performing an API call
+    :type snapshot : dict|None
+
+    :rtype : dict
+    """
+    if request is None:
+        request = EobotAsyncRequest()
+    elif not isinstance(request, EobotAsyncRequest):
+        raise ValueError("Invalid request, must be a EobotAsyncRequest")
+
+    return await run_operation_async(operation(coins, snapshot), request)
@@ -0,0 +1,26 @@
+from ..lib.eobot_async_request import EobotAsyncRequest
+from ..lib.eobot_operation import run_operation_async
+from ..methods.get_deposit_address import operation
+
+
+async def perform_request(coin, config=None, request=None):
+    """
+    Retrieves the deposit wallet address for the given cryptocurrency for the current user
+
+    :param coin : Cryptocurrency to get wallet address for
+    :type coin : str
+
+    :param config : (Optional) Configuration to use, will default to the global config if not provided
+    :type config : EobotConfig|str|None
+
+    :param request : (Optional) Request object to use, will default to a new one if not provided
+    :type request : EobotAsyncRequest|None
+
+    :rtype : str
+    """
+    if request is None:
+        request = EobotAsyncRequest()
+    elif not isinstance(request, EobotAsyncRequest):
+        raise ValueError("Invalid request, must be a EobotAsyncRequest")
+
+    return await run_operation_async(operation(coin, config, request.get_base_url()), request)
@@ -0,0 +1,33 @@
+from ..lib.eobot_async_request import EobotAsyncRequest
+from ..lib.eobot_operation import run_operation_async
+from ..methods.get_exchange_estimate import operation
+
+
+# noinspection PyUnusedLocal
+async def perform_request(from_coin, to_coin, amount, config=None, request=None):
+    """
+    Retrieves the estimated amount of `to_coin` you'd get for `amount` `from_coin`
+
+    :param from_coin : Cryptocurrency to exchange from
+    :type from_coin : str
+
+    :param to_coin : Cryptocurrency to exchange to
+    :type to_coin : str
+
+    :param amount : Amount to exchange
+    :type amount : float|int
+
+    :param config : Not used for this request, since this API method does not require authentication
+    :type config : EobotConfig|str|None
+
+    :param request : (Optional) Request object to use, will default to a new one if not provided
+    :type request : EobotAsyncRequest|None
+
+    :rtype : float
+    """
+    if request is None:
+        request = EobotAsyncRequest()
+    elif not isinstance(request, EobotAsyncRequest):
+        raise ValueError("Invalid request, must be a EobotAsyncRequest")
+
+    return await run_operation_async(operation(from_coin, to_coin, amount), request)
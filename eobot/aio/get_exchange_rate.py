@@ -0,0 +1,27 @@
+from ..lib.eobot_async_request import EobotAsyncRequest
+from ..lib.eobot_operation import run_operation_async
+from ..methods.get_exchange_rate import operation
+
+
+# noinspection PyUnusedLocal
+async def perform_request(currency, config=None, request=None):
+    """
+    Retrieves the current exchange rate from `currency` to US dollar. 1 US dollar equals {result} `currency`
+
+    :param currency : Currency to retrieve exchange rate for
+    :type currency : str
+
+    :param config : Not used for this request, since this API method does not require authentication
+    :type config : EobotConfig|str|None
+
+    :param request : (Optional) Request object to use, will default to a new one if not provided
+    :type request : EobotAsyncRequest|None
+
+    :rtype : str
+    """
+    if request is None:
+        request = EobotAsyncRequest()
+    elif not isinstance(request, EobotAsyncRequest):
+        raise ValueError("Invalid request, must be a EobotAsyncRequest")
+
+    return await run_operation_async(operation(currency), request)
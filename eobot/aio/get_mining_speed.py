@@ -0,0 +1,27 @@
+from ..lib.eobot_async_request import EobotAsyncRequest
+from ..lib.eobot_operation import run_operation_async
+from ..methods.get_mining_speed import operation
+
+
+async def perform_request(config=None, request=None, compact=False):
+    """
+    Retrieves the current mining speeds for the current user
+
+    :param config : (Optional) Configuration to use, will default to the global config if not provided
+    :type config : EobotConfig|str|None
+
+    :param request : (Optional) Request object to use, will default to a new one if not provided
+    :type request : EobotAsyncRequest|None
+
+    :param compact : (Optional) Set to True to return an `EobotAmounts`, which takes far less memory than a dict and
+                     converts values to float when they are first read
+    :type compact : bool
+
+    :rtype : dict|EobotAmounts
+    """
+    if request is None:
+        request = EobotAsyncRequest()
+    elif not isinstance(request, EobotAsyncRequest):
+        raise ValueError("Invalid request, must be a EobotAsyncRequest")
+
+    return await run_operation_async(operation(config, request.get_base_url(), compact), request)
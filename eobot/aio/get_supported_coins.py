@@ -0,0 +1,32 @@
+from ..lib.eobot_async_request import EobotAsyncRequest
+from ..lib.eobot_operation import run_operation_async
+from ..methods.get_supported_coins import operation
+
+
+# noinspection PyUnusedLocal
+async def perform_request(config=None, request=None, compact=False, fields=None):
+    """
+    Retrieves the current values in US dollar for all supported cryptocurrencies. 1 coin equals {result} US dollar.
+
+    :param config : Not used for this request, since this API method does not require authentication
+    :type config : EobotConfig|str|None
+
+    :param request : (Optional) Request object to use, will default to a new one if not provided
+    :type request : EobotAsyncRequest|None
+
+    :param compact : (Optional) Set to True to return an `EobotCoinTable`, which takes far less memory than a dict of
+                     dicts and converts prices to float when they are first read
+    :type compact : bool
+
+    :param fields : (Optional) Fields to keep for every coin in a compact result, defaults to all fields but "Image" and
+                    "BigImage"
+    :type fields : tuple|list|None
+
+    :rtype : dict|EobotCoinTable
+    """
+    if request is None:
+        request = EobotAsyncRequest()
+    elif not isinstance(request, EobotAsyncRequest):
+        raise ValueError("Invalid request, must be a EobotAsyncRequest")
+
+    return await run_operation_async(operation(compact, fields), request)
@@ -0,0 +1,24 @@
+from ..lib.eobot_async_request import EobotAsyncRequest
+from ..lib.eobot_operation import run_operation_async
+from ..methods.get_supported_fiat import operation
+
+
+# noinspection PyUnusedLocal
+async def perform_request(config=None, request=None):
+    """
+    Retrieves the current exchange rates for all supported currencies to US dollar. 1 US dollar equals {result} currency
+
+    :param config : Not used for this request, since this API method does not require authentication
+    :type config : EobotConfig|str|None
+
+    :param request : (Optional) Request object to use, will default to a new one if not provided
+    :type request : EobotAsyncRequest|None
+
+    :rtype : dict
+    """
+    if request is None:
+        request = EobotAsyncRequest()
+    elif not isinstance(request, EobotAsyncRequest):
+        raise ValueError("Invalid request, must be a EobotAsyncRequest")
+
+    return await run_operation_async(operation(), request)
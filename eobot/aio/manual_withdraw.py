@@ -0,0 +1,42 @@
+from ..lib.eobot_async_request import EobotAsyncRequest
+from ..lib.eobot_operation import run_operation_async
+from ..methods.manual_withdraw import operation
+
+
+async def perform_request(coin, amount, wallet_address, config=None, request=None, verification=None,
+                          prior_balances=None):
+    """
+    Immediately withdraws `amount` `coin` to `wallet_address`
+
+    :param coin : Cryptocurrency to withdraw
+    :type coin : str
+
+    :param amount : Amount to withdraw
+    :type amount : int|float
+
+    :param wallet_address : Wallet address to withdraw funds to
+    :type wallet_address : str
+
+    :param config : (Optional) Configuration to use, will default to the global config if not provided
+    :type config : EobotConfig|str|None
+
+    :param request : (Optional) Request object to use, will default to a new one if not provided
+    :type request : EobotAsyncRequest|None
+
+    :param verification : (Optional) How to check that the withdrawal took effect, defaults to the config's
+                          verification mode, see `eobot_verification.VERIFICATION_MODES`
+    :type verification : str|None
+
+    :param prior_balances : (Optional) Balances before the withdrawal, to verify against instead of reading them first
+    :type prior_balances : dict|None
+
+    :rtype : bool
+    """
+    if request is None:
+        request = EobotAsyncRequest()
+    elif not isinstance(request, EobotAsyncRequest):
+        raise ValueError("Invalid request, must be a EobotAsyncRequest")
+
+    return await run_operation_async(
+        operation(coin, amount, wallet_address, config, request.get_base_url(), verification, prior_balances), request
+    )
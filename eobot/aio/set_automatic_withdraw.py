@@ -0,0 +1,34 @@
+from ..lib.eobot_async_request import EobotAsyncRequest
+from ..lib.eobot_operation import run_operation_async
+from ..methods.set_automatic_withdraw import operation
+
+
+async def perform_request(coin, on_amount, wallet_address, config=None, request=None):
+    """
+    Sets the withdraw settings for `coin` to automatically withdraw to `wallet_address` when `on_amount` is reached
+
+    :param coin : Cryptocurrency to configure
+    :type coin : str
+
+    :param on_amount : Threshold to reach for automatic withdrawal
+    :type on_amount : int|float
+
+    :param wallet_address : Wallet address to withdraw funds to
+    :type wallet_address : str
+
+    :param config : (Optional) Configuration to use, will default to the global config if not provided
+    :type config : EobotConfig|str|None
+
+    :param request : (Optional) Request object to use, will default to a new one if not provided
+    :type request : EobotAsyncRequest|None
+
+    :rtype : bool
+    """
+    if request is None:
+        request = EobotAsyncRequest()
+    elif not isinstance(request, EobotAsyncRequest):
+        raise ValueError("Invalid request, must be a EobotAsyncRequest")
+
+    return await run_operation_async(
+        operation(coin, on_amount, wallet_address, config, request.get_base_url()), request
+    )
@@ -0,0 +1,30 @@
+from ..lib.eobot_async_request import EobotAsyncRequest
+from ..lib.eobot_operation import run_operation_async
+from ..methods.set_mining_mode import operation
+
+
+async def perform_request(mode, config=None, request=None, verification=None):
+    """
+    Changes the mining mode to the cryptocurrency specified
+
+    :param mode : Mining mode to set
+    :type mode : str
+
+    :param config : (Optional) Configuration to use, will default to the global config if not provided
+    :type config : EobotConfig|str|None
+
+    :param request : (Optional) Request object to use, will default to a new one if not provided
+    :type request : EobotAsyncRequest|None
+
+    :param verification : (Optional) How to check that the mining mode changed, defaults to the config's verification
+                          mode, see `eobot_verification.VERIFICATION_MODES`
+    :type verification : str|None
+
+    :rtype : bool
+    """
+    if request is None:
+        request = EobotAsyncRequest()
+    elif not isinstance(request, EobotAsyncRequest):
+        raise ValueError("Invalid request, must be a EobotAsyncRequest")
+
+    return await run_operation_async(operation(mode, config, request.get_base_url(), verification), request)
@@ -0,0 +1,435 @@
+import asyncio
+import ssl
+import time
+
+from .eobot_endpoints import get_endpoint, get_request_key, get_request_user_id, is_idempotent_endpoint
+from .eobot_errors import EobotCircuitOpenError, EobotConnectionError, EobotRequestError, EobotResponseError
+from .eobot_instrumentation import EobotRequestEvent, notify_observers
+from .eobot_request import EobotRequest
+
+
+class EobotAsyncConnectionPool(object):
+    """
+    Keeps idle keep-alive connections around for reuse by `EobotAsyncRequest`. Connections are bound to the event loop
+    that opened them, so idle connections are tracked per loop, then per scheme, host and port. A loop's idle
+    connections are closed when `asyncio.run()` shuts the loop down, and dropped once the loop is found closed
+    """
+    def __init__(self, pool_size=10):
+        """
+        :param pool_size : (Optional) Maximum number of idle connections to keep open per host
+        :type pool_size  : int
+        """
+        super(EobotAsyncConnectionPool, self).__init__()
+
+        if not isinstance(pool_size, int) or isinstance(pool_size, bool) or pool_size < 1:
+            raise ValueError("Invalid pool_size, must be a positive int")
+
+        self._pool_size = pool_size
+        self._loops = {}
+
+    def get_pool_size(self):
+        """
+        Returns the maximum number of idle connections kept open per host
+
+        :rtype : int
+        """
+        return self._pool_size
+
+    async def acquire(self, scheme, host, port, ssl_context=None):
+        """
+        Returns an idle connection for the given host if there is one, or opens a new one using `ssl_context`
+
+        :returns tuple : (reader, writer, reused)
+        :rtype : tuple
+        """
+        connections = self._loops.get(asyncio.get_running_loop())
+        idle = connections[0].get((scheme, host, port)) if connections is not None else None
+
+        while idle:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+
+        reader, writer = await asyncio.open_connection(host, port, ssl=ssl_context)
+        return reader, writer, False
+
+    def release(self, scheme, host, port, reader, writer):
+        """
+        Returns a connection to the pool after its response has been read completely
+        """
+        loop = asyncio.get_running_loop()
+        connections = self._loops.get(loop)
+
+        if connections is None:
+            self._drop_closed_loops()
+
+            # waits for the loop to cancel it on shutdown, as `asyncio.run()` does, to close the idle connections while
+            # the loop can still run their closing handshake. Loops closed without cancelling their tasks leave it
+            # pending, which is expected, as asyncio does for its own helper tasks
+            closer = loop.create_task(self._close_on_shutdown(loop))
+            closer._log_destroy_pending = False
+            connections = self._loops[loop] = ({}, closer)
+
+        idle = connections[0].setdefault((scheme, host, port), [])
+
+        if len(idle) >= self._pool_size or writer.is_closing():
+            writer.close()
+            return
+
+        idle.append((reader, writer))
+
+    async def _close_on_shutdown(self, loop):
+        try:
+            await loop.create_future()
+        finally:
+            connections = self._loops.pop(loop, None)
+            if connections is not None:
+                self._close_connections(connections[0])
+
+    def _drop_closed_loops(self):
+        for loop in [loop for loop in self._loops if loop.is_closed()]:
+            # the connections cannot be closed cleanly anymore, they are closed when garbage collected
+            self._loops.pop(loop, None)
+
+    @staticmethod
+    def _close_connections(idle):
+        for connections in idle.values():
+            for reader, writer in connections:
+                writer.close()
+
+    def close(self):
+        """
+        Closes all idle connections
+        """
+        loops, self._loops = self._loops, {}
+
+        for loop, (idle, closer) in loops.items():
+            if loop.is_closed():
+                continue
+
+            closer.cancel()
+            self._close_connections(idle)
+
+
+_async_pool = EobotAsyncConnectionPool()
+
+# SSL contexts by whether they validate certificates, creating one loads the system's CA certificates, which takes far
+# longer than the request itself
+_ssl_contexts = {}
+
+
+def get_async_pool():
+    """
+    Returns the process-wide `EobotAsyncConnectionPool` that is used by default for all asynchronous API calls
+
+    :rtype : EobotAsyncConnectionPool
+    """
+    return _async_pool
+
+
+class EobotAsyncRequest(EobotRequest):
+    """
+    Asyncio counterpart of `EobotRequest`, performing API requests over non-blocking keep-alive connections
+    """
+    def __init__(self):
+        super(EobotAsyncRequest, self).__init__()
+
+        self._async_pool = get_async_pool()
+
+    def set_async_pool(self, pool):
+        """
+        Sets the connection pool to use for the request
+
+        :param pool : connection pool to use, can be None to open a new connection for every request
+        :type pool : EobotAsyncConnectionPool|None
+
+        :returns EobotAsyncRequest : the current instance, for easy method chaining
+        :rtype : EobotAsyncRequest
+        """
+        if pool is not None and not isinstance(pool, EobotAsyncConnectionPool):
+            raise ValueError("Invalid pool, must be a EobotAsyncConnectionPool or None")
+
+        self._async_pool = pool
+        return self
+
+    def get_async_pool(self):
+        """
+        Returns the connection pool used for the request
+
+        :rtype : EobotAsyncConnectionPool|None
+        """
+        return self._async_pool
+
+    def clone(self):
+        """
+        Creates a new request object with the same properties as this one
+
+        :rtype : EobotAsyncRequest
+        """
+        clone = super(EobotAsyncRequest, self).clone()
+        clone.set_async_pool(self.get_async_pool())
+
+        return clone
+
+    async def perform_request(self, parameters=None, fresh=False):
+        """
+        Performs the API request and returns the response value
+
+        :param parameters : (Optional) parameters of this call, added to (or overriding) the request's own parameters
+        :type parameters : dict|None
+
+        :param fresh : (Optional) Set to True to send the request to the API even if its response is cached or an
+                       identical request is in flight, e.g. to verify a write. The response is still cached
+        :type fresh : bool
+
+        :rtype : dict
+        """
+        parameters = self._merge_parameters(parameters)
+
+        endpoint = get_endpoint(parameters)
+        observers = self._observers
+
+        if len(observers) == 0:
+            return await self._perform(endpoint, parameters, fresh, None)
+
+        event = EobotRequestEvent(endpoint, self.get_base_url(), parameters)
+        notify_observers(observers, "before_request", event)
+        started = time.perf_counter()
+
+        try:
+            return await self._perform(endpoint, parameters, fresh, event)
+        except BaseException as e:
+            event.error = e
+            raise
+        finally:
+            event.latency = time.perf_counter() - started
+            notify_observers(observers, "after_request", event)
+
+    async def _perform(self, endpoint, parameters, fresh, event):
+        cache = self._get_active_cache(endpoint)
+        single_flight = None if fresh else self._get_active_single_flight(endpoint)
+
+        if cache is not None or single_flight is not None:
+            key = get_request_key(self.get_base_url(), parameters)
+
+        if cache is not None and not fresh:
+            hit, result = cache.lookup(key)
+            if hit:
+                if event is not None:
+                    event.cached = True
+                return result
+
+        if single_flight is None:
+            result = await self._send_with_retries(endpoint, parameters, event)
+        else:
+            sent = []
+
+            def send():
+                sent.append(True)
+                return self._send_with_retries(endpoint, parameters, event)
+
+            result = await single_flight.do_async(key, send)
+
+            if event is not None and len(sent) == 0:
+                event.coalesced = True
+
+        if cache is not None:
+            cache.store(key, endpoint, result)
+
+        return result
+
+    async def _send_with_retries(self, endpoint, parameters, event):
+        retry_policy = self._retry_policy
+        rate_limiter = self._rate_limiter
+        circuit_breaker = self._circuit_breaker
+        user_id = get_request_user_id(parameters)
+        attempt = 0
+        started = time.monotonic()
+
+        while True:
+            if rate_limiter is not None:
+                await rate_limiter.acquire_async(self.get_base_url(), user_id)
+
+            if circuit_breaker is not None and not circuit_breaker.allow_request():
+                raise EobotCircuitOpenError("Circuit breaker is open, not contacting {0}".format(self.get_base_url()))
+
+            answered = False
+            try:
+                status, body = await self._fetch(parameters)
+                answered = True
+
+                if event is not None:
+                    event.status = status
+                    event.bytes += len(body)
+
+                result = self._parse_response(status, body)
+            except BaseException as e:
+                if circuit_breaker is not None:
+                    if circuit_breaker.is_failure(e):
+                        circuit_breaker.record_failure()
+                    elif isinstance(e, Exception) and (answered or isinstance(e, EobotResponseError)):
+                        circuit_breaker.record_success()
+                    else:
+                        # e.g. a cancelled or interrupted request, which shows nothing about whether the API works
+                        circuit_breaker.release()
+
+                if not isinstance(e, EobotRequestError) or retry_policy is None \
+                        or not retry_policy.should_retry(endpoint, e, attempt, time.monotonic() - started):
+                    raise
+
+                await asyncio.sleep(retry_policy.get_delay(attempt))
+                attempt += 1
+
+                if event is not None:
+                    event.retries = attempt
+
+                continue
+
+            if circuit_breaker is not None:
+                circuit_breaker.record_success()
+
+            if retry_policy is not None:
+                retry_policy.record_success()
+
+            return result
+
+    def set_transport(self, transport):
+        """
+        Sets the transport that sends the request with `EobotTransport.send_async()`, which runs the synchronous
+        transports on the event loop's default executor
+
+        :param transport : transport to use, can be None to use non-blocking connections from the connection pool
+        :type transport : EobotTransport|None
+
+        :returns EobotAsyncRequest : the current instance, for easy method chaining
+        :rtype : EobotAsyncRequest
+        """
+        return super(EobotAsyncRequest, self).set_transport(transport)
+
+    async def _fetch(self, parameters):
+        if self._transport is not None:
+            return await self._transport.send_async(self, parameters)
+
+        scheme, host, port = self._address
+        if scheme not in ("http", "https"):
+            raise ValueError("Invalid base_url, must be an http or https URL")
+
+        target = self.get_target(parameters)
+
+        host_header = host if port is None else "{0}:{1}".format(host, port)
+        if port is None:
+            port = 443 if scheme == "https" else 80
+        message = (
+            "GET {0} HTTP/1.1\r\n"
+            "Host: {1}\r\n"
+            "User-Agent: {2}\r\n"
+            "Accept: */*\r\n"
+            "Accept-Encoding: identity\r\n"
+            "Connection: {3}\r\n"
+            "\r\n"
+        ).format(target, host_header, self.get_user_agent(), "close" if self._async_pool is None else "keep-alive")
+
+        idempotent = is_idempotent_endpoint(get_endpoint(parameters))
+
+        try:
+            status, body = await asyncio.wait_for(
+                self._exchange(scheme, host, port, message.encode("latin-1"), idempotent),
+                self.get_timeout()
+            )
+        except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError) as e:
+            raise EobotConnectionError("Unable to reach the API: {0!r}".format(e))
+
+        return status, body
+
+    async def _exchange(self, scheme, host, port, message, idempotent):
+        pool = self._async_pool
+        context = self._ssl_context() if scheme == "https" else None
+
+        if pool is None:
+            reader, writer = await asyncio.open_connection(host, port, ssl=context)
+            reused = False
+        else:
+            reader, writer, reused = await pool.acquire(scheme, host, port, context)
+
+        try:
+            writer.write(message)
+            await writer.drain()
+            status, body, reusable = await self._read_response(reader)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            writer.close()
+            if not reused or not idempotent:
+                raise
+
+            # an idle pooled connection was closed by the server in the meantime, so try once on a fresh connection.
+            # Write calls are not repeated, the server may have received them before the connection broke
+            reader, writer = await asyncio.open_connection(host, port, ssl=context)
+            try:
+                writer.write(message)
+                await writer.drain()
+                status, body, reusable = await self._read_response(reader)
+            except BaseException:
+                writer.close()
+                raise
+        except BaseException:
+            writer.close()
+            raise
+
+        if pool is not None and reusable:
+            pool.release(scheme, host, port, reader, writer)
+        else:
+            writer.close()
+
+        return status, body
+
+    def _ssl_context(self):
+        validate_ssl = self.get_validate_ssl()
+
+        context = _ssl_contexts.get(validate_ssl)
+        if context is None:
+            context = ssl.create_default_context()
+            if not validate_ssl:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+
+            context = _ssl_contexts.setdefault(validate_ssl, context)
+
+        return context
+
+    @staticmethod
+    async def _read_response(reader):
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Connection closed before a response was received")
+
+        version, status = status_line.decode("latin-1").split(None, 2)[:2]
+        status = int(status)
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        reusable = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0].strip(), 16)
+                if size == 0:
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            body = b"".join(chunks)
+        elif "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+        else:
+            body = await reader.read()
+            reusable = False
+
+        return status, body, reusable
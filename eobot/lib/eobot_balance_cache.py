@@ -0,0 +1,372 @@
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+# threads that perform the background reads of all caches, started on first use. Reconciles wait for their delay in a
+# shared queue rather than on a thread each, so that writes to thousands of accounts do not start thousands of threads
+RECONCILE_THREADS = 4
+
+_reconcile_condition = threading.Condition()
+_reconcile_queue = []
+_reconcile_order = itertools.count()
+_reconcile_threads = []
+
+
+class EobotBalanceCache(object):
+    """
+    Thread-safe cache of the balances of many accounts, consulted by `get_balances` while the balances are not older
+    than a staleness bound. Write methods keep it up to date: balances read to verify a write are stored, and writes
+    that are not verified apply their expected change optimistically (or invalidate the balances if the change cannot
+    be predicted), after which a background read reconciles the cache with the API
+    """
+    def __init__(self, max_staleness=30.0, reconcile_delay=1.0, max_size=100000):
+        """
+        :param max_staleness   : (Optional) Seconds after reading balances from the API that they may still be served
+        :param reconcile_delay : (Optional) Seconds to wait after a write before reading the balances in the background,
+                                 or None to never reconcile
+        :param max_size        : (Optional) Maximum number of accounts to keep, the least recently used one is evicted
+
+        :type max_staleness   : float|int
+        :type reconcile_delay : float|int|None
+        :type max_size        : int
+        """
+        super(EobotBalanceCache, self).__init__()
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._reconciling = set()
+        self._tasks = set()
+        self._max_staleness = 30.0
+        self._reconcile_delay = 1.0
+        self._max_size = 100000
+        self._stats = {}
+
+        self.set_max_staleness(max_staleness)
+        self.set_reconcile_delay(reconcile_delay)
+        self.set_max_size(max_size)
+        self.clear()
+
+    def set_max_staleness(self, max_staleness):
+        """
+        Sets how long after reading balances from the API they may still be served
+
+        :param max_staleness : staleness bound in seconds
+        :type max_staleness : float|int
+
+        :returns EobotBalanceCache : the current instance, for easy method chaining
+        :rtype : EobotBalanceCache
+        """
+        if (not isinstance(max_staleness, float) and not isinstance(max_staleness, int)) \
+                or isinstance(max_staleness, bool) or max_staleness < 0:
+            raise ValueError("Invalid max_staleness, must be a non-negative float or int")
+
+        self._max_staleness = float(max_staleness)
+        return self
+
+    def get_max_staleness(self):
+        """
+        Returns how long after reading balances from the API they may still be served, in seconds
+
+        :rtype : float
+        """
+        return self._max_staleness
+
+    def set_reconcile_delay(self, reconcile_delay):
+        """
+        Sets how long to wait after a write before reading the balances in the background
+
+        :param reconcile_delay : delay in seconds, or None to never reconcile
+        :type reconcile_delay : float|int|None
+
+        :returns EobotBalanceCache : the current instance, for easy method chaining
+        :rtype : EobotBalanceCache
+        """
+        if reconcile_delay is not None and ((not isinstance(reconcile_delay, float)
+                                             and not isinstance(reconcile_delay, int))
+                                            or isinstance(reconcile_delay, bool) or reconcile_delay < 0):
+            raise ValueError("Invalid reconcile_delay, must be a non-negative float or int, or None")
+
+        self._reconcile_delay = None if reconcile_delay is None else float(reconcile_delay)
+        return self
+
+    def get_reconcile_delay(self):
+        """
+        Returns how long to wait after a write before reading the balances in the background, None if never
+
+        :rtype : float|None
+        """
+        return self._reconcile_delay
+
+    def set_max_size(self, max_size):
+        """
+        Sets the maximum number of accounts to keep, evicting the least recently used ones if needed
+
+        :param max_size : maximum number of accounts
+        :type max_size : int
+
+        :returns EobotBalanceCache : the current instance, for easy method chaining
+        :rtype : EobotBalanceCache
+        """
+        if not isinstance(max_size, int) or isinstance(max_size, bool) or max_size < 1:
+            raise ValueError("Invalid max_size, must be a positive int")
+
+        with self._lock:
+            self._max_size = max_size
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+        return self
+
+    def get_max_size(self):
+        """
+        Returns the maximum number of accounts to keep
+
+        :rtype : int
+        """
+        return self._max_size
+
+    def get(self, base_url, user_id, max_staleness=None):
+        """
+        Returns a copy of the cached balances of an account, or None if there are none within the staleness bound
+
+        :param base_url      : base URL of the API
+        :param user_id       : Eobot user ID
+        :param max_staleness : (Optional) Staleness bound in seconds for this read, defaults to the cache's bound
+
+        :type base_url      : str
+        :type user_id       : int
+        :type max_staleness : float|int|None
+
+        :rtype : dict|None
+        """
+        if max_staleness is None:
+            max_staleness = self._max_staleness
+
+        with self._lock:
+            entry = self._entries.get((base_url, user_id))
+
+            if entry is None or time.time() - entry["fetched"] > max_staleness:
+                self._stats["misses"] += 1
+                return None
+
+            self._entries.move_to_end((base_url, user_id))
+            self._stats["hits"] += 1
+            return dict(entry["balances"])
+
+    def store(self, base_url, user_id, balances):
+        """
+        Stores balances that were just read from the API
+
+        :param base_url : base URL of the API
+        :param user_id  : Eobot user ID
+        :param balances : balances, as returned by `get_balances`
+
+        :type base_url : str
+        :type user_id  : int
+        :type balances : dict
+
+        :returns EobotBalanceCache : the current instance, for easy method chaining
+        :rtype : EobotBalanceCache
+        """
+        with self._lock:
+            self._entries[(base_url, user_id)] = {"balances": dict(balances), "fetched": time.time()}
+            self._entries.move_to_end((base_url, user_id))
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+        return self
+
+    def apply_delta(self, base_url, user_id, deltas):
+        """
+        Optimistically changes the cached balances of an account by the expected effect of a write. This does not
+        make the balances any fresher, they are still served only within the staleness bound of the last read
+
+        :param base_url : base URL of the API
+        :param user_id  : Eobot user ID
+        :param deltas   : change per cryptocurrency, e.g. {"BTC": -0.5}
+
+        :type base_url : str
+        :type user_id  : int
+        :type deltas   : dict
+
+        :returns bool : whether balances were cached for the account
+        :rtype : bool
+        """
+        with self._lock:
+            entry = self._entries.get((base_url, user_id))
+            if entry is None:
+                return False
+
+            balances = entry["balances"]
+            for coin, delta in deltas.items():
+                balances[coin] = balances.get(coin, 0.0) + delta
+
+            self._stats["optimistic_updates"] += 1
+            return True
+
+    def invalidate(self, base_url, user_id):
+        """
+        Removes the cached balances of an account
+
+        :param base_url : base URL of the API
+        :param user_id  : Eobot user ID
+
+        :type base_url : str
+        :type user_id  : int
+
+        :returns EobotBalanceCache : the current instance, for easy method chaining
+        :rtype : EobotBalanceCache
+        """
+        with self._lock:
+            if self._entries.pop((base_url, user_id), None) is not None:
+                self._stats["invalidations"] += 1
+
+        return self
+
+    def schedule_reconcile(self, base_url, user_id, fetch):
+        """
+        Reads the balances of an account on one of the shared background threads after the reconcile delay. `fetch` is
+        expected to store the balances it reads, e.g. by calling `get_balances` with `max_staleness=0`. Nothing happens
+        if reconciling is disabled or already scheduled for the account
+
+        :param base_url : base URL of the API
+        :param user_id  : Eobot user ID
+        :param fetch    : function that reads the balances
+
+        :type base_url : str
+        :type user_id  : int
+        :type fetch    : callable
+
+        :returns bool : whether a reconcile was scheduled
+        :rtype : bool
+        """
+        if not self._start_reconcile((base_url, user_id)):
+            return False
+
+        _schedule(self._reconcile_delay, lambda: self._reconcile((base_url, user_id), fetch))
+        return True
+
+    def schedule_reconcile_async(self, base_url, user_id, fetch):
+        """
+        Asynchronous counterpart of `schedule_reconcile()`, reading the balances in a task on the running event loop.
+        `fetch` is a function that returns a coroutine
+
+        :returns bool : whether a reconcile was scheduled
+        :rtype : bool
+        """
+        # `import eobot` imports this module through the config, and would otherwise load asyncio with it, which this
+        # method only needs when it is already called from an event loop
+        import asyncio
+
+        if not self._start_reconcile((base_url, user_id)):
+            return False
+
+        task = asyncio.ensure_future(self._reconcile_async((base_url, user_id), fetch))
+        # the event loop only keeps weak references to tasks
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    def clear(self):
+        """
+        Removes all cached balances and resets the counters
+
+        :returns EobotBalanceCache : the current instance, for easy method chaining
+        :rtype : EobotBalanceCache
+        """
+        with self._lock:
+            self._entries.clear()
+            self._stats = {
+                "hits": 0,
+                "misses": 0,
+                "optimistic_updates": 0,
+                "invalidations": 0,
+                "reconciles": 0,
+                "reconcile_errors": 0,
+            }
+
+        return self
+
+    def get_stats(self):
+        """
+        Returns the cache counters: "hits", "misses", "optimistic_updates", "invalidations", "reconciles" and
+        "reconcile_errors", plus the number of accounts currently cached ("size")
+
+        :rtype : dict
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+            return stats
+
+    def _start_reconcile(self, key):
+        if self._reconcile_delay is None:
+            return False
+
+        with self._lock:
+            if key in self._reconciling:
+                return False
+            self._reconciling.add(key)
+
+        return True
+
+    def _finish_reconcile(self, key, error):
+        with self._lock:
+            self._reconciling.discard(key)
+            self._stats["reconcile_errors" if error is not None else "reconciles"] += 1
+
+        if error is not None:
+            logging.getLogger(__name__).warning("Unable to reconcile the balances of user %s: %r", key[1], error)
+
+    def _reconcile(self, key, fetch):
+        error = None
+        try:
+            fetch()
+        except Exception as e:
+            error = e
+
+        self._finish_reconcile(key, error)
+
+    async def _reconcile_async(self, key, fetch):
+        import asyncio
+
+        error = None
+        try:
+            await asyncio.sleep(self._reconcile_delay)
+            await fetch()
+        except asyncio.CancelledError as e:
+            # the event loop is shutting down
+            error = e
+            raise
+        except Exception as e:
+            error = e
+        finally:
+            self._finish_reconcile(key, error)
+
+
+def _schedule(delay, function):
+    with _reconcile_condition:
+        heapq.heappush(_reconcile_queue, (time.monotonic() + delay, next(_reconcile_order), function))
+        _reconcile_condition.notify()
+
+        # a forked child process has none of the threads of its parent
+        _reconcile_threads[:] = [thread for thread in _reconcile_threads if thread.is_alive()]
+        if len(_reconcile_threads) < RECONCILE_THREADS:
+            thread = threading.Thread(target=_run_reconciles, name="eobot-reconcile")
+            thread.daemon = True
+            thread.start()
+            _reconcile_threads.append(thread)
+
+
+def _run_reconciles():
+    while True:
+        with _reconcile_condition:
+            while len(_reconcile_queue) == 0 or _reconcile_queue[0][0] > time.monotonic():
+                _reconcile_condition.wait(_reconcile_queue[0][0] - time.monotonic() if _reconcile_queue else None)
+
+            function = heapq.heappop(_reconcile_queue)[2]
+
+        function()
@@ -0,0 +1,260 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from .eobot_endpoints import get_request_key, is_write_endpoint
+
+# public market data changes slowly enough that serving it from memory for a few seconds is indistinguishable from
+# fetching it, while account-specific endpoints are not cached unless explicitly configured
+DEFAULT_TTLS = {
+    "get_coin_value": 10.0,
+    "get_supported_coins": 10.0,
+    "get_supported_fiat": 60.0,
+}
+
+
+class EobotCache(object):
+    """
+    Thread-safe LRU cache with per-endpoint time-to-live for API responses. The cache is consulted by `EobotRequest`
+    before performing a request, but only while it is enabled
+    """
+    def __init__(self, max_size=1024, ttls=None, enabled=False):
+        """
+        :param max_size : (Optional) Maximum number of responses to keep, the least recently used one is evicted first
+        :param ttls     : (Optional) Time-to-live in seconds per endpoint name, defaults to `DEFAULT_TTLS`
+        :param enabled  : (Optional) Whether the cache is used by requests
+
+        :type max_size : int
+        :type ttls     : dict|None
+        :type enabled  : bool
+        """
+        super(EobotCache, self).__init__()
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._max_size = 1024
+        self._ttls = {}
+        self._enabled = False
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        self.set_max_size(max_size)
+        for endpoint, ttl in (DEFAULT_TTLS if ttls is None else ttls).items():
+            self.set_ttl(endpoint, ttl)
+        self.set_enabled(enabled)
+
+    def set_enabled(self, enabled):
+        """
+        Sets whether the cache is used by requests
+
+        :param enabled : whether the cache is enabled
+        :type enabled : bool
+
+        :returns EobotCache : the current instance, for easy method chaining
+        :rtype : EobotCache
+        """
+        if not isinstance(enabled, bool):
+            raise ValueError("Invalid enabled, must be a bool")
+
+        self._enabled = enabled
+        return self
+
+    def is_enabled(self):
+        """
+        Returns whether the cache is used by requests
+
+        :rtype : bool
+        """
+        return self._enabled
+
+    def set_max_size(self, max_size):
+        """
+        Sets the maximum number of responses to keep, evicting the least recently used ones if needed
+
+        :param max_size : maximum number of responses
+        :type max_size : int
+
+        :returns EobotCache : the current instance, for easy method chaining
+        :rtype : EobotCache
+        """
+        if not isinstance(max_size, int) or isinstance(max_size, bool) or max_size < 1:
+            raise ValueError("Invalid max_size, must be a positive int")
+
+        with self._lock:
+            self._max_size = max_size
+            self._evict()
+
+        return self
+
+    def get_max_size(self):
+        """
+        Returns the maximum number of responses to keep
+
+        :rtype : int
+        """
+        return self._max_size
+
+    def set_ttl(self, endpoint, ttl):
+        """
+        Sets the time-to-live for responses of an endpoint. Write endpoints can never be cached
+
+        :param endpoint : name of the API method, e.g. "get_coin_value"
+        :param ttl      : time-to-live in seconds, or None to stop caching the endpoint
+
+        :type endpoint : str
+        :type ttl      : float|int|None
+
+        :returns EobotCache : the current instance, for easy method chaining
+        :rtype : EobotCache
+        """
+        if not isinstance(endpoint, str):
+            raise ValueError("Invalid endpoint, must be a str")
+
+        if is_write_endpoint(endpoint):
+            raise ValueError("Invalid endpoint, write endpoints cannot be cached")
+
+        if ttl is None:
+            self._ttls.pop(endpoint, None)
+            return self
+
+        if (not isinstance(ttl, float) and not isinstance(ttl, int)) or isinstance(ttl, bool) or ttl <= 0:
+            raise ValueError("Invalid ttl, must be a positive float or int, or None")
+
+        self._ttls[endpoint] = float(ttl)
+        return self
+
+    def get_ttl(self, endpoint):
+        """
+        Returns the time-to-live for responses of an endpoint, or None if the endpoint is not cached
+
+        :param endpoint : name of the API method
+        :type endpoint : str
+
+        :rtype : float|None
+        """
+        return self._ttls.get(endpoint)
+
+    def is_cacheable(self, endpoint):
+        """
+        Returns whether responses of an endpoint are cached
+
+        :param endpoint : name of the API method
+        :type endpoint : str
+
+        :rtype : bool
+        """
+        return endpoint in self._ttls
+
+    @staticmethod
+    def make_key(base_url, parameters):
+        """
+        Returns the cache key for a request
+
+        :param base_url   : base URL of the request
+        :param parameters : request parameters
+
+        :type base_url   : str
+        :type parameters : dict
+
+        :rtype : tuple
+        """
+        return get_request_key(base_url, parameters)
+
+    def lookup(self, key):
+        """
+        Looks up a cached response. Since callers are free to modify the responses they receive, a copy is returned
+
+        :param key : cache key, as returned by `make_key()`
+        :type key : tuple
+
+        :returns tuple : (hit, response)
+        :rtype : tuple
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and entry[0] <= time.time():
+                del self._entries[key]
+                entry = None
+
+            if entry is None:
+                self._misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            value = entry[1]
+
+        return True, copy.deepcopy(value)
+
+    def store(self, key, endpoint, value):
+        """
+        Stores a copy of a response, if the endpoint is cacheable
+
+        :param key      : cache key, as returned by `make_key()`
+        :param endpoint : name of the API method that produced the response
+        :param value    : response to store
+
+        :type key      : tuple
+        :type endpoint : str
+        :type value    : dict|list|str|int|float
+        """
+        ttl = self._ttls.get(endpoint)
+        if ttl is None:
+            return
+
+        value = copy.deepcopy(value)
+
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, value)
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def clear(self):
+        """
+        Removes all cached responses and resets the counters
+
+        :returns EobotCache : the current instance, for easy method chaining
+        :rtype : EobotCache
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+        return self
+
+    def get_stats(self):
+        """
+        Returns the cache counters: "hits", "misses", "evictions" and the current "size"
+
+        :rtype : dict
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+            }
+
+    def _evict(self):
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+
+_cache = EobotCache()
+
+
+def get_cache():
+    """
+    Returns the process-wide `EobotCache` that is used by default for all API calls. It is disabled until
+    `get_cache().set_enabled(True)` is called
+
+    :rtype : EobotCache
+    """
+    return _cache
@@ -0,0 +1,211 @@
+import threading
+import time
+from collections import deque
+
+from .eobot_errors import EobotConnectionError, EobotServerError
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class EobotCircuitBreaker(object):
+    """
+    Circuit breaker around the API. While closed, requests pass through and their outcome is tracked. After too many
+    consecutive failures, or a too high error rate over the most recent requests, the breaker opens and requests fail
+    right away instead of waiting for a timeout. After `reset_timeout` seconds the breaker becomes half-open and lets a
+    limited number of probe requests through: a successful probe closes the breaker, a failed one opens it again
+    """
+    def __init__(self, failure_threshold=5, error_rate_threshold=0.5, window_size=20, min_requests=10,
+                 reset_timeout=30.0, half_open_max_calls=1, failure_errors=(EobotConnectionError, EobotServerError)):
+        """
+        :param failure_threshold    : (Optional) Number of consecutive failures that opens the breaker
+        :param error_rate_threshold : (Optional) Fraction of failed requests within the window that opens the breaker
+        :param window_size          : (Optional) Number of most recent requests the error rate is calculated over
+        :param min_requests         : (Optional) Minimum number of requests in the window before the error rate counts
+        :param reset_timeout        : (Optional) Number of seconds the breaker stays open before letting probes through
+        :param half_open_max_calls  : (Optional) Number of probe requests allowed at the same time while half-open
+        :param failure_errors       : (Optional) Exception classes that count as a failure of the API
+
+        :type failure_threshold    : int
+        :type error_rate_threshold : float|int
+        :type window_size          : int
+        :type min_requests         : int
+        :type reset_timeout        : float|int
+        :type half_open_max_calls  : int
+        :type failure_errors       : tuple
+        """
+        super(EobotCircuitBreaker, self).__init__()
+
+        for name, value in (("failure_threshold", failure_threshold), ("window_size", window_size),
+                            ("min_requests", min_requests), ("half_open_max_calls", half_open_max_calls)):
+            if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+                raise ValueError("Invalid {0}, must be a positive int".format(name))
+
+        if (not isinstance(error_rate_threshold, float) and not isinstance(error_rate_threshold, int)) \
+                or not 0 < error_rate_threshold <= 1:
+            raise ValueError("Invalid error_rate_threshold, must be a float between 0 and 1")
+
+        if (not isinstance(reset_timeout, float) and not isinstance(reset_timeout, int)) or reset_timeout < 0:
+            raise ValueError("Invalid reset_timeout, must be a positive float or int")
+
+        if not isinstance(failure_errors, tuple):
+            raise ValueError("Invalid failure_errors, must be a tuple")
+
+        self._lock = threading.Lock()
+        self._failure_threshold = failure_threshold
+        self._error_rate_threshold = float(error_rate_threshold)
+        self._min_requests = min_requests
+        self._reset_timeout = float(reset_timeout)
+        self._half_open_max_calls = half_open_max_calls
+        self._failure_errors = failure_errors
+
+        self._window = deque(maxlen=window_size)
+        self._state = STATE_CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = None
+        self._half_open_calls = 0
+        self._rejected = 0
+        self._times_opened = 0
+
+    def is_failure(self, error):
+        """
+        Returns whether `error` counts as a failure of the API
+
+        :param error : error raised while performing a request
+        :type error : Exception
+
+        :rtype : bool
+        """
+        return isinstance(error, self._failure_errors)
+
+    def get_state(self):
+        """
+        Returns the current state: "closed", "open" or "half_open"
+
+        :rtype : str
+        """
+        with self._lock:
+            self._update_state()
+            return self._state
+
+    def allow_request(self):
+        """
+        Returns whether a request may be performed now. A request that is allowed must report its outcome through
+        `record_success()` or `record_failure()`, or call `release()` when it ended without one
+
+        :rtype : bool
+        """
+        with self._lock:
+            self._update_state()
+
+            if self._state == STATE_CLOSED:
+                return True
+
+            if self._state == STATE_HALF_OPEN and self._half_open_calls < self._half_open_max_calls:
+                self._half_open_calls += 1
+                return True
+
+            self._rejected += 1
+            return False
+
+    def record_success(self):
+        """
+        Records that an allowed request completed, closing the breaker if it was a half-open probe
+        """
+        with self._lock:
+            self._window.append(True)
+            self._consecutive_failures = 0
+
+            if self._state == STATE_HALF_OPEN:
+                self._state = STATE_CLOSED
+                self._half_open_calls = 0
+                self._window.clear()
+
+    def record_failure(self):
+        """
+        Records that an allowed request failed, opening the breaker if a threshold is reached or if it was a half-open
+        probe
+        """
+        with self._lock:
+            self._window.append(False)
+            self._consecutive_failures += 1
+
+            if self._state == STATE_HALF_OPEN:
+                self._open()
+                return
+
+            if self._state != STATE_CLOSED:
+                return
+
+            if self._consecutive_failures >= self._failure_threshold:
+                self._open()
+                return
+
+            if len(self._window) >= self._min_requests and self._get_error_rate() >= self._error_rate_threshold:
+                self._open()
+
+    def release(self):
+        """
+        Records that an allowed request ended without showing whether the API works, e.g. because it was cancelled,
+        freeing its place if it was a half-open probe
+        """
+        with self._lock:
+            if self._state == STATE_HALF_OPEN and self._half_open_calls > 0:
+                self._half_open_calls -= 1
+
+    def reset(self):
+        """
+        Closes the breaker and forgets all recorded outcomes
+
+        :returns EobotCircuitBreaker : the current instance, for easy method chaining
+        :rtype : EobotCircuitBreaker
+        """
+        with self._lock:
+            self._window.clear()
+            self._state = STATE_CLOSED
+            self._consecutive_failures = 0
+            self._opened_at = None
+            self._half_open_calls = 0
+
+        return self
+
+    def get_stats(self):
+        """
+        Returns the breaker's "state", "consecutive_failures", "error_rate" over the current window, number of requests
+        "rejected" while open, number of "times_opened" and seconds until probes are let through ("retry_after")
+
+        :rtype : dict
+        """
+        with self._lock:
+            self._update_state()
+
+            retry_after = 0.0
+            if self._state == STATE_OPEN:
+                retry_after = max(0.0, self._opened_at + self._reset_timeout - time.monotonic())
+
+            return {
+                "state": self._state,
+                "consecutive_failures": self._consecutive_failures,
+                "error_rate": self._get_error_rate(),
+                "rejected": self._rejected,
+                "times_opened": self._times_opened,
+                "retry_after": retry_after,
+            }
+
+    def _open(self):
+        self._state = STATE_OPEN
+        self._opened_at = time.monotonic()
+        self._half_open_calls = 0
+        self._times_opened += 1
+
+    def _update_state(self):
+        if self._state == STATE_OPEN and time.monotonic() - self._opened_at >= self._reset_timeout:
+            self._state = STATE_HALF_OPEN
+            self._half_open_calls = 0
+
+    def _get_error_rate(self):
+        if len(self._window) == 0:
+            return 0.0
+
+        return float(sum(1 for success in self._window if not success)) / len(self._window)
@@ -0,0 +1,245 @@
+from ..methods.exchange_coins import operation as exchange_coins
+from ..methods.get_account_overview import operation as get_account_overview
+from ..methods.get_balances import operation as get_balances
+from ..methods.get_coin_value import operation as get_coin_value
+from ..methods.get_coin_values import operation as get_coin_values
+from ..methods.get_deposit_address import operation as get_deposit_address
+from ..methods.get_exchange_estimate import operation as get_exchange_estimate
+from ..methods.get_exchange_rate import operation as get_exchange_rate
+from ..methods.get_mining_estimates import operation as get_mining_estimates
+from ..methods.get_mining_mode import operation as get_mining_mode
+from ..methods.get_mining_speed import operation as get_mining_speed
+from ..methods.get_supported_coins import operation as get_supported_coins
+from ..methods.get_supported_fiat import operation as get_supported_fiat
+from ..methods.get_user_id import operation as get_user_id
+from ..methods.manual_withdraw import operation as manual_withdraw
+from ..methods.set_automatic_withdraw import operation as set_automatic_withdraw
+from ..methods.set_mining_mode import operation as set_mining_mode
+from .eobot_async_request import EobotAsyncRequest
+from .eobot_operation import resolve_config, run_operation, run_operation_async
+from .eobot_request import EobotRequest
+from .eobot_transport import EobotTransport
+
+
+class EobotClient(object):
+    """
+    Binds a config and a request template, and exposes every API method as a method without the `config` and `request`
+    arguments. Both are checked once, when the client is created, instead of on every call, and the config keeps its
+    authentication between calls, so a client is the cheapest way to make many calls for the same account:
+
+        >>> client = EobotClient("account1")
+        >>> balances = client.get_balances()
+
+    The caches, connection pool, retry policy and other settings of the request template apply to every call
+    """
+    def __init__(self, config=None, request=None, transport=None):
+        """
+        :param config    : (Optional) Configuration to use, will default to the global config if not provided
+        :param request   : (Optional) Request object to use as a template for all API calls, will default to a new one
+                           if not provided. The client uses its own copy, later changes to it have no effect
+        :param transport : (Optional) Transport to send the API calls with, will default to the transport of the
+                           request template if not provided
+
+        :type config    : EobotConfig|str|None
+        :type request   : EobotRequest|None
+        :type transport : EobotTransport|None
+        """
+        super(EobotClient, self).__init__()
+
+        request_class = self._get_request_class()
+
+        if request is None:
+            request = request_class()
+        elif not isinstance(request, request_class) \
+                or (isinstance(request, EobotAsyncRequest) and not issubclass(request_class, EobotAsyncRequest)):
+            # an EobotAsyncRequest is an EobotRequest as well, but performs its API calls with coroutines
+            raise ValueError("Invalid request, must be a {0}".format(request_class.__name__))
+        else:
+            request = request.clone()
+
+        if transport is not None:
+            if not isinstance(transport, EobotTransport):
+                raise ValueError("Invalid transport, must be a EobotTransport or None")
+
+            request.set_transport(transport)
+
+        self._config = resolve_config(config)
+        self._request = request
+        self._base_url = request.get_base_url()
+
+    def get_config(self):
+        """
+        Returns the config the client is bound to
+
+        :rtype : EobotConfig
+        """
+        return self._config
+
+    def get_request(self):
+        """
+        Returns the request template the client performs its API calls with
+
+        :rtype : EobotRequest
+        """
+        return self._request
+
+    @staticmethod
+    def _get_request_class():
+        return EobotRequest
+
+    def _run(self, operation):
+        return run_operation(operation, self._request)
+
+    def exchange_coins(self, from_coin, amount, to_coin, verification=None, prior_balances=None):
+        """
+        See `eobot.methods.exchange_coins.perform_request()`
+
+        :rtype : bool
+        """
+        return self._run(exchange_coins(from_coin, amount, to_coin, self._config, self._base_url, verification,
+                                        prior_balances))
+
+    def get_account_overview(self):
+        """
+        See `eobot.methods.get_account_overview.perform_request()`
+
+        :rtype : dict
+        """
+        return self._run(get_account_overview(self._config, self._base_url))
+
+    def get_balances(self, max_staleness=None, compact=False):
+        """
+        See `eobot.methods.get_balances.perform_request()`
+
+        :rtype : dict|EobotAmounts
+        """
+        return self._run(get_balances(self._config, self._base_url, max_staleness, compact))
+
+    def get_coin_value(self, coin, snapshot=None):
+        """
+        See `eobot.methods.get_coin_value.perform_request()`
+
+        :rtype : float
+        """
+        return self._run(get_coin_value(coin, snapshot))
+
+    def get_coin_values(self, coins, snapshot=None):
+        """
+        See `eobot.methods.get_coin_values.perform_request()`
+
+        :rtype : dict
+        """
+        return self._run(get_coin_values(coins, snapshot))
+
+    def get_deposit_address(self, coin):
+        """
+        See `eobot.methods.get_deposit_address.perform_request()`
+
+        :rtype : str
+        """
+        return self._run(get_deposit_address(coin, self._config, self._base_url))
+
+    def get_exchange_estimate(self, from_coin, to_coin, amount):
+        """
+        See `eobot.methods.get_exchange_estimate.perform_request()`
+
+        :rtype : float
+        """
+        return self._run(get_exchange_estimate(from_coin, to_coin, amount))
+
+    def get_exchange_rate(self, currency):
+        """
+        See `eobot.methods.get_exchange_rate.perform_request()`
+
+        :rtype : float
+        """
+        return self._run(get_exchange_rate(currency))
+
+    def get_mining_estimates(self, compact=False):
+        """
+        See `eobot.methods.get_mining_estimates.perform_request()`
+
+        :rtype : dict|EobotAmounts
+        """
+        return self._run(get_mining_estimates(self._config, self._base_url, compact))
+
+    def get_mining_mode(self):
+        """
+        See `eobot.methods.get_mining_mode.perform_request()`
+
+        :rtype : str
+        """
+        return self._run(get_mining_mode(self._config, self._base_url))
+
+    def get_mining_speed(self, compact=False):
+        """
+        See `eobot.methods.get_mining_speed.perform_request()`
+
+        :rtype : dict|EobotAmounts
+        """
+        return self._run(get_mining_speed(self._config, self._base_url, compact))
+
+    def get_supported_coins(self, compact=False, fields=None):
+        """
+        See `eobot.methods.get_supported_coins.perform_request()`
+
+        :rtype : dict|EobotCoinTable
+        """
+        return self._run(get_supported_coins(compact, fields))
+
+    def get_supported_fiat(self):
+        """
+        See `eobot.methods.get_supported_fiat.perform_request()`
+
+        :rtype : dict
+        """
+        return self._run(get_supported_fiat())
+
+    def get_user_id(self):
+        """
+        See `eobot.methods.get_user_id.perform_request()`
+
+        :rtype : int
+        """
+        return self._run(get_user_id(self._config, self._base_url))
+
+    def manual_withdraw(self, coin, amount, wallet_address, verification=None, prior_balances=None):
+        """
+        See `eobot.methods.manual_withdraw.perform_request()`
+
+        :rtype : bool
+        """
+        return self._run(manual_withdraw(coin, amount, wallet_address, self._config, self._base_url, verification,
+                                         prior_balances))
+
+    def set_automatic_withdraw(self, coin, on_amount, wallet_address):
+        """
+        See `eobot.methods.set_automatic_withdraw.perform_request()`
+
+        :rtype : bool
+        """
+        return self._run(set_automatic_withdraw(coin, on_amount, wallet_address, self._config, self._base_url))
+
+    def set_mining_mode(self, mode, verification=None):
+        """
+        See `eobot.methods.set_mining_mode.perform_request()`
+
+        :rtype : bool
+        """
+        return self._run(set_mining_mode(mode, self._config, self._base_url, verification))
+
+
+class EobotAsyncClient(EobotClient):
+    """
+    Asyncio counterpart of `EobotClient`, whose methods are coroutines performing their API calls with an
+    `EobotAsyncRequest`:
+
+        >>> client = EobotAsyncClient("account1")
+        >>> balances = await client.get_balances()
+    """
+    @staticmethod
+    def _get_request_class():
+        return EobotAsyncRequest
+
+    def _run(self, operation):
+        return run_operation_async(operation, self._request)
@@ -1,5 +1,8 @@
 from .eobot_errors import NoUserIdError, NoEmailError, NoPasswordOrTokenError
 from .eobot_authentication import EobotWriteAuthentication, EobotReadonlyAuthentication
+from .eobot_balance_cache import EobotBalanceCache
+from .eobot_store import EobotPersistentStore
+from .eobot_verification import DEFAULT_POLL_TIMEOUT, VERIFY_FULL, validate_verification
 
 # used as default values in EobotConfig.configure() because None is actually a valid value and will drop current values,
 # which is unwanted if named arguments are not provided
@@ -18,6 +21,13 @@ class EobotConfig(object):
         self._email = None
         self._password = None
         self._token = None
+        self._store = None
+        self._balance_cache = None
+        self._verification = VERIFY_FULL
+        self._verification_timeout = DEFAULT_POLL_TIMEOUT
+
+        # authentication objects by `readonly`, built on first use and dropped whenever the credentials change
+        self._authentications = {}
 
     def configure(self, user_id=_NONE, email=_NONE, password=_NONE, token=_NONE):
         """
@@ -75,6 +85,7 @@ class EobotConfig(object):
             raise ValueError("Invalid user_id, it must be an int")
 
         self._user_id = user_id
+        self._authentications = {}
         return self
 
     def get_user_id(self):
@@ -108,6 +119,7 @@ class EobotConfig(object):
             raise ValueError("Invalid email, it must be a str")
 
         self._email = email
+        self._authentications = {}
         return self
 
     def get_email(self):
@@ -141,6 +153,7 @@ class EobotConfig(object):
             raise ValueError("Invalid password, it must be a str")
 
         self._password = password
+        self._authentications = {}
         return self
 
     def get_password(self):
@@ -174,6 +187,7 @@ class EobotConfig(object):
             raise ValueError("Invalid token, it must be a str")
 
         self._token = token
+        self._authentications = {}
         return self
 
     def get_token(self):
@@ -184,6 +198,106 @@ class EobotConfig(object):
         """
         return self._token
 
+    def set_store(self, store):
+        """
+        Sets the persistent store that user IDs and deposit addresses are remembered in across processes
+
+        :param store : store to use, can be None to always ask the API
+        :type store : EobotPersistentStore|None
+        :raises ValueError : if the store is not a EobotPersistentStore
+
+        :returns EobotConfig : the current instance, for easy method chaining
+        :rtype : EobotConfig
+        """
+        if store is not None and not isinstance(store, EobotPersistentStore):
+            raise ValueError("Invalid store, it must be a EobotPersistentStore")
+
+        self._store = store
+        return self
+
+    def get_store(self):
+        """
+        Returns the persistent store that user IDs and deposit addresses are remembered in, if any
+
+        :rtype : EobotPersistentStore|None
+        """
+        return self._store
+
+    def set_balance_cache(self, balance_cache):
+        """
+        Sets the cache that `get_balances` serves balances from, and that write methods keep up to date
+
+        :param balance_cache : cache to use, can be None to always ask the API
+        :type balance_cache : EobotBalanceCache|None
+        :raises ValueError : if the cache is not a EobotBalanceCache
+
+        :returns EobotConfig : the current instance, for easy method chaining
+        :rtype : EobotConfig
+        """
+        if balance_cache is not None and not isinstance(balance_cache, EobotBalanceCache):
+            raise ValueError("Invalid balance_cache, it must be a EobotBalanceCache")
+
+        self._balance_cache = balance_cache
+        return self
+
+    def get_balance_cache(self):
+        """
+        Returns the cache that `get_balances` serves balances from, if any
+
+        :rtype : EobotBalanceCache|None
+        """
+        return self._balance_cache
+
+    def set_verification(self, verification):
+        """
+        Sets how write methods check that their change took effect, see `eobot_verification.VERIFICATION_MODES`
+
+        :param verification : "full", "post-only", "poll" or "none"
+        :type verification : str
+        :raises ValueError : if the verification mode is unknown
+
+        :returns EobotConfig : the current instance, for easy method chaining
+        :rtype : EobotConfig
+        """
+        validate_verification(verification)
+
+        self._verification = verification
+        return self
+
+    def get_verification(self):
+        """
+        Returns how write methods check that their change took effect
+
+        :rtype : str
+        """
+        return self._verification
+
+    def set_verification_timeout(self, timeout):
+        """
+        Sets how long write methods keep polling for their change to show up, in "poll" verification mode
+
+        :param timeout : timeout in seconds
+        :type timeout : float|int
+        :raises ValueError : if the timeout is not a positive float or int
+
+        :returns EobotConfig : the current instance, for easy method chaining
+        :rtype : EobotConfig
+        """
+        if (not isinstance(timeout, float) and not isinstance(timeout, int)) or isinstance(timeout, bool) \
+                or timeout <= 0:
+            raise ValueError("Invalid timeout, it must be a positive float or int")
+
+        self._verification_timeout = float(timeout)
+        return self
+
+    def get_verification_timeout(self):
+        """
+        Returns how long write methods keep polling for their change to show up, in seconds
+
+        :rtype : float
+        """
+        return self._verification_timeout
+
     def get_authentication(self, readonly=True):
         """
         Returns the authentication parameters needed for an API call. Readonly methods only need a user_id, write-calls
@@ -194,6 +308,13 @@ class EobotConfig(object):
         :type readonly  : bool
         :rtype          : EobotReadonlyAuthentication|EobotWriteAuthentication
         """
+        authentication = self._authentications.get(readonly)
+        if authentication is None:
+            authentication = self._authentications[readonly] = self._build_authentication(readonly)
+
+        return authentication
+
+    def _build_authentication(self, readonly):
         if not self.has_user_id():
             raise NoUserIdError()
 
@@ -0,0 +1,106 @@
+# Maps the distinguishing request parameter of every Eobot API call to the name of the method that performs it. The
+# order matters: some calls share parameters (e.g. "convertfrom" is used by both exchange estimates and exchanges), so
+# the most specific parameter is checked first, the same way the API itself dispatches requests
+_ENDPOINTS = (
+    ("exchangefee", "get_exchange_estimate"),
+    ("total", "get_balances"),
+    ("coin", "get_coin_value"),
+    ("deposit", "get_deposit_address"),
+    ("convertfrom", "exchange_coins"),
+    ("idmining", "get_mining_mode"),
+    ("idspeed", "get_mining_speed"),
+    ("idestimates", "get_mining_estimates"),
+    ("supportedcoins", "get_supported_coins"),
+    ("supportedfiat", "get_supported_fiat"),
+    ("manualwithdraw", "manual_withdraw"),
+    ("withdraw", "set_automatic_withdraw"),
+    ("mining", "set_mining_mode"),
+    ("email", "get_user_id"),
+)
+
+# API calls that change account state and must therefore never be cached, coalesced or blindly repeated
+WRITE_ENDPOINTS = frozenset(["exchange_coins", "manual_withdraw", "set_automatic_withdraw", "set_mining_mode"])
+
+# API calls that only read state, so that repeating one (e.g. after a connection dropped before the response arrived)
+# cannot have any effect besides returning the same result again
+IDEMPOTENT_ENDPOINTS = frozenset(endpoint for _, endpoint in _ENDPOINTS if endpoint not in WRITE_ENDPOINTS) \
+    | frozenset(["get_exchange_rate"])
+
+UNKNOWN_ENDPOINT = "unknown"
+
+# request parameters that carry the Eobot user ID, depending on the API call
+_USER_ID_PARAMETERS = ("id", "total", "idmining", "idspeed", "idestimates")
+
+
+def get_endpoint(parameters):
+    """
+    Returns the name of the API method that a set of request parameters belongs to. Note that `get_coin_value` and
+    `get_exchange_rate` use the same API call, which is reported as "get_coin_value"
+
+    :param parameters : request parameters
+    :type parameters : dict
+
+    :rtype : str
+    """
+    for parameter, endpoint in _ENDPOINTS:
+        if parameter in parameters:
+            return endpoint
+
+    return UNKNOWN_ENDPOINT
+
+
+def is_write_endpoint(endpoint):
+    """
+    Returns whether the API method named `endpoint` changes account state
+
+    :param endpoint : name of the API method, as returned by `get_endpoint()`
+    :type endpoint : str
+
+    :rtype : bool
+    """
+    return endpoint in WRITE_ENDPOINTS
+
+
+def is_idempotent_endpoint(endpoint):
+    """
+    Returns whether the API method named `endpoint` can safely be sent again when it is unknown whether the API received
+    it, which is false for write endpoints and for unknown API calls
+
+    :param endpoint : name of the API method, as returned by `get_endpoint()`
+    :type endpoint : str
+
+    :rtype : bool
+    """
+    return endpoint in IDEMPOTENT_ENDPOINTS
+
+
+def get_request_user_id(parameters):
+    """
+    Returns the Eobot user ID a set of request parameters applies to, or None for anonymous API calls and calls that
+    identify the user by email address
+
+    :param parameters : request parameters
+    :type parameters : dict
+
+    :rtype : int|None
+    """
+    for parameter in _USER_ID_PARAMETERS:
+        if parameter in parameters:
+            return parameters[parameter]
+
+    return None
+
+
+def get_request_key(base_url, parameters):
+    """
+    Returns a hashable key that identifies a request by its base URL and parameters, regardless of parameter order
+
+    :param base_url   : base URL of the request
+    :param parameters : request parameters
+
+    :type base_url   : str
+    :type parameters : dict
+
+    :rtype : tuple
+    """
+    return base_url, tuple(sorted((str(key), str(value)) for key, value in parameters.items()))
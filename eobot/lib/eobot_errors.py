@@ -18,3 +18,52 @@ class NoPasswordOrTokenError(RuntimeError):
     current config
     """
     pass
+
+
+class EobotRequestError(RuntimeError):
+    """
+    Base class for errors raised when an API request could not be completed
+    """
+    pass
+
+
+class EobotConnectionError(EobotRequestError):
+    """
+    Raised when the API could not be reached, or did not respond before the request timed out
+    """
+    pass
+
+
+class EobotServerError(EobotRequestError):
+    """
+    Raised when the API responds with a server error (HTTP status 5xx)
+    """
+    pass
+
+
+class EobotResponseError(EobotRequestError):
+    """
+    Raised when the API responds with something other than the expected JSON document
+    """
+    pass
+
+
+class EobotRateLimitError(EobotRequestError):
+    """
+    Raised when a request is not allowed by the client-side rate limiter without waiting longer than permitted
+    """
+    pass
+
+
+class EobotCircuitOpenError(EobotRequestError):
+    """
+    Raised without contacting the API while the circuit breaker is open because of too many recent failures
+    """
+    pass
+
+
+class EobotTimeoutError(EobotRequestError):
+    """
+    Raised when an API method did not complete within the time allotted to it, e.g. by a fleet run
+    """
+    pass
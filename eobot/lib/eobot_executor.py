@@ -0,0 +1,156 @@
+import threading
+
+from .. import methods
+
+
+class EobotExecutor(object):
+    """
+    Runs API methods on a bounded pool of threads and returns a `concurrent.futures.Future` for each call, so that
+    synchronous code can overlap several API calls without using asyncio. Use `Future.result(timeout)` to wait for a
+    call for a limited time, and `Future.cancel()` to drop a call that has not started yet
+    """
+    def __init__(self, max_workers=10):
+        """
+        :param max_workers : (Optional) Maximum number of API calls performed at the same time
+        :type max_workers  : int
+        """
+        super(EobotExecutor, self).__init__()
+
+        self._lock = threading.Lock()
+        self._executor = None
+        self._max_workers = 10
+        # futures of the calls that have not completed yet, to cancel the pending ones on shutdown
+        self._futures = set()
+
+        self.set_max_workers(max_workers)
+
+    def set_max_workers(self, max_workers):
+        """
+        Sets the maximum number of API calls performed at the same time. Calls that were already submitted still run
+        with the previous limit
+
+        :param max_workers : maximum number of threads
+        :type max_workers : int
+
+        :returns EobotExecutor : the current instance, for easy method chaining
+        :rtype : EobotExecutor
+        """
+        if not isinstance(max_workers, int) or isinstance(max_workers, bool) or max_workers < 1:
+            raise ValueError("Invalid max_workers, must be a positive int")
+
+        with self._lock:
+            self._max_workers = max_workers
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+        return self
+
+    def get_max_workers(self):
+        """
+        Returns the maximum number of API calls performed at the same time
+
+        :rtype : int
+        """
+        return self._max_workers
+
+    def submit(self, method, *args, **kwargs):
+        """
+        Schedules an API method to be called with the given arguments, and returns the future of its result
+
+            >>> future = get_executor().submit(eobot.get_balances, config="account1")
+            >>> balances = future.result(timeout=10)
+
+        :param method : API method to call, e.g. `eobot.get_balances`, or its name, e.g. "get_balances"
+        :type method : callable|str
+
+        :rtype : concurrent.futures.Future
+        """
+        if isinstance(method, str):
+            if method not in methods.__all__:
+                raise ValueError("Invalid method, must be one of: {0}".format(", ".join(methods.__all__)))
+
+            method = getattr(methods, method)
+        elif not callable(method):
+            raise ValueError("Invalid method, must be callable or the name of an API method")
+
+        future = self._get_executor().submit(method, *args, **kwargs)
+
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._forget)
+
+        return future
+
+    def _forget(self, future):
+        with self._lock:
+            self._futures.discard(future)
+
+    def shutdown(self, wait=True, cancel_pending=False):
+        """
+        Stops the worker threads once they are idle. The executor can still be used afterwards, new threads are started
+        as soon as another call is submitted
+
+        :param wait           : (Optional) Whether to wait for the calls in progress to complete
+        :param cancel_pending : (Optional) Whether to cancel the calls that have not started yet
+
+        :type wait           : bool
+        :type cancel_pending : bool
+
+        :returns EobotExecutor : the current instance, for easy method chaining
+        :rtype : EobotExecutor
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+            futures = list(self._futures) if cancel_pending else []
+
+        # `ThreadPoolExecutor.shutdown(cancel_futures=True)` needs Python 3.9; cancelling a call that already started
+        # has no effect, so this only cancels the pending ones as well
+        for future in futures:
+            future.cancel()
+
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+        return self
+
+    def _get_executor(self):
+        executor = self._executor
+        if executor is not None:
+            return executor
+
+        # `import eobot` imports this module for `submit()`, and would otherwise load concurrent.futures with it
+        from concurrent.futures import ThreadPoolExecutor
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="eobot")
+            return self._executor
+
+
+_executor = EobotExecutor()
+
+
+def get_executor():
+    """
+    Returns the process-wide `EobotExecutor` that `submit()` schedules API calls on
+
+    :rtype : EobotExecutor
+    """
+    return _executor
+
+
+def submit(method, *args, **kwargs):
+    """
+    Schedules an API method on the process-wide executor, see `EobotExecutor.submit()`
+
+        >>> futures = [submit(eobot.get_balances, config=name) for name in ("account1", "account2")]
+        >>> balances = [future.result(timeout=10) for future in futures]
+
+    :param method : API method to call, e.g. `eobot.get_balances`, or its name, e.g. "get_balances"
+    :type method : callable|str
+
+    :rtype : concurrent.futures.Future
+    """
+    return _executor.submit(method, *args, **kwargs)
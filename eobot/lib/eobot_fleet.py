@@ -0,0 +1,201 @@
+import asyncio
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from .eobot_errors import EobotTimeoutError
+
+
+class EobotFleetResult(object):
+    """
+    Outcome of calling an API method for one config of a fleet, as yielded by `run_fleet()` and `run_fleet_async()`
+    """
+    def __init__(self, config, value=None, error=None, latency=None):
+        """
+        :param config  : Config the method was called for, as it was passed in
+        :param value   : Value returned by the method, None if it failed
+        :param error   : Exception raised by the method, or `EobotTimeoutError` if it did not complete in time
+        :param latency : Seconds from starting the call until it completed or timed out
+
+        :type config  : EobotConfig|str
+        :type value   : dict|list|str|int|float|bool|None
+        :type error   : Exception|None
+        :type latency : float|None
+        """
+        super(EobotFleetResult, self).__init__()
+
+        self.config = config
+        self.value = value
+        self.error = error
+        self.latency = latency
+
+    def __repr__(self):
+        return "EobotFleetResult(config={0!r}, value={1!r}, error={2!r})".format(self.config, self.value, self.error)
+
+
+def _validate_fleet_arguments(method, max_workers, timeout):
+    if not callable(method):
+        raise ValueError("Invalid method, must be callable")
+
+    if not isinstance(max_workers, int) or isinstance(max_workers, bool) or max_workers < 1:
+        raise ValueError("Invalid max_workers, must be a positive int")
+
+    if timeout is not None and ((not isinstance(timeout, float) and not isinstance(timeout, int))
+                                or isinstance(timeout, bool) or timeout <= 0):
+        raise ValueError("Invalid timeout, must be a positive float or int, or None")
+
+
+def _call(method, config, args, kwargs, request):
+    if request is not None:
+        kwargs = dict(kwargs, request=request)
+
+    return method(*args, config=config, **kwargs)
+
+
+def run_fleet(method, configs, args=(), kwargs=None, max_workers=10, timeout=None, request=None):
+    """
+    Calls an API method for every config in `configs` on up to `max_workers` threads, and yields an `EobotFleetResult`
+    per config in the order the calls complete. Exceptions are reported in the results instead of being raised. A call
+    that takes longer than `timeout` is reported as failed with an `EobotTimeoutError`; its thread cannot be
+    interrupted, so it keeps occupying a worker until the request itself times out
+
+        >>> for result in run_fleet(eobot.get_balances, ["account1", "account2"], max_workers=50, timeout=30):
+        ...     print(result.config, result.error or result.value)
+
+    :param method      : API method to call, e.g. `eobot.get_balances`
+    :param configs     : configs or names of configs to call the method for, consumed lazily
+    :param args        : (Optional) Positional arguments to pass to every call
+    :param kwargs      : (Optional) Keyword arguments to pass to every call
+    :param max_workers : (Optional) Maximum number of calls in flight at the same time
+    :param timeout     : (Optional) Seconds after which a call is reported as timed out, None to wait indefinitely
+    :param request     : (Optional) Request object that every call uses as template
+
+    :type method      : callable
+    :type configs     : list|tuple|iterable
+    :type args        : tuple
+    :type kwargs      : dict|None
+    :type max_workers : int
+    :type timeout     : float|int|None
+    :type request     : EobotRequest|None
+
+    :rtype : generator
+    """
+    _validate_fleet_arguments(method, max_workers, timeout)
+    return _run_fleet(method, iter(configs), tuple(args), dict(kwargs or {}), max_workers, timeout, request)
+
+
+def _run_fleet(method, configs, args, kwargs, max_workers, timeout, request):
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="eobot-fleet")
+    # future -> (config, started)
+    in_flight = {}
+    # futures that timed out but are still running, and therefore still occupy a worker
+    abandoned = set()
+    exhausted = False
+
+    try:
+        while True:
+            while not exhausted and len(in_flight) + len(abandoned) < max_workers:
+                try:
+                    config = next(configs)
+                except StopIteration:
+                    exhausted = True
+                    break
+
+                future = executor.submit(_call, method, config, args, kwargs, request)
+                in_flight[future] = (config, time.perf_counter())
+
+            if len(in_flight) == 0 and exhausted:
+                return
+
+            # with every worker occupied by an abandoned call, wait for one of them to finish before calling the
+            # method for the next config
+            wait_timeout = None
+            if timeout is not None and len(in_flight) > 0:
+                earliest = min(started for config, started in in_flight.values())
+                wait_timeout = max(0.0, earliest + timeout - time.perf_counter())
+
+            done, _ = wait(set(in_flight.keys()) | abandoned, timeout=wait_timeout, return_when=FIRST_COMPLETED)
+            now = time.perf_counter()
+
+            for future in done:
+                if future in abandoned:
+                    abandoned.discard(future)
+                    continue
+
+                config, started = in_flight.pop(future)
+                error = future.exception()
+                yield EobotFleetResult(config, None if error is not None else future.result(), error, now - started)
+
+            if timeout is not None:
+                for future, (config, started) in list(in_flight.items()):
+                    if now - started >= timeout:
+                        del in_flight[future]
+                        abandoned.add(future)
+                        error = EobotTimeoutError("Call for {0!r} did not complete within {1}s".format(config, timeout))
+                        yield EobotFleetResult(config, None, error, now - started)
+    finally:
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def run_fleet_async(method, configs, args=(), kwargs=None, max_workers=10, timeout=None, request=None):
+    """
+    Asynchronous counterpart of `run_fleet()`, calling a method of `eobot.aio` in up to `max_workers` tasks on the
+    running event loop. Calls that take longer than `timeout` are cancelled
+
+        >>> async for result in run_fleet_async(eobot.aio.get_balances, names, max_workers=100, timeout=30):
+        ...     print(result.config, result.error or result.value)
+
+    :type method      : callable
+    :type configs     : list|tuple|iterable
+    :type args        : tuple
+    :type kwargs      : dict|None
+    :type max_workers : int
+    :type timeout     : float|int|None
+    :type request     : EobotAsyncRequest|None
+
+    :rtype : async_generator
+    """
+    _validate_fleet_arguments(method, max_workers, timeout)
+    return _run_fleet_async(method, iter(configs), tuple(args), dict(kwargs or {}), max_workers, timeout, request)
+
+
+async def _call_async(method, config, args, kwargs, request, timeout):
+    started = time.perf_counter()
+
+    try:
+        value = await asyncio.wait_for(_call(method, config, args, kwargs, request), timeout)
+    except asyncio.TimeoutError:
+        error = EobotTimeoutError("Call for {0!r} did not complete within {1}s".format(config, timeout))
+        return EobotFleetResult(config, None, error, time.perf_counter() - started)
+    except Exception as e:
+        return EobotFleetResult(config, None, e, time.perf_counter() - started)
+
+    return EobotFleetResult(config, value, None, time.perf_counter() - started)
+
+
+async def _run_fleet_async(method, configs, args, kwargs, max_workers, timeout, request):
+    in_flight = set()
+    exhausted = False
+
+    try:
+        while True:
+            while not exhausted and len(in_flight) < max_workers:
+                try:
+                    config = next(configs)
+                except StopIteration:
+                    exhausted = True
+                    break
+
+                in_flight.add(asyncio.ensure_future(_call_async(method, config, args, kwargs, request, timeout)))
+
+            if len(in_flight) == 0:
+                return
+
+            done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+
+            for task in done:
+                yield task.result()
+    finally:
+        for task in in_flight:
+            task.cancel()
@@ -0,0 +1,329 @@
+import logging
+import threading
+import time
+
+# request parameters whose values must never end up in logs or metrics
+SECRET_PARAMETERS = frozenset(["password"])
+
+REDACTED = "***"
+
+# upper bounds in seconds of the latency histogram buckets, a final +Inf bucket is implied
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_logger = logging.getLogger(__name__)
+
+_default_observers = []
+
+
+def redact_parameters(parameters):
+    """
+    Returns a copy of the request parameters with all secret values replaced
+
+    :param parameters : request parameters
+    :type parameters : dict
+
+    :rtype : dict
+    """
+    return dict(
+        (key, REDACTED if key in SECRET_PARAMETERS else value) for key, value in parameters.items()
+    )
+
+
+class EobotRequestEvent(object):
+    """
+    Describes a single `EobotRequest.perform_request()` call, as passed to `EobotRequestObserver` hooks. Attributes
+    that describe the outcome are only set by the time `after_request()` is called
+    """
+    def __init__(self, endpoint, base_url, parameters):
+        """
+        :param endpoint   : Name of the API method, see `eobot_endpoints.get_endpoint()`
+        :param base_url   : Base URL of the request
+        :param parameters : Request parameters, secrets will be redacted
+
+        :type endpoint   : str
+        :type base_url   : str
+        :type parameters : dict
+        """
+        super(EobotRequestEvent, self).__init__()
+
+        self.endpoint = endpoint
+        self.base_url = base_url
+        self.parameters = redact_parameters(parameters)
+
+        # HTTP status of the last attempt, None if no response was received (e.g. served from cache, or failed)
+        self.status = None
+        # total size in bytes of all response bodies received for this call
+        self.bytes = 0
+        # seconds spent in the call, including waiting for retries and rate limits
+        self.latency = None
+        # number of retries performed
+        self.retries = 0
+        # whether the response came from the cache
+        self.cached = False
+        # whether the response was shared by an identical request that was already in flight
+        self.coalesced = False
+        # exception raised by the call, if it failed
+        self.error = None
+
+
+class EobotRequestObserver(object):
+    """
+    Base class for objects that want to be notified before and after every API request. Exceptions raised by
+    observers are logged and otherwise ignored, so they cannot break the request itself
+    """
+    def before_request(self, event):
+        """
+        Called right before a request is performed
+
+        :param event : description of the request
+        :type event : EobotRequestEvent
+        """
+        pass
+
+    def after_request(self, event):
+        """
+        Called after a request has completed or failed
+
+        :param event : description of the request and its outcome
+        :type event : EobotRequestEvent
+        """
+        pass
+
+
+def notify_observers(observers, hook, event):
+    """
+    Calls `hook` ("before_request" or "after_request") on every observer
+
+    :param observers : observers to notify
+    :param hook      : name of the observer method to call
+    :param event     : event to pass to the observers
+
+    :type observers : list
+    :type hook      : str
+    :type event     : EobotRequestEvent
+    """
+    for observer in observers:
+        try:
+            getattr(observer, hook)(event)
+        except Exception:
+            _logger.exception("Request observer %r failed in %s", observer, hook)
+
+
+class _EndpointMetrics(object):
+    def __init__(self, buckets):
+        super(_EndpointMetrics, self).__init__()
+
+        self.requests = 0
+        self.upstream_requests = 0
+        self.cached = 0
+        self.coalesced = 0
+        self.retries = 0
+        self.bytes = 0
+        self.errors = {}
+        self.latency_sum = 0.0
+        self.latency_counts = [0] * (len(buckets) + 1)
+
+    def to_dict(self, buckets):
+        cumulative = []
+        total = 0
+        for count in self.latency_counts:
+            total += count
+            cumulative.append(total)
+
+        return {
+            "requests": self.requests,
+            "upstream_requests": self.upstream_requests,
+            "cached": self.cached,
+            "coalesced": self.coalesced,
+            "retries": self.retries,
+            "bytes": self.bytes,
+            "errors": dict(self.errors),
+            "latency_sum": self.latency_sum,
+            "latency_buckets": list(zip(list(buckets) + [float("inf")], cumulative)),
+        }
+
+
+class EobotMetricsCollector(EobotRequestObserver):
+    """
+    Request observer that keeps counters and a latency histogram per endpoint in memory
+    """
+    def __init__(self, buckets=DEFAULT_LATENCY_BUCKETS):
+        """
+        :param buckets : (Optional) Ascending upper bounds in seconds of the latency histogram buckets
+        :type buckets  : tuple
+        """
+        super(EobotMetricsCollector, self).__init__()
+
+        if not isinstance(buckets, tuple) or len(buckets) == 0 or list(buckets) != sorted(buckets):
+            raise ValueError("Invalid buckets, must be a non-empty tuple in ascending order")
+
+        self._lock = threading.Lock()
+        self._buckets = tuple(float(bucket) for bucket in buckets)
+        self._endpoints = {}
+        self._in_flight = 0
+
+    def get_buckets(self):
+        """
+        Returns the upper bounds of the latency histogram buckets
+
+        :rtype : tuple
+        """
+        return self._buckets
+
+    def before_request(self, event):
+        with self._lock:
+            self._in_flight += 1
+
+    def after_request(self, event):
+        with self._lock:
+            self._in_flight -= 1
+
+            metrics = self._endpoints.get(event.endpoint)
+            if metrics is None:
+                metrics = _EndpointMetrics(self._buckets)
+                self._endpoints[event.endpoint] = metrics
+
+            metrics.requests += 1
+            metrics.retries += event.retries
+            metrics.bytes += event.bytes
+
+            if event.cached:
+                metrics.cached += 1
+            elif event.coalesced:
+                metrics.coalesced += 1
+            else:
+                metrics.upstream_requests += 1 + event.retries
+
+            if event.error is not None:
+                error_class = event.error.__class__.__name__
+                metrics.errors[error_class] = metrics.errors.get(error_class, 0) + 1
+
+            if event.latency is not None:
+                metrics.latency_sum += event.latency
+                index = len(self._buckets)
+                for position, bucket in enumerate(self._buckets):
+                    if event.latency <= bucket:
+                        index = position
+                        break
+                metrics.latency_counts[index] += 1
+
+    def get_in_flight(self):
+        """
+        Returns the number of requests currently in flight
+
+        :rtype : int
+        """
+        return self._in_flight
+
+    def get_endpoints(self):
+        """
+        Returns the names of all endpoints that requests have been recorded for
+
+        :rtype : list
+        """
+        with self._lock:
+            return sorted(self._endpoints.keys())
+
+    def get_endpoint_stats(self, endpoint):
+        """
+        Returns the metrics recorded for `endpoint`: counters for "requests", "upstream_requests" (including retries),
+        "cached", "coalesced", "retries" and "bytes", the number of "errors" per exception class, the "latency_sum" in
+        seconds and the cumulative "latency_buckets" as a list of (upper bound, count) tuples
+
+        :param endpoint : name of the API method
+        :type endpoint : str
+
+        :rtype : dict|None
+        """
+        with self._lock:
+            metrics = self._endpoints.get(endpoint)
+            return None if metrics is None else metrics.to_dict(self._buckets)
+
+    def get_stats(self):
+        """
+        Returns the metrics for all endpoints, keyed by endpoint name
+
+        :rtype : dict
+        """
+        with self._lock:
+            return dict((endpoint, metrics.to_dict(self._buckets)) for endpoint, metrics in self._endpoints.items())
+
+    def get_latency_quantile(self, endpoint, quantile):
+        """
+        Estimates a latency quantile for `endpoint` from its histogram, by interpolating within the bucket it falls in
+
+        :param endpoint : name of the API method
+        :param quantile : quantile to estimate, e.g. 0.95
+
+        :type endpoint : str
+        :type quantile : float
+
+        :rtype : float|None
+        """
+        if not 0 <= quantile <= 1:
+            raise ValueError("Invalid quantile, must be between 0 and 1")
+
+        stats = self.get_endpoint_stats(endpoint)
+        if stats is None or stats["latency_buckets"][-1][1] == 0:
+            return None
+
+        rank = quantile * stats["latency_buckets"][-1][1]
+        lower_bound = 0.0
+        lower_count = 0
+
+        for upper_bound, count in stats["latency_buckets"]:
+            if count >= rank:
+                if upper_bound == float("inf"):
+                    return lower_bound
+                if count == lower_count:
+                    return upper_bound
+                return lower_bound + (upper_bound - lower_bound) * (rank - lower_count) / (count - lower_count)
+            lower_bound, lower_count = upper_bound, count
+
+        return lower_bound
+
+    def reset(self):
+        """
+        Forgets all recorded metrics
+
+        :returns EobotMetricsCollector : the current instance, for easy method chaining
+        :rtype : EobotMetricsCollector
+        """
+        with self._lock:
+            self._endpoints = {}
+
+        return self
+
+
+def add_default_observer(observer):
+    """
+    Registers an observer that is added to every `EobotRequest` created from now on
+
+    :param observer : observer to register
+    :type observer : EobotRequestObserver
+    """
+    if not isinstance(observer, EobotRequestObserver):
+        raise ValueError("Invalid observer, must be a EobotRequestObserver")
+
+    if observer not in _default_observers:
+        _default_observers.append(observer)
+
+
+def remove_default_observer(observer):
+    """
+    Unregisters an observer that was registered through `add_default_observer()`
+
+    :param observer : observer to unregister
+    :type observer : EobotRequestObserver
+    """
+    if observer in _default_observers:
+        _default_observers.remove(observer)
+
+
+def get_default_observers():
+    """
+    Returns the observers that are added to every new `EobotRequest`
+
+    :rtype : list
+    """
+    return list(_default_observers)
@@ -0,0 +1,42 @@
+import importlib
+import sys
+import types
+
+
+class _LazyMethodPackage(types.ModuleType):
+    def __setattr__(self, name, value):
+        # importing a submodule binds it to its package under its own name, which for a method module is the name of
+        # the method itself, so bind the method instead, like `from .name import perform_request as name` would
+        if isinstance(value, types.ModuleType) and name in self.__dict__.get("__all__", ()):
+            value = value.perform_request
+
+        super(_LazyMethodPackage, self).__setattr__(name, value)
+
+
+def make_lazy_methods(package):
+    """
+    Makes the methods listed in `__all__` of `package`, i.e. the `perform_request` functions of its submodules with the
+    same names, available as attributes of the package while only importing a submodule when its method is first used
+
+    :param package : name of the package, i.e. its `__name__`
+    :type package : str
+
+    :returns tuple : the `__getattr__` and `__dir__` functions to define in the package
+    :rtype : tuple
+    """
+    module = sys.modules[package]
+    module.__class__ = _LazyMethodPackage
+    names = frozenset(module.__all__)
+
+    def __getattr__(name):
+        if name not in names:
+            raise AttributeError("module {0!r} has no attribute {1!r}".format(package, name))
+
+        value = importlib.import_module("." + name, package).perform_request
+        setattr(module, name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(module.__dict__.keys()) | names)
+
+    return __getattr__, __dir__
@@ -0,0 +1,263 @@
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .eobot_cache import get_cache
+from .eobot_circuit_breaker import STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN
+from .eobot_pool import get_pool
+from .eobot_single_flight import get_single_flight
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_DEFAULT = object()
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _MetricsWriter(object):
+    def __init__(self):
+        super(_MetricsWriter, self).__init__()
+        self.lines = []
+
+    def family(self, name, metric_type, help_text):
+        self.lines.append("# HELP {0} {1}".format(name, help_text))
+        self.lines.append("# TYPE {0} {1}".format(name, metric_type))
+
+    def sample(self, name, value, labels=None):
+        if labels:
+            label_text = ",".join('{0}="{1}"'.format(key, _escape(labels[key])) for key in sorted(labels.keys()))
+            self.lines.append("{0}{{{1}}} {2}".format(name, label_text, _format_value(value)))
+        else:
+            self.lines.append("{0} {1}".format(name, _format_value(value)))
+
+    def render(self):
+        return "\n".join(self.lines) + "\n"
+
+
+def _render_collector(writer, collector):
+    stats = collector.get_stats()
+    endpoints = sorted(stats.keys())
+
+    counters = (
+        ("eobot_requests_total", "requests", "API method calls, including cached and coalesced ones"),
+        ("eobot_upstream_requests_total", "upstream_requests", "HTTP requests sent to the API, including retries"),
+        ("eobot_cached_responses_total", "cached", "API method calls served from the response cache"),
+        ("eobot_coalesced_requests_total", "coalesced", "API method calls that shared an identical in-flight request"),
+        ("eobot_retries_total", "retries", "Retries performed after transient errors"),
+        ("eobot_response_bytes_total", "bytes", "Bytes received in response bodies"),
+    )
+
+    for name, key, help_text in counters:
+        writer.family(name, "counter", help_text)
+        for endpoint in endpoints:
+            writer.sample(name, stats[endpoint][key], {"endpoint": endpoint})
+
+    writer.family("eobot_request_errors_total", "counter", "Failed API method calls by error class")
+    for endpoint in endpoints:
+        for error, count in sorted(stats[endpoint]["errors"].items()):
+            writer.sample("eobot_request_errors_total", count, {"endpoint": endpoint, "error": error})
+
+    writer.family("eobot_request_duration_seconds", "histogram", "Duration of API method calls in seconds")
+    for endpoint in endpoints:
+        buckets = stats[endpoint]["latency_buckets"]
+        for upper_bound, count in buckets:
+            writer.sample(
+                "eobot_request_duration_seconds_bucket", count, {"endpoint": endpoint, "le": _format_value(upper_bound)}
+            )
+        writer.sample("eobot_request_duration_seconds_sum", stats[endpoint]["latency_sum"], {"endpoint": endpoint})
+        writer.sample("eobot_request_duration_seconds_count", buckets[-1][1], {"endpoint": endpoint})
+
+    writer.family("eobot_requests_in_flight", "gauge", "API method calls currently in progress")
+    writer.sample("eobot_requests_in_flight", collector.get_in_flight())
+
+
+def _render_cache(writer, cache):
+    stats = cache.get_stats()
+    lookups = stats["hits"] + stats["misses"]
+
+    writer.family("eobot_cache_hits_total", "counter", "Response cache lookups that found a fresh response")
+    writer.sample("eobot_cache_hits_total", stats["hits"])
+    writer.family("eobot_cache_misses_total", "counter", "Response cache lookups that found no fresh response")
+    writer.sample("eobot_cache_misses_total", stats["misses"])
+    writer.family("eobot_cache_evictions_total", "counter", "Responses evicted from the cache to respect its size")
+    writer.sample("eobot_cache_evictions_total", stats["evictions"])
+    writer.family("eobot_cache_entries", "gauge", "Responses currently in the cache")
+    writer.sample("eobot_cache_entries", stats["size"])
+    writer.family("eobot_cache_hit_ratio", "gauge", "Fraction of response cache lookups that were hits")
+    writer.sample("eobot_cache_hit_ratio", float(stats["hits"]) / lookups if lookups > 0 else 0.0)
+
+
+def _render_pool(writer, pool):
+    stats = pool.get_stats()
+
+    writer.family("eobot_pool_sessions", "gauge", "Keep-alive sessions in the connection pool, one per base URL")
+    writer.sample("eobot_pool_sessions", stats["sessions"])
+    writer.family("eobot_pool_size", "gauge", "Maximum number of connections kept open per base URL")
+    writer.sample("eobot_pool_size", stats["pool_size"])
+    writer.family("eobot_pool_connections_opened_total", "counter", "Connections opened by the connection pool")
+    writer.sample("eobot_pool_connections_opened_total", stats["connections_opened"])
+    writer.family("eobot_pool_idle_connections", "gauge", "Open connections currently waiting to be reused")
+    writer.sample("eobot_pool_idle_connections", stats["idle_connections"])
+
+
+def _render_single_flight(writer, single_flight):
+    writer.family("eobot_single_flight_in_flight", "gauge", "Distinct requests currently in flight")
+    writer.sample("eobot_single_flight_in_flight", single_flight.get_in_flight())
+    writer.family("eobot_single_flight_shared_total", "counter", "Calls that shared an identical in-flight request")
+    writer.sample("eobot_single_flight_shared_total", single_flight.get_shared())
+
+
+def _render_circuit_breaker(writer, circuit_breaker):
+    stats = circuit_breaker.get_stats()
+
+    writer.family("eobot_circuit_breaker_state", "gauge", "Current circuit breaker state, 1 for the active state")
+    for state in (STATE_CLOSED, STATE_OPEN, STATE_HALF_OPEN):
+        writer.sample("eobot_circuit_breaker_state", 1 if stats["state"] == state else 0, {"state": state})
+    writer.family("eobot_circuit_breaker_rejected_total", "counter", "Requests rejected while the breaker was open")
+    writer.sample("eobot_circuit_breaker_rejected_total", stats["rejected"])
+    writer.family("eobot_circuit_breaker_opened_total", "counter", "Times the circuit breaker opened")
+    writer.sample("eobot_circuit_breaker_opened_total", stats["times_opened"])
+
+
+def render_metrics(collector=None, cache=_DEFAULT, pool=_DEFAULT, single_flight=_DEFAULT, circuit_breaker=None):
+    """
+    Renders the client's metrics in the Prometheus text exposition format
+
+    :param collector       : (Optional) Metrics collector to render the per-method counters and histograms of
+    :param cache           : (Optional) Response cache to render, defaults to the process-wide cache, None to skip
+    :param pool            : (Optional) Connection pool to render, defaults to the process-wide pool, None to skip
+    :param single_flight   : (Optional) Request coalescer to render, defaults to the process-wide one, None to skip
+    :param circuit_breaker : (Optional) Circuit breaker to render the state of
+
+    :type collector       : EobotMetricsCollector|None
+    :type cache           : EobotCache|None
+    :type pool            : EobotConnectionPool|None
+    :type single_flight   : EobotSingleFlight|None
+    :type circuit_breaker : EobotCircuitBreaker|None
+
+    :rtype : str
+    """
+    writer = _MetricsWriter()
+
+    if collector is not None:
+        _render_collector(writer, collector)
+
+    cache = get_cache() if cache is _DEFAULT else cache
+    if cache is not None:
+        _render_cache(writer, cache)
+
+    pool = get_pool() if pool is _DEFAULT else pool
+    if pool is not None:
+        _render_pool(writer, pool)
+
+    single_flight = get_single_flight() if single_flight is _DEFAULT else single_flight
+    if single_flight is not None:
+        _render_single_flight(writer, single_flight)
+
+    if circuit_breaker is not None:
+        _render_circuit_breaker(writer, circuit_breaker)
+
+    return writer.render()
+
+
+class EobotMetricsServer(object):
+    """
+    Tiny HTTP server that serves `render_metrics()` output on /metrics from a background thread
+    """
+    def __init__(self, port=0, host="127.0.0.1", **render_arguments):
+        """
+        :param port             : (Optional) Port to listen on, a free port is picked if not provided
+        :param host             : (Optional) Address to listen on, defaults to localhost only
+        :param render_arguments : (Optional) Arguments to pass to `render_metrics()`
+
+        :type port : int
+        :type host : str
+        """
+        super(EobotMetricsServer, self).__init__()
+
+        if not isinstance(port, int) or isinstance(port, bool) or port < 0:
+            raise ValueError("Invalid port, must be a positive int")
+
+        if not isinstance(host, str):
+            raise ValueError("Invalid host, must be a str")
+
+        self._host = host
+        self._port = port
+        self._render_arguments = render_arguments
+        self._server = None
+        self._thread = None
+
+    def get_port(self):
+        """
+        Returns the port the server listens on, which is only known for sure once it has been started
+
+        :rtype : int
+        """
+        return self._port
+
+    def start(self):
+        """
+        Starts serving metrics in a background thread
+
+        :returns EobotMetricsServer : the current instance, for easy method chaining
+        :rtype : EobotMetricsServer
+        """
+        if self._server is not None:
+            return self
+
+        render_arguments = self._render_arguments
+
+        class MetricsRequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+                body = render_metrics(**render_arguments).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            # noinspection PyShadowingBuiltins
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((self._host, self._port), MetricsRequestHandler)
+        self._port = self._server.server_address[1]
+
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+
+        return self
+
+    def stop(self):
+        """
+        Stops serving metrics
+
+        :returns EobotMetricsServer : the current instance, for easy method chaining
+        :rtype : EobotMetricsServer
+        """
+        if self._server is None:
+            return self
+
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+
+        return self
@@ -0,0 +1,245 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .eobot_config import EobotConfig, get_config
+
+# Every API method is implemented once, as an "operation": a generator that validates its arguments, builds the
+# request parameters, and parses the responses, but leaves all I/O to whoever drives it. Instead of performing an API
+# call it yields an `EobotCall`, and is sent back the decoded response (or has the exception thrown into it). The
+# synchronous methods in `eobot.methods` drive operations with `run_operation()`, the coroutines in `eobot.aio` with
+# `run_operation_async()`, so both share all logic apart from how the bytes travel
+
+# threads that run the operations gathered by `run_operation()`, created on first use and shared by all callers
+GATHER_MAX_WORKERS = 16
+
+_gather_lock = threading.Lock()
+_gather_executor = None
+
+
+class EobotCall(object):
+    """
+    Instruction yielded by an operation to perform a single API request
+    """
+    def __init__(self, parameters, fresh=False):
+        """
+        :param parameters : Request parameters
+        :param fresh      : (Optional) Whether the request must reach the API, instead of being served from the cache or
+                            sharing an identical request in flight, e.g. to verify a write
+
+        :type parameters  : dict
+        :type fresh       : bool
+        """
+        super(EobotCall, self).__init__()
+
+        self.parameters = parameters
+        self.fresh = fresh
+
+
+class EobotSleep(object):
+    """
+    Instruction yielded by an operation to wait before continuing, e.g. between polls
+    """
+    def __init__(self, seconds):
+        """
+        :param seconds : Seconds to wait
+        :type seconds  : float
+        """
+        super(EobotSleep, self).__init__()
+
+        self.seconds = seconds
+
+
+class EobotGather(object):
+    """
+    Instruction yielded by an operation to run other operations concurrently. It is sent back a list with the result of
+    every operation, in order, or the exception that it raised
+    """
+    def __init__(self, operations):
+        """
+        :param operations : Operations to run
+        :type operations  : list
+        """
+        super(EobotGather, self).__init__()
+
+        self.operations = operations
+
+
+class EobotReconcile(object):
+    """
+    Instruction yielded by an operation to read the balances of an account in the background, see
+    `EobotBalanceCache.schedule_reconcile()`. It is sent back whether a reconcile was scheduled
+    """
+    def __init__(self, balance_cache, base_url, user_id, operation):
+        """
+        :param balance_cache : Cache to reconcile
+        :param base_url      : Base URL of the API
+        :param user_id       : Eobot user ID
+        :param operation     : Operation that reads and stores the balances
+
+        :type balance_cache : EobotBalanceCache
+        :type base_url      : str
+        :type user_id       : int
+        :type operation     : generator
+        """
+        super(EobotReconcile, self).__init__()
+
+        self.balance_cache = balance_cache
+        self.base_url = base_url
+        self.user_id = user_id
+        self.operation = operation
+
+
+def resolve_config(config):
+    """
+    Returns the config an operation should use: the global config if `config` is None, the named config if it is a str
+
+    :param config : config, name of a config, or None
+    :type config : EobotConfig|str|None
+
+    :rtype : EobotConfig
+    """
+    if config is None or isinstance(config, str):
+        return get_config(config)
+
+    if not isinstance(config, EobotConfig):
+        raise ValueError("Invalid config, must be a EobotConfig")
+
+    return config
+
+
+def run_operation(operation, request):
+    """
+    Drives an operation to completion, performing its API calls with `request` as template, and returns its result
+
+    :param operation : operation to run
+    :param request   : request object to perform every API call with
+
+    :type operation : generator
+    :type request   : EobotRequest
+
+    :rtype : dict|list|str|int|float|bool
+    """
+    value = None
+    error = None
+
+    while True:
+        try:
+            instruction = operation.send(value) if error is None else operation.throw(error)
+        except StopIteration as e:
+            return e.value
+
+        value = None
+        error = None
+
+        try:
+            if isinstance(instruction, EobotCall):
+                value = request.perform_request(instruction.parameters, instruction.fresh)
+            elif isinstance(instruction, EobotSleep):
+                time.sleep(instruction.seconds)
+            elif isinstance(instruction, EobotGather):
+                value = _gather(instruction.operations, request)
+            elif isinstance(instruction, EobotReconcile):
+                value = instruction.balance_cache.schedule_reconcile(
+                    instruction.base_url, instruction.user_id,
+                    lambda reconcile=instruction.operation: run_operation(reconcile, request)
+                )
+            else:
+                raise TypeError("Unknown instruction {0!r}".format(instruction))
+        except Exception as e:
+            error = e
+
+
+async def run_operation_async(operation, request):
+    """
+    Asynchronous counterpart of `run_operation()`, performing the API calls of an operation with an `EobotAsyncRequest`
+    as template
+
+    :param operation : operation to run
+    :param request   : request object to perform every API call with
+
+    :type operation : generator
+    :type request   : EobotAsyncRequest
+
+    :rtype : dict|list|str|int|float|bool
+    """
+    value = None
+    error = None
+
+    while True:
+        try:
+            instruction = operation.send(value) if error is None else operation.throw(error)
+        except StopIteration as e:
+            return e.value
+
+        value = None
+        error = None
+
+        try:
+            if isinstance(instruction, EobotCall):
+                value = await request.perform_request(instruction.parameters, instruction.fresh)
+            elif isinstance(instruction, EobotSleep):
+                await asyncio.sleep(instruction.seconds)
+            elif isinstance(instruction, EobotGather):
+                value = await asyncio.gather(
+                    *[run_operation_async(gathered, request) for gathered in instruction.operations],
+                    return_exceptions=True
+                )
+                for result in value:
+                    # e.g. a cancelled task, which is not a failure of the operation itself
+                    if isinstance(result, BaseException) and not isinstance(result, Exception):
+                        raise result
+            elif isinstance(instruction, EobotReconcile):
+                value = instruction.balance_cache.schedule_reconcile_async(
+                    instruction.base_url, instruction.user_id,
+                    lambda reconcile=instruction.operation: run_operation_async(reconcile, request)
+                )
+            else:
+                raise TypeError("Unknown instruction {0!r}".format(instruction))
+        except Exception as e:
+            error = e
+
+
+def _get_gather_executor():
+    global _gather_executor
+
+    executor = _gather_executor
+    if executor is not None:
+        return executor
+
+    with _gather_lock:
+        if _gather_executor is None:
+            _gather_executor = ThreadPoolExecutor(max_workers=GATHER_MAX_WORKERS, thread_name_prefix="eobot-gather")
+        return _gather_executor
+
+
+def _run_gathered(operation, request):
+    try:
+        return run_operation(operation, request)
+    except Exception as e:
+        return e
+
+
+def _gather(operations, request):
+    if len(operations) == 0:
+        return []
+
+    executor = _get_gather_executor()
+    futures = [executor.submit(run_operation, operation, request) for operation in operations[1:]]
+
+    results = [_run_gathered(operations[0], request)]
+
+    for operation, future in zip(operations[1:], futures):
+        # operations that no thread has started yet run on this one instead, so that gathers nested in gathered
+        # operations never wait for a thread of the shared executor while all of them are waiting themselves
+        if future.cancel():
+            results.append(_run_gathered(operation, request))
+            continue
+
+        try:
+            results.append(future.result())
+        except Exception as e:
+            results.append(e)
+
+    return results
@@ -0,0 +1,167 @@
+import threading
+
+
+class EobotConnectionPool(object):
+    """
+    Thread-safe registry of keep-alive `requests` sessions, one per base URL, so that consecutive API calls can reuse
+    already established TCP/TLS connections instead of performing a new handshake for every request
+    """
+    def __init__(self, pool_size=10, keep_alive=True):
+        """
+        :param pool_size  : (Optional) Maximum number of connections to keep open per base URL
+        :param keep_alive : (Optional) Whether to keep connections open after a request has completed
+
+        :type pool_size  : int
+        :type keep_alive : bool
+        """
+        super(EobotConnectionPool, self).__init__()
+
+        self._lock = threading.Lock()
+        self._sessions = {}
+        self._pool_size = 10
+        self._keep_alive = True
+
+        self.set_pool_size(pool_size)
+        self.set_keep_alive(keep_alive)
+
+    def set_pool_size(self, pool_size):
+        """
+        Sets the maximum number of connections to keep open per base URL. Any sessions that were already created are
+        closed, so that new sessions pick up the new pool size
+
+        :param pool_size : maximum number of connections per base URL
+        :type pool_size : int
+
+        :returns EobotConnectionPool : the current instance, for easy method chaining
+        :rtype : EobotConnectionPool
+        """
+        if not isinstance(pool_size, int) or isinstance(pool_size, bool) or pool_size < 1:
+            raise ValueError("Invalid pool_size, must be a positive int")
+
+        self._pool_size = pool_size
+        self.close()
+        return self
+
+    def get_pool_size(self):
+        """
+        Returns the maximum number of connections to keep open per base URL
+
+        :rtype : int
+        """
+        return self._pool_size
+
+    def set_keep_alive(self, keep_alive):
+        """
+        Sets whether connections are kept open after a request has completed
+
+        :param keep_alive : whether to keep connections open
+        :type keep_alive : bool
+
+        :returns EobotConnectionPool : the current instance, for easy method chaining
+        :rtype : EobotConnectionPool
+        """
+        if not isinstance(keep_alive, bool):
+            raise ValueError("Invalid keep_alive, must be a bool")
+
+        self._keep_alive = keep_alive
+        return self
+
+    def get_keep_alive(self):
+        """
+        Returns whether connections are kept open after a request has completed
+
+        :rtype : bool
+        """
+        return self._keep_alive
+
+    def get_session(self, base_url):
+        """
+        Returns the shared session for `base_url`, creating it if it does not exist yet
+
+        :param base_url : base URL the session will be used for
+        :type base_url : str
+
+        :rtype : requests.Session
+        """
+        if not isinstance(base_url, str):
+            raise ValueError("Invalid base_url, must be a str")
+
+        session = self._sessions.get(base_url)
+        if session is not None:
+            return session
+
+        # every API method imports this module through the request, but only the requests transport ever asks for a
+        # session, so with any other transport requests is never imported
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        with self._lock:
+            session = self._sessions.get(base_url)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self._pool_size)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[base_url] = session
+
+        return session
+
+    def get_stats(self):
+        """
+        Returns the pool usage: number of "sessions", configured "pool_size", number of "connections_opened" so far and
+        the number of "idle_connections" currently kept open
+
+        :rtype : dict
+        """
+        with self._lock:
+            sessions = list(self._sessions.values())
+
+        opened = 0
+        idle = 0
+
+        for session in sessions:
+            for adapter in set(session.adapters.values()):
+                pools = adapter.poolmanager.pools
+                for key in pools.keys():
+                    connection_pool = pools.get(key)
+                    if connection_pool is None:
+                        continue
+                    opened += connection_pool.num_connections
+                    queue = getattr(connection_pool, "pool", None)
+                    if queue is not None:
+                        idle += sum(1 for connection in list(queue.queue) if connection is not None)
+
+        return {
+            "sessions": len(sessions),
+            "pool_size": self._pool_size,
+            "connections_opened": opened,
+            "idle_connections": idle,
+        }
+
+    def close(self):
+        """
+        Closes all sessions and their open connections
+
+        :returns EobotConnectionPool : the current instance, for easy method chaining
+        :rtype : EobotConnectionPool
+        """
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions = {}
+
+        for session in sessions:
+            session.close()
+
+        return self
+
+
+_pool = EobotConnectionPool()
+
+
+def get_pool():
+    """
+    Returns the process-wide `EobotConnectionPool` that is used by default for all API calls
+
+    :rtype : EobotConnectionPool
+    """
+    return _pool
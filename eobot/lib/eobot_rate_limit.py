@@ -0,0 +1,280 @@
+import asyncio
+import threading
+import time
+
+from .eobot_errors import EobotRateLimitError
+
+
+class EobotTokenBucket(object):
+    """
+    Thread-safe token bucket: tokens are added at a fixed rate up to a maximum burst capacity, and every request takes
+    one. Requests that find the bucket empty wait until enough tokens have been added, which paces them evenly
+    """
+    def __init__(self, rate, capacity=None):
+        """
+        :param rate     : Number of tokens added per second
+        :param capacity : (Optional) Maximum number of tokens, i.e. the largest allowed burst, defaults to `rate`
+
+        :type rate     : float|int
+        :type capacity : float|int|None
+        """
+        super(EobotTokenBucket, self).__init__()
+
+        if (not isinstance(rate, float) and not isinstance(rate, int)) or isinstance(rate, bool) or rate <= 0:
+            raise ValueError("Invalid rate, must be a positive float or int")
+
+        if capacity is None:
+            capacity = max(1.0, float(rate))
+        elif (not isinstance(capacity, float) and not isinstance(capacity, int)) or capacity < 1:
+            raise ValueError("Invalid capacity, must be a float or int of at least 1")
+
+        self._lock = threading.Lock()
+        self._rate = float(rate)
+        self._capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+
+    def get_rate(self):
+        """
+        Returns the number of tokens added per second
+
+        :rtype : float
+        """
+        return self._rate
+
+    def get_capacity(self):
+        """
+        Returns the maximum number of tokens
+
+        :rtype : float
+        """
+        return self._capacity
+
+    def get_tokens(self):
+        """
+        Returns the number of tokens currently available, which is negative if waiting requests have reserved tokens
+        that have not been added yet
+
+        :rtype : float
+        """
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def reserve(self, tokens=1, max_delay=None):
+        """
+        Takes `tokens` from the bucket, even if they have not been added yet, and returns how long the caller has to
+        wait before using them. If that would take longer than `max_delay`, nothing is taken and None is returned
+
+        :param tokens    : (Optional) Number of tokens to take
+        :param max_delay : (Optional) Maximum number of seconds the caller is willing to wait
+
+        :type tokens    : float|int
+        :type max_delay : float|int|None
+
+        :returns float|None : seconds to wait, or None if the tokens were not taken
+        :rtype : float|None
+        """
+        with self._lock:
+            self._refill()
+
+            delay = max(0.0, (tokens - self._tokens) / self._rate)
+            if max_delay is not None and delay > max_delay:
+                return None
+
+            self._tokens -= tokens
+            return delay
+
+    def refund(self, tokens=1):
+        """
+        Returns previously reserved tokens to the bucket
+
+        :param tokens : (Optional) Number of tokens to return
+        :type tokens : float|int
+        """
+        with self._lock:
+            self._tokens = min(self._capacity, self._tokens + tokens)
+
+    def try_acquire(self, tokens=1):
+        """
+        Takes `tokens` from the bucket only if they are available right away
+
+        :rtype : bool
+        """
+        return self.reserve(tokens, 0) is not None
+
+    def acquire(self, tokens=1, blocking=True, timeout=None):
+        """
+        Takes `tokens` from the bucket, waiting for them to be added if needed
+
+        :param tokens   : (Optional) Number of tokens to take
+        :param blocking : (Optional) Whether to wait for tokens, if False this is the same as `try_acquire()`
+        :param timeout  : (Optional) Maximum number of seconds to wait, waits as long as needed if not provided
+
+        :type tokens   : float|int
+        :type blocking : bool
+        :type timeout  : float|int|None
+
+        :returns bool : whether the tokens were taken
+        :rtype : bool
+        """
+        delay = self.reserve(tokens, timeout if blocking else 0)
+        if delay is None:
+            return False
+
+        if delay > 0:
+            time.sleep(delay)
+
+        return True
+
+    async def acquire_async(self, tokens=1, blocking=True, timeout=None):
+        """
+        Asyncio counterpart of `acquire()`, which waits without blocking the event loop
+
+        :rtype : bool
+        """
+        delay = self.reserve(tokens, timeout if blocking else 0)
+        if delay is None:
+            return False
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        return True
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+
+class EobotRateLimiter(object):
+    """
+    Client-side rate limiter consulted by `EobotRequest` before every API call. It keeps a token bucket per base URL
+    and, optionally, a separate token bucket per Eobot user ID, and a request needs a token from both
+    """
+    def __init__(self, rate=None, capacity=None, account_rate=None, account_capacity=None, blocking=True,
+                 timeout=None):
+        """
+        :param rate             : (Optional) Requests per second allowed per base URL, unlimited if not provided
+        :param capacity         : (Optional) Burst allowed per base URL, defaults to `rate`
+        :param account_rate     : (Optional) Requests per second allowed per user ID, unlimited if not provided
+        :param account_capacity : (Optional) Burst allowed per user ID, defaults to `account_rate`
+        :param blocking         : (Optional) Whether requests wait for a token, or fail right away if none is available
+        :param timeout          : (Optional) Maximum number of seconds a request waits for a token
+
+        :type rate             : float|int|None
+        :type capacity         : float|int|None
+        :type account_rate     : float|int|None
+        :type account_capacity : float|int|None
+        :type blocking         : bool
+        :type timeout          : float|int|None
+        """
+        super(EobotRateLimiter, self).__init__()
+
+        if not isinstance(blocking, bool):
+            raise ValueError("Invalid blocking, must be a bool")
+
+        if timeout is not None and ((not isinstance(timeout, float) and not isinstance(timeout, int)) or timeout < 0):
+            raise ValueError("Invalid timeout, must be a positive float or int, or None")
+
+        # validate the bucket settings right away, instead of on the first request
+        if rate is not None:
+            EobotTokenBucket(rate, capacity)
+        if account_rate is not None:
+            EobotTokenBucket(account_rate, account_capacity)
+
+        self._lock = threading.Lock()
+        self._rate = rate
+        self._capacity = capacity
+        self._account_rate = account_rate
+        self._account_capacity = account_capacity
+        self._blocking = blocking
+        self._timeout = timeout
+        self._buckets = {}
+        self._account_buckets = {}
+
+    def get_bucket(self, base_url):
+        """
+        Returns the token bucket for `base_url`, or None if requests are not limited per base URL
+
+        :rtype : EobotTokenBucket|None
+        """
+        if self._rate is None:
+            return None
+
+        return self._get_or_create(self._buckets, base_url, self._rate, self._capacity)
+
+    def get_account_bucket(self, user_id):
+        """
+        Returns the token bucket for `user_id`, or None if requests are not limited per user ID
+
+        :rtype : EobotTokenBucket|None
+        """
+        if self._account_rate is None or user_id is None:
+            return None
+
+        return self._get_or_create(self._account_buckets, str(user_id), self._account_rate, self._account_capacity)
+
+    def reserve(self, base_url, user_id=None):
+        """
+        Takes a token from every bucket that applies to a request, and returns how long the request has to wait
+
+        :param base_url : base URL of the request
+        :param user_id  : (Optional) Eobot user ID the request applies to
+
+        :type base_url : str
+        :type user_id  : int|None
+
+        :raises EobotRateLimitError : if the request would have to wait longer than allowed
+
+        :rtype : float
+        """
+        max_delay = self._timeout if self._blocking else 0
+        buckets = [bucket for bucket in (self.get_account_bucket(user_id), self.get_bucket(base_url)) if bucket]
+
+        reserved = []
+        delay = 0.0
+
+        for bucket in buckets:
+            bucket_delay = bucket.reserve(1, max_delay)
+            if bucket_delay is None:
+                for reserved_bucket in reserved:
+                    reserved_bucket.refund(1)
+                raise EobotRateLimitError("Rate limit exceeded for {0}".format(base_url))
+
+            reserved.append(bucket)
+            delay = max(delay, bucket_delay)
+
+        return delay
+
+    def acquire(self, base_url, user_id=None):
+        """
+        Waits until a request is allowed by every bucket that applies to it
+
+        :raises EobotRateLimitError : if the request would have to wait longer than allowed
+        """
+        delay = self.reserve(base_url, user_id)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, base_url, user_id=None):
+        """
+        Asyncio counterpart of `acquire()`, which waits without blocking the event loop
+
+        :raises EobotRateLimitError : if the request would have to wait longer than allowed
+        """
+        delay = self.reserve(base_url, user_id)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _get_or_create(self, buckets, key, rate, capacity):
+        bucket = buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = buckets.get(key)
+                if bucket is None:
+                    bucket = EobotTokenBucket(rate, capacity)
+                    buckets[key] = bucket
+
+        return bucket
@@ -1,10 +1,29 @@
+import json
+import time
+
+from urllib.parse import urlencode, urlsplit
+
 from .._version import __version__
-import requests
+from .eobot_cache import EobotCache, get_cache
+from .eobot_circuit_breaker import EobotCircuitBreaker
+from .eobot_endpoints import get_endpoint, get_request_key, get_request_user_id
+from .eobot_errors import EobotCircuitOpenError, EobotRequestError, EobotResponseError, EobotServerError
+from .eobot_instrumentation import EobotRequestEvent, EobotRequestObserver, get_default_observers, notify_observers
+from .eobot_pool import EobotConnectionPool, get_pool
+from .eobot_rate_limit import EobotRateLimiter
+from .eobot_retry import EobotRetryPolicy, get_retry_policy
+from .eobot_single_flight import EobotSingleFlight, get_single_flight
+from .eobot_transport import EobotRequestsTransport, EobotTransport, get_default_transport
+
+# used by requests that do not have a transport of their own
+_requests_transport = EobotRequestsTransport()
 
 
 class EobotRequest(object):
     """
-    Wrapper around the `requests` library to perform API requests
+    Performs API requests, using the `requests` library unless another transport is set. A request object is a
+    template: `perform_request()` merges the parameters of a call into its own without changing them, so one request
+    can be shared by any number of threads, as long as its setters are not called concurrently
     """
     def __init__(self):
         super(EobotRequest, self).__init__()
@@ -13,7 +32,16 @@ class EobotRequest(object):
         self._validate_ssl = True
         self._user_agent = 'RickDenHaan-Eobot/{0} (+http://github.com/rickdenhaan/eobot-py)'.format(__version__)
         self._base_url = 'https://www.eobot.com/api.aspx'
+        self._address, self._target_prefix = _split_base_url(self._base_url)
         self._parameters = {}
+        self._pool = get_pool()
+        self._cache = get_cache()
+        self._single_flight = get_single_flight()
+        self._retry_policy = get_retry_policy()
+        self._rate_limiter = None
+        self._circuit_breaker = None
+        self._observers = get_default_observers()
+        self._transport = get_default_transport()
 
     def set_timeout(self, timeout):
         """
@@ -101,6 +129,7 @@ class EobotRequest(object):
             raise ValueError("Invalid base_url, must be a str")
 
         self._base_url = base_url
+        self._address, self._target_prefix = _split_base_url(base_url)
         return self
 
     def get_base_url(self):
@@ -111,9 +140,29 @@ class EobotRequest(object):
         """
         return self._base_url
 
+    def get_address(self):
+        """
+        Returns the scheme (in lower case), host name and port of the base URL, the port is None if the URL has none
+
+        :rtype : tuple
+        """
+        return self._address
+
+    def get_target(self, parameters):
+        """
+        Returns the request target, the path and query string, to send `parameters` to the base URL with. Only the
+        parameters are encoded, the rest is prepared when the base URL is set
+
+        :param parameters : request parameters
+        :type parameters : dict
+
+        :rtype : str
+        """
+        return self._target_prefix + urlencode(parameters, doseq=True)
+
     def set_parameters(self, parameters):
         """
-        Sets the request parameters
+        Sets the request parameters that every call includes
 
         :param parameters : request parameters
         :type parameters : dict
@@ -124,12 +173,12 @@ class EobotRequest(object):
         if not isinstance(parameters, dict):
             raise ValueError("Invalid parameters, must be a dict")
 
-        self._parameters = parameters
+        self._parameters = dict(parameters)
         return self
 
     def set_parameter(self, parameter, value):
         """
-        Sets a specific request parameter
+        Sets a specific request parameter that every call includes
 
         :param parameter : parameter to set
         :param value : value to set for the parameter
@@ -143,16 +192,228 @@ class EobotRequest(object):
         if not isinstance(parameter, str):
             raise ValueError("Invalid parameter, must be a str")
 
-        self._parameters[parameter] = value
+        # replaced rather than changed, so that calls that are in progress keep the parameters they started with
+        parameters = dict(self._parameters)
+        parameters[parameter] = value
+
+        self._parameters = parameters
         return self
 
     def get_parameters(self):
         """
-        Returns the current request parameters
+        Returns a copy of the request parameters that every call includes
 
         :rtype : dict
         """
-        return self._parameters
+        return dict(self._parameters)
+
+    def set_pool(self, pool):
+        """
+        Sets the connection pool to use for the request
+
+        :param pool : connection pool to use, can be None to open a new connection for every request
+        :type pool : EobotConnectionPool|None
+
+        :returns EobotRequest : the current instance, for easy method chaining
+        :rtype : EobotRequest
+        """
+        if pool is not None and not isinstance(pool, EobotConnectionPool):
+            raise ValueError("Invalid pool, must be a EobotConnectionPool or None")
+
+        self._pool = pool
+        return self
+
+    def get_pool(self):
+        """
+        Returns the connection pool used for the request
+
+        :rtype : EobotConnectionPool|None
+        """
+        return self._pool
+
+    def set_cache(self, cache):
+        """
+        Sets the response cache to use for the request. The cache is only used while it is enabled
+
+        :param cache : response cache to use, can be None to never use a cache for this request
+        :type cache : EobotCache|None
+
+        :returns EobotRequest : the current instance, for easy method chaining
+        :rtype : EobotRequest
+        """
+        if cache is not None and not isinstance(cache, EobotCache):
+            raise ValueError("Invalid cache, must be a EobotCache or None")
+
+        self._cache = cache
+        return self
+
+    def get_cache(self):
+        """
+        Returns the response cache used for the request
+
+        :rtype : EobotCache|None
+        """
+        return self._cache
+
+    def set_single_flight(self, single_flight):
+        """
+        Sets the coalescer that lets identical read requests that are in flight at the same time share one API call,
+        for the endpoints it coalesces
+
+        :param single_flight : coalescer to use, can be None to always perform this request separately
+        :type single_flight : EobotSingleFlight|None
+
+        :returns EobotRequest : the current instance, for easy method chaining
+        :rtype : EobotRequest
+        """
+        if single_flight is not None and not isinstance(single_flight, EobotSingleFlight):
+            raise ValueError("Invalid single_flight, must be a EobotSingleFlight or None")
+
+        self._single_flight = single_flight
+        return self
+
+    def get_single_flight(self):
+        """
+        Returns the coalescer used for the request
+
+        :rtype : EobotSingleFlight|None
+        """
+        return self._single_flight
+
+    def set_retry_policy(self, retry_policy):
+        """
+        Sets the policy that decides whether failed requests are retried
+
+        :param retry_policy : retry policy to use, can be None to never retry this request
+        :type retry_policy : EobotRetryPolicy|None
+
+        :returns EobotRequest : the current instance, for easy method chaining
+        :rtype : EobotRequest
+        """
+        if retry_policy is not None and not isinstance(retry_policy, EobotRetryPolicy):
+            raise ValueError("Invalid retry_policy, must be a EobotRetryPolicy or None")
+
+        self._retry_policy = retry_policy
+        return self
+
+    def get_retry_policy(self):
+        """
+        Returns the policy that decides whether failed requests are retried
+
+        :rtype : EobotRetryPolicy|None
+        """
+        return self._retry_policy
+
+    def set_rate_limiter(self, rate_limiter):
+        """
+        Sets the rate limiter that is consulted before every API call
+
+        :param rate_limiter : rate limiter to use, can be None to not limit the request rate
+        :type rate_limiter : EobotRateLimiter|None
+
+        :returns EobotRequest : the current instance, for easy method chaining
+        :rtype : EobotRequest
+        """
+        if rate_limiter is not None and not isinstance(rate_limiter, EobotRateLimiter):
+            raise ValueError("Invalid rate_limiter, must be a EobotRateLimiter or None")
+
+        self._rate_limiter = rate_limiter
+        return self
+
+    def get_rate_limiter(self):
+        """
+        Returns the rate limiter that is consulted before every API call
+
+        :rtype : EobotRateLimiter|None
+        """
+        return self._rate_limiter
+
+    def set_circuit_breaker(self, circuit_breaker):
+        """
+        Sets the circuit breaker that makes the request fail fast while the API is failing
+
+        :param circuit_breaker : circuit breaker to use, can be None to always contact the API
+        :type circuit_breaker : EobotCircuitBreaker|None
+
+        :returns EobotRequest : the current instance, for easy method chaining
+        :rtype : EobotRequest
+        """
+        if circuit_breaker is not None and not isinstance(circuit_breaker, EobotCircuitBreaker):
+            raise ValueError("Invalid circuit_breaker, must be a EobotCircuitBreaker or None")
+
+        self._circuit_breaker = circuit_breaker
+        return self
+
+    def get_circuit_breaker(self):
+        """
+        Returns the circuit breaker used for the request
+
+        :rtype : EobotCircuitBreaker|None
+        """
+        return self._circuit_breaker
+
+    def set_transport(self, transport):
+        """
+        Sets the transport that sends the request
+
+        :param transport : transport to use, can be None to use the `requests` library
+        :type transport : EobotTransport|None
+
+        :returns EobotRequest : the current instance, for easy method chaining
+        :rtype : EobotRequest
+        """
+        if transport is not None and not isinstance(transport, EobotTransport):
+            raise ValueError("Invalid transport, must be a EobotTransport or None")
+
+        self._transport = transport
+        return self
+
+    def get_transport(self):
+        """
+        Returns the transport that sends the request, None if it uses the `requests` library
+
+        :rtype : EobotTransport|None
+        """
+        return self._transport
+
+    def add_observer(self, observer):
+        """
+        Adds an observer that is notified before and after every API call
+
+        :param observer : observer to add
+        :type observer : EobotRequestObserver
+
+        :returns EobotRequest : the current instance, for easy method chaining
+        :rtype : EobotRequest
+        """
+        if not isinstance(observer, EobotRequestObserver):
+            raise ValueError("Invalid observer, must be a EobotRequestObserver")
+
+        if observer not in self._observers:
+            self._observers = self._observers + [observer]
+
+        return self
+
+    def remove_observer(self, observer):
+        """
+        Removes an observer that was added through `add_observer()`
+
+        :param observer : observer to remove
+        :type observer : EobotRequestObserver
+
+        :returns EobotRequest : the current instance, for easy method chaining
+        :rtype : EobotRequest
+        """
+        self._observers = [current for current in self._observers if current is not observer]
+        return self
+
+    def get_observers(self):
+        """
+        Returns the observers that are notified before and after every API call
+
+        :rtype : list
+        """
+        return list(self._observers)
 
     def clone(self):
         """
@@ -160,37 +421,202 @@ class EobotRequest(object):
 
         :rtype : EobotRequest
         """
-        clone = EobotRequest()
+        clone = self.__class__()
         clone.set_timeout(self.get_timeout())
         clone.set_validate_ssl(self.get_validate_ssl())
         clone.set_user_agent(self.get_user_agent())
         clone.set_base_url(self.get_base_url())
+        clone.set_pool(self.get_pool())
+        clone.set_cache(self.get_cache())
+        clone.set_single_flight(self.get_single_flight())
+        clone.set_retry_policy(self.get_retry_policy())
+        clone.set_rate_limiter(self.get_rate_limiter())
+        clone.set_circuit_breaker(self.get_circuit_breaker())
+        clone.set_transport(self.get_transport())
+        clone._observers = list(self._observers)
 
         return clone
 
-    def perform_request(self):
+    def perform_request(self, parameters=None, fresh=False):
         """
         Performs the API request and returns the response value
 
+        :param parameters : (Optional) parameters of this call, added to (or overriding) the request's own parameters
+        :type parameters : dict|None
+
+        :param fresh : (Optional) Set to True to send the request to the API even if its response is cached or an
+                       identical request is in flight, e.g. to verify a write. The response is still cached
+        :type fresh : bool
+
         :rtype : dict
         """
-        url = self.get_base_url()
-        headers = {
-            "User-Agent": self.get_user_agent()
-        }
+        parameters = self._merge_parameters(parameters)
+
+        endpoint = get_endpoint(parameters)
+        observers = self._observers
 
-        parameters = self.get_parameters()
-        parameters["json"] = "true"
+        if len(observers) == 0:
+            return self._perform(endpoint, parameters, fresh, None)
 
-        response = requests.get(
-            url,
-            params=parameters,
-            headers=headers,
-            timeout=self.get_timeout(),
-            verify=self.get_validate_ssl()
-        )
+        event = EobotRequestEvent(endpoint, self.get_base_url(), parameters)
+        notify_observers(observers, "before_request", event)
+        started = time.perf_counter()
 
         try:
-            return response.json()
-        except:
-            raise RuntimeError("Unexpected non-JSON response: {0}".format(response.text))
+            return self._perform(endpoint, parameters, fresh, event)
+        except BaseException as e:
+            event.error = e
+            raise
+        finally:
+            event.latency = time.perf_counter() - started
+            notify_observers(observers, "after_request", event)
+
+    def _merge_parameters(self, parameters):
+        # the parameters of a single call, leaving the request's own parameters untouched
+        merged = dict(self._parameters)
+
+        if parameters is not None:
+            if not isinstance(parameters, dict):
+                raise ValueError("Invalid parameters, must be a dict or None")
+
+            merged.update(parameters)
+
+        merged["json"] = "true"
+        return merged
+
+    def _perform(self, endpoint, parameters, fresh, event):
+        cache = self._get_active_cache(endpoint)
+        single_flight = None if fresh else self._get_active_single_flight(endpoint)
+
+        if cache is not None or single_flight is not None:
+            key = get_request_key(self.get_base_url(), parameters)
+
+        if cache is not None and not fresh:
+            hit, result = cache.lookup(key)
+            if hit:
+                if event is not None:
+                    event.cached = True
+                return result
+
+        if single_flight is None:
+            result = self._send_with_retries(endpoint, parameters, event)
+        else:
+            sent = []
+
+            def send():
+                sent.append(True)
+                return self._send_with_retries(endpoint, parameters, event)
+
+            result = single_flight.do(key, send)
+
+            if event is not None and len(sent) == 0:
+                event.coalesced = True
+
+        if cache is not None:
+            cache.store(key, endpoint, result)
+
+        return result
+
+    def _get_active_cache(self, endpoint):
+        cache = self._cache
+        if cache is None or not cache.is_enabled() or not cache.is_cacheable(endpoint):
+            return None
+
+        return cache
+
+    def _get_active_single_flight(self, endpoint):
+        single_flight = self._single_flight
+        if single_flight is None or not single_flight.is_coalesced(endpoint):
+            return None
+
+        return single_flight
+
+    def _send_with_retries(self, endpoint, parameters, event):
+        retry_policy = self._retry_policy
+        rate_limiter = self._rate_limiter
+        circuit_breaker = self._circuit_breaker
+        user_id = get_request_user_id(parameters)
+        attempt = 0
+        started = time.monotonic()
+
+        while True:
+            if rate_limiter is not None:
+                rate_limiter.acquire(self.get_base_url(), user_id)
+
+            if circuit_breaker is not None and not circuit_breaker.allow_request():
+                raise EobotCircuitOpenError("Circuit breaker is open, not contacting {0}".format(self.get_base_url()))
+
+            answered = False
+            try:
+                status, body = self._fetch(parameters)
+                answered = True
+
+                if event is not None:
+                    event.status = status
+                    event.bytes += len(body)
+
+                result = self._parse_response(status, body)
+            except BaseException as e:
+                if circuit_breaker is not None:
+                    if circuit_breaker.is_failure(e):
+                        circuit_breaker.record_failure()
+                    elif isinstance(e, Exception) and (answered or isinstance(e, EobotResponseError)):
+                        circuit_breaker.record_success()
+                    else:
+                        # e.g. a cancelled or interrupted request, which shows nothing about whether the API works
+                        circuit_breaker.release()
+
+                if not isinstance(e, EobotRequestError) or retry_policy is None \
+                        or not retry_policy.should_retry(endpoint, e, attempt, time.monotonic() - started):
+                    raise
+
+                time.sleep(retry_policy.get_delay(attempt))
+                attempt += 1
+
+                if event is not None:
+                    event.retries = attempt
+
+                continue
+
+            if circuit_breaker is not None:
+                circuit_breaker.record_success()
+
+            if retry_policy is not None:
+                retry_policy.record_success()
+
+            return result
+
+    def _fetch(self, parameters):
+        transport = self._transport
+        if transport is None:
+            transport = _requests_transport
+
+        return transport.send(self, parameters)
+
+    @staticmethod
+    def _parse_response(status, body):
+        text = body.decode("utf-8", "replace")
+
+        if status >= 500:
+            raise EobotServerError("Unexpected server error {0}: {1}".format(status, text))
+
+        try:
+            return json.loads(text)
+        except ValueError:
+            raise EobotResponseError("Unexpected non-JSON response: {0}".format(text))
+
+
+def _split_base_url(base_url):
+    # the address to connect to and the start of every request target, prepared once per base URL
+    url = urlsplit(base_url)
+
+    try:
+        port = url.port
+    except ValueError:
+        port = None
+
+    prefix = (url.path or "/") + "?"
+    if url.query:
+        prefix += url.query + "&"
+
+    return (url.scheme.lower(), url.hostname, port), prefix
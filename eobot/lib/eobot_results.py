@@ -0,0 +1,167 @@
+import threading
+from array import array
+from collections.abc import Mapping
+
+# key indexes shared by all results with the same keys in the same order, which is the norm for accounts that hold the
+# same coins or run the same miners, so that every result only keeps its own values
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+# more distinct key sets than this are not shared anymore, to bound the memory the indexes themselves take
+MAX_SHARED_INDEXES = 1024
+
+
+def get_shared_index(keys):
+    """
+    Returns a dict with the position of every key in `keys`, the same dict for every call with the same keys
+
+    :param keys : keys, in order
+    :type keys : tuple
+
+    :rtype : dict
+    """
+    index = _indexes.get(keys)
+    if index is not None:
+        return index
+
+    index = dict((key, position) for position, key in enumerate(keys))
+
+    with _indexes_lock:
+        if len(_indexes) >= MAX_SHARED_INDEXES:
+            return index
+
+        return _indexes.setdefault(keys, index)
+
+
+def validate_compact(compact):
+    """
+    Raises a ValueError if `compact` is not a bool
+
+    :type compact : bool
+    """
+    if not isinstance(compact, bool):
+        raise ValueError("Invalid compact, must be a bool")
+
+
+class EobotAmounts(Mapping):
+    """
+    Read-only mapping of names to amounts, such as coins to balances or miners to speeds, that takes far less memory
+    than a dict: the keys are shared with every other result that has the same keys, and the values are kept as received
+    until the first one is read, when they are all converted into an array of floats
+    """
+    __slots__ = ("_index", "_values")
+
+    def __init__(self, amounts):
+        """
+        :param amounts : Amounts by name, as str, int or float
+        :type amounts  : dict|Mapping
+        """
+        super(EobotAmounts, self).__init__()
+
+        self._index = get_shared_index(tuple(amounts))
+        self._values = tuple(amounts[key] for key in self._index)
+
+    def __getitem__(self, key):
+        position = self._index[key]
+
+        values = self._values
+        if values.__class__ is not array:
+            values = self._values = array("d", [float(value) for value in values])
+
+        return values[position]
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __repr__(self):
+        return "{0}({1!r})".format(self.__class__.__name__, dict(self.items()))
+
+    def __reduce__(self):
+        return self.__class__, (dict(self.items()),)
+
+
+class EobotCoinTable(Mapping):
+    """
+    Read-only mapping of coins to their details, as returned by `get_supported_coins`, stored as one column per field
+    instead of a dict per coin. Only the fields it was created with are kept, prices are converted into an array of
+    floats when the first one is read. Every lookup returns a new dict with the details of the coin; `get_price()`
+    reads just the price
+    """
+    __slots__ = ("_index", "_fields", "_columns")
+
+    def __init__(self, coins, fields=None):
+        """
+        :param coins  : Details by coin, each a dict with at least the fields to keep
+        :param fields : (Optional) Fields to keep, defaults to all fields of the first coin
+
+        :type coins  : dict|Mapping
+        :type fields : tuple|list|None
+        """
+        super(EobotCoinTable, self).__init__()
+
+        self._index = get_shared_index(tuple(coins))
+
+        if fields is None:
+            fields = tuple(coins[next(iter(self._index))]) if len(self._index) > 0 else ()
+        elif not isinstance(fields, tuple) and not isinstance(fields, list):
+            raise ValueError("Invalid fields, must be a tuple or list")
+
+        self._fields = tuple(fields)
+        self._columns = [tuple(coins[coin][field] for coin in self._index) for field in self._fields]
+
+    def get_fields(self):
+        """
+        Returns the fields kept for every coin
+
+        :rtype : tuple
+        """
+        return self._fields
+
+    def get_price(self, coin):
+        """
+        Returns the price of `coin` in US dollar
+
+        :param coin : cryptocurrency
+        :type coin : str
+
+        :raises KeyError : if the coin is not supported, or prices were not kept
+
+        :rtype : float
+        """
+        if "Price" not in self._fields:
+            raise KeyError("Price")
+
+        return self._get(coin, self._fields.index("Price"))
+
+    def _get(self, coin, field):
+        position = self._index[coin]
+
+        column = self._columns[field]
+        if self._fields[field] == "Price" and column.__class__ is not array:
+            column = self._columns[field] = array("d", [float(value) for value in column])
+
+        return column[position]
+
+    def __getitem__(self, coin):
+        return dict((field, self._get(coin, number)) for number, field in enumerate(self._fields))
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, coin):
+        return coin in self._index
+
+    def __repr__(self):
+        return "{0}({1!r}, fields={2!r})".format(self.__class__.__name__, dict(self.items()), self._fields)
+
+    def __reduce__(self):
+        return self.__class__, (dict(self.items()), self._fields)
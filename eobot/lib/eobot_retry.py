@@ -0,0 +1,228 @@
+import random
+import threading
+
+from .eobot_endpoints import is_write_endpoint
+from .eobot_errors import EobotConnectionError, EobotServerError
+
+
+class EobotRetryBudget(object):
+    """
+    Limits the number of retries across all requests sharing the budget, so that retries cannot multiply the load on
+    the API during an outage. Every retry withdraws a token, every successful request deposits a fraction of one
+    """
+    def __init__(self, max_tokens=10.0, token_ratio=0.1):
+        """
+        :param max_tokens  : (Optional) Maximum number of retries that can be saved up
+        :param token_ratio : (Optional) Fraction of a retry that is earned by every successful request, e.g. 0.1 allows
+                             one retry per ten successful requests once the saved up retries are used
+
+        :type max_tokens  : float|int
+        :type token_ratio : float|int
+        """
+        super(EobotRetryBudget, self).__init__()
+
+        if (not isinstance(max_tokens, float) and not isinstance(max_tokens, int)) or max_tokens < 1:
+            raise ValueError("Invalid max_tokens, must be a float or int of at least 1")
+
+        if (not isinstance(token_ratio, float) and not isinstance(token_ratio, int)) or token_ratio < 0:
+            raise ValueError("Invalid token_ratio, must be a positive float or int")
+
+        self._lock = threading.Lock()
+        self._max_tokens = float(max_tokens)
+        self._token_ratio = float(token_ratio)
+        self._tokens = float(max_tokens)
+
+    def get_tokens(self):
+        """
+        Returns the number of retries currently available
+
+        :rtype : float
+        """
+        return self._tokens
+
+    def withdraw(self):
+        """
+        Withdraws a token for a single retry, if one is available
+
+        :returns bool : whether the retry may be performed
+        :rtype : bool
+        """
+        with self._lock:
+            if self._tokens < 1:
+                return False
+
+            self._tokens -= 1
+            return True
+
+    def deposit(self):
+        """
+        Deposits the fraction of a token that is earned by a successful request
+        """
+        with self._lock:
+            self._tokens = min(self._max_tokens, self._tokens + self._token_ratio)
+
+
+class EobotRetryPolicy(object):
+    """
+    Decides whether and when a failed request is retried, using exponential backoff with full jitter. Only transient
+    errors (connection problems, timeouts and server errors) are retried, and write methods are never retried unless
+    explicitly allowed, since they are not guaranteed to be idempotent. No retry is started once `max_elapsed` seconds
+    have passed since the first attempt, so a request takes at most `max_elapsed + backoff_max` seconds plus the
+    request timeout, and an attempt that runs into the timeout is not retried unless the timeout is below `max_elapsed`
+    """
+    def __init__(self, max_retries=3, backoff_base=0.1, backoff_max=5.0, jitter=True, retry_writes=False,
+                 budget=None, retryable_errors=(EobotConnectionError, EobotServerError), max_elapsed=10.0):
+        """
+        :param max_retries      : (Optional) Maximum number of retries per request
+        :param backoff_base     : (Optional) Delay in seconds before the first retry, doubled for every next retry
+        :param backoff_max      : (Optional) Maximum delay in seconds between two attempts
+        :param jitter           : (Optional) Whether to randomize the delay between 0 and the backoff, so that clients
+                                  that failed at the same time do not retry at the same time
+        :param retry_writes     : (Optional) Whether write methods may be retried as well
+        :param budget           : (Optional) Retry budget to withdraw retries from, defaults to a new budget
+        :param retryable_errors : (Optional) Exception classes that are considered transient
+        :param max_elapsed      : (Optional) Seconds after the first attempt started during which retries may start, or
+                                  None to retry regardless of how long the request has taken
+
+        :type max_retries      : int
+        :type backoff_base     : float|int
+        :type backoff_max      : float|int
+        :type jitter           : bool
+        :type retry_writes     : bool
+        :type budget           : EobotRetryBudget|None
+        :type retryable_errors : tuple
+        :type max_elapsed      : float|int|None
+        """
+        super(EobotRetryPolicy, self).__init__()
+
+        if not isinstance(max_retries, int) or isinstance(max_retries, bool) or max_retries < 0:
+            raise ValueError("Invalid max_retries, must be an int of at least 0")
+
+        if (not isinstance(backoff_base, float) and not isinstance(backoff_base, int)) or backoff_base < 0:
+            raise ValueError("Invalid backoff_base, must be a positive float or int")
+
+        if (not isinstance(backoff_max, float) and not isinstance(backoff_max, int)) or backoff_max < 0:
+            raise ValueError("Invalid backoff_max, must be a positive float or int")
+
+        if not isinstance(jitter, bool):
+            raise ValueError("Invalid jitter, must be a bool")
+
+        if not isinstance(retry_writes, bool):
+            raise ValueError("Invalid retry_writes, must be a bool")
+
+        if budget is None:
+            budget = EobotRetryBudget()
+        elif not isinstance(budget, EobotRetryBudget):
+            raise ValueError("Invalid budget, must be a EobotRetryBudget or None")
+
+        if not isinstance(retryable_errors, tuple):
+            raise ValueError("Invalid retryable_errors, must be a tuple")
+
+        if max_elapsed is not None and ((not isinstance(max_elapsed, float) and not isinstance(max_elapsed, int))
+                                        or isinstance(max_elapsed, bool) or max_elapsed < 0):
+            raise ValueError("Invalid max_elapsed, must be a positive float or int, or None")
+
+        self._max_retries = max_retries
+        self._backoff_base = float(backoff_base)
+        self._backoff_max = float(backoff_max)
+        self._jitter = jitter
+        self._retry_writes = retry_writes
+        self._budget = budget
+        self._retryable_errors = retryable_errors
+        self._max_elapsed = None if max_elapsed is None else float(max_elapsed)
+
+    def get_max_retries(self):
+        """
+        Returns the maximum number of retries per request
+
+        :rtype : int
+        """
+        return self._max_retries
+
+    def get_max_elapsed(self):
+        """
+        Returns the number of seconds after the first attempt during which retries may start, or None if unlimited
+
+        :rtype : float|None
+        """
+        return self._max_elapsed
+
+    def get_budget(self):
+        """
+        Returns the retry budget that retries are withdrawn from
+
+        :rtype : EobotRetryBudget
+        """
+        return self._budget
+
+    def is_retryable(self, error):
+        """
+        Returns whether `error` is considered transient
+
+        :param error : error raised while performing a request
+        :type error : Exception
+
+        :rtype : bool
+        """
+        return isinstance(error, self._retryable_errors)
+
+    def should_retry(self, endpoint, error, attempt, elapsed=0.0):
+        """
+        Returns whether a failed request should be retried. A retry is withdrawn from the budget if so
+
+        :param endpoint : name of the API method that failed
+        :param error    : error raised while performing the request
+        :param attempt  : number of retries already performed for this request
+        :param elapsed  : (Optional) Seconds since the first attempt of this request started
+
+        :type endpoint : str
+        :type error    : Exception
+        :type attempt  : int
+        :type elapsed  : float
+
+        :rtype : bool
+        """
+        if attempt >= self._max_retries or not self.is_retryable(error):
+            return False
+
+        if self._max_elapsed is not None and elapsed >= self._max_elapsed:
+            return False
+
+        if is_write_endpoint(endpoint) and not self._retry_writes:
+            return False
+
+        return self._budget.withdraw()
+
+    def get_delay(self, attempt):
+        """
+        Returns the number of seconds to wait before performing retry number `attempt` (starting at 0)
+
+        :param attempt : number of retries already performed for this request
+        :type attempt : int
+
+        :rtype : float
+        """
+        delay = min(self._backoff_max, self._backoff_base * (2 ** attempt))
+
+        if self._jitter:
+            return random.uniform(0, delay)
+
+        return delay
+
+    def record_success(self):
+        """
+        Records a successful request, which earns back part of the retry budget
+        """
+        self._budget.deposit()
+
+
+_retry_policy = EobotRetryPolicy()
+
+
+def get_retry_policy():
+    """
+    Returns the process-wide `EobotRetryPolicy` that is used by default for all API calls
+
+    :rtype : EobotRetryPolicy
+    """
+    return _retry_policy
@@ -0,0 +1,197 @@
+import asyncio
+import copy
+import threading
+
+from .eobot_endpoints import is_write_endpoint
+
+# public market data and user IDs, which no write changes. Reads of account state are not coalesced unless explicitly
+# configured: a read issued right after a write could otherwise share the response to a read sent before the write
+DEFAULT_ENDPOINTS = frozenset([
+    "get_coin_value", "get_exchange_estimate", "get_supported_coins", "get_supported_fiat", "get_user_id",
+])
+
+
+class _Call(object):
+    def __init__(self):
+        super(_Call, self).__init__()
+
+        self.event = threading.Event()
+        self.followers = 0
+        self.result = None
+        self.error = None
+
+
+class EobotSingleFlight(object):
+    """
+    Coalesces identical requests that are in flight at the same time: the first caller performs the request, and all
+    callers that ask for the same thing before it completes wait for and share its outcome. Only requests to the
+    configured endpoints are coalesced
+    """
+    def __init__(self, endpoints=None):
+        """
+        :param endpoints : (Optional) Names of the API methods to coalesce, defaults to `DEFAULT_ENDPOINTS`
+        :type endpoints  : set|frozenset|list|tuple|None
+        """
+        super(EobotSingleFlight, self).__init__()
+
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._async_calls = {}
+        self._shared = 0
+        self._endpoints = set()
+
+        for endpoint in (DEFAULT_ENDPOINTS if endpoints is None else endpoints):
+            self.set_coalesced(endpoint, True)
+
+    def set_coalesced(self, endpoint, coalesced):
+        """
+        Sets whether identical requests to an endpoint are coalesced. Write endpoints can never be coalesced
+
+        :param endpoint  : name of the API method, e.g. "get_balances"
+        :param coalesced : whether to coalesce the endpoint
+
+        :type endpoint  : str
+        :type coalesced : bool
+
+        :returns EobotSingleFlight : the current instance, for easy method chaining
+        :rtype : EobotSingleFlight
+        """
+        if not isinstance(endpoint, str):
+            raise ValueError("Invalid endpoint, must be a str")
+
+        if not isinstance(coalesced, bool):
+            raise ValueError("Invalid coalesced, must be a bool")
+
+        if coalesced and is_write_endpoint(endpoint):
+            raise ValueError("Invalid endpoint, write endpoints cannot be coalesced")
+
+        if coalesced:
+            self._endpoints.add(endpoint)
+        else:
+            self._endpoints.discard(endpoint)
+
+        return self
+
+    def is_coalesced(self, endpoint):
+        """
+        Returns whether identical requests to an endpoint are coalesced
+
+        :param endpoint : name of the API method
+        :type endpoint : str
+
+        :rtype : bool
+        """
+        return endpoint in self._endpoints
+
+    def do(self, key, function):
+        """
+        Calls `function` unless a call for `key` is already in flight, in which case it waits for that call instead.
+        Every caller receives its own copy of the result, or the exception raised by the call
+
+        :param key      : hashable key identifying the request, see `eobot_endpoints.get_request_key()`
+        :param function : function that performs the request
+
+        :type key      : tuple
+        :type function : callable
+
+        :rtype : dict|list|str|int|float
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                call.followers += 1
+                self._shared += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            result = function()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                shared = call.followers > 0
+
+            # followers copy from a private snapshot, so the leader's caller is free to modify its own result
+            if shared and call.error is None:
+                call.result = copy.deepcopy(result)
+
+            call.event.set()
+
+        return result
+
+    async def do_async(self, key, coroutine_function):
+        """
+        Asyncio counterpart of `do()`: awaits `coroutine_function()` unless a call for `key` is already in flight on the
+        current event loop, in which case it waits for that call instead
+
+        :param key                : hashable key identifying the request
+        :param coroutine_function : function returning an awaitable that performs the request
+
+        :type key                : tuple
+        :type coroutine_function : callable
+
+        :rtype : dict|list|str|int|float
+        """
+        loop = asyncio.get_event_loop()
+        loop_key = (id(loop), key)
+
+        task = self._async_calls.get(loop_key)
+        if task is None:
+            # the call runs as a task of its own, so that cancelling any one caller (the first included) neither
+            # cancels the call nor hands a CancelledError to the other callers
+            task = asyncio.ensure_future(coroutine_function())
+            self._async_calls[loop_key] = task
+            task.add_done_callback(lambda done: self._finish_async(loop_key, done))
+        else:
+            self._shared += 1
+
+        return copy.deepcopy(await asyncio.shield(task))
+
+    def _finish_async(self, loop_key, task):
+        if self._async_calls.get(loop_key) is task:
+            del self._async_calls[loop_key]
+
+        # retrieve the exception so that asyncio does not complain about it when every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def get_in_flight(self):
+        """
+        Returns the number of distinct requests currently in flight
+
+        :rtype : int
+        """
+        with self._lock:
+            return len(self._calls) + len(self._async_calls)
+
+    def get_shared(self):
+        """
+        Returns how many callers received the outcome of another caller's request instead of performing their own
+
+        :rtype : int
+        """
+        return self._shared
+
+
+_single_flight = EobotSingleFlight()
+
+
+def get_single_flight():
+    """
+    Returns the process-wide `EobotSingleFlight` that is used by default for all API calls
+
+    :rtype : EobotSingleFlight
+    """
+    return _single_flight
@@ -0,0 +1,238 @@
+import os
+import threading
+import time
+
+# user IDs never change and deposit addresses hardly ever do, so they can be kept for a long time
+DEFAULT_STORE_TTL = 7 * 24 * 3600.0
+
+
+def get_default_store_path():
+    """
+    Returns the default location of the persistent store: "store.sqlite3" in the directory named by the
+    EOBOT_CACHE_DIR environment variable, or else in "eobot" under the user's cache directory
+
+    :rtype : str
+    """
+    directory = os.environ.get("EOBOT_CACHE_DIR")
+    if not directory:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        directory = os.path.join(cache_home, "eobot")
+
+    return os.path.join(directory, "store.sqlite3")
+
+
+class EobotPersistentStore(object):
+    """
+    Small key-value store in an SQLite database with a time-to-live per entry, used to remember user IDs and deposit
+    addresses across processes. Keys are hashes salted with a random secret kept in the database, so credentials never
+    end up on disk. Errors accessing the database are logged and treated as cache misses, since the API can always be
+    asked instead
+    """
+    def __init__(self, path=None, ttl=DEFAULT_STORE_TTL):
+        """
+        :param path : (Optional) Path of the SQLite database, created if needed, defaults to `get_default_store_path()`
+        :param ttl  : (Optional) Time-to-live in seconds of new entries
+
+        :type path : str|None
+        :type ttl  : float|int
+        """
+        super(EobotPersistentStore, self).__init__()
+
+        if path is not None and not isinstance(path, str):
+            raise ValueError("Invalid path, must be a str or None")
+
+        self._path = get_default_store_path() if path is None else path
+        self._ttl = DEFAULT_STORE_TTL
+        self._lock = threading.Lock()
+        self._connection = None
+        self._pid = None
+        self._salt = None
+
+        self.set_ttl(ttl)
+
+    def get_path(self):
+        """
+        Returns the path of the SQLite database
+
+        :rtype : str
+        """
+        return self._path
+
+    def set_ttl(self, ttl):
+        """
+        Sets the time-to-live of new entries
+
+        :param ttl : time-to-live in seconds
+        :type ttl : float|int
+
+        :returns EobotPersistentStore : the current instance, for easy method chaining
+        :rtype : EobotPersistentStore
+        """
+        if (not isinstance(ttl, float) and not isinstance(ttl, int)) or isinstance(ttl, bool) or ttl <= 0:
+            raise ValueError("Invalid ttl, must be a positive float or int")
+
+        self._ttl = float(ttl)
+        return self
+
+    def get_ttl(self):
+        """
+        Returns the time-to-live of new entries in seconds
+
+        :rtype : float
+        """
+        return self._ttl
+
+    def make_key(self, kind, *parts):
+        """
+        Returns the key for an entry of the given kind (e.g. "user_id"), identified by `parts`, such as the base URL and
+        credentials. The parts are hashed with the database's salt, so they cannot be recovered from the key, not even
+        by hashing every likely password without access to the salt
+
+        :param kind  : kind of entry
+        :param parts : values that identify the entry
+
+        :type kind  : str
+        :type parts : str|int
+
+        :rtype : str
+        """
+        import hashlib
+        import hmac
+
+        message = "\0".join(str(part) for part in parts).encode("utf-8")
+        return "{0}:{1}".format(kind, hmac.new(self._get_salt(), message, hashlib.sha256).hexdigest())
+
+    def get(self, key):
+        """
+        Returns the value stored under `key`, or None if there is none or it has expired
+
+        :param key : key, as returned by `make_key()`
+        :type key : str
+
+        :rtype : dict|list|str|int|float|None
+        """
+        import json
+
+        row = self._execute("SELECT value FROM entries WHERE key = ? AND expires > ?", (key, time.time()))
+        return None if row is None else json.loads(row[0])
+
+    def set(self, key, value, ttl=None):
+        """
+        Stores a JSON-serializable value under `key`
+
+        :param key   : key, as returned by `make_key()`
+        :param value : value to store
+        :param ttl   : (Optional) Time-to-live in seconds, defaults to the store's TTL
+
+        :type key   : str
+        :type value : dict|list|str|int|float
+        :type ttl   : float|int|None
+
+        :returns EobotPersistentStore : the current instance, for easy method chaining
+        :rtype : EobotPersistentStore
+        """
+        import json
+
+        expires = time.time() + (self._ttl if ttl is None else ttl)
+        self._execute("INSERT OR REPLACE INTO entries (key, value, expires) VALUES (?, ?, ?)",
+                      (key, json.dumps(value), expires))
+        return self
+
+    def delete(self, key):
+        """
+        Removes the value stored under `key`, if any
+
+        :param key : key, as returned by `make_key()`
+        :type key : str
+
+        :returns EobotPersistentStore : the current instance, for easy method chaining
+        :rtype : EobotPersistentStore
+        """
+        self._execute("DELETE FROM entries WHERE key = ?", (key,))
+        return self
+
+    def purge(self):
+        """
+        Removes all expired entries
+
+        :returns EobotPersistentStore : the current instance, for easy method chaining
+        :rtype : EobotPersistentStore
+        """
+        self._execute("DELETE FROM entries WHERE expires <= ?", (time.time(),))
+        return self
+
+    def clear(self):
+        """
+        Removes all entries
+
+        :returns EobotPersistentStore : the current instance, for easy method chaining
+        :rtype : EobotPersistentStore
+        """
+        self._execute("DELETE FROM entries", ())
+        return self
+
+    def close(self):
+        """
+        Closes the database connection, it is reopened when the store is used again
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    # the modules used by the store are imported where needed rather than at module level, since the store is optional
+    # and importing the package should not pay for it
+
+    def _connect(self):
+        import sqlite3
+
+        # a connection must not be shared with a forked child process, so every process opens its own
+        if self._connection is not None and self._pid == os.getpid():
+            return self._connection
+
+        directory = os.path.dirname(self._path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory, 0o700)
+
+        connection = sqlite3.connect(self._path, timeout=5.0, check_same_thread=False, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value TEXT, expires REAL)")
+        connection.execute("CREATE TABLE IF NOT EXISTS settings (name TEXT PRIMARY KEY, value TEXT)")
+
+        self._connection = connection
+        self._pid = os.getpid()
+        return connection
+
+    def _get_salt(self):
+        import binascii
+        import logging
+        import sqlite3
+
+        with self._lock:
+            if self._salt is not None:
+                return self._salt
+
+            try:
+                # the first process to use the database picks the salt, every other one reads it
+                connection = self._connect()
+                connection.execute("INSERT OR IGNORE INTO settings (name, value) VALUES ('salt', ?)",
+                                   (binascii.hexlify(os.urandom(32)).decode("ascii"),))
+                row = connection.execute("SELECT value FROM settings WHERE name = 'salt'").fetchone()
+            except (sqlite3.Error, OSError) as e:
+                logging.getLogger(__name__).warning("Persistent store %s is unavailable: %s", self._path, e)
+                # nothing can be stored or found without the database, so any key will do
+                return os.urandom(32)
+
+            self._salt = binascii.unhexlify(row[0])
+            return self._salt
+
+    def _execute(self, statement, parameters):
+        import logging
+        import sqlite3
+
+        with self._lock:
+            try:
+                return self._connect().execute(statement, parameters).fetchone()
+            except (sqlite3.Error, OSError) as e:
+                logging.getLogger(__name__).warning("Persistent store %s is unavailable: %s", self._path, e)
+                return None
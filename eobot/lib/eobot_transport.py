@@ -0,0 +1,223 @@
+import asyncio
+import threading
+
+from .eobot_endpoints import get_endpoint, is_idempotent_endpoint
+from .eobot_errors import EobotConnectionError
+
+# SSL contexts of `EobotHttpClientTransport` by whether they validate certificates, shared by all connections since
+# every new context reads the system's CA store again
+_ssl_contexts = {}
+
+
+class EobotTransport(object):
+    """
+    Base class for objects that send API requests on behalf of `EobotRequest`. A transport only moves bytes: caching,
+    retries, rate limiting and parsing the response are all done by the request
+    """
+    def send(self, request, parameters):
+        """
+        Sends a GET request with `parameters` as query string to the base URL of `request`, honouring its timeout, user
+        agent, SSL validation and connection pool settings
+
+        :param request    : request that is being performed
+        :param parameters : request parameters
+
+        :type request    : EobotRequest
+        :type parameters : dict
+
+        :raises EobotConnectionError : if the API could not be reached
+
+        :returns tuple : (HTTP status, response body)
+        :rtype : tuple
+        """
+        raise NotImplementedError()
+
+    async def send_async(self, request, parameters):
+        """
+        Asynchronous counterpart of `send()`, used by `EobotAsyncRequest`. Calls `send()` on a thread of the event
+        loop's default executor, so that the loop is not blocked; transports that do non-blocking I/O override it
+
+        :rtype : tuple
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, self.send, request, parameters)
+
+    def close(self):
+        """
+        Closes any connections the transport keeps open
+        """
+        pass
+
+
+class EobotRequestsTransport(EobotTransport):
+    """
+    Sends requests with the `requests` library, over the keep-alive sessions of the request's `EobotConnectionPool`
+    """
+    def send(self, request, parameters):
+        # every API method imports this module, and requests (with urllib3) takes longer to import than all of them
+        # together, while it is not needed at all when calls are sent with another transport
+        import requests
+
+        url = request.get_base_url()
+        headers = {
+            "User-Agent": request.get_user_agent()
+        }
+
+        pool = request.get_pool()
+        if pool is None:
+            send = requests.get
+        else:
+            send = pool.get_session(url).get
+            if not pool.get_keep_alive():
+                headers["Connection"] = "close"
+
+        try:
+            response = send(
+                url,
+                params=parameters,
+                headers=headers,
+                timeout=request.get_timeout(),
+                verify=request.get_validate_ssl()
+            )
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            raise EobotConnectionError("Unable to reach the API: {0}".format(e))
+
+        return response.status_code, response.content
+
+
+class EobotHttpClientTransport(EobotTransport):
+    """
+    Sends requests with the standard library's `http.client`, which has far less overhead per request than `requests`.
+    Connections are kept open for reuse if the request has a keep-alive `EobotConnectionPool`, up to its pool size per
+    host; the pool's own sessions are not used
+    """
+    def __init__(self):
+        super(EobotHttpClientTransport, self).__init__()
+
+        self._lock = threading.Lock()
+        self._idle = {}
+
+    def send(self, request, parameters):
+        # http.client loads the email package, which the API methods would otherwise import even when sending with the
+        # requests transport, which only loads it once the first call is sent
+        import http.client
+
+        scheme, host, port = request.get_address()
+        if scheme not in ("http", "https"):
+            raise ValueError("Invalid base_url, must be an http or https URL")
+
+        target = request.get_target(parameters)
+
+        pool = request.get_pool()
+        keep_alive = pool is not None and pool.get_keep_alive()
+
+        headers = {
+            "User-Agent": request.get_user_agent(),
+            "Accept-Encoding": "identity",
+        }
+        if not keep_alive:
+            headers["Connection"] = "close"
+
+        key = (scheme, host, port, request.get_timeout(), request.get_validate_ssl())
+        connection = self._acquire(key) if keep_alive else None
+        idempotent = is_idempotent_endpoint(get_endpoint(parameters))
+
+        while True:
+            reused = connection is not None
+            if connection is None:
+                connection = self._connect(key)
+
+            try:
+                connection.request("GET", target, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+                break
+            except (http.client.HTTPException, OSError) as e:
+                connection.close()
+                connection = None
+
+                # an idle connection may have been closed by the server in the meantime, so try once on a fresh one.
+                # Write calls are not repeated, the server may have received them before the connection broke
+                if not reused or not idempotent:
+                    raise EobotConnectionError("Unable to reach the API: {0!r}".format(e))
+
+        if keep_alive and not response.will_close:
+            self._release(key, connection, pool.get_pool_size())
+        else:
+            connection.close()
+
+        return response.status, body
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, {}
+
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+    def _acquire(self, key):
+        with self._lock:
+            connections = self._idle.get(key)
+            if connections:
+                return connections.pop()
+
+        return None
+
+    def _release(self, key, connection, pool_size):
+        with self._lock:
+            connections = self._idle.setdefault(key, [])
+            if len(connections) < pool_size:
+                connections.append(connection)
+                return
+
+        connection.close()
+
+    @staticmethod
+    def _connect(key):
+        import http.client
+
+        scheme, host, port, timeout, validate_ssl = key
+
+        if scheme == "http":
+            return http.client.HTTPConnection(host, port, timeout=timeout)
+
+        context = _ssl_contexts.get(validate_ssl)
+        if context is None:
+            import ssl
+
+            context = ssl.create_default_context()
+            if not validate_ssl:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+
+            context = _ssl_contexts.setdefault(validate_ssl, context)
+
+        return http.client.HTTPSConnection(host, port, timeout=timeout, context=context)
+
+
+_default_transport = None
+
+
+def set_default_transport(transport):
+    """
+    Sets the transport that every `EobotRequest` and `EobotAsyncRequest` created from now on uses
+
+    :param transport : transport to use, or None to use `requests` (and non-blocking connections for asynchronous
+                       requests)
+    :type transport : EobotTransport|None
+    """
+    global _default_transport
+
+    if transport is not None and not isinstance(transport, EobotTransport):
+        raise ValueError("Invalid transport, must be a EobotTransport or None")
+
+    _default_transport = transport
+
+
+def get_default_transport():
+    """
+    Returns the transport that new requests use, None if they use their built-in one
+
+    :rtype : EobotTransport|None
+    """
+    return _default_transport
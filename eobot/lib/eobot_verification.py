@@ -0,0 +1,169 @@
+import threading
+import time
+from collections import OrderedDict
+
+# How write methods (exchange_coins, manual_withdraw, set_mining_mode) check that their change took effect:
+# - "full"      : read the state before and after the write (the default, and the most round trips)
+# - "post-only" : read the state once after the write, comparing balances against the caller-supplied prior balances,
+#                 the balance cache, or the balances seen after the previous write for the same account
+# - "poll"      : like "post-only", but keep reading with backoff until the change shows up or the timeout passes
+# - "none"      : do not read at all, a write that does not raise is considered successful
+VERIFY_FULL = "full"
+VERIFY_POST_ONLY = "post-only"
+VERIFY_POLL = "poll"
+VERIFY_NONE = "none"
+
+VERIFICATION_MODES = (VERIFY_FULL, VERIFY_POST_ONLY, VERIFY_POLL, VERIFY_NONE)
+
+DEFAULT_POLL_TIMEOUT = 10.0
+
+POLL_INITIAL_DELAY = 0.25
+POLL_MAX_DELAY = 2.0
+
+# balances recorded after a write are only used as the prior balances of the next write for this many seconds, as
+# mining and other writes change them in the meantime, and for at most this many accounts, least recently recorded first
+RECORDED_BALANCES_MAX_AGE = 30.0
+MAX_RECORDED_BALANCES = 10000
+
+_lock = threading.Lock()
+_recorded_balances = OrderedDict()
+
+
+def validate_verification(verification):
+    """
+    Raises a ValueError if `verification` is not one of `VERIFICATION_MODES`
+
+    :param verification : verification mode
+    :type verification : str
+    """
+    if verification not in VERIFICATION_MODES:
+        raise ValueError("Invalid verification, must be one of: {0}".format(", ".join(VERIFICATION_MODES)))
+
+
+def get_poll_delays(timeout):
+    """
+    Yields the delays to wait between reads while polling, doubling from `POLL_INITIAL_DELAY` up to `POLL_MAX_DELAY`,
+    until `timeout` seconds have passed
+
+    :param timeout : seconds to keep polling for
+    :type timeout : float
+
+    :rtype : generator
+    """
+    deadline = time.time() + timeout
+    delay = POLL_INITIAL_DELAY
+
+    while True:
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            return
+
+        yield min(delay, remaining)
+        delay = min(delay * 2, POLL_MAX_DELAY)
+
+
+def get_balance(balances, coin):
+    """
+    Returns the balance of `coin`, which is 0.0 if the account never held it
+
+    :param balances : balances, as returned by `get_balances`
+    :param coin     : cryptocurrency
+
+    :type balances : dict
+    :type coin     : str
+
+    :rtype : float
+    """
+    return balances[coin] if coin in balances.keys() else 0.0
+
+
+def record_balances(base_url, user_id, balances):
+    """
+    Remembers the balances seen after verifying a write, as the prior balances for the next write to the same account
+
+    :param base_url : base URL of the API
+    :param user_id  : Eobot user ID
+    :param balances : balances, as returned by `get_balances`
+
+    :type base_url : str
+    :type user_id  : int
+    :type balances : dict
+    """
+    key = (base_url, user_id)
+
+    with _lock:
+        _recorded_balances[key] = (time.time(), dict(balances))
+        _recorded_balances.move_to_end(key)
+
+        while len(_recorded_balances) > MAX_RECORDED_BALANCES:
+            _recorded_balances.popitem(last=False)
+
+
+def get_recorded_balances(base_url, user_id, max_age=None):
+    """
+    Returns the balances recorded through `record_balances()` for an account, or None if there are none that are at
+    most `max_age` seconds old
+
+    :param base_url : base URL of the API
+    :param user_id  : Eobot user ID
+    :param max_age  : (Optional) Maximum age in seconds, can only lower the default of `RECORDED_BALANCES_MAX_AGE`
+
+    :type base_url : str
+    :type user_id  : int
+    :type max_age  : float|int|None
+
+    :rtype : dict|None
+    """
+    if max_age is None:
+        max_age = RECORDED_BALANCES_MAX_AGE
+
+    key = (base_url, user_id)
+
+    with _lock:
+        entry = _recorded_balances.get(key)
+        if entry is None:
+            return None
+
+        recorded, balances = entry
+        age = time.time() - recorded
+
+        if age > RECORDED_BALANCES_MAX_AGE:
+            del _recorded_balances[key]
+            return None
+
+        if age > max_age:
+            return None
+
+        return dict(balances)
+
+
+def get_prior_balances(balance_cache, base_url, user_id):
+    """
+    Returns the balances to verify a write against, when the caller did not supply them: the cached balances if there
+    are fresh ones in `balance_cache`, or else the balances recorded after the previous write if they are recent enough,
+    or None
+
+    :param balance_cache : balance cache of the config, if any
+    :param base_url      : base URL of the API
+    :param user_id       : Eobot user ID
+
+    :type balance_cache : EobotBalanceCache|None
+    :type base_url      : str
+    :type user_id       : int
+
+    :rtype : dict|None
+    """
+    if balance_cache is not None:
+        balances = balance_cache.get(base_url, user_id)
+        if balances is not None:
+            return balances
+
+    return get_recorded_balances(base_url, user_id)
+
+
+def clear_recorded_balances():
+    """
+    Forgets all recorded balances
+    """
+    with _lock:
+        _recorded_balances.clear()
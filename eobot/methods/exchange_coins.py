@@ -1,30 +1,46 @@
-from ..lib.eobot_config import EobotConfig, get_config
-from ..lib.eobot_errors import NoUserIdError
+from collections.abc import Mapping
+
+from ..lib.eobot_async_request import EobotAsyncRequest
+from ..lib.eobot_operation import EobotCall, EobotReconcile, EobotSleep, resolve_config, run_operation
 from ..lib.eobot_request import EobotRequest
-from .get_balances import perform_request as get_balances
-from .get_user_id import perform_request as get_user_id
+from ..lib.eobot_verification import VERIFY_FULL, VERIFY_NONE, VERIFY_POLL, get_balance, get_poll_delays, \
+    get_prior_balances, record_balances, validate_verification
+from .get_balances import operation as get_balances
+from .get_user_id import resolve_authentication
 
 
-def perform_request(from_coin, amount, to_coin, config=None, request=None):
+def build_request(auth, from_coin, amount, to_coin):
     """
-    Exchanges `amount` `from_coin` to `to_coin` (note: Eobot will withhold a percentage as fee when doing this)
+    Returns the request parameters to exchange `amount` `from_coin` to `to_coin`
 
-    :param from_coin : Cryptocurrency to exchange from
-    :type from_coin : str
+    :rtype : dict
+    """
+    return {
+        "id": auth.user_id,
+        "email": auth.email,
+        "password": auth.password,
+        "convertfrom": from_coin,
+        "amount": amount,
+        "convertto": to_coin,
+    }
 
-    :param amount : Amount to exchange
-    :type amount : int|float
 
-    :param to_coin : Cryptocurrency to exchange to
-    :type to_coin : str
+def is_exchanged(old_balances, new_balances, from_coin, to_coin):
+    """
+    Returns whether the balances show that `from_coin` was exchanged to `to_coin`
 
-    :param config : (Optional) Configuration to use, will default to the global config if not provided
-    :type config : EobotConfig|str|None
+    :rtype : bool
+    """
+    return get_balance(new_balances, from_coin) < get_balance(old_balances, from_coin) \
+        and get_balance(new_balances, to_coin) > get_balance(old_balances, to_coin)
 
-    :param request : (Optional) Request object to use, will default to a new one if not provided
-    :type request : EobotRequest|None
 
-    :rtype : bool
+def operation(from_coin, amount, to_coin, config=None, base_url=None, verification=None, prior_balances=None):
+    """
+    Sans-IO implementation of `perform_request()`, see `eobot_operation`
+
+    :param base_url : Base URL of the API, to key the balances by in the config's balance cache
+    :type base_url : str|None
     """
     if not isinstance(from_coin, str):
         raise ValueError("Invalid from_coin, must be a str")
@@ -39,37 +55,83 @@ def perform_request(from_coin, amount, to_coin, config=None, request=None):
 
     to_coin = to_coin.upper()
 
+    config = resolve_config(config)
+    auth = yield from resolve_authentication(config, base_url, False)
+
+    if verification is None:
+        verification = config.get_verification()
+    else:
+        validate_verification(verification)
+
+    if prior_balances is not None and not isinstance(prior_balances, Mapping):
+        raise ValueError("Invalid prior_balances, must be a dict or EobotAmounts")
+
+    balance_cache = config.get_balance_cache()
+
+    old_balances = prior_balances
+    if verification != VERIFY_NONE:
+        if old_balances is None and verification != VERIFY_FULL:
+            old_balances = get_prior_balances(balance_cache, base_url, auth.user_id)
+        if old_balances is None:
+            old_balances = yield from get_balances(config, base_url, 0)
+
+    yield EobotCall(build_request(auth, from_coin, amount, to_coin))
+
+    if verification == VERIFY_NONE:
+        if balance_cache is not None:
+            # what is received depends on the exchange rate and fee, so the new balances cannot be predicted
+            balance_cache.invalidate(base_url, auth.user_id)
+            yield EobotReconcile(balance_cache, base_url, auth.user_id, get_balances(config, base_url, 0))
+        return True
+
+    new_balances = yield from get_balances(config, base_url, 0)
+
+    if verification == VERIFY_POLL:
+        for delay in get_poll_delays(config.get_verification_timeout()):
+            if is_exchanged(old_balances, new_balances, from_coin, to_coin):
+                break
+            yield EobotSleep(delay)
+            new_balances = yield from get_balances(config, base_url, 0)
+
+    record_balances(base_url, auth.user_id, new_balances)
+
+    return is_exchanged(old_balances, new_balances, from_coin, to_coin)
+
+
+def perform_request(from_coin, amount, to_coin, config=None, request=None, verification=None,
+                    prior_balances=None):
+    """
+    Exchanges `amount` `from_coin` to `to_coin` (note: Eobot will withhold a percentage as fee when doing this)
+
+    :param from_coin : Cryptocurrency to exchange from
+    :type from_coin : str
+
+    :param amount : Amount to exchange
+    :type amount : int|float
+
+    :param to_coin : Cryptocurrency to exchange to
+    :type to_coin : str
+
+    :param config : (Optional) Configuration to use, will default to the global config if not provided
+    :type config : EobotConfig|str|None
+
+    :param request : (Optional) Request object to use, will default to a new one if not provided
+    :type request : EobotRequest|None
+
+    :param verification : (Optional) How to check that the exchange took effect, defaults to the config's verification
+                          mode, see `eobot_verification.VERIFICATION_MODES`
+    :type verification : str|None
+
+    :param prior_balances : (Optional) Balances before the exchange, to verify against instead of reading them first
+    :type prior_balances : dict|EobotAmounts|None
+
+    :rtype : bool
+    """
     if request is None:
         request = EobotRequest()
-    elif not isinstance(request, EobotRequest):
-        raise ValueError("Invalid request, must be a EobotRequet")
-
-    if config is None or isinstance(config, str):
-        config = get_config(config)
-    elif not isinstance(config, EobotConfig):
-        raise ValueError("Invalid config, must be a EobotConfig")
-
-    try:
-        config.get_authentication(True)
-    except NoUserIdError:
-        config.set_user_id(get_user_id(config=config, request=request.clone()))
-
-    auth = config.get_authentication(False)
-
-    old_balances = get_balances(config=config, request=request.clone())
-    old_balance_from = old_balances[from_coin] if from_coin in old_balances.keys() else 0.0
-    old_balance_to = old_balances[to_coin] if to_coin in old_balances.keys() else 0.0
-
-    request.set_parameter("id", auth.user_id)
-    request.set_parameter("email", auth.email)
-    request.set_parameter("password", auth.password)
-    request.set_parameter("convertfrom", from_coin)
-    request.set_parameter("amount", amount)
-    request.set_parameter("convertto", to_coin)
-    request.perform_request()
-
-    new_balances = get_balances(config=config, request=request.clone())
-    new_balance_from = new_balances[from_coin] if from_coin in new_balances.keys() else 0.0
-    new_balance_to = new_balances[to_coin] if to_coin in new_balances.keys() else 0.0
-
-    return new_balance_from < old_balance_from and new_balance_to > old_balance_to
+    elif not isinstance(request, EobotRequest) or isinstance(request, EobotAsyncRequest):
+        raise ValueError("Invalid request, must be a EobotRequest")
+
+    return run_operation(
+        operation(from_coin, amount, to_coin, config, request.get_base_url(), verification, prior_balances), request
+    )
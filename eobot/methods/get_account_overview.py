@@ -0,0 +1,66 @@
+from ..lib.eobot_async_request import EobotAsyncRequest
+from ..lib.eobot_operation import EobotGather, resolve_config, run_operation
+from ..lib.eobot_request import EobotRequest
+from .get_balances import operation as get_balances
+from .get_mining_estimates import operation as get_mining_estimates
+from .get_mining_mode import operation as get_mining_mode
+from .get_mining_speed import operation as get_mining_speed
+from .get_user_id import resolve_authentication
+
+
+# the read-only operations that make up an account overview, keyed by the name of their value in the result
+OVERVIEW_OPERATIONS = (
+    ("balances", get_balances),
+    ("mining_mode", get_mining_mode),
+    ("mining_speed", get_mining_speed),
+    ("mining_estimates", get_mining_estimates),
+)
+
+
+def operation(config=None, base_url=None):
+    """
+    Sans-IO implementation of `perform_request()`, see `eobot_operation`
+
+    :param base_url : Base URL of the API
+    :type base_url : str|None
+    """
+    config = resolve_config(config)
+    yield from resolve_authentication(config, base_url)
+
+    values = yield EobotGather([read(config, base_url) for name, read in OVERVIEW_OPERATIONS])
+
+    result = {"errors": {}}
+
+    for (name, read), value in zip(OVERVIEW_OPERATIONS, values):
+        if isinstance(value, Exception):
+            result[name] = None
+            result["errors"][name] = value
+        else:
+            result[name] = value
+
+    return result
+
+
+def perform_request(config=None, request=None):
+    """
+    Retrieves the balances, mining mode, mining speed and mining estimates for the current user, performing the four
+    API calls concurrently once the user ID is known. A call that fails does not fail the others: its value is None,
+    and the exception it raised is reported under its name in "errors"
+
+    :param config : (Optional) Configuration to use, will default to the global config if not provided
+    :type config : EobotConfig|str|None
+
+    :param request : (Optional) Request object to use as a template for all API calls, will default to a new one if not
+                     provided
+    :type request : EobotRequest|None
+
+    :returns dict : {"balances": dict, "mining_mode": str, "mining_speed": dict, "mining_estimates": dict,
+                    "errors": {name: Exception}}
+    :rtype : dict
+    """
+    if request is None:
+        request = EobotRequest()
+    elif not isinstance(request, EobotRequest) or isinstance(request, EobotAsyncRequest):
+        raise ValueError("Invalid request, must be a EobotRequest")
+
+    return run_operation(operation(config, request.get_base_url()), request)
@@ -1,10 +1,62 @@
+from ..lib.eobot_async_request import EobotAsyncRequest
+from ..lib.eobot_operation import EobotCall, resolve_config, run_operation
 from ..lib.eobot_request import EobotRequest
-from ..lib.eobot_config import EobotConfig, get_config
-from ..lib.eobot_errors import NoUserIdError
-from .get_user_id import perform_request as get_user_id
+from ..lib.eobot_results import EobotAmounts, validate_compact
+from .get_user_id import resolve_authentication
 
 
-def perform_request(config=None, request=None):
+def build_request(user_id):
+    """
+    Returns the request parameters to retrieve the balances of user `user_id`
+
+    :rtype : dict
+    """
+    return {"total": user_id}
+
+
+def parse_response(result, compact=False):
+    """
+    Returns the balances from the API response, as an `EobotAmounts` if `compact`
+
+    :rtype : dict|EobotAmounts
+    """
+    if compact:
+        return EobotAmounts(result)
+
+    return dict((coin, float(balance)) for coin, balance in result.items())
+
+
+def operation(config=None, base_url=None, max_staleness=None, compact=False):
+    """
+    Sans-IO implementation of `perform_request()`, see `eobot_operation`
+
+    :param base_url : Base URL of the API, to key the balances by in the config's balance cache
+    :type base_url : str|None
+    """
+    if max_staleness is not None and ((not isinstance(max_staleness, float) and not isinstance(max_staleness, int))
+                                      or isinstance(max_staleness, bool) or max_staleness < 0):
+        raise ValueError("Invalid max_staleness, must be a non-negative float or int, or None")
+
+    validate_compact(compact)
+
+    config = resolve_config(config)
+    auth = yield from resolve_authentication(config, base_url)
+
+    balance_cache = config.get_balance_cache()
+    if balance_cache is not None:
+        result = balance_cache.get(base_url, auth.user_id, max_staleness)
+        if result is not None:
+            return EobotAmounts(result) if compact else result
+
+    result = parse_response((yield EobotCall(build_request(auth.user_id), max_staleness == 0)), compact)
+
+    if balance_cache is not None:
+        balance_cache.store(base_url, auth.user_id, result)
+
+    return result
+
+
+def perform_request(config=None, request=None, max_staleness=None, compact=False):
     """
     Retrieves the current balances for the current user
 
@@ -14,29 +66,19 @@ def perform_request(config=None, request=None):
     :param request : (Optional) Request object to use, will default to a new one if not provided
     :type request : EobotRequest|None
 
-    :rtype : dict
+    :param max_staleness : (Optional) Maximum age in seconds of balances served from the config's balance cache,
+                           defaults to the cache's own bound, 0 always reads the balances from the API
+    :type max_staleness : float|int|None
+
+    :param compact : (Optional) Set to True to return an `EobotAmounts`, which takes far less memory than a dict and
+                     converts values to float when they are first read
+    :type compact : bool
+
+    :rtype : dict|EobotAmounts
     """
     if request is None:
         request = EobotRequest()
-    elif not isinstance(request, EobotRequest):
-        raise ValueError("Invalid request, must be a EobotRequet")
-
-    if config is None or isinstance(config, str):
-        config = get_config(config)
-    elif not isinstance(config, EobotConfig):
-        raise ValueError("Invalid config, must be a EobotConfig")
-
-    try:
-        auth = config.get_authentication(True)
-    except NoUserIdError:
-        config.set_user_id(get_user_id(config=config, request=request.clone()))
-        auth = config.get_authentication(True)
+    elif not isinstance(request, EobotRequest) or isinstance(request, EobotAsyncRequest):
+        raise ValueError("Invalid request, must be a EobotRequest")
 
-    request.set_parameter("total", auth.user_id)
-
-    result = request.perform_request()
-
-    for coin in result.keys():
-        result[coin] = float(result[coin])
-
-    return result
+    return run_operation(operation(config, request.get_base_url(), max_staleness, compact), request)
@@ -1,9 +1,53 @@
-from ..lib.eobot_config import EobotConfig
+from collections.abc import Mapping
+
+from ..lib.eobot_async_request import EobotAsyncRequest
+from ..lib.eobot_operation import EobotCall, run_operation
 from ..lib.eobot_request import EobotRequest
+from .get_coin_values import get_values_from_snapshot
+from .get_supported_coins import operation as get_supported_coins
+
+
+def build_request(coin):
+    """
+    Returns the request parameters to retrieve the value of `coin`
+
+    :rtype : dict
+    """
+    return {"coin": coin}
+
+
+def parse_response(result, coin):
+    """
+    Returns the value of `coin` in US dollar from the API response
+
+    :rtype : float
+    """
+    return float(result[coin])
+
+
+def operation(coin, snapshot=None):
+    """
+    Sans-IO implementation of `perform_request()`, see `eobot_operation`
+    """
+    if not isinstance(coin, str):
+        raise ValueError("Invalid coin, must be a str")
+
+    if snapshot is not None and not isinstance(snapshot, Mapping) and not isinstance(snapshot, bool):
+        raise ValueError("Invalid snapshot, must be a dict, EobotCoinTable or bool")
+
+    coin = coin.upper()
+
+    if snapshot is True:
+        snapshot = yield from get_supported_coins()
+
+    if isinstance(snapshot, Mapping):
+        return get_values_from_snapshot([coin], snapshot)[coin]
+
+    return parse_response((yield EobotCall(build_request(coin))), coin)
 
 
 # noinspection PyUnusedLocal
-def perform_request(coin, config=None, request=None):
+def perform_request(coin, config=None, request=None, snapshot=None):
     """
     Retrieves the current value for `coin` in US dollar. 1 `coin` equals {result} US dollar
 
@@ -16,20 +60,16 @@ def perform_request(coin, config=None, request=None):
     :param request : (Optional) Request object to use, will default to a new one if not provided
     :type request : EobotRequest|None
 
-    :rtype : str
+    :param snapshot : (Optional) Set to True to read the value from the `get_supported_coins` result instead of
+                      requesting it separately, which lets many lookups share a single (cached) API call, or provide an
+                      earlier `get_supported_coins` result to read the value from
+    :type snapshot : dict|EobotCoinTable|bool|None
+
+    :rtype : float
     """
     if request is None:
         request = EobotRequest()
-    elif not isinstance(request, EobotRequest):
-        raise ValueError("Invalid request, must be a EobotRequet")
+    elif not isinstance(request, EobotRequest) or isinstance(request, EobotAsyncRequest):
+        raise ValueError("Invalid request, must be a EobotRequest")
 
-    if not isinstance(coin, str):
-        raise ValueError("Invalid coin, must be a str")
-
-    coin = coin.upper()
-
-    request.set_parameter("coin", coin)
-
-    result = request.perform_request()
-
-    return float(result[coin])
+    return run_operation(operation(coin, snapshot), request)
@@ -0,0 +1,83 @@
+from collections.abc import Mapping
+
+from ..lib.eobot_async_request import EobotAsyncRequest
+from ..lib.eobot_operation import run_operation
+from ..lib.eobot_request import EobotRequest
+from ..lib.eobot_results import EobotCoinTable
+from .get_supported_coins import operation as get_supported_coins
+
+
+def get_values_from_snapshot(coins, snapshot):
+    """
+    Looks up the value in US dollar for every coin in `coins` in a `get_supported_coins` result
+
+    :param coins : Cryptocurrencies to look up, already validated and uppercased
+    :type coins : list
+
+    :param snapshot : Result of `get_supported_coins`
+    :type snapshot : dict|EobotCoinTable
+
+    :rtype : dict
+    """
+    unsupported = [coin for coin in coins if coin not in snapshot]
+    if len(unsupported) > 0:
+        raise ValueError("Unsupported coin(s): {0}".format(", ".join(unsupported)))
+
+    if isinstance(snapshot, EobotCoinTable):
+        return dict((coin, snapshot.get_price(coin)) for coin in coins)
+
+    return dict((coin, float(snapshot[coin]["Price"])) for coin in coins)
+
+
+def operation(coins, snapshot=None):
+    """
+    Sans-IO implementation of `perform_request()`, see `eobot_operation`
+    """
+    if not isinstance(coins, list) and not isinstance(coins, tuple):
+        raise ValueError("Invalid coins, must be a list or tuple")
+
+    for coin in coins:
+        if not isinstance(coin, str):
+            raise ValueError("Invalid coin, must be a str")
+
+    if snapshot is not None and not isinstance(snapshot, Mapping):
+        raise ValueError("Invalid snapshot, must be a dict or EobotCoinTable")
+
+    coins = [coin.upper() for coin in coins]
+
+    if len(coins) == 0:
+        return {}
+
+    if snapshot is None:
+        snapshot = yield from get_supported_coins()
+
+    return get_values_from_snapshot(coins, snapshot)
+
+
+# noinspection PyUnusedLocal
+def perform_request(coins, config=None, request=None, snapshot=None):
+    """
+    Retrieves the current values for all `coins` in US dollar, using at most a single API call. 1 coin equals {result}
+    US dollar
+
+    :param coins : Cryptocurrencies to retrieve values for
+    :type coins : list|tuple
+
+    :param config : Not used for this request, since this API method does not require authentication
+    :type config : EobotConfig|str|None
+
+    :param request : (Optional) Request object to use, will default to a new one if not provided
+    :type request : EobotRequest|None
+
+    :param snapshot : (Optional) Result of an earlier `get_supported_coins` call to read the values from, instead of
+                      performing an API call
+    :type snapshot : dict|EobotCoinTable|None
+
+    :rtype : dict
+    """
+    if request is None:
+        request = EobotRequest()
+    elif not isinstance(request, EobotRequest) or isinstance(request, EobotAsyncRequest):
+        raise ValueError("Invalid request, must be a EobotRequest")
+
+    return run_operation(operation(coins, snapshot), request)
@@ -1,7 +1,55 @@
-from ..lib.eobot_config import EobotConfig, get_config
-from ..lib.eobot_errors import NoUserIdError
+from ..lib.eobot_async_request import EobotAsyncRequest
+from ..lib.eobot_operation import EobotCall, resolve_config, run_operation
 from ..lib.eobot_request import EobotRequest
-from .get_user_id import perform_request as get_user_id
+from .get_user_id import resolve_authentication
+
+
+def build_request(user_id, coin):
+    """
+    Returns the request parameters to retrieve the `coin` deposit address of user `user_id`
+
+    :rtype : dict
+    """
+    return {"id": user_id, "deposit": coin}
+
+
+def parse_response(result, coin):
+    """
+    Returns the `coin` deposit address from the API response
+
+    :rtype : str
+    """
+    return result[coin]
+
+
+def operation(coin, config=None, base_url=None):
+    """
+    Sans-IO implementation of `perform_request()`, see `eobot_operation`
+
+    :param base_url : Base URL of the API, to key the address by in the config's persistent store
+    :type base_url : str|None
+    """
+    if not isinstance(coin, str):
+        raise ValueError("Invalid coin, must be a str")
+
+    coin = coin.upper()
+
+    config = resolve_config(config)
+    auth = yield from resolve_authentication(config, base_url)
+
+    store = config.get_store()
+    if store is not None:
+        key = store.make_key("deposit_address", base_url, auth.user_id, coin)
+        address = store.get(key)
+        if address is not None:
+            return address
+
+    address = parse_response((yield EobotCall(build_request(auth.user_id, coin))), coin)
+
+    if store is not None:
+        store.set(key, address)
+
+    return address
 
 
 def perform_request(coin, config=None, request=None):
@@ -21,28 +69,7 @@ def perform_request(coin, config=None, request=None):
     """
     if request is None:
         request = EobotRequest()
-    elif not isinstance(request, EobotRequest):
-        raise ValueError("Invalid request, must be a EobotRequet")
-
-    if not isinstance(coin, str):
-        raise ValueError("Invalid coin, must be a str")
-
-    coin = coin.upper()
-
-    if config is None or isinstance(config, str):
-        config = get_config(config)
-    elif not isinstance(config, EobotConfig):
-        raise ValueError("Invalid config, must be a EobotConfig")
+    elif not isinstance(request, EobotRequest) or isinstance(request, EobotAsyncRequest):
+        raise ValueError("Invalid request, must be a EobotRequest")
 
-    try:
-        auth = config.get_authentication(True)
-    except NoUserIdError:
-        config.set_user_id(get_user_id(config=config, request=request.clone()))
-        auth = config.get_authentication(True)
-
-    request.set_parameter("id", auth.user_id)
-    request.set_parameter("deposit", coin)
-
-    result = request.perform_request()
-
-    return result[coin]
+    return run_operation(operation(coin, config, request.get_base_url()), request)
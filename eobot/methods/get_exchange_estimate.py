@@ -1,7 +1,42 @@
-from ..lib.eobot_config import EobotConfig
+from ..lib.eobot_async_request import EobotAsyncRequest
+from ..lib.eobot_operation import EobotCall, run_operation
 from ..lib.eobot_request import EobotRequest
 
 
+def build_request(from_coin, to_coin, amount):
+    """
+    Returns the request parameters to estimate the exchange of `amount` `from_coin` to `to_coin`
+
+    :rtype : dict
+    """
+    return {"exchangefee": "true", "convertfrom": from_coin, "amount": amount, "convertto": to_coin}
+
+
+def parse_response(result):
+    """
+    Returns the estimated amount of the target cryptocurrency from the API response
+
+    :rtype : float
+    """
+    return float(result["Result"])
+
+
+def operation(from_coin, to_coin, amount):
+    """
+    Sans-IO implementation of `perform_request()`, see `eobot_operation`
+    """
+    if not isinstance(from_coin, str):
+        raise ValueError("Invalid from_coin, must be a str")
+
+    if not isinstance(to_coin, str):
+        raise ValueError("Invalid to_coin, must be a str")
+
+    if not isinstance(amount, int) and not isinstance(amount, float):
+        raise ValueError("Invalid amount, must be a float or int")
+
+    return parse_response((yield EobotCall(build_request(from_coin.upper(), to_coin.upper(), amount))))
+
+
 # noinspection PyUnusedLocal
 def perform_request(from_coin, to_coin, amount, config=None, request=None):
     """
@@ -26,26 +61,7 @@ def perform_request(from_coin, to_coin, amount, config=None, request=None):
     """
     if request is None:
         request = EobotRequest()
-    elif not isinstance(request, EobotRequest):
-        raise ValueError("Invalid request, must be a EobotRequet")
+    elif not isinstance(request, EobotRequest) or isinstance(request, EobotAsyncRequest):
+        raise ValueError("Invalid request, must be a EobotRequest")
 
-    if not isinstance(from_coin, str):
-        raise ValueError("Invalid from_coin, must be a str")
-
-    if not isinstance(to_coin, str):
-        raise ValueError("Invalid to_coin, must be a str")
-
-    if not isinstance(amount, int) and not isinstance(amount, float):
-        raise ValueError("Invalid amount, must be a float or int")
-
-    from_coin = from_coin.upper()
-    to_coin = to_coin.upper()
-
-    request.set_parameter("exchangefee", "true")
-    request.set_parameter("convertfrom", from_coin)
-    request.set_parameter("amount", amount)
-    request.set_parameter("convertto", to_coin)
-
-    result = request.perform_request()
-
-    return float(result["Result"])
+    return run_operation(operation(from_coin, to_coin, amount), request)
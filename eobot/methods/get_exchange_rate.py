@@ -1,7 +1,38 @@
-from ..lib.eobot_config import EobotConfig
+from ..lib.eobot_async_request import EobotAsyncRequest
+from ..lib.eobot_operation import EobotCall, run_operation
 from ..lib.eobot_request import EobotRequest
 
 
+def build_request(currency):
+    """
+    Returns the request parameters to retrieve the exchange rate of `currency`
+
+    :rtype : dict
+    """
+    return {"coin": currency}
+
+
+def parse_response(result, currency):
+    """
+    Returns the exchange rate of `currency` from the API response
+
+    :rtype : float
+    """
+    return float(result[currency])
+
+
+def operation(currency):
+    """
+    Sans-IO implementation of `perform_request()`, see `eobot_operation`
+    """
+    if not isinstance(currency, str):
+        raise ValueError("Invalid currency, must be a str")
+
+    currency = currency.upper()
+
+    return parse_response((yield EobotCall(build_request(currency))), currency)
+
+
 # noinspection PyUnusedLocal
 def perform_request(currency, config=None, request=None):
     """
@@ -20,16 +51,7 @@ def perform_request(currency, config=None, request=None):
     """
     if request is None:
         request = EobotRequest()
-    elif not isinstance(request, EobotRequest):
-        raise ValueError("Invalid request, must be a EobotRequet")
-
-    if not isinstance(currency, str):
-        raise ValueError("Invalid currency, must be a str")
-
-    currency = currency.upper()
+    elif not isinstance(request, EobotRequest) or isinstance(request, EobotAsyncRequest):
+        raise ValueError("Invalid request, must be a EobotRequest")
 
-    request.set_parameter("coin", currency)
-
-    result = request.perform_request()
-
-    return float(result[currency])
+    return run_operation(operation(currency), request)
@@ -1,10 +1,47 @@
-from ..lib.eobot_config import EobotConfig, get_config
-from ..lib.eobot_errors import NoUserIdError
+from ..lib.eobot_async_request import EobotAsyncRequest
+from ..lib.eobot_operation import EobotCall, resolve_config, run_operation
 from ..lib.eobot_request import EobotRequest
-from .get_user_id import perform_request as get_user_id
+from ..lib.eobot_results import EobotAmounts, validate_compact
+from .get_user_id import resolve_authentication
 
 
-def perform_request(config=None, request=None):
+def build_request(user_id):
+    """
+    Returns the request parameters to retrieve the estimated mining profits of user `user_id`
+
+    :rtype : dict
+    """
+    return {"idestimates": user_id}
+
+
+def parse_response(result, compact=False):
+    """
+    Returns the estimated profit per miner from the API response, as an `EobotAmounts` if `compact`
+
+    :rtype : dict|EobotAmounts
+    """
+    if compact:
+        return EobotAmounts(result)
+
+    return dict((miner, float(estimate)) for miner, estimate in result.items())
+
+
+def operation(config=None, base_url=None, compact=False):
+    """
+    Sans-IO implementation of `perform_request()`, see `eobot_operation`
+
+    :param base_url : Base URL of the API
+    :type base_url : str|None
+    """
+    validate_compact(compact)
+
+    config = resolve_config(config)
+    auth = yield from resolve_authentication(config, base_url)
+
+    return parse_response((yield EobotCall(build_request(auth.user_id))), compact)
+
+
+def perform_request(config=None, request=None, compact=False):
     """
     Retrieves the current estimated mining profits for the current user, in US Dollar per month
 
@@ -14,29 +51,15 @@ def perform_request(config=None, request=None):
     :param request : (Optional) Request object to use, will default to a new one if not provided
     :type request : EobotRequest|None
 
-    :rtype : dict
+    :param compact : (Optional) Set to True to return an `EobotAmounts`, which takes far less memory than a dict and
+                     converts values to float when they are first read
+    :type compact : bool
+
+    :rtype : dict|EobotAmounts
     """
     if request is None:
         request = EobotRequest()
-    elif not isinstance(request, EobotRequest):
-        raise ValueError("Invalid request, must be a EobotRequet")
-
-    if config is None or isinstance(config, str):
-        config = get_config(config)
-    elif not isinstance(config, EobotConfig):
-        raise ValueError("Invalid config, must be a EobotConfig")
-
-    try:
-        auth = config.get_authentication(True)
-    except NoUserIdError:
-        config.set_user_id(get_user_id(config=config, request=request.clone()))
-        auth = config.get_authentication(True)
-
-    request.set_parameter("idestimates", auth.user_id)
-
-    result = request.perform_request()
-
-    for miner in result.keys():
-        result[miner] = float(result[miner])
+    elif not isinstance(request, EobotRequest) or isinstance(request, EobotAsyncRequest):
+        raise ValueError("Invalid request, must be a EobotRequest")
 
-    return result
+    return run_operation(operation(config, request.get_base_url(), compact), request)
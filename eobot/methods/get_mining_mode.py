@@ -1,7 +1,41 @@
-from ..lib.eobot_config import EobotConfig, get_config
-from ..lib.eobot_errors import NoUserIdError
+from ..lib.eobot_async_request import EobotAsyncRequest
+from ..lib.eobot_operation import EobotCall, resolve_config, run_operation
 from ..lib.eobot_request import EobotRequest
-from .get_user_id import perform_request as get_user_id
+from .get_user_id import resolve_authentication
+
+
+def build_request(user_id):
+    """
+    Returns the request parameters to retrieve the mining mode of user `user_id`
+
+    :rtype : dict
+    """
+    return {"idmining": user_id}
+
+
+def parse_response(result):
+    """
+    Returns the mining mode from the API response
+
+    :rtype : str
+    """
+    return result["mining"]
+
+
+def operation(config=None, base_url=None, fresh=False):
+    """
+    Sans-IO implementation of `perform_request()`, see `eobot_operation`
+
+    :param base_url : Base URL of the API
+    :type base_url : str|None
+
+    :param fresh : Whether the mode must be read from the API, e.g. to verify that it was changed
+    :type fresh : bool
+    """
+    config = resolve_config(config)
+    auth = yield from resolve_authentication(config, base_url)
+
+    return parse_response((yield EobotCall(build_request(auth.user_id), fresh)))
 
 
 def perform_request(config=None, request=None):
@@ -18,22 +52,7 @@ def perform_request(config=None, request=None):
     """
     if request is None:
         request = EobotRequest()
-    elif not isinstance(request, EobotRequest):
-        raise ValueError("Invalid request, must be a EobotRequet")
-
-    if config is None or isinstance(config, str):
-        config = get_config(config)
-    elif not isinstance(config, EobotConfig):
-        raise ValueError("Invalid config, must be a EobotConfig")
-
-    try:
-        auth = config.get_authentication(True)
-    except NoUserIdError:
-        config.set_user_id(get_user_id(config=config, request=request.clone()))
-        auth = config.get_authentication(True)
+    elif not isinstance(request, EobotRequest) or isinstance(request, EobotAsyncRequest):
+        raise ValueError("Invalid request, must be a EobotRequest")
 
-    request.set_parameter("idmining", auth.user_id)
-
-    result = request.perform_request()
-
-    return result["mining"]
+    return run_operation(operation(config, request.get_base_url()), request)
@@ -1,9 +1,51 @@
-from ..lib.eobot_config import EobotConfig
+from ..lib.eobot_async_request import EobotAsyncRequest
+from ..lib.eobot_operation import EobotCall, run_operation
 from ..lib.eobot_request import EobotRequest
+from ..lib.eobot_results import EobotCoinTable, validate_compact
+
+# fields of every coin that a compact result leaves out by default, since they are rarely needed
+IMAGE_FIELDS = ("Image", "BigImage")
+
+
+def build_request():
+    """
+    Returns the request parameters to retrieve all supported cryptocurrencies
+
+    :rtype : dict
+    """
+    return {"supportedcoins": "true", "currency": "USD"}
+
+
+def parse_response(result, compact=False, fields=None):
+    """
+    Returns the supported cryptocurrencies from the API response, with their prices as floats, as an `EobotCoinTable`
+    with only `fields` (by default all fields but the images) if `compact`
+
+    :rtype : dict|EobotCoinTable
+    """
+    if compact:
+        if fields is None:
+            fields = [field for field in next(iter(result.values()), {}) if field not in IMAGE_FIELDS]
+
+        return EobotCoinTable(result, fields)
+
+    return dict((coin, dict(details, Price=float(details["Price"]))) for coin, details in result.items())
+
+
+def operation(compact=False, fields=None):
+    """
+    Sans-IO implementation of `perform_request()`, see `eobot_operation`
+    """
+    validate_compact(compact)
+
+    if fields is not None and not isinstance(fields, tuple) and not isinstance(fields, list):
+        raise ValueError("Invalid fields, must be a tuple or list")
+
+    return parse_response((yield EobotCall(build_request())), compact, fields)
 
 
 # noinspection PyUnusedLocal
-def perform_request(config=None, request=None):
+def perform_request(config=None, request=None, compact=False, fields=None):
     """
     Retrieves the current values in US dollar for all supported cryptocurrencies. 1 coin equals {result} US dollar.
 
@@ -13,19 +55,19 @@ def perform_request(config=None, request=None):
     :param request : (Optional) Request object to use, will default to a new one if not provided
     :type request : EobotRequest|None
 
-    :rtype : dict
+    :param compact : (Optional) Set to True to return an `EobotCoinTable`, which takes far less memory than a dict of
+                     dicts and converts prices to float when they are first read
+    :type compact : bool
+
+    :param fields : (Optional) Fields to keep for every coin in a compact result, defaults to all fields but "Image" and
+                    "BigImage"
+    :type fields : tuple|list|None
+
+    :rtype : dict|EobotCoinTable
     """
     if request is None:
         request = EobotRequest()
-    elif not isinstance(request, EobotRequest):
-        raise ValueError("Invalid request, must be a EobotRequet")
-
-    request.set_parameter("supportedcoins", "true")
-    request.set_parameter("currency", "USD")
-
-    result = request.perform_request()
-
-    for coin in result.keys():
-        result[coin]["Price"] = float(result[coin]["Price"])
+    elif not isinstance(request, EobotRequest) or isinstance(request, EobotAsyncRequest):
+        raise ValueError("Invalid request, must be a EobotRequest")
 
-    return result
+    return run_operation(operation(compact, fields), request)
@@ -1,7 +1,33 @@
-from ..lib.eobot_config import EobotConfig
+from ..lib.eobot_async_request import EobotAsyncRequest
+from ..lib.eobot_operation import EobotCall, run_operation
 from ..lib.eobot_request import EobotRequest
 
 
+def build_request():
+    """
+    Returns the request parameters to retrieve all supported fiat currencies
+
+    :rtype : dict
+    """
+    return {"supportedfiat": "true"}
+
+
+def parse_response(result):
+    """
+    Returns the supported fiat currencies from the API response, with their prices as floats
+
+    :rtype : dict
+    """
+    return dict((currency, dict(details, Price=float(details["Price"]))) for currency, details in result.items())
+
+
+def operation():
+    """
+    Sans-IO implementation of `perform_request()`, see `eobot_operation`
+    """
+    return parse_response((yield EobotCall(build_request())))
+
+
 # noinspection PyUnusedLocal
 def perform_request(config=None, request=None):
     """
@@ -17,14 +43,7 @@ def perform_request(config=None, request=None):
     """
     if request is None:
         request = EobotRequest()
-    elif not isinstance(request, EobotRequest):
-        raise ValueError("Invalid request, must be a EobotRequet")
-
-    request.set_parameter("supportedfiat", "true")
-
-    result = request.perform_request()
-
-    for currency in result.keys():
-        result[currency]["Price"] = float(result[currency]["Price"])
+    elif not isinstance(request, EobotRequest) or isinstance(request, EobotAsyncRequest):
+        raise ValueError("Invalid request, must be a EobotRequest")
 
-    return result
+    return run_operation(operation(), request)
@@ -1,29 +1,35 @@
-from ..lib.eobot_config import EobotConfig, get_config
-from ..lib.eobot_errors import NoEmailError, NoPasswordOrTokenError
+from ..lib.eobot_async_request import EobotAsyncRequest
+from ..lib.eobot_errors import NoEmailError, NoPasswordOrTokenError, NoUserIdError
+from ..lib.eobot_operation import EobotCall, resolve_config, run_operation
 from ..lib.eobot_request import EobotRequest
 
 
-def perform_request(config=None, request=None):
+def build_request(email, secret):
     """
-    Retrieves the user id for the current user
+    Returns the request parameters to look up the user id of the account with `email` and password or token `secret`
 
-    :param config : (Optional) Configuration to use, will default to the global config if not provided
-    :type config : EobotConfig|str|None
+    :rtype : dict
+    """
+    return {"email": email, "password": secret}
 
-    :param request : (Optional) Request object to use, will default to a new one if not provided
-    :type request : EobotRequest|None
+
+def parse_response(result):
+    """
+    Returns the user id from the API response
 
     :rtype : int
     """
-    if request is None:
-        request = EobotRequest()
-    elif not isinstance(request, EobotRequest):
-        raise ValueError("Invalid request, must be a EobotRequet")
+    return int(result["userid"])
+
+
+def operation(config=None, base_url=None):
+    """
+    Sans-IO implementation of `perform_request()`, see `eobot_operation`
 
-    if config is None or isinstance(config, str):
-        config = get_config(config)
-    elif not isinstance(config, EobotConfig):
-        raise ValueError("Invalid config, must be a EobotConfig")
+    :param base_url : Base URL of the API, to key the user id by in the config's persistent store
+    :type base_url : str|None
+    """
+    config = resolve_config(config)
 
     if not config.has_email():
         raise NoEmailError()
@@ -31,9 +37,63 @@ def perform_request(config=None, request=None):
     if not config.has_token() and not config.has_password():
         raise NoPasswordOrTokenError()
 
-    request.set_parameter("email", config.get_email())
-    request.set_parameter("password", config.get_token() if config.has_token() else config.get_password())
+    secret = config.get_token() if config.has_token() else config.get_password()
 
-    result = request.perform_request()
+    store = config.get_store()
+    if store is not None:
+        key = store.make_key("user_id", base_url, config.get_email(), secret)
+        user_id = store.get(key)
+        if user_id is not None:
+            return user_id
 
-    return int(result["userid"])
+    user_id = parse_response((yield EobotCall(build_request(config.get_email(), secret))))
+
+    if store is not None:
+        store.set(key, user_id)
+
+    return user_id
+
+
+def resolve_authentication(config, base_url=None, readonly=True):
+    """
+    Operation that returns the authentication of `config`, looking up the user id first if the config does not have
+    one yet, and remembering it in the config
+
+    :param config   : Configuration to authenticate with
+    :param base_url : Base URL of the API
+    :param readonly : Whether read-only authentication suffices, otherwise the email address and password or token are
+                      required as well
+
+    :type config   : EobotConfig
+    :type base_url : str|None
+    :type readonly : bool
+
+    :rtype : EobotReadonlyAuthentication|EobotWriteAuthentication
+    """
+    try:
+        auth = config.get_authentication(True)
+    except NoUserIdError:
+        config.set_user_id((yield from operation(config, base_url)))
+        auth = config.get_authentication(True)
+
+    return auth if readonly else config.get_authentication(False)
+
+
+def perform_request(config=None, request=None):
+    """
+    Retrieves the user id for the current user
+
+    :param config : (Optional) Configuration to use, will default to the global config if not provided
+    :type config : EobotConfig|str|None
+
+    :param request : (Optional) Request object to use, will default to a new one if not provided
+    :type request : EobotRequest|None
+
+    :rtype : int
+    """
+    if request is None:
+        request = EobotRequest()
+    elif not isinstance(request, EobotRequest) or isinstance(request, EobotAsyncRequest):
+        raise ValueError("Invalid request, must be a EobotRequest")
+
+    return run_operation(operation(config, request.get_base_url()), request)
@@ -1,30 +1,45 @@
-from ..lib.eobot_config import EobotConfig, get_config
-from ..lib.eobot_errors import NoUserIdError
+from collections.abc import Mapping
+
+from ..lib.eobot_async_request import EobotAsyncRequest
+from ..lib.eobot_operation import EobotCall, EobotReconcile, EobotSleep, resolve_config, run_operation
 from ..lib.eobot_request import EobotRequest
-from .get_balances import perform_request as get_balances
-from .get_user_id import perform_request as get_user_id
+from ..lib.eobot_verification import VERIFY_FULL, VERIFY_NONE, VERIFY_POLL, get_balance, get_poll_delays, \
+    get_prior_balances, record_balances, validate_verification
+from .get_balances import operation as get_balances
+from .get_user_id import resolve_authentication
 
 
-def perform_request(coin, amount, wallet_address, config=None, request=None):
+def build_request(auth, coin, amount, wallet_address):
     """
-    Immediately withdraws `amount` `coin` to `wallet_address`
+    Returns the request parameters to withdraw `amount` `coin` to `wallet_address`
 
-    :param coin : Cryptocurrency to withdraw
-    :type coin : str
+    :rtype : dict
+    """
+    return {
+        "id": auth.user_id,
+        "email": auth.email,
+        "password": auth.password,
+        "manualwithdraw": coin,
+        "amount": amount,
+        "wallet": wallet_address,
+    }
 
-    :param amount : Amount to withdraw
-    :type amount : int|float
 
-    :param wallet_address : Wallet address to withdraw funds to
-    :type wallet_address : str
+def is_withdrawn(old_balances, new_balances, coin):
+    """
+    Returns whether the balances show that `coin` was withdrawn
 
-    :param config : (Optional) Configuration to use, will default to the global config if not provided
-    :type config : EobotConfig|str|None
+    :rtype : bool
+    """
+    return get_balance(new_balances, coin) < get_balance(old_balances, coin)
 
-    :param request : (Optional) Request object to use, will default to a new one if not provided
-    :type request : EobotRequest|None
 
-    :rtype : bool
+def operation(coin, amount, wallet_address, config=None, base_url=None, verification=None, prior_balances=None):
+    """
+    Sans-IO implementation of `perform_request()`, see `eobot_operation`
+
+    :param base_url : Base URL of the API, to key the balances by in the config's balance cache
+    :type base_url : str|None
     """
     if not isinstance(coin, str):
         raise ValueError("Invalid coin, must be a str")
@@ -37,35 +52,82 @@ def perform_request(coin, amount, wallet_address, config=None, request=None):
     if not isinstance(wallet_address, str):
         raise ValueError("Invalid wallet_address, must be a str")
 
-    if request is None:
-        request = EobotRequest()
-    elif not isinstance(request, EobotRequest):
-        raise ValueError("Invalid request, must be a EobotRequet")
+    config = resolve_config(config)
+    auth = yield from resolve_authentication(config, base_url, False)
+
+    if verification is None:
+        verification = config.get_verification()
+    else:
+        validate_verification(verification)
+
+    if prior_balances is not None and not isinstance(prior_balances, Mapping):
+        raise ValueError("Invalid prior_balances, must be a dict or EobotAmounts")
+
+    balance_cache = config.get_balance_cache()
+
+    old_balances = prior_balances
+    if verification != VERIFY_NONE:
+        if old_balances is None and verification != VERIFY_FULL:
+            old_balances = get_prior_balances(balance_cache, base_url, auth.user_id)
+        if old_balances is None:
+            old_balances = yield from get_balances(config, base_url, 0)
+
+    yield EobotCall(build_request(auth, coin, amount, wallet_address))
 
-    if config is None or isinstance(config, str):
-        config = get_config(config)
-    elif not isinstance(config, EobotConfig):
-        raise ValueError("Invalid config, must be a EobotConfig")
+    if verification == VERIFY_NONE:
+        if balance_cache is not None:
+            balance_cache.apply_delta(base_url, auth.user_id, {coin: -float(amount)})
+            yield EobotReconcile(balance_cache, base_url, auth.user_id, get_balances(config, base_url, 0))
+        return True
 
-    try:
-        config.get_authentication(True)
-    except NoUserIdError:
-        config.set_user_id(get_user_id(config=config, request=request.clone()))
+    new_balances = yield from get_balances(config, base_url, 0)
 
-    auth = config.get_authentication(False)
+    if verification == VERIFY_POLL:
+        for delay in get_poll_delays(config.get_verification_timeout()):
+            if is_withdrawn(old_balances, new_balances, coin):
+                break
+            yield EobotSleep(delay)
+            new_balances = yield from get_balances(config, base_url, 0)
 
-    old_balances = get_balances(config=config, request=request.clone())
-    old_balance = old_balances[coin] if coin in old_balances.keys() else 0.0
+    record_balances(base_url, auth.user_id, new_balances)
 
-    request.set_parameter("id", auth.user_id)
-    request.set_parameter("email", auth.email)
-    request.set_parameter("password", auth.password)
-    request.set_parameter("manualwithdraw", coin)
-    request.set_parameter("amount", amount)
-    request.set_parameter("wallet", wallet_address)
-    request.perform_request()
+    return is_withdrawn(old_balances, new_balances, coin)
 
-    new_balances = get_balances(config=config, request=request.clone())
-    new_balance = new_balances[coin] if coin in new_balances.keys() else 0.0
 
-    return new_balance < old_balance
+def perform_request(coin, amount, wallet_address, config=None, request=None, verification=None,
+                    prior_balances=None):
+    """
+    Immediately withdraws `amount` `coin` to `wallet_address`
+
+    :param coin : Cryptocurrency to withdraw
+    :type coin : str
+
+    :param amount : Amount to withdraw
+    :type amount : int|float
+
+    :param wallet_address : Wallet address to withdraw funds to
+    :type wallet_address : str
+
+    :param config : (Optional) Configuration to use, will default to the global config if not provided
+    :type config : EobotConfig|str|None
+
+    :param request : (Optional) Request object to use, will default to a new one if not provided
+    :type request : EobotRequest|None
+
+    :param verification : (Optional) How to check that the withdrawal took effect, defaults to the config's
+                          verification mode, see `eobot_verification.VERIFICATION_MODES`
+    :type verification : str|None
+
+    :param prior_balances : (Optional) Balances before the withdrawal, to verify against instead of reading them first
+    :type prior_balances : dict|EobotAmounts|None
+
+    :rtype : bool
+    """
+    if request is None:
+        request = EobotRequest()
+    elif not isinstance(request, EobotRequest) or isinstance(request, EobotAsyncRequest):
+        raise ValueError("Invalid request, must be a EobotRequest")
+
+    return run_operation(
+        operation(coin, amount, wallet_address, config, request.get_base_url(), verification, prior_balances), request
+    )
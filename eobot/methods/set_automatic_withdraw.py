@@ -1,7 +1,51 @@
-from ..lib.eobot_config import EobotConfig, get_config
-from ..lib.eobot_errors import NoUserIdError
+from ..lib.eobot_async_request import EobotAsyncRequest
+from ..lib.eobot_operation import EobotCall, resolve_config, run_operation
 from ..lib.eobot_request import EobotRequest
-from .get_user_id import perform_request as get_user_id
+from .get_user_id import resolve_authentication
+
+
+def build_request(auth, coin, on_amount, wallet_address):
+    """
+    Returns the request parameters to automatically withdraw `coin` to `wallet_address` once the balance exceeds
+    `on_amount`
+
+    :rtype : dict
+    """
+    return {
+        "id": auth.user_id,
+        "email": auth.email,
+        "password": auth.password,
+        "withdraw": coin,
+        "amount": on_amount,
+        "wallet": wallet_address,
+    }
+
+
+def operation(coin, on_amount, wallet_address, config=None, base_url=None):
+    """
+    Sans-IO implementation of `perform_request()`, see `eobot_operation`
+
+    :param base_url : Base URL of the API
+    :type base_url : str|None
+    """
+    if not isinstance(coin, str):
+        raise ValueError("Invalid coin, must be a str")
+
+    coin = coin.upper()
+
+    if not isinstance(on_amount, float) and not isinstance(on_amount, int):
+        raise ValueError("Invalid on_amount, must be a float or int")
+
+    if not isinstance(wallet_address, str):
+        raise ValueError("Invalid wallet_address, must be a str")
+
+    config = resolve_config(config)
+    auth = yield from resolve_authentication(config, base_url, False)
+
+    yield EobotCall(build_request(auth, coin, on_amount, wallet_address))
+
+    # This API method does not return anything by which we can see whether the request was successful, so assume it was
+    return True
 
 
 def perform_request(coin, on_amount, wallet_address, config=None, request=None):
@@ -25,41 +69,9 @@ def perform_request(coin, on_amount, wallet_address, config=None, request=None):
 
     :rtype : bool
     """
-    if not isinstance(coin, str):
-        raise ValueError("Invalid coin, must be a str")
-
-    coin = coin.upper()
-
-    if not isinstance(on_amount, float) and not isinstance(on_amount, int):
-        raise ValueError("Invalid on_amount, must be a float or int")
-
-    if not isinstance(wallet_address, str):
-        raise ValueError("Invalid wallet_address, must be a str")
-
     if request is None:
         request = EobotRequest()
-    elif not isinstance(request, EobotRequest):
-        raise ValueError("Invalid request, must be a EobotRequet")
-
-    if config is None or isinstance(config, str):
-        config = get_config(config)
-    elif not isinstance(config, EobotConfig):
-        raise ValueError("Invalid config, must be a EobotConfig")
+    elif not isinstance(request, EobotRequest) or isinstance(request, EobotAsyncRequest):
+        raise ValueError("Invalid request, must be a EobotRequest")
 
-    try:
-        config.get_authentication(True)
-    except NoUserIdError:
-        config.set_user_id(get_user_id(config=config, request=request.clone()))
-
-    auth = config.get_authentication(False)
-
-    request.set_parameter("id", auth.user_id)
-    request.set_parameter("email", auth.email)
-    request.set_parameter("password", auth.password)
-    request.set_parameter("withdraw", coin)
-    request.set_parameter("amount", on_amount)
-    request.set_parameter("wallet", wallet_address)
-    request.perform_request()
-
-    # This API method does not return anything by which we can see whether the request was successful, so assume it was
-    return True
+    return run_operation(operation(coin, on_amount, wallet_address, config, request.get_base_url()), request)
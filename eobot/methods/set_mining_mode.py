@@ -1,56 +1,85 @@
-from ..lib.eobot_config import EobotConfig, get_config
-from ..lib.eobot_errors import NoUserIdError
+from ..lib.eobot_async_request import EobotAsyncRequest
+from ..lib.eobot_operation import EobotCall, EobotSleep, resolve_config, run_operation
 from ..lib.eobot_request import EobotRequest
-from .get_user_id import perform_request as get_user_id
-from .get_mining_mode import perform_request as get_mining_mode
+from ..lib.eobot_verification import VERIFY_FULL, VERIFY_NONE, VERIFY_POLL, get_poll_delays, validate_verification
+from .get_mining_mode import operation as get_mining_mode
+from .get_user_id import resolve_authentication
 
 
-def perform_request(mode, config=None, request=None):
+def build_request(auth, mode):
     """
-    Changes the mining mode to the cryptocurrency specified
+    Returns the request parameters to change the mining mode to `mode`
 
-    :param mode : Mining mode to set
-    :type mode : str
+    :rtype : dict
+    """
+    return {"id": auth.user_id, "email": auth.email, "password": auth.password, "mining": mode}
 
-    :param config : (Optional) Configuration to use, will default to the global config if not provided
-    :type config : EobotConfig|str|None
 
-    :param request : (Optional) Request object to use, will default to a new one if not provided
-    :type request : EobotRequest|None
+def operation(mode, config=None, base_url=None, verification=None):
+    """
+    Sans-IO implementation of `perform_request()`, see `eobot_operation`
 
-    :rtype : bool
+    :param base_url : Base URL of the API
+    :type base_url : str|None
     """
     if not isinstance(mode, str):
         raise ValueError("Invalid mode, must be a str")
 
     mode = mode.upper()
 
-    if request is None:
-        request = EobotRequest()
-    elif not isinstance(request, EobotRequest):
-        raise ValueError("Invalid request, must be a EobotRequet")
+    config = resolve_config(config)
+    auth = yield from resolve_authentication(config, base_url, False)
 
-    if config is None or isinstance(config, str):
-        config = get_config(config)
-    elif not isinstance(config, EobotConfig):
-        raise ValueError("Invalid config, must be a EobotConfig")
+    if verification is None:
+        verification = config.get_verification()
+    else:
+        validate_verification(verification)
 
-    try:
-        config.get_authentication(True)
-    except NoUserIdError:
-        config.set_user_id(get_user_id(config=config, request=request.clone()))
+    # only full verification reads the current mode first, which skips the write if the mode is already set
+    if verification == VERIFY_FULL:
+        current_mode = yield from get_mining_mode(config, base_url, True)
+        if current_mode == mode:
+            return True
 
-    auth = config.get_authentication(False)
+    yield EobotCall(build_request(auth, mode))
 
-    current_mode = get_mining_mode(config=config, request=request.clone())
-    if current_mode == mode:
+    if verification == VERIFY_NONE:
         return True
 
-    request.set_parameter("id", auth.user_id)
-    request.set_parameter("email", auth.email)
-    request.set_parameter("password", auth.password)
-    request.set_parameter("mining", mode)
-    request.perform_request()
+    new_mode = yield from get_mining_mode(config, base_url, True)
+
+    if verification == VERIFY_POLL:
+        for delay in get_poll_delays(config.get_verification_timeout()):
+            if new_mode == mode:
+                break
+            yield EobotSleep(delay)
+            new_mode = yield from get_mining_mode(config, base_url, True)
 
-    new_mode = get_mining_mode(config=config, request=request.clone())
     return new_mode == mode
+
+
+def perform_request(mode, config=None, request=None, verification=None):
+    """
+    Changes the mining mode to the cryptocurrency specified
+
+    :param mode : Mining mode to set
+    :type mode : str
+
+    :param config : (Optional) Configuration to use, will default to the global config if not provided
+    :type config : EobotConfig|str|None
+
+    :param request : (Optional) Request object to use, will default to a new one if not provided
+    :type request : EobotRequest|None
+
+    :param verification : (Optional) How to check that the mining mode changed, defaults to the config's verification
+                          mode, see `eobot_verification.VERIFICATION_MODES`
+    :type verification : str|None
+
+    :rtype : bool
+    """
+    if request is None:
+        request = EobotRequest()
+    elif not isinstance(request, EobotRequest) or isinstance(request, EobotAsyncRequest):
+        raise ValueError("Invalid request, must be a EobotRequest")
+
+    return run_operation(operation(mode, config, request.get_base_url(), verification), request)
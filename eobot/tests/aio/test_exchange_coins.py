@@ -0,0 +1,136 @@
+import unittest
+from asyncio import run
+
+from eobot.aio.exchange_coins import perform_request
+from eobot.aio.get_balances import perform_request as get_balances
+from eobot.lib.eobot_config import get_config
+from eobot.lib.eobot_async_request import EobotAsyncRequest
+from eobot.lib.eobot_verification import VERIFY_FULL, VERIFY_NONE, VERIFY_POLL, VERIFY_POST_ONLY, \
+    clear_recorded_balances
+from eobot.tests.mock_server import MockServer
+
+
+class AsyncExchangeCoinsTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockServer()
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_perform_request_without_arguments(self):
+        with self.assertRaises(TypeError):
+            # noinspection PyArgumentList
+            run(perform_request())
+
+    def test_perform_request_with_invalid_from_coin(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            run(perform_request(123, 1, "ETH"))
+
+    def test_perform_request_with_invalid_amount(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            run(perform_request("BTC", "1", "ETH"))
+
+    def test_perform_request_with_invalid_to_coin(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            run(perform_request("BTC", 1, 456))
+
+    def test_perform_request_with_invalid_config(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            run(perform_request("BTC", 1, "ETH", config={}))
+
+    def test_perform_request_with_invalid_request(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            run(perform_request("BTC", 1, "ETH", request={}))
+
+    def test_perform_request(self):
+        MockServer.reset()
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        get_config().configure(123, "123@example.com", password="password", token=None)
+
+        self.assertEqual(0.2, run(get_balances(request=req.clone()))["BTC"])
+        self.assertEqual(2.5, run(get_balances(request=req.clone()))["ETH"])
+
+        result = run(perform_request("BTC", 0.1, "ETH", request=req.clone()))
+        self.assertTrue(result)
+
+        self.assertEqual(0.1, run(get_balances(request=req.clone()))["BTC"])
+        self.assertEqual(3.0, run(get_balances(request=req.clone()))["ETH"])
+
+    def test_perform_request_with_config(self):
+        MockServer.reset()
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        get_config("tec").configure(456, "456@example.com", password="password", token=None)
+
+        self.assertEqual(0.1, run(get_balances(config="tec", request=req.clone()))["BTC"])
+        self.assertEqual(2.0, run(get_balances(config="tec", request=req.clone()))["ETH"])
+
+        result = run(perform_request("BTC", 0.1, "ETH", config="tec", request=req.clone()))
+        self.assertTrue(result)
+
+        self.assertEqual(0.0, run(get_balances(config=get_config("tec"), request=req.clone()))["BTC"])
+        self.assertEqual(2.5, run(get_balances(config=get_config("tec"), request=req.clone()))["ETH"])
+
+    def test_perform_request_with_config_without_user_id(self):
+        MockServer.reset()
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        get_config("tec2").configure(email="456@example.com", password="password", token=None)
+
+        result = run(perform_request("ETH", 0.5, "BTC", config="tec2", request=req.clone()))
+        self.assertTrue(result)
+
+        self.assertEqual(0.2, run(get_balances(config=get_config("tec2"), request=req.clone()))["BTC"])
+        self.assertEqual(1.5, run(get_balances(config=get_config("tec2"), request=req.clone()))["ETH"])
+
+    def test_perform_request_with_verification(self):
+        MockServer.reset()
+        clear_recorded_balances()
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        cfg = get_config("atec_verify").configure(123, "123@example.com", password="password", token=None)
+        cfg.set_verification(VERIFY_FULL).set_verification_timeout(0.3)
+
+        def requests_for(*args, **kwargs):
+            self.server.reset_counters()
+            result = run(perform_request(*args, config=cfg, request=req.clone(), **kwargs))
+            return result, self.server.get_counters()["requests"]
+
+        # reads balances before and after the exchange
+        self.assertEqual((True, 3), requests_for("BTC", 0.01, "ETH"))
+
+        # compares against the balances recorded after the previous exchange
+        self.assertEqual((True, 2), requests_for("BTC", 0.01, "ETH", verification=VERIFY_POST_ONLY))
+
+        # compares against the balances supplied by the caller
+        prior_balances = {"BTC": 1.0, "ETH": 0.0}
+        self.assertEqual((True, 2), requests_for("BTC", 0.01, "ETH", verification=VERIFY_POST_ONLY,
+                                                 prior_balances=prior_balances))
+        prior_balances = {"BTC": 0.0, "ETH": 0.0}
+        self.assertEqual((False, 2), requests_for("BTC", 0.01, "ETH", verification=VERIFY_POST_ONLY,
+                                                  prior_balances=prior_balances))
+
+        # polls until the timeout passes, since exchanging nothing never changes the balances
+        result, requests = requests_for("BTC", 0.0, "ETH", verification=VERIFY_POLL)
+        self.assertFalse(result)
+        self.assertGreater(requests, 2)
+
+        cfg.set_verification(VERIFY_NONE)
+        self.assertEqual((True, 1), requests_for("BTC", 0.01, "ETH"))
+
+        with self.assertRaises(ValueError):
+            requests_for("BTC", 0.01, "ETH", verification="nosuch")
+
+        with self.assertRaises(ValueError):
+            requests_for("BTC", 0.01, "ETH", prior_balances=[])
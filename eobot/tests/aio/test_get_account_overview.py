@@ -0,0 +1,86 @@
+import unittest
+from asyncio import run
+
+from eobot.aio.get_account_overview import perform_request
+from eobot.lib.eobot_config import get_config
+from eobot.lib.eobot_errors import EobotRequestError
+from eobot.lib.eobot_async_request import EobotAsyncRequest
+from eobot.tests.mock_server import FAULT_SERVER_ERROR, MockServer
+
+
+class AsyncGetAccountOverviewTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockServer(load_mode=True)
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_perform_request_with_invalid_config(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            run(perform_request(config={}))
+
+    def test_perform_request_with_invalid_request(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            run(perform_request(request={}))
+
+    def test_perform_request(self):
+        MockServer.reset()
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        get_config("atgao").configure(123, "123@example.com", password="password", token=None)
+
+        overview = run(perform_request(config="atgao", request=req.clone()))
+
+        self.assertEqual({}, overview["errors"])
+        self.assertEqual(0.2, overview["balances"]["BTC"])
+        self.assertEqual("BTC", overview["mining_mode"])
+        self.assertIsInstance(overview["mining_speed"], dict)
+        self.assertIsInstance(overview["mining_estimates"], dict)
+
+    def test_perform_request_without_user_id(self):
+        MockServer.reset()
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        cfg = get_config("atgao_user_id").configure(None, "123@example.com", password="password", token=None)
+
+        overview = run(perform_request(config=cfg, request=req.clone()))
+
+        # the user ID is looked up once, before the four reads
+        self.assertEqual(5, self.server.get_counters()["requests"])
+        self.assertEqual(123, cfg.get_user_id())
+        self.assertEqual({}, overview["errors"])
+
+    def test_perform_request_concurrently(self):
+        MockServer.reset()
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+        self.server.set_latency(0.5)
+
+        get_config("atgao_latency").configure(123, "123@example.com", password="password", token=None)
+
+        overview = run(perform_request(config="atgao_latency", request=req.clone()))
+
+        # the four reads were waiting on the server at the same time
+        self.assertEqual(4, self.server.get_counters()["max_delayed"])
+        self.assertEqual({}, overview["errors"])
+
+    def test_perform_request_with_partial_failure(self):
+        MockServer.reset()
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+        self.server.set_fault(FAULT_SERVER_ERROR, 1.0, "get_mining_speed")
+
+        get_config("atgao_fault").configure(123, "123@example.com", password="password", token=None)
+
+        overview = run(perform_request(config="atgao_fault", request=req.clone()))
+
+        self.assertEqual(["mining_speed"], list(overview["errors"].keys()))
+        self.assertIsInstance(overview["errors"]["mining_speed"], EobotRequestError)
+        self.assertIsNone(overview["mining_speed"])
+        self.assertEqual(0.2, overview["balances"]["BTC"])
+        self.assertEqual("BTC", overview["mining_mode"])
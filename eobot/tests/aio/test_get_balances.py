@@ -0,0 +1,120 @@
+import unittest
+from asyncio import run
+
+from eobot.aio.get_balances import perform_request
+from eobot.lib.eobot_balance_cache import EobotBalanceCache
+from eobot.lib.eobot_config import get_config
+from eobot.lib.eobot_async_request import EobotAsyncRequest
+from eobot.lib.eobot_results import EobotAmounts
+from eobot.tests.mock_server import MockServer
+
+
+class AsyncGetBalancesTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockServer()
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_perform_request_with_invalid_config(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            run(perform_request(config={}))
+
+    def test_perform_request_with_invalid_request(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            run(perform_request(request={}))
+
+    def test_perform_request(self):
+        MockServer.reset()
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        get_config().configure(123, "123@example.com", password="password", token=None)
+
+        balances = run(perform_request(request=req.clone()))
+
+        self.assertIsInstance(balances, dict)
+        self.assertEqual(3, len(balances))
+        self.assertIn("BTC", balances.keys())
+        self.assertIn("ETH", balances.keys())
+        self.assertIn("Total", balances.keys())
+
+        self.assertEqual(0.2, balances["BTC"])
+        self.assertEqual(2.5, balances["ETH"])
+        self.assertEqual(70.0, balances["Total"])
+
+    def test_perform_request_with_config(self):
+        MockServer.reset()
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        get_config("tgb").configure(456, "456@example.com", password="password", token=None)
+
+        balances = run(perform_request(config="tgb", request=req.clone()))
+
+        self.assertIsInstance(balances, dict)
+        self.assertEqual(3, len(balances))
+        self.assertIn("BTC", balances.keys())
+        self.assertIn("ETH", balances.keys())
+        self.assertIn("Total", balances.keys())
+
+        self.assertEqual(0.1, balances["BTC"])
+        self.assertEqual(2.0, balances["ETH"])
+        self.assertEqual(50.0, balances["Total"])
+
+    def test_perform_request_with_config_without_user_id(self):
+        MockServer.reset()
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        get_config("tgb2").configure(email="456@example.com", password="password", token=None)
+
+        balances = run(perform_request(config=get_config("tgb2"), request=req.clone()))
+
+        self.assertIsInstance(balances, dict)
+        self.assertEqual(3, len(balances))
+        self.assertIn("BTC", balances.keys())
+        self.assertIn("ETH", balances.keys())
+        self.assertIn("Total", balances.keys())
+
+        self.assertEqual(0.1, balances["BTC"])
+        self.assertEqual(2.0, balances["ETH"])
+        self.assertEqual(50.0, balances["Total"])
+
+    def test_perform_request_with_balance_cache(self):
+        MockServer.reset()
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        cfg = get_config("atgb_cache").configure(123, "123@example.com", password="password", token=None)
+        cfg.set_balance_cache(EobotBalanceCache(max_staleness=60))
+
+        def requests_for(**kwargs):
+            self.server.reset_counters()
+            result = run(perform_request(config=cfg, request=req.clone(), **kwargs))
+            return result, self.server.get_counters()["requests"]
+
+        balances, requests = requests_for()
+        self.assertEqual(0.2, balances["BTC"])
+        self.assertEqual(1, requests)
+
+        self.assertEqual((balances, 0), requests_for())
+        self.assertEqual((balances, 1), requests_for(max_staleness=0))
+
+        with self.assertRaises(ValueError):
+            requests_for(max_staleness=-1)
+
+    def test_perform_request_compact(self):
+        MockServer.reset()
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        get_config().configure(123, "123@example.com", password="password", token=None)
+
+        balances = run(perform_request(request=req.clone(), compact=True))
+
+        self.assertIsInstance(balances, EobotAmounts)
+        self.assertEqual({"BTC": 0.2, "ETH": 2.5, "Total": 70.0}, balances)
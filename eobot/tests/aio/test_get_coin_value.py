@@ -0,0 +1,53 @@
+import unittest
+from asyncio import run
+
+from eobot.aio.get_coin_value import perform_request
+from eobot.lib.eobot_async_request import EobotAsyncRequest
+from eobot.tests.mock_server import MockServer
+
+
+class AsyncGetCoinValueTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockServer()
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_perform_request_without_coin(self):
+        with self.assertRaises(TypeError):
+            # noinspection PyArgumentList
+            run(perform_request())
+
+    def test_perform_request_with_invalid_coin(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            run(perform_request(123))
+
+    def test_perform_request_with_invalid_request(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            run(perform_request("BTC", request={}))
+
+    def test_perform_request_with_invalid_snapshot(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            run(perform_request("BTC", snapshot=[]))
+
+    def test_perform_request(self):
+        MockServer.reset()
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        value = run(perform_request("BTC", request=req.clone()))
+
+        self.assertIsInstance(value, float)
+        self.assertEqual(100.0, value)
+
+    def test_perform_request_with_snapshot(self):
+        MockServer.reset()
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        self.assertEqual(20.0, run(perform_request("ETH", request=req.clone(), snapshot=True)))
+        self.assertEqual(50.0, run(perform_request("BTC", request=req.clone(), snapshot={"BTC": {"Price": 50.0}})))
@@ -0,0 +1,104 @@
+import os
+import shutil
+import tempfile
+import unittest
+from asyncio import run
+
+from eobot.aio.get_deposit_address import perform_request
+from eobot.lib.eobot_config import get_config
+from eobot.lib.eobot_store import EobotPersistentStore
+from eobot.lib.eobot_async_request import EobotAsyncRequest
+from eobot.tests.mock_server import MockServer
+
+try:
+    # noinspection PyShadowingBuiltins
+    basestring = basestring
+except NameError:
+    # noinspection PyShadowingBuiltins
+    basestring = (str, bytes)
+
+
+class AsyncGetDepositAddressTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockServer()
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_perform_request_without_coin(self):
+        with self.assertRaises(TypeError):
+            # noinspection PyArgumentList
+            run(perform_request())
+
+    def test_perform_request_with_invalid_coin(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            run(perform_request(123))
+
+    def test_perform_request_with_invalid_config(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            run(perform_request("BTC", config={}))
+
+    def test_perform_request_with_invalid_request(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            run(perform_request("BTC", request={}))
+
+    def test_perform_request(self):
+        MockServer.reset()
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        get_config().configure(123, "123@example.com", password="password", token=None)
+
+        wallet = run(perform_request("BTC", request=req.clone()))
+
+        self.assertIsInstance(wallet, basestring)
+        self.assertEqual("bitcoin-wallet", wallet)
+
+    def test_perform_request_with_config(self):
+        MockServer.reset()
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        get_config("tgda").configure(456, "456@example.com", password="password", token=None)
+
+        wallet = run(perform_request("ETH", config="tgda", request=req.clone()))
+
+        self.assertIsInstance(wallet, basestring)
+        self.assertEqual("wallet-ethereum", wallet)
+
+    def test_perform_request_with_config_without_user_id(self):
+        MockServer.reset()
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        get_config("tgda2").configure(user_id=None, email="456@example.com", password="password", token=None)
+
+        wallet = run(perform_request("BTC", config=get_config("tgda2"), request=req.clone()))
+
+        self.assertIsInstance(wallet, basestring)
+        self.assertEqual("wallet-bitcoin", wallet)
+
+    def test_perform_request_with_store(self):
+        MockServer.reset()
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        store = EobotPersistentStore(os.path.join(directory, "store.sqlite3"))
+
+        get_config("atgda_store").configure(user_id=None, email="456@example.com", password="password", token=None)
+        get_config("atgda_store").set_store(store)
+
+        self.assertEqual("wallet-bitcoin", run(perform_request("BTC", config="atgda_store", request=req.clone())))
+        self.assertEqual(2, self.server.get_counters()["requests"])
+
+        # a new process resolves neither the user ID nor the address through the API
+        get_config("atgda_store").configure(user_id=None).set_store(EobotPersistentStore(store.get_path()))
+        self.assertEqual("wallet-bitcoin", run(perform_request("BTC", config="atgda_store", request=req.clone())))
+        self.assertEqual("wallet-ethereum", run(perform_request("ETH", config="atgda_store", request=req.clone())))
+        self.assertEqual(3, self.server.get_counters()["requests"])
@@ -0,0 +1,40 @@
+import unittest
+from asyncio import run
+
+from eobot.aio.get_exchange_rate import perform_request
+from eobot.lib.eobot_async_request import EobotAsyncRequest
+from eobot.tests.mock_server import MockServer
+
+
+class AsyncGetExchangeRateValueTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockServer()
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_perform_request_without_currency(self):
+        with self.assertRaises(TypeError):
+            # noinspection PyArgumentList
+            run(perform_request())
+
+    def test_perform_request_with_invalid_currency(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            run(perform_request(123))
+
+    def test_perform_request_with_invalid_request(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            run(perform_request("EUR", request={}))
+
+    def test_perform_request(self):
+        MockServer.reset()
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        rate = run(perform_request("EUR", request=req.clone()))
+
+        self.assertIsInstance(rate, float)
+        self.assertEqual(0.85, rate)
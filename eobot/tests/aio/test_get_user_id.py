@@ -0,0 +1,93 @@
+import os
+import shutil
+import tempfile
+import unittest
+from asyncio import run
+
+from eobot.lib.eobot_errors import NoEmailError, NoPasswordOrTokenError
+from eobot.aio.get_user_id import perform_request
+from eobot.lib.eobot_config import get_config
+from eobot.lib.eobot_store import EobotPersistentStore
+from eobot.lib.eobot_async_request import EobotAsyncRequest
+from eobot.tests.mock_server import MockServer
+
+
+class AsyncGetUserIdTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockServer()
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_perform_request_with_invalid_config(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            run(perform_request(config={}))
+
+    def test_perform_request_with_invalid_request(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            run(perform_request(request={}))
+
+    def test_perform_request_with_config_without_email(self):
+        get_config("tgui1").configure(user_id=None, email=None, password=None, token=None)
+
+        with self.assertRaises(NoEmailError):
+            run(perform_request(config=get_config("tgui1")))
+
+    def test_perform_request_with_config_without_password_or_token(self):
+        get_config("tgui2").configure(user_id=None, email="123@example.com", password=None, token=None)
+
+        with self.assertRaises(NoPasswordOrTokenError):
+            run(perform_request(config=get_config("tgui2")))
+
+    def test_perform_request_with_valid_config(self):
+        MockServer.reset()
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        get_config().configure(None, "123@example.com", password="password", token=None)
+
+        user_id = run(perform_request(request=req.clone()))
+
+        self.assertIsInstance(user_id, int)
+        self.assertEqual(123, user_id)
+
+    def test_perform_request_with_config(self):
+        MockServer.reset()
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        get_config("tgui3").configure(456, "456@example.com", password="password", token=None)
+
+        user_id = run(perform_request(config="tgui3", request=req.clone()))
+
+        self.assertIsInstance(user_id, int)
+        self.assertEqual(456, user_id)
+
+    def test_perform_request_with_store(self):
+        MockServer.reset()
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        store = EobotPersistentStore(os.path.join(directory, "store.sqlite3"))
+
+        get_config("atgui_store").configure(None, "456@example.com", password="password", token=None)
+        get_config("atgui_store").set_store(store)
+
+        self.assertEqual(456, run(perform_request(config="atgui_store", request=req.clone())))
+        self.assertEqual(1, self.server.get_counters()["requests"])
+
+        # a new process would only share the database file
+        get_config("atgui_store").set_store(EobotPersistentStore(store.get_path()))
+        self.assertEqual(456, run(perform_request(config="atgui_store", request=req.clone())))
+        self.assertEqual(1, self.server.get_counters()["requests"])
+
+        # other credentials are stored separately
+        get_config("atgui_store").set_password("other")
+        with self.assertRaises(TypeError):
+            run(perform_request(config="atgui_store", request=req.clone()))
+        self.assertEqual(2, self.server.get_counters()["requests"])
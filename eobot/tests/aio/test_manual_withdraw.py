@@ -0,0 +1,144 @@
+import unittest
+from asyncio import run, sleep
+
+from eobot.aio.manual_withdraw import perform_request
+from eobot.aio.get_balances import perform_request as get_balances
+from eobot.lib.eobot_balance_cache import EobotBalanceCache
+from eobot.lib.eobot_config import get_config
+from eobot.lib.eobot_async_request import EobotAsyncRequest
+from eobot.lib.eobot_verification import VERIFY_FULL, VERIFY_NONE, VERIFY_POLL, VERIFY_POST_ONLY, \
+    clear_recorded_balances
+from eobot.tests.mock_server import MockServer
+
+
+class AsyncManualWithdrawTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockServer()
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_perform_request_without_arguments(self):
+        with self.assertRaises(TypeError):
+            # noinspection PyArgumentList
+            run(perform_request())
+
+    def test_perform_request_with_invalid_coin(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            run(perform_request(123, 0.1, "bitcoin-wallet"))
+
+    def test_perform_request_with_invalid_amount(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            run(perform_request("BTC", "0.1", "bitcoin-wallet"))
+
+    def test_perform_request_with_invalid_wallet(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            run(perform_request("BTC", 0.1, 456))
+
+    def test_perform_request_with_invalid_config(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            run(perform_request("BTC", 0.1, "bitcoin-wallet", config={}))
+
+    def test_perform_request_with_invalid_request(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            run(perform_request("BTC", 0.11, "bitcoin-wallet", request={}))
+
+    def test_perform_request(self):
+        MockServer.reset()
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        get_config().configure(123, "123@example.com", password="password", token=None)
+
+        self.assertEqual(0.2, run(get_balances(request=req.clone()))["BTC"])
+
+        result = run(perform_request("BTC", 0.1, "bitcoin-wallet", request=req.clone()))
+        self.assertTrue(result)
+
+        self.assertEqual(0.1, run(get_balances(request=req.clone()))["BTC"])
+
+    def test_perform_request_with_config(self):
+        MockServer.reset()
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        get_config("tmw").configure(456, "456@example.com", password="password", token=None)
+
+        self.assertEqual(0.1, run(get_balances(config="tmw", request=req.clone()))["BTC"])
+
+        result = run(perform_request("BTC", 0.05, "wallet-bitcoin", config="tmw", request=req.clone()))
+        self.assertTrue(result)
+
+        self.assertEqual(0.05, run(get_balances(config=get_config("tmw"), request=req.clone()))["BTC"])
+
+    def test_perform_request_with_config_without_user_id(self):
+        MockServer.reset()
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        get_config("tmw2").configure(email="456@example.com", password="password", token=None)
+
+        result = run(perform_request("BTC", 0.05, "wallet-bitcoin", config="tmw2", request=req.clone()))
+        self.assertTrue(result)
+
+        self.assertEqual(0.05, run(get_balances(config=get_config("tmw2"), request=req.clone()))["BTC"])
+
+    def test_perform_request_with_verification(self):
+        MockServer.reset()
+        clear_recorded_balances()
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        cfg = get_config("atmw_verify").configure(123, "123@example.com", password="password", token=None)
+        cfg.set_verification(VERIFY_POST_ONLY).set_verification_timeout(0.3)
+
+        def requests_for(*args, **kwargs):
+            self.server.reset_counters()
+            result = run(perform_request(*args, config=cfg, request=req.clone(), **kwargs))
+            return result, self.server.get_counters()["requests"]
+
+        # nothing was recorded yet, so the balances are read before the withdrawal after all
+        self.assertEqual((True, 3), requests_for("BTC", 0.01, "wallet"))
+        self.assertEqual((True, 2), requests_for("BTC", 0.01, "wallet"))
+        self.assertEqual((True, 2), requests_for("BTC", 0.01, "wallet", prior_balances={"BTC": 1.0}))
+
+        result, requests = requests_for("BTC", 0.0, "wallet", verification=VERIFY_POLL)
+        self.assertFalse(result)
+        self.assertGreater(requests, 2)
+
+        self.assertEqual((True, 1), requests_for("BTC", 0.01, "wallet", verification=VERIFY_NONE))
+
+    def test_perform_request_with_balance_cache(self):
+        MockServer.reset()
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        balance_cache = EobotBalanceCache(max_staleness=60, reconcile_delay=0)
+        cfg = get_config("atmw_cache").configure(123, "123@example.com", password="password", token=None)
+        cfg.set_balance_cache(balance_cache).set_verification(VERIFY_NONE)
+
+        async def withdraw():
+            await get_balances(config=cfg, request=req.clone())
+            result = await perform_request("BTC", 0.05, "wallet", config=cfg, request=req.clone())
+
+            # the background read reconciles the optimistic balance with the API
+            for _ in range(100):
+                if balance_cache.get_stats()["reconciles"] == 1:
+                    break
+                await sleep(0.01)
+
+            return result
+
+        self.assertTrue(run(withdraw()))
+        self.assertEqual(1, balance_cache.get_stats()["optimistic_updates"])
+        self.assertEqual(1, balance_cache.get_stats()["reconciles"])
+
+        self.server.reset_counters()
+        self.assertAlmostEqual(0.15, run(get_balances(config=cfg, request=req.clone()))["BTC"])
+        self.assertEqual(0, self.server.get_counters()["requests"])
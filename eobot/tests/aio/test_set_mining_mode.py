@@ -0,0 +1,97 @@
+import unittest
+from asyncio import run
+
+from eobot.aio.set_mining_mode import perform_request
+from eobot.aio.get_mining_mode import perform_request as get_mining_mode
+from eobot.lib.eobot_config import get_config
+from eobot.lib.eobot_async_request import EobotAsyncRequest
+from eobot.lib.eobot_verification import VERIFY_FULL, VERIFY_NONE, VERIFY_POLL, VERIFY_POST_ONLY
+from eobot.tests.mock_server import MockServer
+
+
+class AsyncSetMiningModeTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockServer()
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_perform_request_without_arguments(self):
+        with self.assertRaises(TypeError):
+            # noinspection PyArgumentList
+            run(perform_request())
+
+    def test_perform_request_with_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            run(perform_request(123))
+
+    def test_perform_request_with_invalid_config(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            run(perform_request("ETH", config={}))
+
+    def test_perform_request_with_invalid_request(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            run(perform_request("ETH", request={}))
+
+    def test_perform_request(self):
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        get_config().configure(123, "123@example.com", password="password", token=None)
+
+        mode_before = run(get_mining_mode(request=req.clone()))
+        self.assertEqual("BTC", mode_before)
+
+        result = run(perform_request("ETH", request=req.clone()))
+        self.assertTrue(result)
+
+        mode_after = run(get_mining_mode(request=req.clone()))
+        self.assertEqual("ETH", mode_after)
+
+    def test_perform_request_with_config(self):
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        get_config("tsmm").configure(456, "456@example.com", password="password", token=None)
+
+        mode_before = run(get_mining_mode(config="tsmm", request=req.clone()))
+        self.assertEqual("ETH", mode_before)
+
+        result = run(perform_request("BTC", config="tsmm", request=req.clone()))
+        self.assertTrue(result)
+
+        mode_after = run(get_mining_mode(config="tsmm", request=req.clone()))
+        self.assertEqual("BTC", mode_after)
+
+    def test_perform_request_with_config_without_user_id(self):
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        get_config("tsmm2").configure(email="456@example.com", password="password", token=None)
+
+        result = run(perform_request("BTC", config=get_config("tsmm2"), request=req.clone()))
+        self.assertTrue(result)
+
+    def test_perform_request_with_verification(self):
+        MockServer.reset()
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        cfg = get_config("atsmm_verify").configure(123, "123@example.com", password="password", token=None)
+        cfg.set_verification(VERIFY_FULL).set_verification_timeout(0.3)
+
+        def requests_for(*args, **kwargs):
+            self.server.reset_counters()
+            result = run(perform_request(*args, config=cfg, request=req.clone(), **kwargs))
+            return result, self.server.get_counters()["requests"]
+
+        # full verification skips the write if the mode is already set
+        self.assertEqual((True, 1), requests_for("BTC"))
+        self.assertEqual((True, 3), requests_for("ETH"))
+        self.assertEqual((True, 2), requests_for("BTC", verification=VERIFY_POST_ONLY))
+        self.assertEqual((True, 2), requests_for("ETH", verification=VERIFY_POLL))
+        self.assertEqual((True, 1), requests_for("BTC", verification=VERIFY_NONE))
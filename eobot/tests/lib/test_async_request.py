@@ -0,0 +1,256 @@
+import asyncio
+import gc
+import ssl
+import unittest
+import warnings
+
+from eobot.lib.eobot_cache import EobotCache
+from eobot.lib.eobot_errors import EobotConnectionError
+from eobot.lib.eobot_async_request import EobotAsyncConnectionPool, EobotAsyncRequest, get_async_pool
+from eobot.tests.mock_server import MockServer
+
+
+class EobotAsyncRequestTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockServer()
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_default_values(self):
+        req = EobotAsyncRequest()
+
+        self.assertEqual(30.0, req._timeout)
+        self.assertIs(get_async_pool(), req._async_pool)
+
+    def test_set_async_pool_with_invalid_value(self):
+        req = EobotAsyncRequest()
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            req.set_async_pool({})
+
+    def test_get_async_pool(self):
+        pool = EobotAsyncConnectionPool()
+        req = EobotAsyncRequest()
+        req.set_async_pool(pool)
+        self.assertIs(pool, req.get_async_pool())
+        req.set_async_pool(None)
+        self.assertIsNone(req.get_async_pool())
+
+    def test_clone(self):
+        pool = EobotAsyncConnectionPool()
+        req = EobotAsyncRequest()
+        req.set_base_url("url")
+        req.set_async_pool(pool)
+
+        clone = req.clone()
+
+        self.assertIsInstance(clone, EobotAsyncRequest)
+        self.assertEqual("url", clone.get_base_url())
+        self.assertIs(pool, clone.get_async_pool())
+
+    def test_perform_request(self):
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+        req.set_parameter("coin", "BTC")
+
+        response = asyncio.run(req.perform_request())
+
+        self.assertIsInstance(response, dict)
+        self.assertEqual(100.0, response["BTC"])
+
+    def test_perform_request_with_parameters(self):
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+        req.set_cache(None)
+
+        async def perform():
+            return await asyncio.gather(*[req.perform_request({"coin": coin}) for coin in ("BTC", "ETH")])
+
+        self.assertEqual([{"BTC": 100.0}, {"ETH": 20.0}], asyncio.run(perform()))
+        self.assertEqual({}, req.get_parameters())
+
+    def test_perform_request_without_pool(self):
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+        req.set_async_pool(None)
+        req.set_parameter("coin", "ETH")
+
+        self.assertEqual(20.0, asyncio.run(req.perform_request())["ETH"])
+
+    def test_perform_request_with_error(self):
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+        req.set_parameter("nosuch", "page")
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(req.perform_request())
+
+    def test_perform_request_with_cache(self):
+        cache = EobotCache(enabled=True)
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+        req.set_cache(cache)
+
+        for _ in range(3):
+            request = req.clone()
+            request.set_parameter("coin", "BTC")
+            self.assertEqual(100.0, asyncio.run(request.perform_request())["BTC"])
+
+        self.assertEqual(2, cache.get_stats()["hits"])
+        self.assertEqual(1, cache.get_stats()["misses"])
+
+    def test_perform_request_concurrently(self):
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        async def perform_all():
+            requests = []
+            for coin in ["BTC", "ETH"] * 2:
+                request = req.clone()
+                request.set_parameter("coin", coin)
+                requests.append(request.perform_request())
+
+            return await asyncio.gather(*requests)
+
+        responses = asyncio.run(perform_all())
+
+        self.assertEqual(4, len(responses))
+        self.assertEqual(100.0, responses[0]["BTC"])
+        self.assertEqual(20.0, responses[1]["ETH"])
+
+
+class _BrokenReader(object):
+    # an idle connection the server has closed in the meantime
+    @staticmethod
+    async def readline():
+        return b""
+
+
+class _BrokenWriter(object):
+    def __init__(self):
+        self.closed = False
+
+    def write(self, data):
+        pass
+
+    async def drain(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class _BrokenConnectionPool(EobotAsyncConnectionPool):
+    # hands out a broken connection as if it were a reused idle one
+    async def acquire(self, scheme, host, port, ssl_context=None):
+        return _BrokenReader(), _BrokenWriter(), True
+
+
+class EobotAsyncConnectionPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockServer(load_mode=True, in_process=False)
+        self.server.start()
+
+        MockServer.reset()
+
+        self.request = EobotAsyncRequest()
+        self.request.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+        self.request.set_transport(None)
+        self.request.set_cache(None)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_connections_are_reused(self):
+        pool = EobotAsyncConnectionPool()
+        self.request.set_async_pool(pool)
+
+        async def perform():
+            await self.request.perform_request({"coin": "BTC"})
+            await self.request.perform_request({"coin": "ETH"})
+
+        asyncio.run(perform())
+
+        self.assertEqual(1, self.server.get_counters()["connections"])
+
+    def test_connections_are_closed_with_their_loop(self):
+        pool = EobotAsyncConnectionPool()
+        self.request.set_async_pool(pool)
+        writers = []
+
+        async def perform():
+            await self.request.perform_request({"coin": "BTC"})
+            writers.extend(writer for connections in pool._loops[asyncio.get_running_loop()][0].values()
+                           for reader, writer in connections)
+
+        for _ in range(3):
+            asyncio.run(perform())
+
+            self.assertEqual({}, pool._loops)
+            self.assertTrue(all(writer.is_closing() for writer in writers))
+
+    def test_closed_loops_are_dropped(self):
+        pool = EobotAsyncConnectionPool()
+        self.request.set_async_pool(pool)
+
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(self.request.perform_request({"coin": "BTC"}))
+        loop.close()
+
+        self.assertIn(loop, pool._loops)
+
+        with warnings.catch_warnings():
+            # the connections of the closed loop can only be closed by the garbage collector
+            warnings.simplefilter("ignore", ResourceWarning)
+
+            asyncio.run(self.request.perform_request({"coin": "BTC"}))
+            self.assertNotIn(loop, pool._loops)
+
+            del loop
+            gc.collect()
+
+    def test_close(self):
+        pool = EobotAsyncConnectionPool()
+        self.request.set_async_pool(pool)
+
+        async def perform():
+            await self.request.perform_request({"coin": "BTC"})
+            pool.close()
+
+            self.assertEqual({}, pool._loops)
+            await self.request.perform_request({"coin": "BTC"})
+
+        asyncio.run(perform())
+
+        self.assertEqual(2, self.server.get_counters()["connections"])
+
+    def test_stale_connection_is_retried_for_reads(self):
+        self.request.set_async_pool(_BrokenConnectionPool())
+
+        self.assertEqual(100.0, asyncio.run(self.request.perform_request({"coin": "BTC"}))["BTC"])
+        self.assertEqual(1, self.server.get_counters()["requests"])
+
+    def test_stale_connection_is_not_retried_for_writes(self):
+        self.request.set_async_pool(_BrokenConnectionPool())
+
+        with self.assertRaises(EobotConnectionError):
+            asyncio.run(self.request.perform_request({"id": 123, "email": "123@example.com", "password": "password",
+                                                      "mining": "ETH"}))
+
+        self.assertEqual(0, self.server.get_counters()["requests"])
+
+    def test_ssl_context_is_cached(self):
+        request = EobotAsyncRequest()
+        context = request._ssl_context()
+
+        self.assertIs(context, request._ssl_context())
+        self.assertIs(context, EobotAsyncRequest()._ssl_context())
+        self.assertEqual(ssl.CERT_REQUIRED, context.verify_mode)
+
+        request.set_validate_ssl(False)
+        self.assertIsNot(context, request._ssl_context())
+        self.assertIs(request._ssl_context(), request._ssl_context())
+        self.assertEqual(ssl.CERT_NONE, request._ssl_context().verify_mode)
@@ -0,0 +1,184 @@
+import threading
+import time
+import unittest
+from asyncio import run, sleep
+
+from eobot.lib.eobot_balance_cache import RECONCILE_THREADS, EobotBalanceCache
+
+BASE_URL = "https://www.eobot.com/api.aspx"
+
+
+class EobotBalanceCacheTest(unittest.TestCase):
+    def test_init(self):
+        cache = EobotBalanceCache()
+
+        self.assertEqual(30.0, cache.get_max_staleness())
+        self.assertEqual(1.0, cache.get_reconcile_delay())
+        self.assertEqual(100000, cache.get_max_size())
+
+        with self.assertRaises(ValueError):
+            EobotBalanceCache(max_staleness=-1)
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            EobotBalanceCache(reconcile_delay="1")
+
+        with self.assertRaises(ValueError):
+            EobotBalanceCache(max_size=0)
+
+        self.assertIsNone(EobotBalanceCache(reconcile_delay=None).get_reconcile_delay())
+
+    def test_get_and_store(self):
+        cache = EobotBalanceCache()
+
+        self.assertIsNone(cache.get(BASE_URL, 123))
+        self.assertIs(cache, cache.store(BASE_URL, 123, {"BTC": 0.2}))
+
+        balances = cache.get(BASE_URL, 123)
+        self.assertEqual({"BTC": 0.2}, balances)
+
+        # callers get a copy, so they cannot change the cached balances
+        balances["BTC"] = 1.0
+        self.assertEqual({"BTC": 0.2}, cache.get(BASE_URL, 123))
+
+        self.assertIsNone(cache.get(BASE_URL, 456))
+        self.assertIsNone(cache.get("http://localhost/api.test", 123))
+
+        stats = cache.get_stats()
+        self.assertEqual(2, stats["hits"])
+        self.assertEqual(3, stats["misses"])
+        self.assertEqual(1, stats["size"])
+
+    def test_max_staleness(self):
+        cache = EobotBalanceCache(max_staleness=0.05)
+        cache.store(BASE_URL, 123, {"BTC": 0.2})
+
+        self.assertIsNotNone(cache.get(BASE_URL, 123))
+        self.assertIsNone(cache.get(BASE_URL, 123, max_staleness=0))
+
+        time.sleep(0.1)
+        self.assertIsNone(cache.get(BASE_URL, 123))
+        self.assertIsNotNone(cache.get(BASE_URL, 123, max_staleness=60))
+
+    def test_max_size(self):
+        cache = EobotBalanceCache(max_size=2)
+        cache.store(BASE_URL, 1, {"BTC": 1.0})
+        cache.store(BASE_URL, 2, {"BTC": 2.0})
+        cache.get(BASE_URL, 1)
+        cache.store(BASE_URL, 3, {"BTC": 3.0})
+
+        # account 2 was the least recently used one
+        self.assertIsNotNone(cache.get(BASE_URL, 1))
+        self.assertIsNone(cache.get(BASE_URL, 2))
+        self.assertIsNotNone(cache.get(BASE_URL, 3))
+
+        cache.set_max_size(1)
+        self.assertEqual(1, cache.get_stats()["size"])
+
+    def test_apply_delta(self):
+        cache = EobotBalanceCache()
+
+        self.assertFalse(cache.apply_delta(BASE_URL, 123, {"BTC": -0.1}))
+
+        cache.store(BASE_URL, 123, {"BTC": 0.25})
+        self.assertTrue(cache.apply_delta(BASE_URL, 123, {"BTC": -0.05, "ETH": 1.0}))
+        self.assertEqual({"BTC": 0.2, "ETH": 1.0}, cache.get(BASE_URL, 123))
+        self.assertEqual(1, cache.get_stats()["optimistic_updates"])
+
+    def test_invalidate(self):
+        cache = EobotBalanceCache()
+        cache.store(BASE_URL, 123, {"BTC": 0.2})
+
+        self.assertIs(cache, cache.invalidate(BASE_URL, 123))
+        self.assertIsNone(cache.get(BASE_URL, 123))
+
+        cache.invalidate(BASE_URL, 123)
+        self.assertEqual(1, cache.get_stats()["invalidations"])
+
+    def test_clear(self):
+        cache = EobotBalanceCache()
+        cache.store(BASE_URL, 123, {"BTC": 0.2})
+        cache.get(BASE_URL, 123)
+
+        self.assertIs(cache, cache.clear())
+        self.assertEqual(0, cache.get_stats()["size"])
+        self.assertEqual(0, cache.get_stats()["hits"])
+
+    def test_schedule_reconcile(self):
+        cache = EobotBalanceCache(reconcile_delay=0.01)
+        done = threading.Event()
+
+        def fetch():
+            cache.store(BASE_URL, 123, {"BTC": 0.5})
+            done.set()
+
+        self.assertTrue(cache.schedule_reconcile(BASE_URL, 123, fetch))
+        # a reconcile for the same account is already pending
+        self.assertFalse(cache.schedule_reconcile(BASE_URL, 123, fetch))
+
+        self.assertTrue(done.wait(5))
+        for _ in range(100):
+            if cache.get_stats()["reconciles"] == 1:
+                break
+            time.sleep(0.01)
+
+        self.assertEqual({"BTC": 0.5}, cache.get(BASE_URL, 123))
+        self.assertEqual(1, cache.get_stats()["reconciles"])
+
+        self.assertFalse(EobotBalanceCache(reconcile_delay=None).schedule_reconcile(BASE_URL, 123, fetch))
+
+    def test_schedule_reconcile_for_many_accounts(self):
+        cache = EobotBalanceCache(reconcile_delay=0.05)
+        release = threading.Event()
+        fetched = []
+
+        def fetch():
+            release.wait(5)
+            fetched.append(1)
+
+        for user_id in range(200):
+            self.assertTrue(cache.schedule_reconcile(BASE_URL, user_id, fetch))
+
+        reconcile_threads = [thread for thread in threading.enumerate() if thread.name == "eobot-reconcile"]
+        self.assertLessEqual(len(reconcile_threads), RECONCILE_THREADS)
+
+        release.set()
+        for _ in range(500):
+            if cache.get_stats()["reconciles"] == 200:
+                break
+            time.sleep(0.01)
+
+        self.assertEqual(200, len(fetched))
+        self.assertEqual(200, cache.get_stats()["reconciles"])
+
+    def test_schedule_reconcile_with_error(self):
+        cache = EobotBalanceCache(reconcile_delay=0)
+
+        def fetch():
+            raise ValueError("API unreachable")
+
+        cache.schedule_reconcile(BASE_URL, 123, fetch)
+        for _ in range(100):
+            if cache.get_stats()["reconcile_errors"] == 1:
+                break
+            time.sleep(0.01)
+
+        self.assertEqual(1, cache.get_stats()["reconcile_errors"])
+        # the failed reconcile does not keep the account from being reconciled again
+        self.assertTrue(cache.schedule_reconcile(BASE_URL, 123, fetch))
+
+    def test_schedule_reconcile_async(self):
+        cache = EobotBalanceCache(reconcile_delay=0.01)
+
+        async def fetch():
+            cache.store(BASE_URL, 123, {"BTC": 0.5})
+
+        async def main():
+            self.assertTrue(cache.schedule_reconcile_async(BASE_URL, 123, fetch))
+            self.assertFalse(cache.schedule_reconcile_async(BASE_URL, 123, fetch))
+            await sleep(0.1)
+
+        run(main())
+
+        self.assertEqual({"BTC": 0.5}, cache.get(BASE_URL, 123))
+        self.assertEqual(1, cache.get_stats()["reconciles"])
@@ -0,0 +1,157 @@
+import time
+import unittest
+
+from eobot.lib.eobot_cache import EobotCache, DEFAULT_TTLS, get_cache
+from eobot.lib.eobot_request import EobotRequest
+from eobot.tests.mock_server import MockServer, mock_state
+
+
+class EobotCacheTest(unittest.TestCase):
+    def test_default_values(self):
+        cache = EobotCache()
+
+        self.assertEqual(1024, cache._max_size)
+        self.assertEqual(DEFAULT_TTLS, cache._ttls)
+        self.assertFalse(cache._enabled)
+        self.assertEqual({"hits": 0, "misses": 0, "evictions": 0, "size": 0}, cache.get_stats())
+
+    def test_set_enabled_with_invalid_value(self):
+        cache = EobotCache()
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            cache.set_enabled(1)
+
+    def test_is_enabled(self):
+        cache = EobotCache()
+        self.assertFalse(cache.is_enabled())
+        cache.set_enabled(True)
+        self.assertTrue(cache.is_enabled())
+
+    def test_set_max_size_with_invalid_value(self):
+        cache = EobotCache()
+
+        with self.assertRaises(ValueError):
+            cache.set_max_size(0)
+
+    def test_set_ttl_with_invalid_values(self):
+        cache = EobotCache()
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            cache.set_ttl(123, 10)
+
+        with self.assertRaises(ValueError):
+            cache.set_ttl("get_balances", -1)
+
+        with self.assertRaises(ValueError):
+            cache.set_ttl("exchange_coins", 10)
+
+    def test_get_ttl(self):
+        cache = EobotCache(ttls={})
+        self.assertIsNone(cache.get_ttl("get_balances"))
+        self.assertFalse(cache.is_cacheable("get_balances"))
+
+        cache.set_ttl("get_balances", 5)
+        self.assertEqual(5.0, cache.get_ttl("get_balances"))
+        self.assertTrue(cache.is_cacheable("get_balances"))
+
+        cache.set_ttl("get_balances", None)
+        self.assertFalse(cache.is_cacheable("get_balances"))
+
+    def test_make_key(self):
+        self.assertEqual(
+            EobotCache.make_key("url", {"a": 1, "b": "2"}),
+            EobotCache.make_key("url", {"b": 2, "a": "1"})
+        )
+        self.assertNotEqual(EobotCache.make_key("url", {"a": 1}), EobotCache.make_key("url2", {"a": 1}))
+
+    def test_lookup_and_store(self):
+        cache = EobotCache()
+        key = cache.make_key("url", {"coin": "BTC"})
+
+        self.assertEqual((False, None), cache.lookup(key))
+
+        value = {"BTC": "100.0"}
+        cache.store(key, "get_coin_value", value)
+        value["BTC"] = 1.0
+
+        hit, result = cache.lookup(key)
+        self.assertTrue(hit)
+        self.assertEqual({"BTC": "100.0"}, result)
+
+        result["BTC"] = 2.0
+        self.assertEqual({"BTC": "100.0"}, cache.lookup(key)[1])
+
+        self.assertEqual({"hits": 2, "misses": 1, "evictions": 0, "size": 1}, cache.get_stats())
+
+    def test_store_with_uncacheable_endpoint(self):
+        cache = EobotCache()
+        key = cache.make_key("url", {"total": 123})
+        cache.store(key, "get_balances", {"BTC": 1.0})
+        self.assertFalse(cache.lookup(key)[0])
+
+    def test_lookup_with_expired_entry(self):
+        cache = EobotCache(ttls={"get_coin_value": 0.01})
+        key = cache.make_key("url", {"coin": "BTC"})
+        cache.store(key, "get_coin_value", {"BTC": 100.0})
+        time.sleep(0.02)
+        self.assertFalse(cache.lookup(key)[0])
+        self.assertEqual(0, cache.get_stats()["size"])
+
+    def test_lru_eviction(self):
+        cache = EobotCache(max_size=2)
+        keys = [cache.make_key("url", {"coin": coin}) for coin in ["BTC", "ETH", "DOGE"]]
+
+        cache.store(keys[0], "get_coin_value", 1)
+        cache.store(keys[1], "get_coin_value", 2)
+        cache.lookup(keys[0])
+        cache.store(keys[2], "get_coin_value", 3)
+
+        self.assertTrue(cache.lookup(keys[0])[0])
+        self.assertFalse(cache.lookup(keys[1])[0])
+        self.assertTrue(cache.lookup(keys[2])[0])
+        self.assertEqual(1, cache.get_stats()["evictions"])
+
+    def test_clear(self):
+        cache = EobotCache()
+        key = cache.make_key("url", {"coin": "BTC"})
+        cache.store(key, "get_coin_value", 1)
+        cache.lookup(key)
+        cache.clear()
+        self.assertEqual({"hits": 0, "misses": 0, "evictions": 0, "size": 0}, cache.get_stats())
+
+    def test_get_cache(self):
+        self.assertIsInstance(get_cache(), EobotCache)
+        self.assertIs(get_cache(), get_cache())
+        self.assertFalse(get_cache().is_enabled())
+
+    def test_perform_request_with_cache(self):
+        server = MockServer()
+        server.start()
+        MockServer.reset()
+
+        cache = EobotCache(enabled=True)
+        req = EobotRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(server.port))
+        req.set_cache(cache)
+
+        first = req.clone()
+        first.set_parameter("coin", "BTC")
+        self.assertEqual(100.0, first.perform_request()["BTC"])
+
+        mock_state["coins"]["BTC"]["Price"] = 200.0
+
+        second = req.clone()
+        second.set_parameter("coin", "BTC")
+        self.assertEqual(100.0, second.perform_request()["BTC"])
+
+        cache.set_enabled(False)
+        third = req.clone()
+        third.set_parameter("coin", "BTC")
+        self.assertEqual(200.0, third.perform_request()["BTC"])
+
+        mock_state["coins"]["BTC"]["Price"] = 100.0
+        server.stop()
+
+        self.assertEqual({"hits": 1, "misses": 1, "evictions": 0, "size": 1}, cache.get_stats())
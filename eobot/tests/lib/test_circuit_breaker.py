@@ -0,0 +1,217 @@
+import asyncio
+import time
+import unittest
+
+from eobot.lib.eobot_async_request import EobotAsyncRequest
+from eobot.lib.eobot_circuit_breaker import EobotCircuitBreaker, STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN
+from eobot.lib.eobot_errors import EobotCircuitOpenError, EobotConnectionError, EobotResponseError
+from eobot.lib.eobot_request import EobotRequest
+
+
+class FailingRequest(EobotRequest):
+    def __init__(self):
+        super(FailingRequest, self).__init__()
+        self.attempts = 0
+        self.error = EobotConnectionError()
+
+    def _fetch(self, parameters):
+        self.attempts += 1
+        if self.error is not None:
+            raise self.error
+        return 200, b'{"BTC": 100.0}'
+
+
+class FailingAsyncRequest(EobotAsyncRequest):
+    def __init__(self):
+        super(FailingAsyncRequest, self).__init__()
+        self.attempts = 0
+
+    async def _fetch(self, parameters):
+        self.attempts += 1
+        raise EobotConnectionError()
+
+
+class HangingAsyncRequest(EobotAsyncRequest):
+    async def _fetch(self, parameters):
+        await asyncio.sleep(60)
+
+
+class EobotCircuitBreakerTest(unittest.TestCase):
+    def test_invalid_values(self):
+        with self.assertRaises(ValueError):
+            EobotCircuitBreaker(failure_threshold=0)
+
+        with self.assertRaises(ValueError):
+            EobotCircuitBreaker(error_rate_threshold=1.5)
+
+        with self.assertRaises(ValueError):
+            EobotCircuitBreaker(reset_timeout=-1)
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            EobotCircuitBreaker(failure_errors=EobotConnectionError)
+
+    def test_default_values(self):
+        breaker = EobotCircuitBreaker()
+
+        self.assertEqual(STATE_CLOSED, breaker.get_state())
+        self.assertTrue(breaker.allow_request())
+        self.assertEqual({
+            "state": STATE_CLOSED,
+            "consecutive_failures": 0,
+            "error_rate": 0.0,
+            "rejected": 0,
+            "times_opened": 0,
+            "retry_after": 0.0,
+        }, breaker.get_stats())
+
+    def test_is_failure(self):
+        breaker = EobotCircuitBreaker()
+
+        self.assertTrue(breaker.is_failure(EobotConnectionError()))
+        self.assertFalse(breaker.is_failure(EobotResponseError()))
+
+    def test_open_after_consecutive_failures(self):
+        breaker = EobotCircuitBreaker(failure_threshold=3)
+
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        self.assertEqual(STATE_CLOSED, breaker.get_state())
+
+        breaker.record_failure()
+        self.assertEqual(STATE_OPEN, breaker.get_state())
+        self.assertFalse(breaker.allow_request())
+        self.assertEqual(1, breaker.get_stats()["rejected"])
+        self.assertGreater(breaker.get_stats()["retry_after"], 0)
+
+    def test_open_after_error_rate(self):
+        breaker = EobotCircuitBreaker(failure_threshold=100, error_rate_threshold=0.5, window_size=4, min_requests=4)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        self.assertEqual(STATE_CLOSED, breaker.get_state())
+
+        breaker.record_success()
+        breaker.record_failure()
+        self.assertEqual(STATE_OPEN, breaker.get_state())
+
+    def test_half_open(self):
+        breaker = EobotCircuitBreaker(failure_threshold=1, reset_timeout=0.05, half_open_max_calls=1)
+
+        breaker.record_failure()
+        self.assertEqual(STATE_OPEN, breaker.get_state())
+
+        time.sleep(0.06)
+        self.assertEqual(STATE_HALF_OPEN, breaker.get_state())
+        self.assertTrue(breaker.allow_request())
+        self.assertFalse(breaker.allow_request())
+
+        breaker.record_failure()
+        self.assertEqual(STATE_OPEN, breaker.get_state())
+        self.assertEqual(2, breaker.get_stats()["times_opened"])
+
+        time.sleep(0.06)
+        self.assertTrue(breaker.allow_request())
+        breaker.record_success()
+        self.assertEqual(STATE_CLOSED, breaker.get_state())
+        self.assertEqual(0.0, breaker.get_stats()["error_rate"])
+
+    def test_release(self):
+        breaker = EobotCircuitBreaker(failure_threshold=1, reset_timeout=0.05, half_open_max_calls=1)
+
+        breaker.record_failure()
+        time.sleep(0.06)
+        self.assertTrue(breaker.allow_request())
+        self.assertFalse(breaker.allow_request())
+
+        breaker.release()
+        self.assertEqual(STATE_HALF_OPEN, breaker.get_state())
+        self.assertTrue(breaker.allow_request())
+
+    def test_reset(self):
+        breaker = EobotCircuitBreaker(failure_threshold=1)
+        breaker.record_failure()
+        breaker.reset()
+        self.assertEqual(STATE_CLOSED, breaker.get_state())
+
+    def test_perform_request_with_circuit_breaker(self):
+        breaker = EobotCircuitBreaker(failure_threshold=2, reset_timeout=60)
+        req = FailingRequest()
+        req.set_retry_policy(None)
+        req.set_circuit_breaker(breaker)
+        req.set_parameter("coin", "BTC")
+
+        for _ in range(2):
+            with self.assertRaises(EobotConnectionError):
+                req.perform_request()
+
+        with self.assertRaises(EobotCircuitOpenError):
+            req.perform_request()
+
+        self.assertEqual(2, req.attempts)
+
+    def test_perform_request_with_non_failure_error(self):
+        breaker = EobotCircuitBreaker(failure_threshold=1)
+        req = FailingRequest()
+        req.error = EobotResponseError()
+        req.set_circuit_breaker(breaker)
+        req.set_parameter("coin", "BTC")
+
+        with self.assertRaises(EobotResponseError):
+            req.perform_request()
+
+        self.assertEqual(STATE_CLOSED, breaker.get_state())
+
+    def test_perform_async_request_with_circuit_breaker(self):
+        breaker = EobotCircuitBreaker(failure_threshold=1, reset_timeout=60)
+        req = FailingAsyncRequest()
+        req.set_retry_policy(None)
+        req.set_circuit_breaker(breaker)
+        req.set_parameter("coin", "BTC")
+
+        with self.assertRaises(EobotConnectionError):
+            asyncio.run(req.perform_request())
+
+        with self.assertRaises(EobotCircuitOpenError):
+            asyncio.run(req.perform_request())
+
+        self.assertEqual(1, req.attempts)
+
+    def test_perform_request_with_interrupted_probe(self):
+        breaker = EobotCircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+        req = FailingRequest()
+        req.error = KeyboardInterrupt()
+        req.set_retry_policy(None)
+        req.set_circuit_breaker(breaker)
+        req.set_parameter("coin", "BTC")
+
+        breaker.record_failure()
+        time.sleep(0.06)
+
+        with self.assertRaises(KeyboardInterrupt):
+            req.perform_request()
+
+        self.assertEqual(STATE_HALF_OPEN, breaker.get_state())
+        self.assertEqual(1, breaker.get_stats()["consecutive_failures"])
+        self.assertTrue(breaker.allow_request())
+
+    def test_perform_async_request_with_cancelled_probe(self):
+        breaker = EobotCircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+        req = HangingAsyncRequest()
+        req.set_retry_policy(None)
+        req.set_circuit_breaker(breaker)
+        req.set_parameter("coin", "BTC")
+
+        breaker.record_failure()
+        time.sleep(0.06)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(asyncio.wait_for(req.perform_request(), 0.05))
+
+        self.assertEqual(STATE_HALF_OPEN, breaker.get_state())
+        self.assertEqual(1, breaker.get_stats()["consecutive_failures"])
+        self.assertTrue(breaker.allow_request())
@@ -0,0 +1,110 @@
+import unittest
+from asyncio import run
+
+from eobot import methods
+from eobot.lib.eobot_async_request import EobotAsyncRequest
+from eobot.lib.eobot_client import EobotAsyncClient, EobotClient
+from eobot.lib.eobot_config import EobotConfig, get_config
+from eobot.lib.eobot_request import EobotRequest
+from eobot.lib.eobot_verification import VERIFY_NONE
+from eobot.tests.mock_server import MockServer, MockServerTransport
+
+
+class EobotClientTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockServer()
+        self.server.start()
+
+        MockServer.reset()
+
+        self.request = EobotRequest()
+        self.request.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+        self.request.set_cache(None)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_client_has_every_method(self):
+        for name in methods.__all__:
+            self.assertTrue(callable(getattr(EobotClient, name)), name)
+
+    def test_client_with_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            EobotClient(config={})
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            EobotClient(request={})
+
+        with self.assertRaises(ValueError):
+            EobotClient(request=EobotRequest(), transport=object())
+
+        with self.assertRaises(ValueError):
+            EobotClient(request=EobotAsyncRequest())
+
+    def test_client_binds_config_and_request(self):
+        client = EobotClient("tcl", self.request)
+
+        self.assertIs(get_config("tcl"), client.get_config())
+        self.assertIsInstance(client.get_request(), EobotRequest)
+        self.assertIsNot(self.request, client.get_request())
+        self.assertEqual(self.request.get_base_url(), client.get_request().get_base_url())
+        self.assertIs(self.request.get_transport(), client.get_request().get_transport())
+
+        # the client keeps its own copy of the template
+        self.request.set_base_url("http://localhost:1/api.test")
+        self.assertNotEqual(self.request.get_base_url(), client.get_request().get_base_url())
+
+    def test_client_with_transport(self):
+        transport = MockServerTransport()
+        client = EobotClient(EobotConfig().configure(user_id=123), self.request, transport)
+
+        self.assertIs(transport, client.get_request().get_transport())
+        self.assertEqual(0.2, client.get_balances()["BTC"])
+
+    def test_read_methods(self):
+        client = EobotClient(EobotConfig().configure(email="123@example.com", password="password"), self.request)
+
+        self.assertEqual(123, client.get_user_id())
+        self.assertEqual({"BTC": 0.2, "ETH": 2.5, "Total": 70.0}, client.get_balances())
+        self.assertEqual("BTC", client.get_mining_mode())
+        self.assertEqual(client.get_mining_mode(), client.get_account_overview()["mining_mode"])
+        self.assertIn("BTC", client.get_supported_coins())
+        self.assertEqual(client.get_coin_value("BTC"), client.get_coin_values(["BTC"])["BTC"])
+        self.assertEqual("bitcoin-wallet", client.get_deposit_address("BTC"))
+
+    def test_client_looks_up_user_id_once(self):
+        config = EobotConfig().configure(email="456@example.com", password="password")
+        client = EobotClient(config, self.request)
+
+        self.assertEqual(0.1, client.get_balances()["BTC"])
+        self.assertEqual(456, config.get_user_id())
+
+        self.server.reset_counters()
+        client.get_balances()
+        self.assertEqual(1, self.server.get_counters()["requests"])
+
+    def test_write_methods(self):
+        client = EobotClient(
+            EobotConfig().configure(user_id=123, email="123@example.com", password="password"), self.request
+        )
+
+        self.assertTrue(client.exchange_coins("BTC", 0.1, "ETH"))
+        self.assertTrue(client.manual_withdraw("ETH", 1.0, "ethereum-wallet", verification=VERIFY_NONE))
+        self.assertTrue(client.set_mining_mode("ETH"))
+        self.assertEqual("ETH", client.get_mining_mode())
+
+    def test_async_client(self):
+        request = EobotAsyncRequest()
+        request.set_base_url(self.request.get_base_url())
+        request.set_cache(None)
+
+        with self.assertRaises(ValueError):
+            EobotAsyncClient(request=self.request)
+
+        client = EobotAsyncClient(EobotConfig().configure(user_id=123), request)
+
+        self.assertIsInstance(client.get_request(), EobotAsyncRequest)
+        self.assertEqual(0.2, run(client.get_balances())["BTC"])
+        self.assertEqual("BTC", run(client.get_mining_mode()))
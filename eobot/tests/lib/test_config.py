@@ -1,8 +1,13 @@
+import os
+import tempfile
 import unittest
 
 from eobot.lib.eobot_authentication import EobotReadonlyAuthentication, EobotWriteAuthentication
+from eobot.lib.eobot_balance_cache import EobotBalanceCache
 from eobot.lib.eobot_config import EobotConfig, get_config
 from eobot.lib.eobot_errors import NoUserIdError, NoEmailError, NoPasswordOrTokenError
+from eobot.lib.eobot_store import EobotPersistentStore
+from eobot.lib.eobot_verification import DEFAULT_POLL_TIMEOUT, VERIFY_FULL, VERIFY_POLL
 
 
 class EobotConfigTest(unittest.TestCase):
@@ -403,6 +408,25 @@ class EobotConfigTest(unittest.TestCase):
         # token takes precedence over password, if available
         self.assertEqual("token", auth.password)
 
+    def test_get_authentication_reuses_authentication_until_credentials_change(self):
+        cfg = EobotConfig()
+        cfg.configure(user_id=123, email="email", password="password")
+
+        auth = cfg.get_authentication(True)
+        self.assertIs(auth, cfg.get_authentication(True))
+        self.assertIsNot(auth, cfg.get_authentication(False))
+        self.assertIs(cfg.get_authentication(False), cfg.get_authentication(False))
+
+        cfg.set_token("token")
+        self.assertEqual("token", cfg.get_authentication(False).password)
+
+        cfg.set_user_id(456)
+        self.assertEqual(456, cfg.get_authentication(True).user_id)
+
+        cfg.set_user_id(None)
+        with self.assertRaises(NoUserIdError):
+            cfg.get_authentication(True)
+
 
 class GetConfigTest(unittest.TestCase):
     def test_global_config(self):
@@ -446,3 +470,57 @@ class GetConfigTest(unittest.TestCase):
         self.assertNotEqual(get_config().get_email(), get_config("named").get_email())
         self.assertNotEqual(get_config().get_password(), get_config("named").get_password())
         self.assertNotEqual(get_config().get_token(), get_config("named").get_token())
+
+    def test_set_store(self):
+        cfg = EobotConfig()
+        self.assertIsNone(cfg.get_store())
+
+        store = EobotPersistentStore(os.path.join(tempfile.gettempdir(), "unused.sqlite3"))
+        self.assertIs(cfg, cfg.set_store(store))
+        self.assertIs(store, cfg.get_store())
+
+        cfg.set_store(None)
+        self.assertIsNone(cfg.get_store())
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            cfg.set_store("store.sqlite3")
+
+    def test_set_balance_cache(self):
+        cfg = EobotConfig()
+        self.assertIsNone(cfg.get_balance_cache())
+
+        balance_cache = EobotBalanceCache()
+        self.assertIs(cfg, cfg.set_balance_cache(balance_cache))
+        self.assertIs(balance_cache, cfg.get_balance_cache())
+
+        cfg.set_balance_cache(None)
+        self.assertIsNone(cfg.get_balance_cache())
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            cfg.set_balance_cache({})
+
+    def test_set_verification(self):
+        cfg = EobotConfig()
+        self.assertEqual(VERIFY_FULL, cfg.get_verification())
+
+        self.assertIs(cfg, cfg.set_verification(VERIFY_POLL))
+        self.assertEqual(VERIFY_POLL, cfg.get_verification())
+
+        with self.assertRaises(ValueError):
+            cfg.set_verification("nosuch")
+
+    def test_set_verification_timeout(self):
+        cfg = EobotConfig()
+        self.assertEqual(DEFAULT_POLL_TIMEOUT, cfg.get_verification_timeout())
+
+        self.assertIs(cfg, cfg.set_verification_timeout(2))
+        self.assertEqual(2.0, cfg.get_verification_timeout())
+
+        with self.assertRaises(ValueError):
+            cfg.set_verification_timeout(0)
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            cfg.set_verification_timeout("2")
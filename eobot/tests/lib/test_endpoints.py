@@ -0,0 +1,54 @@
+import unittest
+
+from eobot.lib.eobot_endpoints import get_endpoint, get_request_key, get_request_user_id, is_idempotent_endpoint, \
+    is_write_endpoint, UNKNOWN_ENDPOINT
+
+
+class EobotEndpointsTest(unittest.TestCase):
+    def test_get_endpoint(self):
+        self.assertEqual("get_balances", get_endpoint({"total": 123, "json": "true"}))
+        self.assertEqual("get_coin_value", get_endpoint({"coin": "BTC"}))
+        self.assertEqual("get_supported_coins", get_endpoint({"supportedcoins": "true", "currency": "USD"}))
+        self.assertEqual("get_user_id", get_endpoint({"email": "email", "password": "password"}))
+
+    def test_get_endpoint_with_shared_parameters(self):
+        self.assertEqual(
+            "get_exchange_estimate",
+            get_endpoint({"exchangefee": "true", "convertfrom": "BTC", "amount": 1, "convertto": "ETH"})
+        )
+        self.assertEqual(
+            "exchange_coins",
+            get_endpoint({
+                "id": 1, "email": "e", "password": "p", "convertfrom": "BTC", "amount": 1, "convertto": "ETH",
+            })
+        )
+        self.assertEqual("manual_withdraw", get_endpoint({"manualwithdraw": "BTC", "wallet": "w", "email": "e"}))
+        self.assertEqual("set_automatic_withdraw", get_endpoint({"withdraw": "BTC", "wallet": "w", "email": "e"}))
+        self.assertEqual("set_mining_mode", get_endpoint({"id": 1, "mining": "BTC", "email": "e"}))
+
+    def test_get_endpoint_without_match(self):
+        self.assertEqual(UNKNOWN_ENDPOINT, get_endpoint({"nosuch": "page"}))
+
+    def test_is_write_endpoint(self):
+        self.assertTrue(is_write_endpoint("exchange_coins"))
+        self.assertTrue(is_write_endpoint("set_mining_mode"))
+        self.assertFalse(is_write_endpoint("get_balances"))
+        self.assertFalse(is_write_endpoint(UNKNOWN_ENDPOINT))
+
+    def test_is_idempotent_endpoint(self):
+        self.assertTrue(is_idempotent_endpoint("get_balances"))
+        self.assertTrue(is_idempotent_endpoint("get_exchange_rate"))
+        self.assertTrue(is_idempotent_endpoint("get_user_id"))
+        self.assertFalse(is_idempotent_endpoint("exchange_coins"))
+        self.assertFalse(is_idempotent_endpoint("manual_withdraw"))
+        self.assertFalse(is_idempotent_endpoint(UNKNOWN_ENDPOINT))
+
+    def test_get_request_user_id(self):
+        self.assertEqual(123, get_request_user_id({"total": 123}))
+        self.assertEqual(123, get_request_user_id({"id": 123, "deposit": "BTC"}))
+        self.assertIsNone(get_request_user_id({"coin": "BTC"}))
+        self.assertIsNone(get_request_user_id({"email": "email", "password": "password"}))
+
+    def test_get_request_key(self):
+        self.assertEqual(get_request_key("url", {"a": 1, "b": 2}), get_request_key("url", {"b": "2", "a": "1"}))
+        self.assertNotEqual(get_request_key("url", {"a": 1}), get_request_key("url", {"a": 2}))
@@ -0,0 +1,113 @@
+import threading
+import time
+import unittest
+from concurrent.futures import Future, TimeoutError
+
+from eobot.lib.eobot_config import get_config
+from eobot.lib.eobot_executor import EobotExecutor, get_executor, submit
+from eobot.lib.eobot_request import EobotRequest
+from eobot.methods.get_balances import perform_request as get_balances
+from eobot.tests.mock_server import MockServer
+
+
+class EobotExecutorTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockServer(load_mode=True)
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_init(self):
+        executor = EobotExecutor(max_workers=2)
+        self.assertEqual(2, executor.get_max_workers())
+
+        self.assertIs(executor, executor.set_max_workers(4))
+        self.assertEqual(4, executor.get_max_workers())
+
+        with self.assertRaises(ValueError):
+            EobotExecutor(max_workers=0)
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            executor.set_max_workers("4")
+
+    def test_submit(self):
+        MockServer.reset()
+        req = EobotRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        get_config("tex").configure(123, "123@example.com", password="password", token=None)
+
+        future = submit(get_balances, config="tex", request=req.clone())
+        self.assertIsInstance(future, Future)
+        self.assertEqual(0.2, future.result(timeout=10)["BTC"])
+
+        future = get_executor().submit("get_mining_mode", config="tex", request=req.clone())
+        self.assertEqual("BTC", future.result(timeout=10))
+
+        with self.assertRaises(ValueError):
+            submit("nosuch")
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            submit(123)
+
+    def test_submit_concurrently(self):
+        MockServer.reset()
+        req = EobotRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+        # without coalescing, so that every call reaches the server
+        req.set_single_flight(None)
+        self.server.set_latency(0.5)
+
+        get_config("tex_latency").configure(123, "123@example.com", password="password", token=None)
+
+        executor = EobotExecutor(max_workers=4)
+        futures = [executor.submit(get_balances, config="tex_latency", request=req.clone()) for _ in range(4)]
+
+        for future in futures:
+            self.assertEqual(0.2, future.result(timeout=10)["BTC"])
+
+        # the four calls were waiting on the server at the same time
+        self.assertEqual(4, self.server.get_counters()["max_delayed"])
+        executor.shutdown()
+
+    def test_timeout_and_cancel(self):
+        executor = EobotExecutor(max_workers=1)
+        release = threading.Event()
+
+        running = executor.submit(release.wait, 10)
+        pending = executor.submit(time.sleep, 0)
+
+        with self.assertRaises(TimeoutError):
+            running.result(timeout=0.05)
+
+        # only calls that have not started yet can be cancelled
+        self.assertTrue(pending.cancel())
+        self.assertFalse(running.cancel())
+
+        release.set()
+        self.assertTrue(running.result(timeout=10))
+        self.assertTrue(pending.cancelled())
+        executor.shutdown()
+
+    def test_shutdown(self):
+        executor = EobotExecutor(max_workers=1)
+        release = threading.Event()
+
+        running = executor.submit(release.wait, 10)
+        pending = executor.submit(time.sleep, 0)
+
+        self.assertIs(executor, executor.shutdown(wait=False, cancel_pending=True))
+        self.assertTrue(pending.cancelled())
+
+        release.set()
+        self.assertTrue(running.result(timeout=10))
+
+        # the executor starts new threads for calls submitted after a shutdown
+        self.assertIsNone(executor.submit(time.sleep, 0).result(timeout=10))
+        executor.shutdown()
+
+        # completed and cancelled calls are not kept around
+        self.assertEqual(0, len(executor._futures))
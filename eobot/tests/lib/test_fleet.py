@@ -0,0 +1,190 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from eobot.aio.get_balances import perform_request as get_balances_async
+from eobot.lib.eobot_async_request import EobotAsyncRequest
+from eobot.lib.eobot_config import EobotConfig
+from eobot.lib.eobot_errors import EobotTimeoutError
+from eobot.lib.eobot_fleet import EobotFleetResult, run_fleet, run_fleet_async
+from eobot.lib.eobot_request import EobotRequest
+from eobot.methods.get_balances import perform_request as get_balances
+from eobot.tests.mock_server import MockServer, generate_fleet
+
+
+def sleep_for(config=None):
+    time.sleep(config)
+    return config
+
+
+async def sleep_for_async(config=None):
+    await asyncio.sleep(config)
+    return config
+
+
+def collect_async(*args, **kwargs):
+    async def collect():
+        return [result async for result in run_fleet_async(*args, **kwargs)]
+
+    return asyncio.run(collect())
+
+
+class EobotFleetTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockServer(load_mode=True)
+        self.server.start()
+        MockServer.reset(generate_fleet(accounts=50, coins=5, seed=1))
+
+    def tearDown(self):
+        self.server.stop()
+        MockServer.reset()
+
+    def get_configs(self):
+        return [EobotConfig().configure(user_id, None) for user_id in range(1, 51)]
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            run_fleet("get_balances", [])
+
+        with self.assertRaises(ValueError):
+            run_fleet(sleep_for, [], max_workers=0)
+
+        with self.assertRaises(ValueError):
+            run_fleet(sleep_for, [], timeout=0)
+
+        with self.assertRaises(ValueError):
+            run_fleet_async(sleep_for_async, [], max_workers=0)
+
+    def test_run_fleet(self):
+        req = EobotRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+        configs = self.get_configs()
+
+        results = list(run_fleet(get_balances, configs, max_workers=8, request=req))
+
+        self.assertEqual(50, len(results))
+        self.assertEqual(50, self.server.get_counters()["requests"])
+        for result in results:
+            self.assertIsInstance(result, EobotFleetResult)
+            self.assertIsNone(result.error)
+            self.assertIn("BTC", result.value)
+            self.assertGreaterEqual(result.latency, 0)
+
+        self.assertEqual(set(configs), set(result.config for result in results))
+
+    def test_run_fleet_completion_order(self):
+        results = list(run_fleet(sleep_for, [0.3, 0.0, 0.1], max_workers=3))
+
+        self.assertEqual([0.0, 0.1, 0.3], [result.value for result in results])
+
+    def test_run_fleet_with_errors(self):
+        def divide(config=None):
+            return 1 / config
+
+        results = list(run_fleet(divide, [1, 0, 2]))
+
+        self.assertEqual(3, len(results))
+        errors = [result for result in results if result.error is not None]
+        self.assertEqual(1, len(errors))
+        self.assertEqual(0, errors[0].config)
+        self.assertIsInstance(errors[0].error, ZeroDivisionError)
+
+    def test_run_fleet_with_bounded_concurrency(self):
+        lock = threading.Lock()
+        running = [0, 0]
+
+        def track(config=None):
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+            time.sleep(0.01)
+            with lock:
+                running[0] -= 1
+
+        consumed = []
+
+        def configs():
+            for index in range(20):
+                consumed.append(index)
+                yield index
+
+        fleet = run_fleet(track, configs(), max_workers=3)
+        next(fleet)
+        # configs are consumed lazily, only as workers become available
+        self.assertLessEqual(len(consumed), 4)
+
+        self.assertEqual(19, len(list(fleet)))
+        self.assertEqual(3, running[1])
+
+    def test_run_fleet_with_timeout(self):
+        release = threading.Event()
+        finished = []
+
+        def wait_for_release(config=None):
+            if config == "slow":
+                release.wait(10)
+                finished.append(config)
+            return config
+
+        try:
+            results = list(run_fleet(wait_for_release, ["slow", "a", "b"], max_workers=3, timeout=0.2))
+
+            # the fleet gave up on the slow call while it was still running
+            self.assertEqual([], finished)
+        finally:
+            release.set()
+
+        self.assertEqual(["a", "b", None], [result.value for result in results])
+        self.assertIsInstance(results[-1].error, EobotTimeoutError)
+        self.assertEqual("slow", results[-1].config)
+
+    def test_run_fleet_with_every_worker_timed_out(self):
+        self.server.set_latency(0.3)
+
+        req = EobotRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+        configs = self.get_configs()[:4]
+
+        results = list(run_fleet(get_balances, configs, max_workers=1, timeout=0.1, request=req))
+
+        # the only worker is still busy with an abandoned call when the next config is up, which must wait for it
+        self.assertEqual(configs, [result.config for result in results])
+        for result in results:
+            self.assertIsInstance(result.error, EobotTimeoutError)
+
+    def test_run_fleet_async(self):
+        req = EobotAsyncRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+        configs = self.get_configs()
+
+        results = collect_async(get_balances_async, configs, max_workers=8, request=req)
+
+        self.assertEqual(50, len(results))
+        self.assertEqual(50, self.server.get_counters()["requests"])
+        self.assertTrue(all(result.error is None and "BTC" in result.value for result in results))
+        self.assertEqual(set(configs), set(result.config for result in results))
+
+    def test_run_fleet_async_with_errors_and_timeout(self):
+        async def fail(config=None):
+            raise ValueError(config)
+
+        results = collect_async(sleep_for_async, [1.0, 0.0], timeout=0.2)
+        self.assertEqual(0.0, results[0].value)
+        self.assertIsInstance(results[1].error, EobotTimeoutError)
+
+        results = collect_async(fail, ["a"])
+        self.assertIsInstance(results[0].error, ValueError)
+
+    def test_run_fleet_async_with_bounded_concurrency(self):
+        running = [0, 0]
+
+        async def track(config=None):
+            running[0] += 1
+            running[1] = max(running)
+            await asyncio.sleep(0.01)
+            running[0] -= 1
+
+        self.assertEqual(20, len(collect_async(track, range(20), max_workers=4)))
+        self.assertEqual(4, running[1])
@@ -0,0 +1,181 @@
+import asyncio
+import unittest
+
+from eobot.lib.eobot_async_request import EobotAsyncRequest
+from eobot.lib.eobot_cache import EobotCache
+from eobot.lib.eobot_config import get_config
+from eobot.lib.eobot_errors import EobotResponseError
+from eobot.lib.eobot_instrumentation import EobotMetricsCollector, EobotRequestEvent, EobotRequestObserver, \
+    add_default_observer, get_default_observers, redact_parameters, remove_default_observer, REDACTED
+from eobot.lib.eobot_request import EobotRequest
+from eobot.methods.exchange_coins import perform_request as exchange_coins
+from eobot.tests.mock_server import MockServer
+
+
+class RecordingObserver(EobotRequestObserver):
+    def __init__(self):
+        super(RecordingObserver, self).__init__()
+        self.calls = []
+
+    def before_request(self, event):
+        self.calls.append(("before", event.endpoint, event.latency))
+
+    def after_request(self, event):
+        self.calls.append(("after", event.endpoint, event))
+
+
+class BrokenObserver(EobotRequestObserver):
+    def before_request(self, event):
+        raise RuntimeError("broken")
+
+
+class EobotInstrumentationTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockServer()
+        self.server.start()
+        self.base_url = 'http://localhost:{0}/api.test'.format(self.server.port)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_redact_parameters(self):
+        parameters = {"email": "email", "password": "secret"}
+
+        self.assertEqual({"email": "email", "password": REDACTED}, redact_parameters(parameters))
+        self.assertEqual("secret", parameters["password"])
+
+    def test_event(self):
+        event = EobotRequestEvent("get_user_id", "url", {"email": "email", "password": "secret"})
+
+        self.assertEqual(REDACTED, event.parameters["password"])
+        self.assertIsNone(event.status)
+        self.assertEqual(0, event.bytes)
+        self.assertEqual(0, event.retries)
+        self.assertFalse(event.cached)
+        self.assertIsNone(event.error)
+
+    def test_add_observer_with_invalid_value(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            EobotRequest().add_observer({})
+
+    def test_observers_are_cloned(self):
+        observer = RecordingObserver()
+        req = EobotRequest().add_observer(observer)
+
+        self.assertEqual([observer], req.clone().get_observers())
+        self.assertEqual([], req.remove_observer(observer).get_observers())
+
+    def test_perform_request_with_observer(self):
+        observer = RecordingObserver()
+        req = EobotRequest().set_base_url(self.base_url).add_observer(observer)
+        req.set_parameter("coin", "BTC")
+        req.perform_request()
+
+        self.assertEqual(2, len(observer.calls))
+        self.assertEqual(("before", "get_coin_value", None), observer.calls[0])
+
+        event = observer.calls[1][2]
+        self.assertEqual(200, event.status)
+        self.assertGreater(event.bytes, 0)
+        self.assertGreater(event.latency, 0)
+        self.assertEqual(0, event.retries)
+        self.assertIsNone(event.error)
+
+    def test_perform_request_with_error(self):
+        observer = RecordingObserver()
+        req = EobotRequest().set_base_url(self.base_url).add_observer(observer)
+        req.set_parameter("nosuch", "page")
+
+        with self.assertRaises(EobotResponseError):
+            req.perform_request()
+
+        event = observer.calls[1][2]
+        self.assertEqual("unknown", event.endpoint)
+        self.assertEqual(404, event.status)
+        self.assertIsInstance(event.error, EobotResponseError)
+
+    def test_perform_request_with_broken_observer(self):
+        req = EobotRequest().set_base_url(self.base_url).add_observer(BrokenObserver())
+        req.set_parameter("coin", "BTC")
+
+        self.assertEqual(100.0, req.perform_request()["BTC"])
+
+    def test_default_observers(self):
+        observer = RecordingObserver()
+        add_default_observer(observer)
+
+        try:
+            self.assertIn(observer, get_default_observers())
+            self.assertIn(observer, EobotRequest().get_observers())
+        finally:
+            remove_default_observer(observer)
+
+        self.assertNotIn(observer, EobotRequest().get_observers())
+
+    def test_collector_counts_upstream_calls(self):
+        MockServer.reset()
+        collector = EobotMetricsCollector()
+        req = EobotRequest().set_base_url(self.base_url).add_observer(collector)
+
+        get_config("instrumentation").configure(email="123@example.com", password="password", token=None)
+        self.assertTrue(exchange_coins("BTC", 0.1, "ETH", config="instrumentation", request=req))
+
+        self.assertEqual(["exchange_coins", "get_balances", "get_user_id"], collector.get_endpoints())
+        self.assertEqual(2, collector.get_endpoint_stats("get_balances")["upstream_requests"])
+        self.assertEqual(1, collector.get_endpoint_stats("exchange_coins")["requests"])
+        self.assertEqual(0, collector.get_in_flight())
+
+        stats = collector.get_stats()
+        self.assertEqual(4, sum(endpoint["upstream_requests"] for endpoint in stats.values()))
+
+    def test_collector_with_cache(self):
+        collector = EobotMetricsCollector()
+        req = EobotRequest().set_base_url(self.base_url).add_observer(collector)
+        req.set_cache(EobotCache(enabled=True))
+
+        for _ in range(3):
+            req.clone().set_parameter("coin", "BTC").perform_request()
+
+        stats = collector.get_endpoint_stats("get_coin_value")
+        self.assertEqual(3, stats["requests"])
+        self.assertEqual(2, stats["cached"])
+        self.assertEqual(1, stats["upstream_requests"])
+
+    def test_collector_with_async_request(self):
+        collector = EobotMetricsCollector()
+        req = EobotAsyncRequest().set_base_url(self.base_url).add_observer(collector)
+
+        asyncio.run(req.clone().set_parameter("supportedfiat", "true").perform_request())
+
+        stats = collector.get_endpoint_stats("get_supported_fiat")
+        self.assertEqual(1, stats["requests"])
+        self.assertGreater(stats["bytes"], 0)
+
+    def test_collector_histogram(self):
+        collector = EobotMetricsCollector(buckets=(0.1, 1.0))
+
+        for latency in (0.05, 0.5, 0.5, 5.0):
+            event = EobotRequestEvent("get_balances", "url", {})
+            event.latency = latency
+            collector.before_request(event)
+            collector.after_request(event)
+
+        stats = collector.get_endpoint_stats("get_balances")
+        self.assertEqual([(0.1, 1), (1.0, 3), (float("inf"), 4)], stats["latency_buckets"])
+        self.assertAlmostEqual(6.05, stats["latency_sum"])
+        self.assertAlmostEqual(0.55, collector.get_latency_quantile("get_balances", 0.5))
+        self.assertEqual(1.0, collector.get_latency_quantile("get_balances", 0.99))
+        self.assertIsNone(collector.get_latency_quantile("get_mining_mode", 0.5))
+
+    def test_collector_with_invalid_buckets(self):
+        with self.assertRaises(ValueError):
+            EobotMetricsCollector(buckets=(1.0, 0.1))
+
+    def test_collector_reset(self):
+        collector = EobotMetricsCollector()
+        event = EobotRequestEvent("get_balances", "url", {})
+        collector.before_request(event)
+        collector.after_request(event)
+        collector.reset()
+        self.assertEqual({}, collector.get_stats())
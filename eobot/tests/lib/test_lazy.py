@@ -0,0 +1,67 @@
+import importlib
+import json
+import subprocess
+import sys
+import types
+import unittest
+
+import eobot
+import eobot.aio
+import eobot.methods
+
+
+def run_in_fresh_interpreter(script):
+    return json.loads(subprocess.check_output([sys.executable, "-c", script], universal_newlines=True))
+
+
+class EobotLazyImportTest(unittest.TestCase):
+    def test_import_does_not_load_methods(self):
+        modules = run_in_fresh_interpreter("import json, sys, eobot; print(json.dumps(sorted(sys.modules.keys())))")
+
+        self.assertNotIn("requests", modules)
+        self.assertNotIn("eobot.lib.eobot_request", modules)
+        self.assertEqual([], [module for module in modules if module.startswith("eobot.methods.")])
+
+    def test_method_access_loads_only_that_method(self):
+        modules = run_in_fresh_interpreter(
+            "import json, sys, eobot; eobot.get_supported_fiat; print(json.dumps(sorted(sys.modules.keys())))"
+        )
+
+        self.assertIn("eobot.methods.get_supported_fiat", modules)
+        self.assertNotIn("eobot.methods.get_balances", modules)
+        self.assertNotIn("requests", modules)
+
+    def test_methods_are_functions(self):
+        for package in (eobot, eobot.methods, eobot.aio):
+            for name in eobot.methods.__all__:
+                self.assertIsInstance(getattr(package, name), types.FunctionType)
+                self.assertIn(name, dir(package))
+
+        # importing a method module directly, as other methods do, must not shadow the method with its module
+        importlib.import_module("eobot.methods.get_user_id")
+        self.assertIsInstance(eobot.methods.get_user_id, types.FunctionType)
+
+        from eobot.methods.get_balances import perform_request
+        self.assertIs(perform_request, eobot.methods.get_balances)
+        self.assertIs(perform_request, eobot.get_balances)
+
+    def test_client_access_loads_methods(self):
+        modules = run_in_fresh_interpreter("import json, sys, eobot; print(json.dumps(sorted(sys.modules.keys())))")
+        self.assertNotIn("eobot.lib.eobot_client", modules)
+
+        from eobot.lib.eobot_client import EobotClient
+        self.assertIs(EobotClient, eobot.EobotClient)
+        self.assertIn("EobotClient", dir(eobot))
+        self.assertIsInstance(eobot.methods.get_balances, types.FunctionType)
+
+    def test_star_import(self):
+        namespace = {}
+        exec("from eobot import *", namespace)
+
+        self.assertIs(eobot.get_config, namespace["get_config"])
+        self.assertIs(eobot.methods.set_mining_mode, namespace["set_mining_mode"])
+
+    def test_unknown_attribute(self):
+        for package in (eobot, eobot.methods, eobot.aio):
+            with self.assertRaises(AttributeError):
+                getattr(package, "nosuch")
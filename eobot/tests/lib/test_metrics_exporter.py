@@ -0,0 +1,89 @@
+import unittest
+
+import requests
+
+from eobot.lib.eobot_cache import EobotCache
+from eobot.lib.eobot_circuit_breaker import EobotCircuitBreaker
+from eobot.lib.eobot_instrumentation import EobotMetricsCollector
+from eobot.lib.eobot_metrics_exporter import CONTENT_TYPE, EobotMetricsServer, render_metrics
+from eobot.lib.eobot_pool import EobotConnectionPool
+from eobot.lib.eobot_request import EobotRequest
+from eobot.lib.eobot_single_flight import EobotSingleFlight
+from eobot.tests.mock_server import IN_PROCESS, MockServer
+
+
+class EobotMetricsExporterTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockServer()
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_render_metrics_without_sources(self):
+        self.assertEqual("\n", render_metrics(cache=None, pool=None, single_flight=None))
+
+    @unittest.skipIf(IN_PROCESS, "counts real connections")
+    def test_render_metrics(self):
+        collector = EobotMetricsCollector(buckets=(0.5, 30.0))
+        cache = EobotCache(enabled=True)
+        pool = EobotConnectionPool()
+        req = EobotRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+        req.add_observer(collector).set_cache(cache).set_pool(pool)
+
+        for _ in range(2):
+            req.clone().set_parameter("coin", "BTC").perform_request()
+
+        with self.assertRaises(RuntimeError):
+            req.clone().set_parameter("nosuch", "page").perform_request()
+
+        text = render_metrics(collector, cache=cache, pool=pool, single_flight=EobotSingleFlight(),
+                              circuit_breaker=EobotCircuitBreaker())
+        lines = text.splitlines()
+
+        self.assertIn("# TYPE eobot_requests_total counter", lines)
+        self.assertIn('eobot_requests_total{endpoint="get_coin_value"} 2', lines)
+        self.assertIn('eobot_upstream_requests_total{endpoint="get_coin_value"} 1', lines)
+        self.assertIn('eobot_cached_responses_total{endpoint="get_coin_value"} 1', lines)
+        self.assertIn('eobot_request_errors_total{endpoint="unknown",error="EobotResponseError"} 1', lines)
+        self.assertIn("# TYPE eobot_request_duration_seconds histogram", lines)
+        self.assertIn('eobot_request_duration_seconds_bucket{endpoint="get_coin_value",le="30.0"} 2', lines)
+        self.assertIn('eobot_request_duration_seconds_bucket{endpoint="get_coin_value",le="+Inf"} 2', lines)
+        self.assertIn('eobot_request_duration_seconds_count{endpoint="get_coin_value"} 2', lines)
+        self.assertIn("eobot_requests_in_flight 0", lines)
+        self.assertIn("eobot_cache_hits_total 1", lines)
+        self.assertIn("eobot_cache_misses_total 1", lines)
+        self.assertIn("eobot_cache_hit_ratio 0.5", lines)
+        self.assertIn("eobot_pool_sessions 1", lines)
+        self.assertIn("eobot_pool_size 10", lines)
+        self.assertIn("eobot_pool_connections_opened_total 1", lines)
+        self.assertIn("eobot_single_flight_in_flight 0", lines)
+        self.assertIn('eobot_circuit_breaker_state{state="closed"} 1', lines)
+        self.assertIn('eobot_circuit_breaker_state{state="open"} 0', lines)
+        self.assertTrue(text.endswith("\n"))
+
+        pool.close()
+
+    def test_metrics_server(self):
+        collector = EobotMetricsCollector()
+        metrics_server = EobotMetricsServer(collector=collector).start()
+
+        try:
+            response = requests.get("http://127.0.0.1:{0}/metrics".format(metrics_server.get_port()), timeout=5)
+            self.assertEqual(200, response.status_code)
+            self.assertEqual(CONTENT_TYPE, response.headers["Content-Type"])
+            self.assertIn("eobot_requests_in_flight 0", response.text)
+
+            response = requests.get("http://127.0.0.1:{0}/nosuch".format(metrics_server.get_port()), timeout=5)
+            self.assertEqual(404, response.status_code)
+        finally:
+            metrics_server.stop()
+
+    def test_metrics_server_with_invalid_values(self):
+        with self.assertRaises(ValueError):
+            EobotMetricsServer(port=-1)
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            EobotMetricsServer(host=123)
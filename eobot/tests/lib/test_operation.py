@@ -0,0 +1,169 @@
+import importlib
+import time
+import unittest
+from asyncio import run
+
+from eobot.lib.eobot_async_request import EobotAsyncRequest
+from eobot.lib.eobot_config import EobotConfig
+from eobot.lib import eobot_operation
+from eobot.lib.eobot_operation import EobotCall, EobotGather, EobotSleep, GATHER_MAX_WORKERS, resolve_config, \
+    run_operation, run_operation_async
+from eobot.lib.eobot_request import EobotRequest
+from eobot.lib.eobot_verification import VERIFY_FULL
+from eobot.methods.get_balances import operation as get_balances_operation
+from eobot.methods.get_mining_mode import operation as get_mining_mode_operation
+from eobot.methods.set_mining_mode import operation as set_mining_mode_operation
+from eobot.tests.mock_server import MockServer
+
+
+def fail(message):
+    raise ValueError(message)
+    # noinspection PyUnreachableCode
+    yield
+
+
+def recover():
+    try:
+        yield EobotCall({"nosuch": "true"})
+    except Exception as e:
+        return e.__class__.__name__
+
+
+def gather():
+    results = yield EobotGather([get_mining_mode_operation(EobotConfig().configure(123, None)), fail("oops")])
+    return results
+
+
+def sleep(seconds):
+    yield EobotSleep(seconds)
+    return seconds
+
+
+def unknown():
+    yield "nosuch"
+
+
+def nested_gather(depth, width):
+    if depth == 0:
+        yield EobotSleep(0.01)
+        return 1
+
+    results = yield EobotGather([nested_gather(depth - 1, width) for _ in range(width)])
+    return sum(results)
+
+
+class EobotOperationTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockServer()
+        self.server.start()
+        MockServer.reset()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def get_request(self, request_class=EobotRequest):
+        req = request_class()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+        return req
+
+    def test_resolve_config(self):
+        cfg = EobotConfig()
+        self.assertIs(cfg, resolve_config(cfg))
+        self.assertIsInstance(resolve_config(None), EobotConfig)
+        self.assertIsInstance(resolve_config("top"), EobotConfig)
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            resolve_config({})
+
+    def test_build_and_parse(self):
+        # building requests and parsing responses does not involve any I/O
+        balances = importlib.import_module("eobot.methods.get_balances")
+        self.assertEqual({"total": 123}, balances.build_request(123))
+        self.assertEqual({"BTC": 0.2, "Total": 70.0}, balances.parse_response({"BTC": "0.20", "Total": "70"}))
+
+        coins = importlib.import_module("eobot.methods.get_supported_coins")
+        response = {"BTC": {"Name": "Bitcoin", "Price": "1000.5"}}
+        self.assertEqual({"BTC": {"Name": "Bitcoin", "Price": 1000.5}}, coins.parse_response(response))
+        self.assertEqual("1000.5", response["BTC"]["Price"])
+
+    def test_operation_without_io(self):
+        operation = get_mining_mode_operation(EobotConfig().configure(123, None))
+
+        call = next(operation)
+        self.assertIsInstance(call, EobotCall)
+        self.assertEqual({"idmining": 123}, call.parameters)
+
+        with self.assertRaises(StopIteration) as context:
+            operation.send({"mining": "BTC"})
+
+        self.assertEqual("BTC", context.exception.value)
+
+    def test_fresh_calls(self):
+        config = EobotConfig().configure(123, None)
+
+        self.assertFalse(next(get_mining_mode_operation(config)).fresh)
+        self.assertTrue(next(get_mining_mode_operation(config, fresh=True)).fresh)
+        self.assertFalse(next(get_balances_operation(config)).fresh)
+        self.assertTrue(next(get_balances_operation(config, max_staleness=0)).fresh)
+
+        # verification reads must never share the response to a read sent before the write
+        config.configure(email="123@example.com", password="password")
+        operation = set_mining_mode_operation("ETH", config, verification=VERIFY_FULL)
+        self.assertTrue(next(operation).fresh)
+        self.assertIn("mining", operation.send({"mining": "BTC"}).parameters)
+        self.assertTrue(operation.send(True).fresh)
+
+    def test_run_operation(self):
+        req = self.get_request()
+        cfg = EobotConfig().configure(123, None)
+
+        self.assertEqual(0.2, run_operation(get_balances_operation(cfg), req)["BTC"])
+        # the request passed in is only used as a template
+        self.assertEqual({}, req.get_parameters())
+
+        self.assertEqual("EobotResponseError", run_operation(recover(), req))
+        self.assertEqual(0.01, run_operation(sleep(0.01), req))
+
+        with self.assertRaises(ValueError):
+            run_operation(fail("oops"), req)
+
+        with self.assertRaises(TypeError):
+            run_operation(unknown(), req)
+
+    def test_run_operation_nested_gather(self):
+        # far more gathers wait at the same time than the shared executor has threads
+        self.assertGreater(4 ** 3, GATHER_MAX_WORKERS)
+        self.assertEqual(4 ** 4, run_operation(nested_gather(4, 4), self.get_request()))
+
+    def test_gather_executor_is_shared(self):
+        run_operation(gather(), self.get_request())
+        executor = eobot_operation._gather_executor
+
+        run_operation(gather(), self.get_request())
+        self.assertIsNotNone(executor)
+        self.assertIs(executor, eobot_operation._gather_executor)
+
+    def test_run_operation_gather(self):
+        mode, error = run_operation(gather(), self.get_request())
+
+        self.assertEqual("BTC", mode)
+        self.assertIsInstance(error, ValueError)
+
+    def test_run_operation_async(self):
+        req = self.get_request(EobotAsyncRequest)
+        cfg = EobotConfig().configure(123, None)
+
+        self.assertEqual(0.2, run(run_operation_async(get_balances_operation(cfg), req))["BTC"])
+        self.assertEqual("EobotResponseError", run(run_operation_async(recover(), req)))
+
+        started = time.perf_counter()
+        self.assertEqual(0.05, run(run_operation_async(sleep(0.05), req)))
+        self.assertGreaterEqual(time.perf_counter() - started, 0.04)
+
+        mode, error = run(run_operation_async(gather(), req))
+        self.assertEqual("BTC", mode)
+        self.assertIsInstance(error, ValueError)
+
+        with self.assertRaises(TypeError):
+            run(run_operation_async(unknown(), req))
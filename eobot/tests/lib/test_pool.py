@@ -0,0 +1,104 @@
+import unittest
+
+from eobot.lib.eobot_pool import EobotConnectionPool, get_pool
+from eobot.lib.eobot_request import EobotRequest
+from eobot.tests.mock_server import IN_PROCESS, MockServer
+
+
+class EobotConnectionPoolTest(unittest.TestCase):
+    def test_default_values(self):
+        pool = EobotConnectionPool()
+
+        self.assertEqual(10, pool._pool_size)
+        self.assertTrue(pool._keep_alive)
+        self.assertEqual(0, len(pool._sessions))
+
+    def test_set_pool_size_with_invalid_value(self):
+        pool = EobotConnectionPool()
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            pool.set_pool_size("10")
+
+        with self.assertRaises(ValueError):
+            pool.set_pool_size(0)
+
+    def test_get_pool_size(self):
+        pool = EobotConnectionPool(pool_size=5)
+        self.assertEqual(5, pool.get_pool_size())
+        pool.set_pool_size(20)
+        self.assertEqual(20, pool.get_pool_size())
+
+    def test_set_keep_alive_with_invalid_value(self):
+        pool = EobotConnectionPool()
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            pool.set_keep_alive(1)
+
+    def test_get_keep_alive(self):
+        pool = EobotConnectionPool(keep_alive=False)
+        self.assertFalse(pool.get_keep_alive())
+        pool.set_keep_alive(True)
+        self.assertTrue(pool.get_keep_alive())
+
+    def test_get_session_with_invalid_base_url(self):
+        pool = EobotConnectionPool()
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            pool.get_session(123)
+
+    def test_get_session(self):
+        pool = EobotConnectionPool()
+
+        session = pool.get_session("http://localhost/one")
+        self.assertIs(session, pool.get_session("http://localhost/one"))
+        self.assertIsNot(session, pool.get_session("http://localhost/two"))
+        self.assertEqual(2, len(pool._sessions))
+
+    def test_set_pool_size_closes_sessions(self):
+        pool = EobotConnectionPool()
+        session = pool.get_session("http://localhost/one")
+
+        pool.set_pool_size(2)
+
+        self.assertEqual(0, len(pool._sessions))
+        self.assertIsNot(session, pool.get_session("http://localhost/one"))
+
+    def test_close(self):
+        pool = EobotConnectionPool()
+        pool.get_session("http://localhost/one")
+        pool.close()
+        self.assertEqual(0, len(pool._sessions))
+
+    def test_get_pool(self):
+        self.assertIsInstance(get_pool(), EobotConnectionPool)
+        self.assertIs(get_pool(), get_pool())
+
+    @unittest.skipIf(IN_PROCESS, "counts real connections")
+    def test_perform_request_with_pool(self):
+        server = MockServer()
+        server.start()
+
+        pool = EobotConnectionPool(keep_alive=False)
+        req = EobotRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(server.port))
+        req.set_pool(pool)
+
+        first = req.clone()
+        first.set_parameter("coin", "BTC")
+        second = req.clone()
+        second.set_parameter("coin", "ETH")
+
+        self.assertEqual(100.0, first.perform_request()["BTC"])
+        self.assertEqual(20.0, second.perform_request()["ETH"])
+        self.assertEqual(1, len(pool._sessions))
+
+        stats = pool.get_stats()
+        self.assertEqual(1, stats["sessions"])
+        self.assertEqual(10, stats["pool_size"])
+        self.assertEqual(1, stats["connections_opened"])
+
+        server.stop()
+        pool.close()
@@ -0,0 +1,161 @@
+import asyncio
+import time
+import unittest
+
+from eobot.lib.eobot_async_request import EobotAsyncRequest
+from eobot.lib.eobot_errors import EobotRateLimitError
+from eobot.lib.eobot_rate_limit import EobotRateLimiter, EobotTokenBucket
+from eobot.lib.eobot_request import EobotRequest
+
+
+class CountingRequest(EobotRequest):
+    def _fetch(self, parameters):
+        return 200, b'{"BTC": 100.0}'
+
+
+class CountingAsyncRequest(EobotAsyncRequest):
+    async def _fetch(self, parameters):
+        return 200, b'{"BTC": 100.0}'
+
+
+class EobotTokenBucketTest(unittest.TestCase):
+    def test_invalid_values(self):
+        with self.assertRaises(ValueError):
+            EobotTokenBucket(0)
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            EobotTokenBucket("10")
+
+        with self.assertRaises(ValueError):
+            EobotTokenBucket(10, 0.5)
+
+    def test_default_values(self):
+        bucket = EobotTokenBucket(5)
+
+        self.assertEqual(5.0, bucket.get_rate())
+        self.assertEqual(5.0, bucket.get_capacity())
+        self.assertAlmostEqual(5.0, bucket.get_tokens(), places=2)
+
+    def test_try_acquire(self):
+        bucket = EobotTokenBucket(1, 2)
+
+        self.assertTrue(bucket.try_acquire())
+        self.assertTrue(bucket.try_acquire())
+        self.assertFalse(bucket.try_acquire())
+
+    def test_acquire(self):
+        bucket = EobotTokenBucket(20, 1)
+
+        start = time.monotonic()
+        for _ in range(3):
+            self.assertTrue(bucket.acquire())
+        elapsed = time.monotonic() - start
+
+        self.assertGreaterEqual(elapsed, 0.09)
+
+    def test_acquire_without_blocking(self):
+        bucket = EobotTokenBucket(1, 1)
+
+        self.assertTrue(bucket.acquire(blocking=False))
+        self.assertFalse(bucket.acquire(blocking=False))
+
+    def test_acquire_with_timeout(self):
+        bucket = EobotTokenBucket(1, 1)
+
+        self.assertTrue(bucket.acquire())
+        self.assertFalse(bucket.acquire(timeout=0.1))
+        self.assertGreater(bucket.get_tokens(), -0.5)
+
+    def test_acquire_async(self):
+        bucket = EobotTokenBucket(20, 1)
+
+        async def acquire_all():
+            return await asyncio.gather(*[bucket.acquire_async() for _ in range(3)])
+
+        start = time.monotonic()
+        self.assertEqual([True, True, True], asyncio.run(acquire_all()))
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    def test_refund(self):
+        bucket = EobotTokenBucket(1, 1)
+
+        self.assertTrue(bucket.try_acquire())
+        bucket.refund()
+        self.assertTrue(bucket.try_acquire())
+
+
+class EobotRateLimiterTest(unittest.TestCase):
+    def test_invalid_values(self):
+        with self.assertRaises(ValueError):
+            EobotRateLimiter(rate=0)
+
+        with self.assertRaises(ValueError):
+            EobotRateLimiter(account_rate=-1)
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            EobotRateLimiter(blocking=1)
+
+        with self.assertRaises(ValueError):
+            EobotRateLimiter(timeout=-1)
+
+    def test_get_bucket(self):
+        limiter = EobotRateLimiter(rate=10)
+
+        self.assertIsInstance(limiter.get_bucket("url"), EobotTokenBucket)
+        self.assertIs(limiter.get_bucket("url"), limiter.get_bucket("url"))
+        self.assertIsNot(limiter.get_bucket("url"), limiter.get_bucket("url2"))
+        self.assertIsNone(limiter.get_account_bucket(123))
+
+    def test_get_account_bucket(self):
+        limiter = EobotRateLimiter(account_rate=1)
+
+        self.assertIsNone(limiter.get_bucket("url"))
+        self.assertIsNone(limiter.get_account_bucket(None))
+        self.assertIs(limiter.get_account_bucket(123), limiter.get_account_bucket("123"))
+        self.assertIsNot(limiter.get_account_bucket(123), limiter.get_account_bucket(456))
+
+    def test_acquire_without_blocking(self):
+        limiter = EobotRateLimiter(rate=10, capacity=2, account_rate=1, account_capacity=1, blocking=False)
+
+        limiter.acquire("url", 123)
+
+        with self.assertRaises(EobotRateLimitError):
+            limiter.acquire("url", 123)
+
+        # the global token is refunded when the account bucket refuses the request
+        limiter.acquire("url", 456)
+        with self.assertRaises(EobotRateLimitError):
+            limiter.acquire("url")
+
+    def test_perform_request_with_rate_limiter(self):
+        req = CountingRequest()
+        req.set_rate_limiter(EobotRateLimiter(rate=1, capacity=1, blocking=False))
+        req.set_parameter("coin", "BTC")
+
+        self.assertEqual({"BTC": 100.0}, req.clone().set_parameter("coin", "BTC").perform_request())
+
+        with self.assertRaises(EobotRateLimitError):
+            req.clone().set_parameter("coin", "BTC").perform_request()
+
+    def test_perform_request_with_account_rate_limiter(self):
+        req = CountingRequest()
+        req.set_rate_limiter(EobotRateLimiter(account_rate=1, account_capacity=1, blocking=False))
+
+        req.clone().set_parameter("total", 123).perform_request()
+        req.clone().set_parameter("total", 456).perform_request()
+
+        with self.assertRaises(EobotRateLimitError):
+            req.clone().set_parameter("total", 123).perform_request()
+
+    def test_perform_async_request_with_rate_limiter(self):
+        req = CountingAsyncRequest()
+        req.set_rate_limiter(EobotRateLimiter(rate=20, capacity=1))
+
+        async def perform_all():
+            return await asyncio.gather(*[req.clone().set_parameter("idspeed", i).perform_request() for i in range(3)])
+
+        start = time.monotonic()
+        self.assertEqual(3, len(asyncio.run(perform_all())))
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
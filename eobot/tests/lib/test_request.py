@@ -1,6 +1,13 @@
 import unittest
 
+from eobot.lib.eobot_cache import EobotCache, get_cache
+from eobot.lib.eobot_pool import EobotConnectionPool, get_pool
+from eobot.lib.eobot_circuit_breaker import EobotCircuitBreaker
+from eobot.lib.eobot_errors import EobotResponseError
+from eobot.lib.eobot_rate_limit import EobotRateLimiter
 from eobot.lib.eobot_request import EobotRequest
+from eobot.lib.eobot_retry import EobotRetryPolicy, get_retry_policy
+from eobot.lib.eobot_single_flight import EobotSingleFlight, get_single_flight
 from eobot import __version__
 from eobot.tests.mock_server import MockServer
 
@@ -18,6 +25,12 @@ class EobotRequestTest(unittest.TestCase):
         self.assertEqual('https://www.eobot.com/api.aspx', req._base_url)
         self.assertIsInstance(req._parameters, dict)
         self.assertEqual(0, len(req._parameters))
+        self.assertIs(get_pool(), req._pool)
+        self.assertIs(get_cache(), req._cache)
+        self.assertIs(get_single_flight(), req._single_flight)
+        self.assertIs(get_retry_policy(), req._retry_policy)
+        self.assertIsNone(req._rate_limiter)
+        self.assertIsNone(req._circuit_breaker)
 
     def test_set_timeout_without_value(self):
         req = EobotRequest()
@@ -199,6 +212,162 @@ class EobotRequestTest(unittest.TestCase):
         self.assertIn("key_2", req.get_parameters().keys())
         self.assertEqual("value_2", req.get_parameters()["key_2"])
 
+    def test_parameters_are_not_shared(self):
+        parameters = {"key": "value"}
+        req = EobotRequest()
+        req.set_parameters(parameters)
+
+        # neither the dict passed in nor a dict returned earlier changes along with the request
+        previous = req.get_parameters()
+        req.set_parameter("key", "other")
+        req.get_parameters()["key"] = "changed"
+
+        self.assertEqual({"key": "value"}, parameters)
+        self.assertEqual({"key": "value"}, previous)
+        self.assertEqual({"key": "other"}, req.get_parameters())
+
+    def test_get_address_and_target(self):
+        req = EobotRequest()
+        self.assertEqual(("https", "www.eobot.com", None), req.get_address())
+        self.assertEqual("/api.aspx?coin=BTC&json=true", req.get_target({"coin": "BTC", "json": "true"}))
+
+        req.set_base_url("HTTP://localhost:8080/api.test?key=value")
+        self.assertEqual(("http", "localhost", 8080), req.get_address())
+        self.assertEqual("/api.test?key=value&coin=BTC", req.get_target({"coin": "BTC"}))
+
+        req.set_base_url("http://localhost")
+        self.assertEqual("/?coin=BTC", req.get_target({"coin": "BTC"}))
+
+    def test_set_pool_with_invalid_value(self):
+        req = EobotRequest()
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            req.set_pool({})
+
+    def test_set_pool_with_none(self):
+        req = EobotRequest()
+        req.set_pool(None)
+        self.assertIsNone(req._pool)
+
+    def test_get_pool(self):
+        req = EobotRequest()
+        self.assertIs(get_pool(), req.get_pool())
+        pool = EobotConnectionPool()
+        req.set_pool(pool)
+        self.assertIs(pool, req.get_pool())
+
+    def test_set_cache_with_invalid_value(self):
+        req = EobotRequest()
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            req.set_cache({})
+
+    def test_get_cache(self):
+        req = EobotRequest()
+        self.assertIs(get_cache(), req.get_cache())
+        cache = EobotCache()
+        req.set_cache(cache)
+        self.assertIs(cache, req.get_cache())
+        req.set_cache(None)
+        self.assertIsNone(req.get_cache())
+
+    def test_set_single_flight_with_invalid_value(self):
+        req = EobotRequest()
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            req.set_single_flight({})
+
+    def test_get_single_flight(self):
+        req = EobotRequest()
+        self.assertIs(get_single_flight(), req.get_single_flight())
+        single_flight = EobotSingleFlight()
+        req.set_single_flight(single_flight)
+        self.assertIs(single_flight, req.get_single_flight())
+        req.set_single_flight(None)
+        self.assertIsNone(req.get_single_flight())
+
+    def test_set_retry_policy_with_invalid_value(self):
+        req = EobotRequest()
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            req.set_retry_policy({})
+
+    def test_get_retry_policy(self):
+        req = EobotRequest()
+        self.assertIs(get_retry_policy(), req.get_retry_policy())
+        retry_policy = EobotRetryPolicy()
+        req.set_retry_policy(retry_policy)
+        self.assertIs(retry_policy, req.get_retry_policy())
+        req.set_retry_policy(None)
+        self.assertIsNone(req.get_retry_policy())
+
+    def test_set_rate_limiter_with_invalid_value(self):
+        req = EobotRequest()
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            req.set_rate_limiter({})
+
+    def test_get_rate_limiter(self):
+        req = EobotRequest()
+        self.assertIsNone(req.get_rate_limiter())
+        rate_limiter = EobotRateLimiter(rate=10)
+        req.set_rate_limiter(rate_limiter)
+        self.assertIs(rate_limiter, req.get_rate_limiter())
+
+    def test_set_circuit_breaker_with_invalid_value(self):
+        req = EobotRequest()
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            req.set_circuit_breaker({})
+
+    def test_get_circuit_breaker(self):
+        req = EobotRequest()
+        self.assertIsNone(req.get_circuit_breaker())
+        circuit_breaker = EobotCircuitBreaker()
+        req.set_circuit_breaker(circuit_breaker)
+        self.assertIs(circuit_breaker, req.get_circuit_breaker())
+
+    def test_clone(self):
+        circuit_breaker = EobotCircuitBreaker()
+        rate_limiter = EobotRateLimiter(rate=10)
+        retry_policy = EobotRetryPolicy()
+        single_flight = EobotSingleFlight()
+        cache = EobotCache()
+        pool = EobotConnectionPool()
+        req = EobotRequest()
+        req.set_timeout(10)
+        req.set_validate_ssl(False)
+        req.set_user_agent("UserAgent")
+        req.set_base_url("url")
+        req.set_pool(pool)
+        req.set_cache(cache)
+        req.set_single_flight(single_flight)
+        req.set_retry_policy(retry_policy)
+        req.set_rate_limiter(rate_limiter)
+        req.set_circuit_breaker(circuit_breaker)
+        req.set_parameter("key", "value")
+
+        clone = req.clone()
+
+        self.assertIsNot(req, clone)
+        self.assertEqual(10.0, clone.get_timeout())
+        self.assertFalse(clone.get_validate_ssl())
+        self.assertEqual("UserAgent", clone.get_user_agent())
+        self.assertEqual("url", clone.get_base_url())
+        self.assertIs(pool, clone.get_pool())
+        self.assertIs(cache, clone.get_cache())
+        self.assertIs(single_flight, clone.get_single_flight())
+        self.assertIs(retry_policy, clone.get_retry_policy())
+        self.assertIs(rate_limiter, clone.get_rate_limiter())
+        self.assertIs(circuit_breaker, clone.get_circuit_breaker())
+        self.assertEqual(0, len(clone.get_parameters()))
+
     def test_perform_request(self):
         server = MockServer()
         server.start()
@@ -215,6 +384,61 @@ class EobotRequestTest(unittest.TestCase):
         self.assertIsInstance(response["BTC"], float)
         self.assertEqual(100.0, response["BTC"])
 
+    def test_perform_request_with_parameters(self):
+        server = MockServer()
+        server.start()
+
+        req = EobotRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(server.port))
+        req.set_cache(None)
+        req.set_parameter("coin", "BTC")
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            req.perform_request([("coin", "ETH")])
+
+        self.assertIn("ETH", req.perform_request({"coin": "ETH"}))
+        self.assertIn("BTC", req.perform_request())
+
+        server.stop()
+
+        # the template itself is never changed by a call
+        self.assertEqual({"coin": "BTC"}, req.get_parameters())
+
+    def test_perform_request_from_many_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        server = MockServer(load_mode=True)
+        server.start()
+
+        req = EobotRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(server.port))
+        req.set_cache(None)
+        req.set_single_flight(None)
+
+        coins = ["BTC", "ETH"] * 20
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            responses = list(executor.map(lambda coin: req.perform_request({"coin": coin}), coins))
+
+        server.stop()
+
+        self.assertEqual(coins, [list(response.keys())[0] for response in responses])
+        self.assertEqual({}, req.get_parameters())
+
+    def test_perform_request_without_pool(self):
+        server = MockServer()
+        server.start()
+
+        req = EobotRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(server.port))
+        req.set_pool(None)
+        req.set_parameter("coin", "BTC")
+        response = req.perform_request()
+
+        server.stop()
+
+        self.assertEqual(100.0, response["BTC"])
+
     def test_perform_request_with_error(self):
         server = MockServer()
         server.start()
@@ -223,7 +447,57 @@ class EobotRequestTest(unittest.TestCase):
         req.set_base_url('http://localhost:{0}/api.test'.format(server.port))
         req.set_parameter("nosuch", "page")
 
-        with self.assertRaises(RuntimeError):
+        with self.assertRaises(EobotResponseError):
             req.perform_request()
 
         server.stop()
+
+    def test_perform_request_coalesces_public_endpoints_only(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        server = MockServer(load_mode=True)
+        server.set_latency(0.2)
+        server.start()
+
+        MockServer.reset()
+
+        req = EobotRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(server.port))
+        req.set_cache(None)
+        req.set_single_flight(EobotSingleFlight())
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda parameters: req.perform_request(parameters), [{"coin": "BTC"}] * 2))
+            list(executor.map(lambda parameters: req.perform_request(parameters), [{"total": 123}] * 2))
+
+        endpoints = server.get_counters()["endpoints"]
+        server.stop()
+
+        self.assertEqual(1, endpoints["get_coin_value"])
+        self.assertEqual(2, endpoints["get_balances"])
+
+    def test_perform_request_fresh(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        server = MockServer(load_mode=True)
+        server.set_latency(0.2)
+        server.start()
+
+        cache = EobotCache(enabled=True)
+        req = EobotRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(server.port))
+        req.set_cache(cache)
+        req.set_single_flight(EobotSingleFlight())
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda fresh: req.perform_request({"coin": "BTC"}, fresh), [False, True]))
+
+        self.assertEqual(2, server.get_counters()["endpoints"]["get_coin_value"])
+
+        req.perform_request({"coin": "BTC"}, True)
+        req.perform_request({"coin": "BTC"})
+
+        server.stop()
+
+        self.assertEqual(3, server.get_counters()["endpoints"]["get_coin_value"])
+        self.assertEqual(1, cache.get_stats()["hits"])
@@ -0,0 +1,145 @@
+import pickle
+import sys
+import unittest
+from array import array
+from collections.abc import Mapping
+
+from eobot.lib.eobot_results import EobotAmounts, EobotCoinTable, get_shared_index, validate_compact
+
+
+class EobotResultsTest(unittest.TestCase):
+    def test_validate_compact(self):
+        validate_compact(True)
+        validate_compact(False)
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            validate_compact(None)
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            validate_compact(1)
+
+    def test_get_shared_index(self):
+        index = get_shared_index(("BTC", "ETH"))
+
+        self.assertEqual({"BTC": 0, "ETH": 1}, index)
+        self.assertIs(index, get_shared_index(("BTC", "ETH")))
+        self.assertIsNot(index, get_shared_index(("ETH", "BTC")))
+
+
+class EobotAmountsTest(unittest.TestCase):
+    def test_mapping(self):
+        amounts = EobotAmounts({"BTC": "0.2", "ETH": 2.5, "Total": 70})
+
+        self.assertIsInstance(amounts, Mapping)
+        self.assertEqual(3, len(amounts))
+        self.assertEqual(["BTC", "ETH", "Total"], list(amounts))
+        self.assertIn("BTC", amounts)
+        self.assertNotIn("DOGE", amounts)
+        self.assertEqual(0.2, amounts["BTC"])
+        self.assertEqual(70.0, amounts.get("Total"))
+        self.assertEqual(0.0, amounts.get("DOGE", 0.0))
+        self.assertEqual({"BTC": 0.2, "ETH": 2.5, "Total": 70.0}, amounts)
+        self.assertEqual({"BTC": 0.2, "ETH": 2.5, "Total": 70.0}, dict(amounts))
+
+        with self.assertRaises(KeyError):
+            # noinspection PyStatementEffect
+            amounts["DOGE"]
+
+    def test_values_are_converted_lazily(self):
+        amounts = EobotAmounts({"BTC": "0.2", "ETH": "2.5"})
+
+        self.assertEqual(("0.2", "2.5"), amounts._values)
+
+        self.assertIsInstance(amounts["BTC"], float)
+        self.assertEqual(array("d", [0.2, 2.5]), amounts._values)
+
+        with self.assertRaises(ValueError):
+            # noinspection PyStatementEffect
+            EobotAmounts({"BTC": "nan?"})["BTC"]
+
+    def test_is_compact(self):
+        first = EobotAmounts({"BTC": "0.2", "ETH": "2.5"})
+        second = EobotAmounts({"BTC": "0.1", "ETH": "2.0"})
+
+        self.assertIs(first._index, second._index)
+        self.assertFalse(hasattr(first, "__dict__"))
+        self.assertLess(sys.getsizeof(first) + sys.getsizeof(first._values), sys.getsizeof(dict(first)))
+
+        # noinspection PyStatementEffect
+        first["BTC"]
+        self.assertLess(sys.getsizeof(first) + sys.getsizeof(first._values), sys.getsizeof(dict(first)))
+
+    def test_read_only(self):
+        amounts = EobotAmounts({"BTC": "0.2"})
+
+        with self.assertRaises(TypeError):
+            # noinspection PyUnresolvedReferences
+            amounts["BTC"] = 1.0
+
+    def test_pickle(self):
+        amounts = pickle.loads(pickle.dumps(EobotAmounts({"BTC": "0.2"})))
+
+        self.assertIsInstance(amounts, EobotAmounts)
+        self.assertEqual({"BTC": 0.2}, amounts)
+        self.assertEqual("EobotAmounts({'BTC': 0.2})", repr(amounts))
+
+
+class EobotCoinTableTest(unittest.TestCase):
+    coins = {
+        "BTC": {"Price": "100.0", "Image": "btc.png", "BigImage": "btcbig.png"},
+        "ETH": {"Price": 20, "Image": "eth.png", "BigImage": "ethbig.png"},
+    }
+
+    def test_mapping(self):
+        table = EobotCoinTable(self.coins)
+
+        self.assertIsInstance(table, Mapping)
+        self.assertEqual(("Price", "Image", "BigImage"), table.get_fields())
+        self.assertEqual(2, len(table))
+        self.assertEqual(["BTC", "ETH"], list(table))
+        self.assertIn("ETH", table)
+        self.assertEqual({"Price": 100.0, "Image": "btc.png", "BigImage": "btcbig.png"}, table["BTC"])
+        self.assertEqual(20.0, table.get_price("ETH"))
+        self.assertIsInstance(table.get_price("ETH"), float)
+
+        with self.assertRaises(KeyError):
+            table.get_price("DOGE")
+
+    def test_fields(self):
+        table = EobotCoinTable(self.coins, ["Price"])
+
+        self.assertEqual(("Price",), table.get_fields())
+        self.assertEqual({"BTC": {"Price": 100.0}, "ETH": {"Price": 20.0}}, table)
+        self.assertEqual(1, len(table._columns))
+
+        with self.assertRaises(KeyError):
+            EobotCoinTable(self.coins, ["Image"]).get_price("BTC")
+
+        with self.assertRaises(KeyError):
+            EobotCoinTable(self.coins, ["Name"])
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            EobotCoinTable(self.coins, "Price")
+
+    def test_prices_are_converted_lazily(self):
+        table = EobotCoinTable(self.coins, ["Price"])
+
+        self.assertEqual(("100.0", 20), table._columns[0])
+        table.get_price("BTC")
+        self.assertEqual(array("d", [100.0, 20.0]), table._columns[0])
+
+    def test_empty(self):
+        table = EobotCoinTable({})
+
+        self.assertEqual((), table.get_fields())
+        self.assertEqual({}, table)
+
+    def test_pickle(self):
+        table = pickle.loads(pickle.dumps(EobotCoinTable(self.coins, ("Price",))))
+
+        self.assertIsInstance(table, EobotCoinTable)
+        self.assertEqual(("Price",), table.get_fields())
+        self.assertEqual(100.0, table.get_price("BTC"))
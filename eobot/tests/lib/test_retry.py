@@ -0,0 +1,247 @@
+import asyncio
+import time
+import unittest
+
+from eobot.lib.eobot_async_request import EobotAsyncRequest
+from eobot.lib.eobot_errors import EobotConnectionError, EobotResponseError, EobotServerError
+from eobot.lib.eobot_request import EobotRequest
+from eobot.lib.eobot_retry import EobotRetryBudget, EobotRetryPolicy, get_retry_policy
+
+
+class FlakyRequest(EobotRequest):
+    def __init__(self):
+        super(FlakyRequest, self).__init__()
+        self.errors = []
+        self.attempts = 0
+
+    def _fetch(self, parameters):
+        self.attempts += 1
+        if len(self.errors) > 0:
+            raise self.errors.pop(0)
+        return 200, b'{"BTC": 100.0}'
+
+
+class FlakyAsyncRequest(EobotAsyncRequest):
+    def __init__(self):
+        super(FlakyAsyncRequest, self).__init__()
+        self.errors = []
+        self.attempts = 0
+
+    async def _fetch(self, parameters):
+        self.attempts += 1
+        if len(self.errors) > 0:
+            raise self.errors.pop(0)
+        return 200, b'{"BTC": 100.0}'
+
+
+def fast_policy(**kwargs):
+    return EobotRetryPolicy(backoff_base=0.001, backoff_max=0.001, **kwargs)
+
+
+class EobotRetryBudgetTest(unittest.TestCase):
+    def test_invalid_values(self):
+        with self.assertRaises(ValueError):
+            EobotRetryBudget(max_tokens=0)
+
+        with self.assertRaises(ValueError):
+            EobotRetryBudget(token_ratio=-1)
+
+    def test_withdraw_and_deposit(self):
+        budget = EobotRetryBudget(max_tokens=2, token_ratio=0.5)
+
+        self.assertTrue(budget.withdraw())
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
+
+        budget.deposit()
+        self.assertFalse(budget.withdraw())
+        budget.deposit()
+        self.assertTrue(budget.withdraw())
+
+        for _ in range(10):
+            budget.deposit()
+        self.assertEqual(2.0, budget.get_tokens())
+
+
+class EobotRetryPolicyTest(unittest.TestCase):
+    def test_invalid_values(self):
+        with self.assertRaises(ValueError):
+            EobotRetryPolicy(max_retries=-1)
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            EobotRetryPolicy(backoff_base="1")
+
+        with self.assertRaises(ValueError):
+            EobotRetryPolicy(backoff_max=-1)
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            EobotRetryPolicy(jitter=1)
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            EobotRetryPolicy(retry_writes=1)
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            EobotRetryPolicy(budget={})
+
+        with self.assertRaises(ValueError):
+            EobotRetryPolicy(max_elapsed=-1)
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            EobotRetryPolicy(max_elapsed=True)
+
+    def test_is_retryable(self):
+        policy = EobotRetryPolicy()
+
+        self.assertTrue(policy.is_retryable(EobotConnectionError()))
+        self.assertTrue(policy.is_retryable(EobotServerError()))
+        self.assertFalse(policy.is_retryable(EobotResponseError()))
+        self.assertFalse(policy.is_retryable(ValueError()))
+
+    def test_should_retry(self):
+        policy = EobotRetryPolicy(max_retries=2)
+
+        self.assertTrue(policy.should_retry("get_balances", EobotServerError(), 0))
+        self.assertTrue(policy.should_retry("get_balances", EobotServerError(), 1))
+        self.assertFalse(policy.should_retry("get_balances", EobotServerError(), 2))
+        self.assertFalse(policy.should_retry("get_balances", EobotResponseError(), 0))
+
+    def test_should_retry_after_max_elapsed(self):
+        policy = EobotRetryPolicy(max_elapsed=5)
+
+        self.assertEqual(5.0, policy.get_max_elapsed())
+        self.assertEqual(10.0, EobotRetryPolicy().get_max_elapsed())
+        self.assertTrue(policy.should_retry("get_balances", EobotConnectionError(), 0, 4.9))
+        self.assertFalse(policy.should_retry("get_balances", EobotConnectionError(), 0, 5.0))
+
+        policy = EobotRetryPolicy(max_elapsed=None)
+        self.assertIsNone(policy.get_max_elapsed())
+        self.assertTrue(policy.should_retry("get_balances", EobotConnectionError(), 0, 3600.0))
+
+    def test_should_retry_with_write_endpoint(self):
+        self.assertFalse(EobotRetryPolicy().should_retry("exchange_coins", EobotConnectionError(), 0))
+        self.assertTrue(EobotRetryPolicy(retry_writes=True).should_retry("exchange_coins", EobotConnectionError(), 0))
+
+    def test_should_retry_with_exhausted_budget(self):
+        policy = EobotRetryPolicy(budget=EobotRetryBudget(max_tokens=1, token_ratio=0))
+
+        self.assertTrue(policy.should_retry("get_balances", EobotServerError(), 0))
+        self.assertFalse(policy.should_retry("get_balances", EobotServerError(), 0))
+
+    def test_get_delay(self):
+        policy = EobotRetryPolicy(backoff_base=0.1, backoff_max=0.5, jitter=False)
+
+        self.assertEqual(0.1, policy.get_delay(0))
+        self.assertEqual(0.2, policy.get_delay(1))
+        self.assertEqual(0.4, policy.get_delay(2))
+        self.assertEqual(0.5, policy.get_delay(3))
+
+    def test_get_delay_with_jitter(self):
+        policy = EobotRetryPolicy(backoff_base=0.1, backoff_max=0.5)
+
+        for attempt in range(5):
+            delay = policy.get_delay(attempt)
+            self.assertGreaterEqual(delay, 0)
+            self.assertLessEqual(delay, min(0.5, 0.1 * (2 ** attempt)))
+
+    def test_get_retry_policy(self):
+        self.assertIsInstance(get_retry_policy(), EobotRetryPolicy)
+        self.assertIs(get_retry_policy(), get_retry_policy())
+
+    def test_perform_request_with_transient_errors(self):
+        req = FlakyRequest()
+        req.set_retry_policy(fast_policy())
+        req.errors = [EobotConnectionError(), EobotServerError()]
+        req.set_parameter("coin", "BTC")
+
+        self.assertEqual({"BTC": 100.0}, req.perform_request())
+        self.assertEqual(3, req.attempts)
+
+    def test_perform_request_with_too_many_errors(self):
+        req = FlakyRequest()
+        req.set_retry_policy(fast_policy(max_retries=1))
+        req.errors = [EobotServerError(), EobotServerError()]
+        req.set_parameter("coin", "BTC")
+
+        with self.assertRaises(EobotServerError):
+            req.perform_request()
+
+        self.assertEqual(2, req.attempts)
+
+    def test_perform_request_after_max_elapsed(self):
+        class SlowRequest(FlakyRequest):
+            def _fetch(self, parameters):
+                time.sleep(0.05)
+                return super(SlowRequest, self)._fetch(parameters)
+
+        req = SlowRequest()
+        req.set_retry_policy(fast_policy(max_elapsed=0.04))
+        req.errors = [EobotConnectionError(), EobotConnectionError()]
+        req.set_parameter("coin", "BTC")
+
+        # the first attempt took longer than the retries may start after
+        with self.assertRaises(EobotConnectionError):
+            req.perform_request()
+
+        self.assertEqual(1, req.attempts)
+
+    def test_perform_request_with_permanent_error(self):
+        req = FlakyRequest()
+        req.set_retry_policy(fast_policy())
+        req.errors = [EobotResponseError()]
+        req.set_parameter("coin", "BTC")
+
+        with self.assertRaises(EobotResponseError):
+            req.perform_request()
+
+        self.assertEqual(1, req.attempts)
+
+    def test_perform_request_with_write_endpoint(self):
+        req = FlakyRequest()
+        req.set_retry_policy(fast_policy())
+        req.errors = [EobotConnectionError()]
+        req.set_parameters({"id": 1, "email": "e", "password": "p", "mining": "BTC"})
+
+        with self.assertRaises(EobotConnectionError):
+            req.perform_request()
+
+        self.assertEqual(1, req.attempts)
+
+    def test_perform_request_without_retry_policy(self):
+        req = FlakyRequest()
+        req.set_retry_policy(None)
+        req.errors = [EobotConnectionError()]
+        req.set_parameter("coin", "BTC")
+
+        with self.assertRaises(EobotConnectionError):
+            req.perform_request()
+
+    def test_perform_async_request_with_transient_errors(self):
+        req = FlakyAsyncRequest()
+        req.set_retry_policy(fast_policy())
+        req.errors = [EobotConnectionError(), EobotServerError()]
+        req.set_parameter("coin", "BTC")
+
+        self.assertEqual({"BTC": 100.0}, asyncio.run(req.perform_request()))
+        self.assertEqual(3, req.attempts)
+
+    def test_perform_request_with_unreachable_api(self):
+        req = EobotRequest()
+        req.set_base_url("http://localhost:1/api.test")
+        req.set_retry_policy(fast_policy(max_retries=1))
+        req.set_parameter("coin", "BTC")
+
+        with self.assertRaises(EobotConnectionError):
+            req.perform_request()
+
+        req = EobotAsyncRequest()
+        req.set_base_url("http://localhost:1/api.test")
+        req.set_retry_policy(fast_policy(max_retries=1))
+        req.set_parameter("coin", "BTC")
+
+        with self.assertRaises(EobotConnectionError):
+            asyncio.run(req.perform_request())
@@ -0,0 +1,203 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from eobot.lib.eobot_single_flight import DEFAULT_ENDPOINTS, EobotSingleFlight, get_single_flight
+
+
+class EobotSingleFlightTest(unittest.TestCase):
+    def test_do(self):
+        flight = EobotSingleFlight()
+        self.assertEqual({"a": 1}, flight.do(("key",), lambda: {"a": 1}))
+        self.assertEqual(0, flight.get_in_flight())
+        self.assertEqual(0, flight.get_shared())
+
+    def test_do_concurrently(self):
+        flight = EobotSingleFlight()
+        calls = []
+        results = []
+
+        def slow_request():
+            calls.append(1)
+            time.sleep(0.2)
+            return {"BTC": 100.0}
+
+        def caller():
+            results.append(flight.do(("key",), slow_request))
+
+        threads = [threading.Thread(target=caller) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(1, len(calls))
+        self.assertEqual(5, len(results))
+        self.assertEqual(4, flight.get_shared())
+        self.assertEqual(5, len(set(id(result) for result in results)))
+        for result in results:
+            self.assertEqual({"BTC": 100.0}, result)
+
+    def test_do_concurrently_with_different_keys(self):
+        flight = EobotSingleFlight()
+        calls = []
+
+        def slow_request():
+            calls.append(1)
+            time.sleep(0.1)
+            return 1
+
+        threads = [threading.Thread(target=flight.do, args=((index,), slow_request)) for index in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(3, len(calls))
+
+    def test_do_with_error(self):
+        flight = EobotSingleFlight()
+        errors = []
+
+        def failing_request():
+            time.sleep(0.2)
+            raise RuntimeError("failed")
+
+        def caller():
+            try:
+                flight.do(("key",), failing_request)
+            except RuntimeError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=caller) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(3, len(errors))
+        self.assertEqual(0, flight.get_in_flight())
+
+    def test_do_async(self):
+        flight = EobotSingleFlight()
+        calls = []
+
+        async def slow_request():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"BTC": 100.0}
+
+        async def perform_all():
+            return await asyncio.gather(*[flight.do_async(("key",), slow_request) for _ in range(5)])
+
+        results = asyncio.run(perform_all())
+
+        self.assertEqual(1, len(calls))
+        self.assertEqual(4, flight.get_shared())
+        self.assertEqual(0, flight.get_in_flight())
+        self.assertEqual([{"BTC": 100.0}] * 5, results)
+
+    def test_do_async_with_error(self):
+        flight = EobotSingleFlight()
+
+        async def failing_request():
+            await asyncio.sleep(0.05)
+            raise RuntimeError("failed")
+
+        async def perform_all():
+            return await asyncio.gather(
+                *[flight.do_async(("key",), failing_request) for _ in range(3)],
+                return_exceptions=True
+            )
+
+        results = asyncio.run(perform_all())
+
+        self.assertEqual(3, len(results))
+        for result in results:
+            self.assertIsInstance(result, RuntimeError)
+
+    def test_do_async_with_cancelled_leader(self):
+        flight = EobotSingleFlight()
+        calls = []
+
+        async def slow_request():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"BTC": 100.0}
+
+        async def perform_all():
+            leader = asyncio.ensure_future(flight.do_async(("key",), slow_request))
+            await asyncio.sleep(0)
+            followers = [asyncio.ensure_future(flight.do_async(("key",), slow_request)) for _ in range(2)]
+            await asyncio.sleep(0)
+            leader.cancel()
+
+            return leader, await asyncio.gather(*followers)
+
+        leader, results = asyncio.run(perform_all())
+
+        self.assertTrue(leader.cancelled())
+        self.assertEqual(1, len(calls))
+        self.assertEqual([{"BTC": 100.0}] * 2, results)
+        self.assertEqual(0, flight.get_in_flight())
+
+    def test_do_async_with_every_caller_cancelled(self):
+        flight = EobotSingleFlight()
+        finished = []
+
+        async def slow_request():
+            await asyncio.sleep(0.05)
+            finished.append(1)
+            raise RuntimeError("failed")
+
+        async def perform_all():
+            callers = [asyncio.ensure_future(flight.do_async(("key",), slow_request)) for _ in range(2)]
+            await asyncio.sleep(0)
+            for caller in callers:
+                caller.cancel()
+            await asyncio.sleep(0.1)
+
+        asyncio.run(perform_all())
+
+        self.assertEqual([1], finished)
+        self.assertEqual(0, flight.get_in_flight())
+
+    def test_coalesced_endpoints(self):
+        flight = EobotSingleFlight()
+
+        for endpoint in DEFAULT_ENDPOINTS:
+            self.assertTrue(flight.is_coalesced(endpoint))
+        self.assertFalse(flight.is_coalesced("get_balances"))
+        self.assertFalse(flight.is_coalesced("exchange_coins"))
+
+        self.assertIs(flight, flight.set_coalesced("get_balances", True))
+        self.assertTrue(flight.is_coalesced("get_balances"))
+        flight.set_coalesced("get_balances", False)
+        self.assertFalse(flight.is_coalesced("get_balances"))
+
+        self.assertFalse(EobotSingleFlight(endpoints=["get_balances"]).is_coalesced("get_coin_value"))
+        self.assertTrue(EobotSingleFlight(endpoints=["get_balances"]).is_coalesced("get_balances"))
+
+    def test_set_coalesced_with_invalid_value(self):
+        flight = EobotSingleFlight()
+
+        with self.assertRaises(ValueError):
+            flight.set_coalesced("exchange_coins", True)
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            flight.set_coalesced(None, True)
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            flight.set_coalesced("get_balances", 1)
+
+        with self.assertRaises(ValueError):
+            EobotSingleFlight(endpoints=["set_mining_mode"])
+
+        flight.set_coalesced("exchange_coins", False)
+
+    def test_get_single_flight(self):
+        self.assertIsInstance(get_single_flight(), EobotSingleFlight)
+        self.assertIs(get_single_flight(), get_single_flight())
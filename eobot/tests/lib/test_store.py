@@ -0,0 +1,117 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from eobot.lib.eobot_store import EobotPersistentStore, get_default_store_path
+
+
+class EobotPersistentStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "cache", "store.sqlite3")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_init(self):
+        store = EobotPersistentStore(self.path, ttl=60)
+
+        self.assertEqual(self.path, store.get_path())
+        self.assertEqual(60.0, store.get_ttl())
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            EobotPersistentStore(123)
+
+        with self.assertRaises(ValueError):
+            EobotPersistentStore(self.path, ttl=0)
+
+    def test_default_store_path(self):
+        previous = os.environ.get("EOBOT_CACHE_DIR")
+        os.environ["EOBOT_CACHE_DIR"] = self.directory
+
+        try:
+            self.assertEqual(os.path.join(self.directory, "store.sqlite3"), get_default_store_path())
+            self.assertEqual(os.path.join(self.directory, "store.sqlite3"), EobotPersistentStore().get_path())
+        finally:
+            if previous is None:
+                del os.environ["EOBOT_CACHE_DIR"]
+            else:
+                os.environ["EOBOT_CACHE_DIR"] = previous
+
+    def test_make_key(self):
+        store = EobotPersistentStore(self.path)
+        key = store.make_key("user_id", "https://www.eobot.com/api.aspx", "me@example.com", "secret")
+
+        self.assertTrue(key.startswith("user_id:"))
+        self.assertNotIn("secret", key)
+        self.assertNotIn("me@example.com", key)
+        self.assertEqual(key, store.make_key("user_id", "https://www.eobot.com/api.aspx", "me@example.com", "secret"))
+        self.assertNotEqual(key, store.make_key("user_id", "https://www.eobot.com/api.aspx", "me@example.com", "other"))
+
+        # the salt is kept in the database, so every store using it makes the same keys
+        other = EobotPersistentStore(self.path)
+        self.assertEqual(key, other.make_key("user_id", "https://www.eobot.com/api.aspx", "me@example.com", "secret"))
+        other.close()
+        store.close()
+
+    def test_make_key_is_salted(self):
+        other_path = os.path.join(self.directory, "other", "store.sqlite3")
+        store = EobotPersistentStore(self.path)
+        other = EobotPersistentStore(other_path)
+        parts = ("user_id", "https://www.eobot.com/api.aspx", "me@example.com", "secret")
+
+        self.assertNotEqual(store.make_key(*parts), other.make_key(*parts))
+
+        # a new database gets a new salt
+        other.close()
+        os.remove(other_path)
+        recreated = EobotPersistentStore(other_path)
+        self.assertNotEqual(other.make_key(*parts), recreated.make_key(*parts))
+        recreated.close()
+        store.close()
+
+    def test_get_and_set(self):
+        store = EobotPersistentStore(self.path)
+
+        self.assertIsNone(store.get("key"))
+        store.set("key", 123).set("other", {"BTC": "wallet"})
+        self.assertEqual(123, store.get("key"))
+        self.assertEqual({"BTC": "wallet"}, store.get("other"))
+
+        # entries are shared with every other store, and process, using the same database
+        self.assertEqual(123, EobotPersistentStore(self.path).get("key"))
+
+        store.delete("key")
+        self.assertIsNone(store.get("key"))
+
+        store.clear()
+        self.assertIsNone(store.get("other"))
+        store.close()
+
+    def test_ttl(self):
+        store = EobotPersistentStore(self.path, ttl=0.1)
+
+        store.set("key", 123)
+        store.set("longer", 456, ttl=60)
+        self.assertEqual(123, store.get("key"))
+
+        time.sleep(0.15)
+
+        self.assertIsNone(store.get("key"))
+        self.assertEqual(456, store.get("longer"))
+
+        store.purge()
+        self.assertEqual(1, store._connect().execute("SELECT COUNT(*) FROM entries").fetchone()[0])
+
+    def test_unavailable_database(self):
+        # a directory where the database file should be
+        store = EobotPersistentStore(self.directory)
+
+        with self.assertLogs("eobot.lib.eobot_store", "WARNING"):
+            store.set("key", 123)
+
+        with self.assertLogs("eobot.lib.eobot_store", "WARNING"):
+            self.assertIsNone(store.get("key"))
@@ -0,0 +1,166 @@
+import ssl
+import unittest
+from asyncio import run
+
+from eobot.lib.eobot_async_request import EobotAsyncRequest
+from eobot.lib.eobot_errors import EobotConnectionError
+from eobot.lib.eobot_pool import EobotConnectionPool
+from eobot.lib.eobot_request import EobotRequest
+from eobot.lib.eobot_transport import EobotHttpClientTransport, EobotRequestsTransport, EobotTransport, \
+    get_default_transport, set_default_transport
+from eobot.tests.mock_server import MockServer, MockServerTransport
+
+
+class _StaleConnection(object):
+    # an idle connection the server has closed in the meantime
+    def request(self, method, target, headers=None):
+        raise ConnectionResetError("Connection reset by peer")
+
+    def close(self):
+        pass
+
+
+class EobotTransportTest(unittest.TestCase):
+    def start(self, **kwargs):
+        # the transports under test need a server that listens on a real port
+        self.server = MockServer(in_process=False, **kwargs)
+        self.server.start()
+        self.addCleanup(self.server.stop)
+
+    def request(self, transport, pool=None, request_class=EobotRequest):
+        return request_class() \
+            .set_base_url('http://localhost:{0}/api.test'.format(self.server.port)) \
+            .set_transport(transport) \
+            .set_pool(pool) \
+            .set_retry_policy(None) \
+            .set_parameter("coin", "BTC")
+
+    def test_transport(self):
+        with self.assertRaises(NotImplementedError):
+            EobotTransport().send(EobotRequest(), {})
+
+        with self.assertRaises(NotImplementedError):
+            run(EobotTransport().send_async(EobotRequest(), {}))
+
+    def test_set_transport(self):
+        transport = EobotHttpClientTransport()
+        req = EobotRequest()
+
+        self.assertIs(req, req.set_transport(transport))
+        self.assertIs(transport, req.get_transport())
+        self.assertIs(transport, req.clone().get_transport())
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            req.set_transport("http.client")
+
+    def test_set_default_transport(self):
+        default = get_default_transport()
+        self.addCleanup(set_default_transport, default)
+        transport = EobotHttpClientTransport()
+
+        set_default_transport(transport)
+        self.assertIs(transport, get_default_transport())
+        self.assertIs(transport, EobotRequest().get_transport())
+        self.assertIs(transport, EobotAsyncRequest().get_transport())
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            set_default_transport({})
+
+    def test_requests_transport(self):
+        self.start()
+
+        self.assertEqual({"BTC": 100.0}, self.request(EobotRequestsTransport()).perform_request())
+
+    def test_http_client_transport(self):
+        self.start()
+        transport = EobotHttpClientTransport()
+
+        self.assertEqual({"BTC": 100.0}, self.request(transport).perform_request())
+        self.assertEqual({"BTC": 100.0}, self.request(transport, EobotConnectionPool()).perform_request())
+        self.assertEqual(2, self.server.get_counters()["connections"])
+
+    def test_http_client_transport_keeps_connections_alive(self):
+        self.start(load_mode=True)
+        transport = EobotHttpClientTransport()
+        pool = EobotConnectionPool()
+
+        for _ in range(5):
+            self.assertEqual({"BTC": 100.0}, self.request(transport, pool).perform_request())
+
+        self.assertEqual(1, self.server.get_counters()["connections"])
+
+        # connections closed in the meantime are replaced transparently
+        transport.close()
+        self.assertEqual({"BTC": 100.0}, self.request(transport, pool).perform_request())
+        self.assertEqual(2, self.server.get_counters()["connections"])
+        transport.close()
+
+    def test_http_client_transport_without_server(self):
+        self.start()
+        port = self.server.port
+        self.server.stop()
+
+        req = EobotRequest() \
+            .set_base_url('http://localhost:{0}/api.test'.format(port)) \
+            .set_transport(EobotHttpClientTransport()) \
+            .set_retry_policy(None)
+
+        with self.assertRaises(EobotConnectionError):
+            req.perform_request()
+
+        with self.assertRaises(ValueError):
+            EobotHttpClientTransport().send(EobotRequest().set_base_url("ftp://localhost/api.test"), {})
+
+    def test_synchronous_transports_with_async_requests(self):
+        self.start(load_mode=True)
+
+        for transport in (EobotRequestsTransport(), EobotHttpClientTransport()):
+            req = self.request(transport, EobotConnectionPool(), EobotAsyncRequest)
+
+            self.assertEqual({"BTC": 100.0}, run(req.perform_request()))
+            self.assertEqual({"ETH": 20.0}, run(req.perform_request({"coin": "ETH"})))
+            transport.close()
+
+    def test_http_client_transport_caches_ssl_contexts(self):
+        first = EobotHttpClientTransport._connect(("https", "localhost", 443, 5, True))
+        second = EobotHttpClientTransport._connect(("https", "localhost", 443, 5, True))
+        unvalidated = EobotHttpClientTransport._connect(("https", "localhost", 443, 5, False))
+
+        self.assertIs(first._context, second._context)
+        self.assertIsNot(first._context, unvalidated._context)
+        self.assertEqual(ssl.CERT_REQUIRED, first._context.verify_mode)
+        self.assertEqual(ssl.CERT_NONE, unvalidated._context.verify_mode)
+
+    def test_http_client_transport_retries_stale_connections_of_reads_only(self):
+        self.start(load_mode=True)
+        transport = EobotHttpClientTransport()
+        req = self.request(transport, EobotConnectionPool()).set_cache(None)
+        key = ("http", "localhost", self.server.port, req.get_timeout(), req.get_validate_ssl())
+
+        transport._idle[key] = [_StaleConnection()]
+        self.assertEqual({"BTC": 100.0}, req.perform_request())
+        self.assertEqual(1, self.server.get_counters()["requests"])
+
+        req = self.request(transport, EobotConnectionPool()).set_parameters({})
+
+        transport._idle[key] = [_StaleConnection()]
+        with self.assertRaises(EobotConnectionError):
+            req.perform_request({"id": 123, "email": "123@example.com", "password": "password", "mining": "ETH"})
+        self.assertEqual(1, self.server.get_counters()["requests"])
+
+        transport.close()
+
+    def test_in_process_transport(self):
+        server = MockServer(in_process=True)
+        server.start()
+        self.addCleanup(server.stop)
+        self.server = server
+
+        self.assertEqual({"BTC": 100.0}, self.request(MockServerTransport()).perform_request())
+        self.assertEqual(
+            {"BTC": 100.0},
+            run(self.request(MockServerTransport(), request_class=EobotAsyncRequest).perform_request())
+        )
+        self.assertEqual(0, server.get_counters()["connections"])
@@ -0,0 +1,92 @@
+import time
+import unittest
+
+from eobot.lib import eobot_verification
+from eobot.lib.eobot_verification import MAX_RECORDED_BALANCES, POLL_INITIAL_DELAY, POLL_MAX_DELAY, \
+    VERIFICATION_MODES, clear_recorded_balances, get_balance, get_poll_delays, get_recorded_balances, record_balances, \
+    validate_verification
+
+
+class EobotVerificationTest(unittest.TestCase):
+    def test_validate_verification(self):
+        for verification in VERIFICATION_MODES:
+            validate_verification(verification)
+
+        with self.assertRaises(ValueError):
+            validate_verification("nosuch")
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            validate_verification(None)
+
+    def test_get_poll_delays(self):
+        delays = []
+        generator = get_poll_delays(3600.0)
+        for _ in range(6):
+            delays.append(next(generator))
+
+        self.assertEqual(POLL_INITIAL_DELAY, delays[0])
+        self.assertEqual(POLL_INITIAL_DELAY * 2, delays[1])
+        self.assertEqual(POLL_MAX_DELAY, delays[-1])
+
+    def test_get_poll_delays_stop_at_timeout(self):
+        started = time.time()
+        waited = 0.0
+
+        for delay in get_poll_delays(0.3):
+            time.sleep(delay)
+            waited += delay
+
+        self.assertAlmostEqual(0.3, waited, delta=0.05)
+        self.assertLess(time.time() - started, 0.5)
+
+    def test_get_balance(self):
+        self.assertEqual(1.5, get_balance({"BTC": 1.5}, "BTC"))
+        self.assertEqual(0.0, get_balance({"BTC": 1.5}, "ETH"))
+
+    def test_recorded_balances(self):
+        clear_recorded_balances()
+        self.assertIsNone(get_recorded_balances("http://localhost", 123))
+
+        balances = {"BTC": 1.0}
+        record_balances("http://localhost", 123, balances)
+        balances["BTC"] = 2.0
+
+        self.assertEqual({"BTC": 1.0}, get_recorded_balances("http://localhost", 123))
+        self.assertIsNone(get_recorded_balances("http://localhost", 456))
+        self.assertIsNone(get_recorded_balances("https://www.eobot.com", 123))
+
+        clear_recorded_balances()
+        self.assertIsNone(get_recorded_balances("http://localhost", 123))
+
+    def test_recorded_balances_expire(self):
+        clear_recorded_balances()
+        record_balances("http://localhost", 123, {"BTC": 1.0})
+        time.sleep(0.05)
+
+        self.assertEqual({"BTC": 1.0}, get_recorded_balances("http://localhost", 123))
+        self.assertIsNone(get_recorded_balances("http://localhost", 123, max_age=0.01))
+        self.assertEqual({"BTC": 1.0}, get_recorded_balances("http://localhost", 123))
+
+        # entries older than the default age are dropped, whatever the age asked for
+        eobot_verification._recorded_balances[("http://localhost", 123)] = (time.time() - 3600, {"BTC": 1.0})
+        self.assertIsNone(get_recorded_balances("http://localhost", 123, max_age=7200))
+        self.assertEqual(0, len(eobot_verification._recorded_balances))
+
+    def test_recorded_balances_are_bounded(self):
+        clear_recorded_balances()
+
+        for user_id in range(MAX_RECORDED_BALANCES + 1):
+            record_balances("http://localhost", user_id, {"BTC": 1.0})
+
+        self.assertEqual(MAX_RECORDED_BALANCES, len(eobot_verification._recorded_balances))
+        self.assertIsNone(get_recorded_balances("http://localhost", 0))
+        self.assertEqual({"BTC": 1.0}, get_recorded_balances("http://localhost", 1))
+
+        # recording again makes an account the most recently recorded one
+        record_balances("http://localhost", 1, {"BTC": 2.0})
+        record_balances("http://localhost", -1, {"BTC": 1.0})
+        self.assertEqual({"BTC": 2.0}, get_recorded_balances("http://localhost", 1))
+        self.assertIsNone(get_recorded_balances("http://localhost", 2))
+
+        clear_recorded_balances()
@@ -2,8 +2,12 @@ import unittest
 
 from eobot.methods.exchange_coins import perform_request
 from eobot.methods.get_balances import perform_request as get_balances
+from eobot.lib.eobot_async_request import EobotAsyncRequest
 from eobot.lib.eobot_config import get_config
 from eobot.lib.eobot_request import EobotRequest
+from eobot.lib.eobot_results import EobotAmounts
+from eobot.lib.eobot_verification import VERIFY_FULL, VERIFY_NONE, VERIFY_POLL, VERIFY_POST_ONLY, \
+    clear_recorded_balances
 from eobot.tests.mock_server import MockServer
 
 
@@ -45,6 +49,9 @@ class ExchangeCoinsTest(unittest.TestCase):
             # noinspection PyTypeChecker
             perform_request("BTC", 1, "ETH", request={})
 
+        with self.assertRaises(ValueError):
+            perform_request("BTC", 1, "ETH", request=EobotAsyncRequest())
+
     def test_perform_request(self):
         MockServer.reset()
         req = EobotRequest()
@@ -89,3 +96,48 @@ class ExchangeCoinsTest(unittest.TestCase):
 
         self.assertEqual(0.2, get_balances(config=get_config("tec2"), request=req.clone())["BTC"])
         self.assertEqual(1.5, get_balances(config=get_config("tec2"), request=req.clone())["ETH"])
+
+    def test_perform_request_with_verification(self):
+        MockServer.reset()
+        clear_recorded_balances()
+        req = EobotRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        cfg = get_config("tec_verify").configure(123, "123@example.com", password="password", token=None)
+        cfg.set_verification(VERIFY_FULL).set_verification_timeout(0.3)
+
+        def requests_for(*args, **kwargs):
+            self.server.reset_counters()
+            result = perform_request(*args, config=cfg, request=req.clone(), **kwargs)
+            return result, self.server.get_counters()["requests"]
+
+        # reads balances before and after the exchange
+        self.assertEqual((True, 3), requests_for("BTC", 0.01, "ETH"))
+
+        # compares against the balances recorded after the previous exchange
+        self.assertEqual((True, 2), requests_for("BTC", 0.01, "ETH", verification=VERIFY_POST_ONLY))
+
+        # compares against the balances supplied by the caller
+        prior_balances = {"BTC": 1.0, "ETH": 0.0}
+        self.assertEqual((True, 2), requests_for("BTC", 0.01, "ETH", verification=VERIFY_POST_ONLY,
+                                                 prior_balances=prior_balances))
+        prior_balances = {"BTC": 0.0, "ETH": 0.0}
+        self.assertEqual((False, 2), requests_for("BTC", 0.01, "ETH", verification=VERIFY_POST_ONLY,
+                                                  prior_balances=prior_balances))
+        prior_balances = EobotAmounts({"BTC": "1.0", "ETH": "0.0"})
+        self.assertEqual((True, 2), requests_for("BTC", 0.01, "ETH", verification=VERIFY_POST_ONLY,
+                                                 prior_balances=prior_balances))
+
+        # polls until the timeout passes, since exchanging nothing never changes the balances
+        result, requests = requests_for("BTC", 0.0, "ETH", verification=VERIFY_POLL)
+        self.assertFalse(result)
+        self.assertGreater(requests, 2)
+
+        cfg.set_verification(VERIFY_NONE)
+        self.assertEqual((True, 1), requests_for("BTC", 0.01, "ETH"))
+
+        with self.assertRaises(ValueError):
+            requests_for("BTC", 0.01, "ETH", verification="nosuch")
+
+        with self.assertRaises(ValueError):
+            requests_for("BTC", 0.01, "ETH", prior_balances=[])
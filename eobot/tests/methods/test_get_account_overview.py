@@ -0,0 +1,88 @@
+import unittest
+
+from eobot.methods.get_account_overview import perform_request
+from eobot.lib.eobot_async_request import EobotAsyncRequest
+from eobot.lib.eobot_config import get_config
+from eobot.lib.eobot_errors import EobotRequestError
+from eobot.lib.eobot_request import EobotRequest
+from eobot.tests.mock_server import FAULT_SERVER_ERROR, MockServer
+
+class GetAccountOverviewTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockServer(load_mode=True)
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_perform_request_with_invalid_config(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            perform_request(config={})
+
+    def test_perform_request_with_invalid_request(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            perform_request(request={})
+
+        with self.assertRaises(ValueError):
+            perform_request(request=EobotAsyncRequest())
+
+    def test_perform_request(self):
+        MockServer.reset()
+        req = EobotRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        get_config("tgao").configure(123, "123@example.com", password="password", token=None)
+
+        overview = perform_request(config="tgao", request=req.clone())
+
+        self.assertEqual({}, overview["errors"])
+        self.assertEqual(0.2, overview["balances"]["BTC"])
+        self.assertEqual("BTC", overview["mining_mode"])
+        self.assertIsInstance(overview["mining_speed"], dict)
+        self.assertIsInstance(overview["mining_estimates"], dict)
+
+    def test_perform_request_without_user_id(self):
+        MockServer.reset()
+        req = EobotRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        cfg = get_config("tgao_user_id").configure(None, "123@example.com", password="password", token=None)
+
+        overview = perform_request(config=cfg, request=req.clone())
+
+        # the user ID is looked up once, before the four reads
+        self.assertEqual(5, self.server.get_counters()["requests"])
+        self.assertEqual(123, cfg.get_user_id())
+        self.assertEqual({}, overview["errors"])
+
+    def test_perform_request_concurrently(self):
+        MockServer.reset()
+        req = EobotRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+        self.server.set_latency(0.5)
+
+        get_config("tgao_latency").configure(123, "123@example.com", password="password", token=None)
+
+        overview = perform_request(config="tgao_latency", request=req.clone())
+
+        # the four reads were waiting on the server at the same time
+        self.assertEqual(4, self.server.get_counters()["max_delayed"])
+        self.assertEqual({}, overview["errors"])
+
+    def test_perform_request_with_partial_failure(self):
+        MockServer.reset()
+        req = EobotRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+        self.server.set_fault(FAULT_SERVER_ERROR, 1.0, "get_mining_speed")
+
+        get_config("tgao_fault").configure(123, "123@example.com", password="password", token=None)
+
+        overview = perform_request(config="tgao_fault", request=req.clone())
+
+        self.assertEqual(["mining_speed"], list(overview["errors"].keys()))
+        self.assertIsInstance(overview["errors"]["mining_speed"], EobotRequestError)
+        self.assertIsNone(overview["mining_speed"])
+        self.assertEqual(0.2, overview["balances"]["BTC"])
+        self.assertEqual("BTC", overview["mining_mode"])
@@ -1,8 +1,11 @@
 import unittest
 
 from eobot.methods.get_balances import perform_request
+from eobot.lib.eobot_async_request import EobotAsyncRequest
+from eobot.lib.eobot_balance_cache import EobotBalanceCache
 from eobot.lib.eobot_config import get_config
 from eobot.lib.eobot_request import EobotRequest
+from eobot.lib.eobot_results import EobotAmounts
 from eobot.tests.mock_server import MockServer
 
 
@@ -24,6 +27,9 @@ class GetBalancesTest(unittest.TestCase):
             # noinspection PyTypeChecker
             perform_request(request={})
 
+        with self.assertRaises(ValueError):
+            perform_request(request=EobotAsyncRequest())
+
     def test_perform_request(self):
         MockServer.reset()
         req = EobotRequest()
@@ -80,3 +86,51 @@ class GetBalancesTest(unittest.TestCase):
         self.assertEqual(0.1, balances["BTC"])
         self.assertEqual(2.0, balances["ETH"])
         self.assertEqual(50.0, balances["Total"])
+
+    def test_perform_request_with_balance_cache(self):
+        MockServer.reset()
+        req = EobotRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        cfg = get_config("tgb_cache").configure(123, "123@example.com", password="password", token=None)
+        cfg.set_balance_cache(EobotBalanceCache(max_staleness=60))
+
+        def requests_for(**kwargs):
+            self.server.reset_counters()
+            result = perform_request(config=cfg, request=req.clone(), **kwargs)
+            return result, self.server.get_counters()["requests"]
+
+        balances, requests = requests_for()
+        self.assertEqual(0.2, balances["BTC"])
+        self.assertEqual(1, requests)
+
+        self.assertEqual((balances, 0), requests_for())
+        self.assertEqual((balances, 1), requests_for(max_staleness=0))
+
+        with self.assertRaises(ValueError):
+            requests_for(max_staleness=-1)
+
+    def test_perform_request_compact(self):
+        MockServer.reset()
+        req = EobotRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        cfg = get_config("tgb_compact").configure(123, "123@example.com", password="password", token=None)
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            perform_request(config=cfg, request=req.clone(), compact=None)
+
+        balances = perform_request(config=cfg, request=req.clone(), compact=True)
+        self.assertIsInstance(balances, EobotAmounts)
+        self.assertEqual({"BTC": 0.2, "ETH": 2.5, "Total": 70.0}, balances)
+
+        # balances served from the balance cache are compact as well
+        cfg.set_balance_cache(EobotBalanceCache(max_staleness=60))
+        perform_request(config=cfg, request=req.clone())
+
+        self.server.reset_counters()
+        balances = perform_request(config=cfg, request=req.clone(), compact=True)
+        self.assertEqual(0, self.server.get_counters()["requests"])
+        self.assertIsInstance(balances, EobotAmounts)
+        self.assertEqual(0.2, balances["BTC"])
@@ -1,6 +1,7 @@
 import unittest
 
 from eobot.methods.get_coin_value import perform_request
+from eobot.lib.eobot_async_request import EobotAsyncRequest
 from eobot.lib.eobot_request import EobotRequest
 from eobot.tests.mock_server import MockServer
 
@@ -28,6 +29,14 @@ class GetCoinValueTest(unittest.TestCase):
             # noinspection PyTypeChecker
             perform_request("BTC", request={})
 
+        with self.assertRaises(ValueError):
+            perform_request("BTC", request=EobotAsyncRequest())
+
+    def test_perform_request_with_invalid_snapshot(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            perform_request("BTC", snapshot=[])
+
     def test_perform_request(self):
         MockServer.reset()
         req = EobotRequest()
@@ -37,3 +46,11 @@ class GetCoinValueTest(unittest.TestCase):
 
         self.assertIsInstance(value, float)
         self.assertEqual(100.0, value)
+
+    def test_perform_request_with_snapshot(self):
+        MockServer.reset()
+        req = EobotRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        self.assertEqual(20.0, perform_request("ETH", request=req.clone(), snapshot=True))
+        self.assertEqual(50.0, perform_request("BTC", request=req.clone(), snapshot={"BTC": {"Price": 50.0}}))
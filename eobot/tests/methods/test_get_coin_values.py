@@ -0,0 +1,76 @@
+import unittest
+
+from eobot.methods.get_coin_values import perform_request
+from eobot.lib.eobot_async_request import EobotAsyncRequest
+from eobot.lib.eobot_cache import EobotCache
+from eobot.lib.eobot_request import EobotRequest
+from eobot.lib.eobot_results import EobotCoinTable
+from eobot.tests.mock_server import MockServer
+
+
+class GetCoinValuesTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockServer()
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_perform_request_without_coins(self):
+        with self.assertRaises(TypeError):
+            # noinspection PyArgumentList
+            perform_request()
+
+    def test_perform_request_with_invalid_coins(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            perform_request("BTC")
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            perform_request(["BTC", 123])
+
+    def test_perform_request_with_invalid_request(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            perform_request(["BTC"], request={})
+
+        with self.assertRaises(ValueError):
+            perform_request(["BTC"], request=EobotAsyncRequest())
+
+    def test_perform_request_with_invalid_snapshot(self):
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            perform_request(["BTC"], snapshot=[])
+
+    def test_perform_request_with_unsupported_coin(self):
+        with self.assertRaises(ValueError):
+            perform_request(["BTC", "NOSUCH"], snapshot={"BTC": {"Price": 100.0}})
+
+    def test_perform_request_without_any_coin(self):
+        self.assertEqual({}, perform_request([], request=EobotRequest().set_base_url("http://localhost:1/")))
+
+    def test_perform_request(self):
+        MockServer.reset()
+        cache = EobotCache(enabled=True)
+        req = EobotRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+        req.set_cache(cache)
+
+        values = perform_request(["btc", "ETH"], request=req.clone())
+
+        self.assertEqual({"BTC": 100.0, "ETH": 20.0}, values)
+        self.assertIsInstance(values["BTC"], float)
+        self.assertEqual(1, cache.get_stats()["misses"])
+
+    def test_perform_request_with_snapshot(self):
+        snapshot = {"BTC": {"Price": "100.0"}, "ETH": {"Price": 20.0}}
+        req = EobotRequest().set_base_url("http://localhost:1/")
+
+        self.assertEqual({"ETH": 20.0, "BTC": 100.0}, perform_request(("ETH", "BTC"), request=req, snapshot=snapshot))
+
+    def test_perform_request_with_coin_table_snapshot(self):
+        snapshot = EobotCoinTable({"BTC": {"Price": "100.0"}, "ETH": {"Price": 20.0}})
+        req = EobotRequest().set_base_url("http://localhost:1/")
+
+        self.assertEqual({"ETH": 20.0, "BTC": 100.0}, perform_request(("ETH", "BTC"), request=req, snapshot=snapshot))
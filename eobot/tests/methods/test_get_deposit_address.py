@@ -1,7 +1,12 @@
+import os
+import shutil
+import tempfile
 import unittest
 
 from eobot.methods.get_deposit_address import perform_request
+from eobot.lib.eobot_async_request import EobotAsyncRequest
 from eobot.lib.eobot_config import get_config
+from eobot.lib.eobot_store import EobotPersistentStore
 from eobot.lib.eobot_request import EobotRequest
 from eobot.tests.mock_server import MockServer
 
@@ -41,6 +46,9 @@ class GetDepositAddressTest(unittest.TestCase):
             # noinspection PyTypeChecker
             perform_request("BTC", request={})
 
+        with self.assertRaises(ValueError):
+            perform_request("BTC", request=EobotAsyncRequest())
+
     def test_perform_request(self):
         MockServer.reset()
         req = EobotRequest()
@@ -76,3 +84,24 @@ class GetDepositAddressTest(unittest.TestCase):
 
         self.assertIsInstance(wallet, basestring)
         self.assertEqual("wallet-bitcoin", wallet)
+
+    def test_perform_request_with_store(self):
+        MockServer.reset()
+        req = EobotRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        store = EobotPersistentStore(os.path.join(directory, "store.sqlite3"))
+
+        get_config("tgda_store").configure(user_id=None, email="456@example.com", password="password", token=None)
+        get_config("tgda_store").set_store(store)
+
+        self.assertEqual("wallet-bitcoin", perform_request("BTC", config="tgda_store", request=req.clone()))
+        self.assertEqual(2, self.server.get_counters()["requests"])
+
+        # a new process resolves neither the user ID nor the address through the API
+        get_config("tgda_store").configure(user_id=None).set_store(EobotPersistentStore(store.get_path()))
+        self.assertEqual("wallet-bitcoin", perform_request("BTC", config="tgda_store", request=req.clone()))
+        self.assertEqual("wallet-ethereum", perform_request("ETH", config="tgda_store", request=req.clone()))
+        self.assertEqual(3, self.server.get_counters()["requests"])
@@ -1,6 +1,7 @@
 import unittest
 
 from eobot.methods.get_exchange_estimate import perform_request
+from eobot.lib.eobot_async_request import EobotAsyncRequest
 from eobot.lib.eobot_request import EobotRequest
 from eobot.tests.mock_server import MockServer
 
@@ -53,6 +54,9 @@ class GetExchangeEstimateTest(unittest.TestCase):
             # noinspection PyTypeChecker
             perform_request("BTC", "ETH", 1.0, request={})
 
+        with self.assertRaises(ValueError):
+            perform_request("BTC", "ETH", 1.0, request=EobotAsyncRequest())
+
     def test_perform_request(self):
         MockServer.reset()
         req = EobotRequest()
@@ -1,6 +1,7 @@
 import unittest
 
 from eobot.methods.get_exchange_rate import perform_request
+from eobot.lib.eobot_async_request import EobotAsyncRequest
 from eobot.lib.eobot_request import EobotRequest
 from eobot.tests.mock_server import MockServer
 
@@ -28,6 +29,9 @@ class GetExchangeRateValueTest(unittest.TestCase):
             # noinspection PyTypeChecker
             perform_request("EUR", request={})
 
+        with self.assertRaises(ValueError):
+            perform_request("EUR", request=EobotAsyncRequest())
+
     def test_perform_request(self):
         MockServer.reset()
         req = EobotRequest()
@@ -1,8 +1,10 @@
 import unittest
 
 from eobot.methods.get_mining_estimates import perform_request
+from eobot.lib.eobot_async_request import EobotAsyncRequest
 from eobot.lib.eobot_config import get_config
 from eobot.lib.eobot_request import EobotRequest
+from eobot.lib.eobot_results import EobotAmounts
 from eobot.tests.mock_server import MockServer
 
 
@@ -24,6 +26,9 @@ class GetMiningEstimatesTest(unittest.TestCase):
             # noinspection PyTypeChecker
             perform_request(request={})
 
+        with self.assertRaises(ValueError):
+            perform_request(request=EobotAsyncRequest())
+
     def test_perform_request(self):
         MockServer.reset()
         req = EobotRequest()
@@ -68,3 +73,15 @@ class GetMiningEstimatesTest(unittest.TestCase):
 
         self.assertIsInstance(estimates["MiningSHA-256"], float)
         self.assertEqual((1.0/12.0), estimates["MiningSHA-256"])
+
+    def test_perform_request_compact(self):
+        MockServer.reset()
+        req = EobotRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        get_config().configure(123, "123@example.com", password="password", token=None)
+
+        estimates = perform_request(request=req.clone(), compact=True)
+
+        self.assertIsInstance(estimates, EobotAmounts)
+        self.assertEqual((1.0/6.0), estimates["MiningSHA-256"])
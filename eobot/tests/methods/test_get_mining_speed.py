@@ -1,8 +1,10 @@
 import unittest
 
 from eobot.methods.get_mining_speed import perform_request
+from eobot.lib.eobot_async_request import EobotAsyncRequest
 from eobot.lib.eobot_config import get_config
 from eobot.lib.eobot_request import EobotRequest
+from eobot.lib.eobot_results import EobotAmounts
 from eobot.tests.mock_server import MockServer
 
 
@@ -24,6 +26,9 @@ class GetMiningSpeedTest(unittest.TestCase):
             # noinspection PyTypeChecker
             perform_request(request={})
 
+        with self.assertRaises(ValueError):
+            perform_request(request=EobotAsyncRequest())
+
     def test_perform_request(self):
         MockServer.reset()
         req = EobotRequest()
@@ -68,3 +73,15 @@ class GetMiningSpeedTest(unittest.TestCase):
 
         self.assertIsInstance(speeds["MiningSHA-256"], float)
         self.assertEqual(5.0, speeds["MiningSHA-256"])
+
+    def test_perform_request_compact(self):
+        MockServer.reset()
+        req = EobotRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        get_config().configure(123, "123@example.com", password="password", token=None)
+
+        speeds = perform_request(request=req.clone(), compact=True)
+
+        self.assertIsInstance(speeds, EobotAmounts)
+        self.assertEqual(10.0, speeds["MiningSHA-256"])
@@ -1,7 +1,9 @@
 import unittest
 
 from eobot.methods.get_supported_coins import perform_request
+from eobot.lib.eobot_async_request import EobotAsyncRequest
 from eobot.lib.eobot_request import EobotRequest
+from eobot.lib.eobot_results import EobotCoinTable
 from eobot.tests.mock_server import MockServer
 
 try:
@@ -25,6 +27,9 @@ class GetSupportedCoinsTest(unittest.TestCase):
             # noinspection PyTypeChecker
             perform_request(request={})
 
+        with self.assertRaises(ValueError):
+            perform_request(request=EobotAsyncRequest())
+
     def test_perform_request(self):
         MockServer.reset()
         req = EobotRequest()
@@ -62,3 +67,26 @@ class GetSupportedCoinsTest(unittest.TestCase):
         self.assertEqual(20.0, coins["ETH"]["Price"])
         self.assertEqual("http://www.eobot.com/eth.png", coins["ETH"]["Image"])
         self.assertEqual("http://www.eobot.com/ethbig.png", coins["ETH"]["BigImage"])
+
+    def test_perform_request_compact(self):
+        MockServer.reset()
+        req = EobotRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            perform_request(request=req.clone(), compact="true")
+
+        with self.assertRaises(ValueError):
+            # noinspection PyTypeChecker
+            perform_request(request=req.clone(), compact=True, fields="Price")
+
+        coins = perform_request(request=req.clone(), compact=True)
+
+        self.assertIsInstance(coins, EobotCoinTable)
+        self.assertEqual(("Price",), coins.get_fields())
+        self.assertEqual({"BTC": {"Price": 100.0}, "ETH": {"Price": 20.0}}, coins)
+
+        coins = perform_request(request=req.clone(), compact=True, fields=("Price", "Image"))
+
+        self.assertEqual({"Price": 20.0, "Image": "http://www.eobot.com/eth.png"}, coins["ETH"])
@@ -1,6 +1,7 @@
 import unittest
 
 from eobot.methods.get_supported_fiat import perform_request
+from eobot.lib.eobot_async_request import EobotAsyncRequest
 from eobot.lib.eobot_request import EobotRequest
 from eobot.tests.mock_server import MockServer
 
@@ -18,6 +19,9 @@ class GetSupportedFiatTest(unittest.TestCase):
             # noinspection PyTypeChecker
             perform_request(request={})
 
+        with self.assertRaises(ValueError):
+            perform_request(request=EobotAsyncRequest())
+
     def test_perform_request(self):
         MockServer.reset()
         req = EobotRequest()
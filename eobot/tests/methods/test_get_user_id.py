@@ -1,8 +1,13 @@
+import os
+import shutil
+import tempfile
 import unittest
 
+from eobot.lib.eobot_async_request import EobotAsyncRequest
 from eobot.lib.eobot_errors import NoEmailError, NoPasswordOrTokenError
 from eobot.methods.get_user_id import perform_request
 from eobot.lib.eobot_config import get_config
+from eobot.lib.eobot_store import EobotPersistentStore
 from eobot.lib.eobot_request import EobotRequest
 from eobot.tests.mock_server import MockServer
 
@@ -25,6 +30,9 @@ class GetUserIdTest(unittest.TestCase):
             # noinspection PyTypeChecker
             perform_request(request={})
 
+        with self.assertRaises(ValueError):
+            perform_request(request=EobotAsyncRequest())
+
     def test_perform_request_with_config_without_email(self):
         get_config("tgui1").configure(user_id=None, email=None, password=None, token=None)
 
@@ -60,3 +68,29 @@ class GetUserIdTest(unittest.TestCase):
 
         self.assertIsInstance(user_id, int)
         self.assertEqual(456, user_id)
+
+    def test_perform_request_with_store(self):
+        MockServer.reset()
+        req = EobotRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        store = EobotPersistentStore(os.path.join(directory, "store.sqlite3"))
+
+        get_config("tgui_store").configure(None, "456@example.com", password="password", token=None)
+        get_config("tgui_store").set_store(store)
+
+        self.assertEqual(456, perform_request(config="tgui_store", request=req.clone()))
+        self.assertEqual(1, self.server.get_counters()["requests"])
+
+        # a new process would only share the database file
+        get_config("tgui_store").set_store(EobotPersistentStore(store.get_path()))
+        self.assertEqual(456, perform_request(config="tgui_store", request=req.clone()))
+        self.assertEqual(1, self.server.get_counters()["requests"])
+
+        # other credentials are stored separately
+        get_config("tgui_store").set_password("other")
+        with self.assertRaises(TypeError):
+            perform_request(config="tgui_store", request=req.clone())
+        self.assertEqual(2, self.server.get_counters()["requests"])
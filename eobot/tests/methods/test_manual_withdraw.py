@@ -1,9 +1,14 @@
+import time
 import unittest
 
 from eobot.methods.manual_withdraw import perform_request
 from eobot.methods.get_balances import perform_request as get_balances
+from eobot.lib.eobot_async_request import EobotAsyncRequest
+from eobot.lib.eobot_balance_cache import EobotBalanceCache
 from eobot.lib.eobot_config import get_config
 from eobot.lib.eobot_request import EobotRequest
+from eobot.lib.eobot_verification import VERIFY_FULL, VERIFY_NONE, VERIFY_POLL, VERIFY_POST_ONLY, \
+    clear_recorded_balances
 from eobot.tests.mock_server import MockServer
 
 
@@ -45,6 +50,9 @@ class ManualWithdrawTest(unittest.TestCase):
             # noinspection PyTypeChecker
             perform_request("BTC", 0.11, "bitcoin-wallet", request={})
 
+        with self.assertRaises(ValueError):
+            perform_request("BTC", 0.11, "bitcoin-wallet", request=EobotAsyncRequest())
+
     def test_perform_request(self):
         MockServer.reset()
         req = EobotRequest()
@@ -84,3 +92,53 @@ class ManualWithdrawTest(unittest.TestCase):
         self.assertTrue(result)
 
         self.assertEqual(0.05, get_balances(config=get_config("tmw2"), request=req.clone())["BTC"])
+
+    def test_perform_request_with_verification(self):
+        MockServer.reset()
+        clear_recorded_balances()
+        req = EobotRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        cfg = get_config("tmw_verify").configure(123, "123@example.com", password="password", token=None)
+        cfg.set_verification(VERIFY_POST_ONLY).set_verification_timeout(0.3)
+
+        def requests_for(*args, **kwargs):
+            self.server.reset_counters()
+            result = perform_request(*args, config=cfg, request=req.clone(), **kwargs)
+            return result, self.server.get_counters()["requests"]
+
+        # nothing was recorded yet, so the balances are read before the withdrawal after all
+        self.assertEqual((True, 3), requests_for("BTC", 0.01, "wallet"))
+        self.assertEqual((True, 2), requests_for("BTC", 0.01, "wallet"))
+        self.assertEqual((True, 2), requests_for("BTC", 0.01, "wallet", prior_balances={"BTC": 1.0}))
+
+        result, requests = requests_for("BTC", 0.0, "wallet", verification=VERIFY_POLL)
+        self.assertFalse(result)
+        self.assertGreater(requests, 2)
+
+        self.assertEqual((True, 1), requests_for("BTC", 0.01, "wallet", verification=VERIFY_NONE))
+
+    def test_perform_request_with_balance_cache(self):
+        MockServer.reset()
+        req = EobotRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        balance_cache = EobotBalanceCache(max_staleness=60, reconcile_delay=0)
+        cfg = get_config("tmw_cache").configure(123, "123@example.com", password="password", token=None)
+        cfg.set_balance_cache(balance_cache).set_verification(VERIFY_NONE)
+
+        self.assertEqual(0.2, get_balances(config=cfg, request=req.clone())["BTC"])
+
+        self.assertTrue(perform_request("BTC", 0.05, "wallet", config=cfg, request=req.clone()))
+        self.assertEqual(1, balance_cache.get_stats()["optimistic_updates"])
+
+        # the background read reconciles the optimistic balance with the API
+        for _ in range(100):
+            if balance_cache.get_stats()["reconciles"] == 1:
+                break
+            time.sleep(0.01)
+
+        self.assertEqual(1, balance_cache.get_stats()["reconciles"])
+        self.server.reset_counters()
+        self.assertAlmostEqual(0.15, get_balances(config=cfg, request=req.clone())["BTC"])
+        self.assertEqual(0, self.server.get_counters()["requests"])
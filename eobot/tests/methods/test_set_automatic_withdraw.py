@@ -1,6 +1,7 @@
 import unittest
 
 from eobot.methods.set_automatic_withdraw import perform_request
+from eobot.lib.eobot_async_request import EobotAsyncRequest
 from eobot.lib.eobot_config import get_config
 from eobot.lib.eobot_request import EobotRequest
 from eobot.tests.mock_server import MockServer
@@ -44,6 +45,9 @@ class SetAutomaticWithdrawTest(unittest.TestCase):
             # noinspection PyTypeChecker
             perform_request("BTC", 0.11, "bitcoin-wallet", request={})
 
+        with self.assertRaises(ValueError):
+            perform_request("BTC", 0.11, "bitcoin-wallet", request=EobotAsyncRequest())
+
     def test_perform_request(self):
         MockServer.reset()
         req = EobotRequest()
@@ -2,8 +2,10 @@ import unittest
 
 from eobot.methods.set_mining_mode import perform_request
 from eobot.methods.get_mining_mode import perform_request as get_mining_mode
+from eobot.lib.eobot_async_request import EobotAsyncRequest
 from eobot.lib.eobot_config import get_config
 from eobot.lib.eobot_request import EobotRequest
+from eobot.lib.eobot_verification import VERIFY_FULL, VERIFY_NONE, VERIFY_POLL, VERIFY_POST_ONLY
 from eobot.tests.mock_server import MockServer
 
 
@@ -35,6 +37,9 @@ class SetMiningModeTest(unittest.TestCase):
             # noinspection PyTypeChecker
             perform_request("ETH", request={})
 
+        with self.assertRaises(ValueError):
+            perform_request("ETH", request=EobotAsyncRequest())
+
     def test_perform_request(self):
         req = EobotRequest()
         req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
@@ -73,3 +78,23 @@ class SetMiningModeTest(unittest.TestCase):
 
         result = perform_request("BTC", config=get_config("tsmm2"), request=req.clone())
         self.assertTrue(result)
+
+    def test_perform_request_with_verification(self):
+        MockServer.reset()
+        req = EobotRequest()
+        req.set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+        cfg = get_config("tsmm_verify").configure(123, "123@example.com", password="password", token=None)
+        cfg.set_verification(VERIFY_FULL).set_verification_timeout(0.3)
+
+        def requests_for(*args, **kwargs):
+            self.server.reset_counters()
+            result = perform_request(*args, config=cfg, request=req.clone(), **kwargs)
+            return result, self.server.get_counters()["requests"]
+
+        # full verification skips the write if the mode is already set
+        self.assertEqual((True, 1), requests_for("BTC"))
+        self.assertEqual((True, 3), requests_for("ETH"))
+        self.assertEqual((True, 2), requests_for("BTC", verification=VERIFY_POST_ONLY))
+        self.assertEqual((True, 2), requests_for("ETH", verification=VERIFY_POLL))
+        self.assertEqual((True, 1), requests_for("BTC", verification=VERIFY_NONE))
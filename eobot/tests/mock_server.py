@@ -1,6 +1,11 @@
+import copy
+import itertools
 import json
+import os
+import random
 import socket
-from threading import Thread
+import time
+from threading import Lock, Thread
 
 try:
     # noinspection PyUnresolvedReferences
@@ -11,8 +16,27 @@ except ImportError:
 try:
     # noinspection PyUnresolvedReferences
     from http.server import BaseHTTPRequestHandler, HTTPServer
+    # noinspection PyUnresolvedReferences
+    from socketserver import ThreadingMixIn
 except ImportError:
     from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+
+from eobot.lib.eobot_endpoints import get_endpoint
+from eobot.lib.eobot_errors import EobotConnectionError
+from eobot.lib.eobot_transport import EobotTransport, set_default_transport
+
+# faults that can be injected into responses, see MockServer.set_fault()
+FAULT_SERVER_ERROR = "server_error"
+FAULT_TIMEOUT = "timeout"
+FAULT_NON_JSON = "non_json"
+FAULTS = (FAULT_SERVER_ERROR, FAULT_TIMEOUT, FAULT_NON_JSON)
+
+# set to "in-process" to serve every request made by the tests through `MockServerTransport`, without any sockets
+IN_PROCESS = os.environ.get("EOBOT_TEST_TRANSPORT") == "in-process"
+
+# guards mock_state against concurrent modification by the threads of a load-test server
+_state_lock = Lock()
 
 
 mock_state = {
@@ -84,15 +108,117 @@ mock_state = {
 }
 
 
+# well-known coins used first when generating a fleet, any further coins get synthetic tickers
+_FLEET_COINS = ("BTC", "ETH", "LTC", "DOGE", "XRP", "BCH", "DASH", "XMR", "ZEC", "ETC")
+
+
+def index_state(state):
+    """
+    Adds an index of account IDs by email address to a mock state, so that user ID lookups do not scan every account
+
+    :param state : mock state, shaped like `mock_state`
+    :type state : dict
+
+    :rtype : dict
+    """
+    state["emails"] = dict((account["email"], account_id) for account_id, account in state["accounts"].items())
+    return state
+
+
+def generate_fleet(accounts=10000, coins=10, seed=None):
+    """
+    Generates a mock state with `accounts` accounts and `coins` coins. Account IDs run from 1 to `accounts`, with email
+    address "<id>@example.com" and password "password"; the first coins are BTC and ETH, so the same calls work as
+    against the default state. The same seed always generates the same fleet
+
+    :param accounts : (Optional) Number of accounts
+    :param coins    : (Optional) Number of coins, at least 2
+    :param seed     : (Optional) Seed for the generated prices and balances
+
+    :type accounts : int
+    :type coins    : int
+    :type seed     : int|None
+
+    :rtype : dict
+    """
+    if coins < 2:
+        raise ValueError("Invalid coins, must be at least 2")
+
+    generator = random.Random(seed)
+    tickers = list(_FLEET_COINS[:coins]) + ["C{0:04d}".format(index) for index in range(len(_FLEET_COINS), coins)]
+
+    state = {
+        "coins": dict((coin, {
+            "Price": round(generator.uniform(0.01, 1000.0), 4),
+            "Image": "http://www.eobot.com/{0}.png".format(coin.lower()),
+            "BigImage": "http://www.eobot.com/{0}big.png".format(coin.lower())
+        }) for coin in tickers),
+        "miners": copy.deepcopy(mock_state["miners"]),
+        "fiat": copy.deepcopy(mock_state["fiat"]),
+        "accounts": {},
+    }
+
+    for account_id in range(1, accounts + 1):
+        state["accounts"][account_id] = {
+            "email": "{0}@example.com".format(account_id),
+            "password": "password",
+            "coins": dict((coin, round(generator.uniform(0.0, 10.0), 8)) for coin in tickers),
+            "miners": {
+                "GHS": round(generator.uniform(0.0, 100.0), 2)
+            },
+            "mode": generator.choice(tickers),
+            "speed": {
+                "MiningSHA-256": round(generator.uniform(0.0, 100.0), 2)
+            },
+            "wallets": dict((coin, "{0}-wallet-{1}".format(coin.lower(), account_id)) for coin in tickers)
+        }
+
+    return index_state(state)
+
+
+index_state(mock_state)
+
+_default_state = copy.deepcopy(mock_state)
+
+
 # noinspection PyTypeChecker,PyUnresolvedReferences
 class MockServerRequestHandler(BaseHTTPRequestHandler):
     def log_message(self, _format, *args):
         return
 
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        self.server.mock_server.count_connection()
+
+    def send_body(self, status, body, content_type):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_json(self, value):
+        self.send_body(200, json.dumps(value).encode(), "application/json")
+
     # noinspection PyPep8Naming
     def do_GET(self):
         parameters = parse_qs(urlparse('http://localhost{0}'.format(self.path)).query)
 
+        fault = self.server.mock_server.before_request(get_endpoint(parameters))
+
+        if fault == FAULT_SERVER_ERROR:
+            self.send_body(503, "Service Unavailable".encode(), "text/plain")
+        elif fault == FAULT_NON_JSON:
+            self.send_body(200, "<html><body>Maintenance</body></html>".encode(), "text/html")
+        elif fault == FAULT_TIMEOUT:
+            # hold the connection without answering, then drop it
+            time.sleep(self.server.mock_server.fault_delay)
+            self.close_connection = True
+        else:
+            with _state_lock:
+                self.do_dispatch(parameters)
+
+    def do_dispatch(self, parameters):
         if "exchangefee" in parameters.keys():
             self.do_get_exchange_estimate(parameters)
         elif "total" in parameters.keys():
@@ -122,9 +248,7 @@ class MockServerRequestHandler(BaseHTTPRequestHandler):
         elif "email" in parameters.keys():
             self.do_get_user_id(parameters)
         else:
-            self.send_response(404)
-            self.end_headers()
-            self.wfile.write("Page not found".encode())
+            self.send_body(404, "Page not found".encode(), "text/plain")
 
     def do_exchange_coins(self, parameters):
         from_coin = parameters["convertfrom"]
@@ -149,9 +273,7 @@ class MockServerRequestHandler(BaseHTTPRequestHandler):
         mock_state["accounts"][account_id]["coins"][from_coin] -= amount
         mock_state["accounts"][account_id]["coins"][to_coin] += add_amount
 
-        self.send_response(200)
-        self.end_headers()
-        self.wfile.write(json.dumps("OK").encode())
+        self.send_json("OK")
 
     def do_get_balances(self, parameters):
         account_id = parameters["total"]
@@ -166,10 +288,7 @@ class MockServerRequestHandler(BaseHTTPRequestHandler):
 
         balances["Total"] = total
 
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.end_headers()
-        self.wfile.write(json.dumps(balances).encode())
+        self.send_json(balances)
 
     def do_get_coin_value_or_exchange_rate(self, parameters):
         coin = parameters["coin"]
@@ -177,15 +296,9 @@ class MockServerRequestHandler(BaseHTTPRequestHandler):
             coin = coin[0]
 
         if coin in mock_state["coins"].keys():
-            self.send_response(200)
-            self.send_header("Content-Type", "application/json")
-            self.end_headers()
-            self.wfile.write(json.dumps({coin: mock_state["coins"][coin]["Price"]}).encode())
+            self.send_json({coin: mock_state["coins"][coin]["Price"]})
         else:
-            self.send_response(200)
-            self.send_header("Content-Type", "application/json")
-            self.end_headers()
-            self.wfile.write(json.dumps({coin: mock_state["fiat"][coin]["Price"]}).encode())
+            self.send_json({coin: mock_state["fiat"][coin]["Price"]})
 
     def do_get_deposit_address(self, parameters):
         account_id = parameters["id"]
@@ -198,10 +311,7 @@ class MockServerRequestHandler(BaseHTTPRequestHandler):
 
         wallet = mock_state["accounts"][account_id]["wallets"][coin]
 
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.end_headers()
-        self.wfile.write(json.dumps({coin: wallet}).encode())
+        self.send_json({coin: wallet})
 
     def do_get_exchange_estimate(self, parameters):
         from_coin = parameters["convertfrom"]
@@ -226,10 +336,7 @@ class MockServerRequestHandler(BaseHTTPRequestHandler):
 
         estimate = (float(quantity) * float(from_value)) / float(to_value)
 
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.end_headers()
-        self.wfile.write(json.dumps({"Result": estimate}).encode())
+        self.send_json({"Result": estimate})
 
     def do_get_mining_mode(self, parameters):
         account_id = parameters["idmining"]
@@ -238,20 +345,14 @@ class MockServerRequestHandler(BaseHTTPRequestHandler):
 
         mode = mock_state["accounts"][account_id]["mode"]
 
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.end_headers()
-        self.wfile.write(json.dumps({"mining": mode}).encode())
+        self.send_json({"mining": mode})
 
     def do_get_mining_speed(self, parameters):
         account_id = parameters["idspeed"]
         if isinstance(account_id, list):
             account_id = int(account_id[0])
 
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.end_headers()
-        self.wfile.write(json.dumps(mock_state["accounts"][account_id]["speed"]).encode())
+        self.send_json(mock_state["accounts"][account_id]["speed"])
 
     def do_get_mining_estimates(self, parameters):
         account_id = parameters["idestimates"]
@@ -265,22 +366,13 @@ class MockServerRequestHandler(BaseHTTPRequestHandler):
             "MiningSHA-256": estimate
         }
 
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.end_headers()
-        self.wfile.write(json.dumps(estimates).encode())
+        self.send_json(estimates)
 
     def do_get_supported_coins(self):
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.end_headers()
-        self.wfile.write(json.dumps(mock_state["coins"]).encode())
+        self.send_json(mock_state["coins"])
 
     def do_get_supported_fiat(self):
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.end_headers()
-        self.wfile.write(json.dumps(mock_state["fiat"]).encode())
+        self.send_json(mock_state["fiat"])
 
     def do_manual_withdraw(self, parameters):
         coin = parameters["manualwithdraw"]
@@ -298,15 +390,10 @@ class MockServerRequestHandler(BaseHTTPRequestHandler):
 
         mock_state["accounts"][account_id]["coins"][coin] -= amount
 
-        self.send_response(200)
-        self.end_headers()
-        self.wfile.write(json.dumps("OK").encode())
+        self.send_json("OK")
 
     def do_set_automatic_withdraw(self):
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.end_headers()
-        self.wfile.write(json.dumps("OK").encode())
+        self.send_json("OK")
 
     def do_set_mining_mode(self, parameters):
         account_id = parameters["id"]
@@ -319,10 +406,7 @@ class MockServerRequestHandler(BaseHTTPRequestHandler):
 
         mock_state["accounts"][account_id]["mode"] = mode
 
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.end_headers()
-        self.wfile.write(json.dumps("OK").encode())
+        self.send_json("OK")
 
     def do_get_user_id(self, parameters):
         email = parameters["email"]
@@ -333,27 +417,238 @@ class MockServerRequestHandler(BaseHTTPRequestHandler):
         if isinstance(password, list):
             password = password[0]
 
-        user_id = None
+        user_id = mock_state["emails"].get(email)
+        if user_id is not None and mock_state["accounts"][user_id]["password"] != password:
+            user_id = None
 
-        for account_id in mock_state["accounts"].keys():
-            if mock_state["accounts"][account_id]["email"] == email \
-                    and mock_state["accounts"][account_id]["password"] == password:
-                user_id = account_id
-                break
+        self.send_json({"userid": user_id})
 
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.end_headers()
-        self.wfile.write(json.dumps({"userid": user_id}).encode())
+
+class LoadTestRequestHandler(MockServerRequestHandler):
+    # keep connections open between requests, which requires every response to carry a Content-Length
+    protocol_version = "HTTP/1.1"
+    # headers and body are written separately, which Nagle's algorithm would delay on kept-alive connections
+    disable_nagle_algorithm = True
+
+
+class _MockHTTPServer(HTTPServer):
+    # a listen backlog of 5 makes concurrent clients wait for SYN retransmissions
+    request_queue_size = 128
+
+
+class _ThreadingMockHTTPServer(ThreadingMixIn, _MockHTTPServer):
+    daemon_threads = True
+
+
+class _InProcessServer(object):
+    def __init__(self, mock_server):
+        super(_InProcessServer, self).__init__()
+        self.mock_server = mock_server
+
+
+class _InProcessRequestHandler(MockServerRequestHandler):
+    # handles a single request without a socket, keeping the response instead of writing it
+    # noinspection PyMissingConstructor
+    def __init__(self, mock_server, path):
+        self.server = _InProcessServer(mock_server)
+        self.path = path
+        self.close_connection = False
+        self.response = None
+
+    def send_body(self, status, body, content_type):
+        self.response = (status, body)
+
+
+# started mock servers by port, for MockServerTransport to route requests to
+_servers = {}
+
+# ports for in-process mock servers, which do not listen on a real port
+_in_process_ports = itertools.count(1)
+
+
+class MockServerTransport(EobotTransport):
+    """
+    Serves requests with the request handler logic of a `MockServer` directly, without opening any sockets, so that
+    only the client overhead remains. Requests go to the started mock server whose port is the port of the base URL
+    """
+    def send(self, request, parameters):
+        port = request.get_address()[2]
+        mock_server = _servers.get(port)
+        if mock_server is None:
+            raise EobotConnectionError("Unable to reach the API: no mock server on port {0}".format(port))
+
+        handler = _InProcessRequestHandler(mock_server, request.get_target(parameters))
+        handler.do_GET()
+
+        if handler.response is None:
+            raise EobotConnectionError("Unable to reach the API: connection closed without a response")
+
+        return handler.response
+
+    async def send_async(self, request, parameters):
+        mock_server = _servers.get(request.get_address()[2])
+        if mock_server is None or not mock_server.has_latency_or_faults():
+            return self.send(request, parameters)
+
+        # injected latency and timeouts sleep, which must not block the event loop
+        return await super(MockServerTransport, self).send_async(request, parameters)
 
 
 # noinspection PyTypeChecker
 class MockServer(object):
-    def __init__(self):
+    """
+    Serves the Eobot API from `mock_state`. By default requests are handled one at a time and every connection is
+    closed after its response; in load-test mode every connection is handled by its own thread and kept alive. Latency,
+    faults and request counters work in both modes. An in-process mock server does not listen at all, and can only be
+    reached through `MockServerTransport`
+    """
+    def __init__(self, load_mode=False, seed=None, in_process=IN_PROCESS):
+        """
+        :param load_mode  : (Optional) Whether to serve requests concurrently over HTTP/1.1 keep-alive connections
+        :param seed       : (Optional) Seed for the random latencies and faults, for reproducible runs
+        :param in_process : (Optional) Whether to serve requests through `MockServerTransport` only, instead of over
+                            sockets, defaults to True if the EOBOT_TEST_TRANSPORT environment variable is "in-process"
+
+        :type load_mode  : bool
+        :type seed       : int|None
+        :type in_process : bool
+        """
         super(MockServer, self).__init__()
         self.port = 0
         self.thread = None
         self.server = None
+        self.load_mode = load_mode
+        self.in_process = in_process
+        self.fault_delay = 5.0
+
+        self._lock = Lock()
+        self._random = random.Random(seed)
+        self._latencies = {}
+        self._faults = {}
+        self._counters = None
+        self._delayed = 0
+        self.reset_counters()
+
+    def set_latency(self, latency, endpoint=None):
+        """
+        Delays responses, either by a fixed number of seconds or by the value returned from a callable, e.g.
+        `lambda: random.expovariate(50)`
+
+        :param latency  : seconds, a callable returning seconds, or None to remove the latency
+        :param endpoint : (Optional) API method to delay, e.g. "get_balances", defaults to all of them
+
+        :type latency  : float|int|callable|None
+        :type endpoint : str|None
+        """
+        if latency is None:
+            self._latencies.pop(endpoint, None)
+        else:
+            self._latencies[endpoint] = latency
+
+        return self
+
+    def set_fault(self, fault, rate, endpoint=None):
+        """
+        Makes a fraction of the responses fail. The rates of all faults that apply to an endpoint together must not
+        exceed 1.0
+
+        :param fault    : one of `FAULTS`: a 503 response, no response at all (see `fault_delay`) or an HTML response
+        :param rate     : fraction of the requests to fail, 0.0 to stop injecting the fault
+        :param endpoint : (Optional) API method to fail, e.g. "get_balances", defaults to all of them
+
+        :type fault    : str
+        :type rate     : float
+        :type endpoint : str|None
+        """
+        if fault not in FAULTS:
+            raise ValueError("Invalid fault, must be one of: {0}".format(", ".join(FAULTS)))
+
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError("Invalid rate, must be between 0.0 and 1.0")
+
+        self._faults.setdefault(endpoint, {})[fault] = rate
+        return self
+
+    def clear_faults(self):
+        """
+        Stops injecting latency and faults
+        """
+        self._latencies = {}
+        self._faults = {}
+        return self
+
+    def has_latency_or_faults(self):
+        """
+        Returns whether any latency or faults are being injected
+
+        :rtype : bool
+        """
+        return len(self._latencies) > 0 or len(self._faults) > 0
+
+    def before_request(self, endpoint):
+        """
+        Counts a request, applies its latency and returns the fault to inject, if any
+
+        :rtype : str|None
+        """
+        latency = self._latencies.get(endpoint, self._latencies.get(None))
+        faults = dict(self._faults.get(None, {}))
+        faults.update(self._faults.get(endpoint, {}))
+
+        with self._lock:
+            if callable(latency):
+                latency = latency()
+
+            fault = None
+            draw = self._random.random()
+            for name in FAULTS:
+                draw -= faults.get(name, 0.0)
+                if draw < 0:
+                    fault = name
+                    break
+
+            self._counters["requests"] += 1
+            self._counters["endpoints"][endpoint] = self._counters["endpoints"].get(endpoint, 0) + 1
+            if fault is not None:
+                self._counters["faults"][fault] = self._counters["faults"].get(fault, 0) + 1
+
+        if latency:
+            with self._lock:
+                self._delayed += 1
+                self._counters["max_delayed"] = max(self._counters["max_delayed"], self._delayed)
+
+            try:
+                time.sleep(latency)
+            finally:
+                with self._lock:
+                    self._delayed -= 1
+
+        return fault
+
+    def count_connection(self):
+        with self._lock:
+            self._counters["connections"] += 1
+
+    def get_counters(self):
+        """
+        Returns the number of "requests" and "connections" handled so far, the number of requests per endpoint
+        ("endpoints"), the number of injected faults per fault ("faults"), and the largest number of requests that were
+        delayed by their latency at the same time ("max_delayed"), which shows whether requests overlapped
+
+        :rtype : dict
+        """
+        with self._lock:
+            return {
+                "requests": self._counters["requests"],
+                "connections": self._counters["connections"],
+                "endpoints": dict(self._counters["endpoints"]),
+                "faults": dict(self._counters["faults"]),
+                "max_delayed": self._counters["max_delayed"],
+            }
+
+    def reset_counters(self):
+        with self._lock:
+            self._counters = {"requests": 0, "connections": 0, "endpoints": {}, "faults": {}, "max_delayed": 0}
 
     def get_free_port(self):
         s = socket.socket(socket.AF_INET, type=socket.SOCK_STREAM)
@@ -363,30 +658,51 @@ class MockServer(object):
         self.port = port
 
     def start(self):
+        if self.in_process:
+            self.port = next(_in_process_ports)
+            _servers[self.port] = self
+            return True
+
         self.get_free_port()
-        self.server = HTTPServer(('localhost', self.port), MockServerRequestHandler)
+        if self.load_mode:
+            self.server = _ThreadingMockHTTPServer(('localhost', self.port), LoadTestRequestHandler)
+        else:
+            self.server = _MockHTTPServer(('localhost', self.port), MockServerRequestHandler)
+        self.server.mock_server = self
 
-        self.thread = Thread(target=self.server.serve_forever)
-        self.thread.setDaemon(True)
+        self.thread = Thread(target=self.server.serve_forever, args=(0.05,))
+        self.thread.daemon = True
         self.thread.start()
+        _servers[self.port] = self
 
         return True
 
     @staticmethod
-    def reset():
-        mock_state["accounts"][123]["coins"]["BTC"] = 0.2
-        mock_state["accounts"][123]["coins"]["ETH"] = 2.5
-        mock_state["accounts"][123]["miners"]["GHS"] = 10.0
-        mock_state["accounts"][123]["mode"] = "BTC"
+    def reset(state=None):
+        """
+        Replaces `mock_state` with a copy of `state`, e.g. a fleet from `generate_fleet()`, or with the default state
 
-        mock_state["accounts"][456]["coins"]["BTC"] = 0.1
-        mock_state["accounts"][456]["coins"]["ETH"] = 2.0
-        mock_state["accounts"][456]["miners"]["GHS"] = 5.0
-        mock_state["accounts"][456]["mode"] = "ETH"
+        :param state : (Optional) Mock state to serve
+        :type state : dict|None
+        """
+        state = copy.deepcopy(_default_state if state is None else state)
+        if "emails" not in state:
+            index_state(state)
+
+        with _state_lock:
+            mock_state.clear()
+            mock_state.update(state)
 
     def stop(self):
-        self.server.shutdown()
-        self.server.server_close()
+        _servers.pop(self.port, None)
+
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
         self.server = None
         self.thread = None
         self.port = 0
+
+
+if IN_PROCESS:
+    set_default_transport(MockServerTransport())
@@ -0,0 +1,232 @@
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from eobot.lib.eobot_config import EobotConfig
+from eobot.lib.eobot_circuit_breaker import EobotCircuitBreaker, STATE_OPEN
+from eobot.lib.eobot_errors import EobotCircuitOpenError, EobotConnectionError, EobotResponseError, \
+    EobotServerError
+from eobot.lib.eobot_pool import EobotConnectionPool
+from eobot.lib.eobot_request import EobotRequest
+from eobot.lib.eobot_retry import EobotRetryBudget, EobotRetryPolicy
+from eobot.methods import exchange_coins, get_balances, get_user_id
+from eobot.tests.mock_server import FAULT_NON_JSON, FAULT_SERVER_ERROR, FAULT_TIMEOUT, IN_PROCESS, MockServer, \
+    MockServerTransport, generate_fleet, mock_state
+
+
+class MockServerTest(unittest.TestCase):
+    def start(self, **kwargs):
+        self.server = MockServer(**kwargs)
+        self.server.start()
+        self.addCleanup(self.server.stop)
+
+    def request(self, pool=None):
+        return EobotRequest() \
+            .set_base_url('http://localhost:{0}/api.test'.format(self.server.port)) \
+            .set_pool(pool) \
+            .set_retry_policy(None) \
+            .set_parameter("coin", "BTC")
+
+    @unittest.skipIf(IN_PROCESS, "counts real connections")
+    def test_counters(self):
+        self.start()
+
+        self.request().perform_request()
+        self.request().perform_request()
+        self.request().set_parameter("supportedfiat", "true").perform_request()
+
+        counters = self.server.get_counters()
+        self.assertEqual(3, counters["requests"])
+        self.assertEqual(3, counters["connections"])
+        self.assertEqual({"get_coin_value": 3}, counters["endpoints"])
+        self.assertEqual({}, counters["faults"])
+
+        self.server.reset_counters()
+        self.assertEqual(0, self.server.get_counters()["requests"])
+
+    @unittest.skipIf(IN_PROCESS, "counts real connections")
+    def test_load_mode_keeps_connections_alive(self):
+        self.start(load_mode=True)
+        pool = EobotConnectionPool()
+
+        for _ in range(5):
+            self.assertEqual({"BTC": 100.0}, self.request(pool).perform_request())
+
+        pool.close()
+
+        counters = self.server.get_counters()
+        self.assertEqual(5, counters["requests"])
+        self.assertEqual(1, counters["connections"])
+
+    def test_load_mode_serves_concurrently(self):
+        self.start(load_mode=True)
+        self.server.set_latency(0.2)
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            # without coalescing, so that every request reaches the server
+            results = list(executor.map(lambda _: self.request().set_single_flight(None).perform_request(), range(10)))
+
+        self.assertEqual([{"BTC": 100.0}] * 10, results)
+        self.assertGreater(self.server.get_counters()["max_delayed"], 1)
+
+    def test_latency(self):
+        self.start()
+        self.server.set_latency(lambda: 0.1, endpoint="get_coin_value")
+        self.server.set_latency(5.0, endpoint="get_balances")
+
+        started = time.time()
+        self.request().perform_request()
+        self.assertGreaterEqual(time.time() - started, 0.1)
+
+        self.server.set_latency(None, endpoint="get_coin_value")
+
+        started = time.time()
+        self.request().perform_request()
+        self.assertLess(time.time() - started, 0.1)
+
+    def test_faults(self):
+        self.start()
+
+        self.server.set_fault(FAULT_SERVER_ERROR, 1.0)
+        with self.assertRaises(EobotServerError):
+            self.request().perform_request()
+
+        self.server.set_fault(FAULT_SERVER_ERROR, 0.0).set_fault(FAULT_NON_JSON, 1.0, endpoint="get_coin_value")
+        with self.assertRaises(EobotResponseError):
+            self.request().perform_request()
+
+        self.server.clear_faults().set_fault(FAULT_TIMEOUT, 1.0)
+        self.server.fault_delay = 0.5
+        with self.assertRaises(EobotConnectionError):
+            self.request().set_timeout(0.1).perform_request()
+
+        self.server.clear_faults()
+        self.assertEqual({"BTC": 100.0}, self.request().perform_request())
+
+        self.assertEqual({FAULT_SERVER_ERROR: 1, FAULT_NON_JSON: 1, FAULT_TIMEOUT: 1},
+                         self.server.get_counters()["faults"])
+
+    def test_fault_rate(self):
+        self.start(seed=1)
+        self.server.set_fault(FAULT_SERVER_ERROR, 0.5)
+
+        failures = 0
+        for _ in range(100):
+            try:
+                self.request().perform_request()
+            except EobotServerError:
+                failures += 1
+
+        self.assertGreater(failures, 30)
+        self.assertLess(failures, 70)
+
+    def test_retries_and_circuit_breaking(self):
+        self.start(seed=1)
+        self.server.set_fault(FAULT_SERVER_ERROR, 0.5)
+
+        policy = EobotRetryPolicy(max_retries=10, backoff_base=0.001, backoff_max=0.001,
+                                  budget=EobotRetryBudget(max_tokens=100))
+        for _ in range(10):
+            self.assertEqual({"BTC": 100.0}, self.request().set_retry_policy(policy).perform_request())
+
+        self.server.set_fault(FAULT_SERVER_ERROR, 1.0)
+        breaker = EobotCircuitBreaker(failure_threshold=3)
+
+        for _ in range(3):
+            with self.assertRaises(EobotServerError):
+                self.request().set_circuit_breaker(breaker).perform_request()
+
+        self.assertEqual(STATE_OPEN, breaker.get_state())
+        with self.assertRaises(EobotCircuitOpenError):
+            self.request().set_circuit_breaker(breaker).perform_request()
+
+    def test_in_process(self):
+        self.start(in_process=True)
+        self.server.fault_delay = 0.01
+        transport = MockServerTransport()
+
+        self.assertEqual({"BTC": 100.0}, self.request().set_transport(transport).perform_request())
+
+        self.server.set_fault(FAULT_SERVER_ERROR, 1.0)
+        with self.assertRaises(EobotServerError):
+            self.request().set_transport(transport).perform_request()
+
+        self.server.clear_faults().set_fault(FAULT_TIMEOUT, 1.0)
+        with self.assertRaises(EobotConnectionError):
+            self.request().set_transport(transport).perform_request()
+
+        counters = self.server.get_counters()
+        self.assertEqual(3, counters["requests"])
+        self.assertEqual(0, counters["connections"])
+
+        self.server.clear_faults()
+        port = self.server.port
+        self.server.stop()
+
+        with self.assertRaises(EobotConnectionError):
+            self.request().set_base_url('http://localhost:{0}/api.test'.format(port)).set_transport(transport) \
+                .perform_request()
+
+    def test_invalid_faults(self):
+        server = MockServer()
+
+        with self.assertRaises(ValueError):
+            server.set_fault("nosuch", 0.5)
+
+        with self.assertRaises(ValueError):
+            server.set_fault(FAULT_TIMEOUT, 1.5)
+
+
+class MockServerFleetTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockServer()
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+        MockServer.reset()
+
+    def config(self, user_id):
+        return EobotConfig().configure(user_id=user_id, email="{0}@example.com".format(user_id), password="password")
+
+    def request(self):
+        return EobotRequest().set_base_url('http://localhost:{0}/api.test'.format(self.server.port))
+
+    def test_generate_fleet(self):
+        fleet = generate_fleet(accounts=100, coins=15, seed=1)
+
+        self.assertEqual(100, len(fleet["accounts"]))
+        self.assertEqual(15, len(fleet["coins"]))
+        self.assertEqual(["BTC", "ETH"], list(fleet["coins"].keys())[:2])
+        self.assertIn("C0014", fleet["coins"])
+        self.assertEqual(42, fleet["emails"]["42@example.com"])
+        self.assertEqual(fleet, generate_fleet(accounts=100, coins=15, seed=1))
+        self.assertNotEqual(fleet, generate_fleet(accounts=100, coins=15, seed=2))
+
+        with self.assertRaises(ValueError):
+            generate_fleet(coins=1)
+
+    def test_serve_fleet(self):
+        fleet = generate_fleet(accounts=10000, coins=5, seed=1)
+        MockServer.reset(fleet)
+
+        self.assertEqual(9876, get_user_id(config=EobotConfig().configure(
+            email="9876@example.com", password="password"
+        ), request=self.request()))
+
+        self.assertEqual({"userid": None}, self.request().set_parameter("email", "9876@example.com")
+                         .set_parameter("password", "wrong").perform_request())
+
+        balances = get_balances(config=self.config(5000), request=self.request())
+        self.assertEqual(fleet["accounts"][5000]["coins"]["LTC"], balances["LTC"])
+
+        exchange_coins("BTC", 0.5, "ETH", config=self.config(5000), request=self.request())
+        self.assertNotEqual(fleet["accounts"][5000]["coins"]["BTC"], mock_state["accounts"][5000]["coins"]["BTC"])
+
+        # resetting to the fleet undoes the exchange without touching the fleet itself
+        MockServer.reset(fleet)
+        self.assertEqual(fleet["accounts"][5000]["coins"]["BTC"], mock_state["accounts"][5000]["coins"]["BTC"])
+
+        MockServer.reset()
+        self.assertEqual([123, 456], sorted(mock_state["accounts"].keys()))
+        self.assertEqual(0.2, mock_state["accounts"][123]["coins"]["BTC"])
@@ -25,11 +25,14 @@ setup(
         'Development Status :: 4 - Beta',
         'Intended Audience :: Developers',
         'License :: Freeware',
-        'Programming Language :: Python :: 2.7',
-        'Programming Language :: Python :: 3.3',
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3',
+        'Programming Language :: Python :: 3 :: Only',
+        'Programming Language :: Python :: 3.7',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
+        'Programming Language :: Python :: 3.12',
         'Topic :: Utilities',
         'Topic :: Internet :: WWW/HTTP',
         'Topic :: Software Development :: Libraries'
@@ -41,10 +44,9 @@ setup(
     license='Freeware',
     packages=['eobot'],
     include_package_data=True,
+    python_requires='>=3.7',
     install_requires=[
         'requests'
     ],
-    zip_safe=False,
-    test_suite='nose.collector',
-    tests_require=['nose']
+    zip_safe=False
 )